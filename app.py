@@ -1,799 +1,192 @@
 import streamlit as st
-from supabase import create_client, Client
+import altair as alt
 import hashlib
+import os
+from functools import wraps
+from pathlib import Path
 from datetime import datetime, date, timedelta
-from streamlit_autorefresh import st_autorefresh
 import pytz
+from store import BookingStore, create_store
+from http_client import HttpSettings
+from passwords import SCRYPT_N, Authenticator, RateLimiter
+from events import start_realtime_bridge
+from archive import start_archiver
+from rollups import NO_SHOW_AFTER, NO_SHOW_BEFORE, start_refresher
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+from tracing import TracedStore, Tracer, serve_prometheus
+from service import BookingService
+from timeslots import SLOT_TABLES, build_time_options
+from models import classify_bookings, to_epoch
+from layout import DEFAULT_LOT
+from heatmap import BUCKET_MINUTES, by_row
 
 # ---------- LOGO ----------
-LOGO_B64 = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAABLAAAASwCAYAAADrIbPPAAEAAElEQVR4nOzdd5ztV13v//da61t2mZnTEkILgdBBrhQVLCj28kO9tnu9+tOrXu9FUVCK1PQCQQVRsIvXq179KYIaQYSQkAAhCSUJpNeTnpDktJnZ5VvWWr8/vnt/Z+bkJOQkJ2efmXk985jHyZkzZU3Z6/tdn/0pEgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA+zGzXgAAAMChdtJpN0bvK9XVSEUxUFEsqygGqquRfKgUfK0Qg3xdqqpGquti8melGL2qaqwYg2IIK28fasUYFGJU8JWiohRj83bTPyevkyQZIyMjY6yMaf6cvs66VHbyOmsTWZfI2VTGWhljlaYdGeOUJKnStKskyZWmXbkkkzW2ffsk7SrP+8rzOeV5X0nalXOpTjvpGdzjAQCADYWbGwAAcMQ68113x7177tRotFdlOdBgsFtVNdJ4tKi6LlSUAxXjJRXFsspioKoayftK3lcHCCCZ9nXe15LUvO4hxGkwaj/OJasCWHHV2+7/9qb9HAf6/Pt7uOvZ//PvH0BzLpVzTfArmwa4OvPKs76SJFenu6A07arf364s66vb3aqt256kt7/5CdwbAgCAIxI3KQAA4LA65YydcTDYrfF4nwbLuzQc7tFotFfj0T4NBrtVjJc0GO6Wr0tZ61TXpZxLZF2quirkklQx+DZw0wSNzJrgj7G2+Z81waUVXytQJGPWBKe+ljUfb/r/q973oD7O5HM/lAf9eiZ/xhD2e9uV75ExRsY6+bpSkuYKvpL3tZIkUwheLsnU721X3plXv79dne4Wdbtb1ettU39uhzqdLer3t+uUE57GfSQAADhsuPEAAACH1Bvf8oW4tHiPxuMlDZbv12DQBKmGwz0aDfeqLIdfO4CEI1qMUVnWU7fXBLZ6vW3q93eoP3eUOp15zS88Xr971jfyQwYAAIcMNxYAAOCgnHTqDXHvvju1d88dGizfr+Xl+7V71y3yvtTevXeq19umELxCqBWCl6S2jG9a6maMnfFXgUdj+jNc/TOVJGtd09PLOg2He7R165PkXKbtO56qubmj1J87Slu3PVlbtzxJp538TO5DAQDAw8aNAwAAeIA3v/2yuLj4VS3uu1uDwS7t2XWrhsM9Ggx3q67GijE2DcidU5p0VNVjWePkkkzDwR4lSdaWuTUla3ZN0Co8SA8orA/WJe3/T5vdr/5513WpXn+bfF0qRN/+jgTvJ8EvoyTtqN/brl5vm7btOE79/g4tbHmCFhaO0bvOfBH3qAAAYA1uDgAA2KTOOOuuuG/f3brv3htUjBd1++2XKcag3btvVYxBadpVMV6Sc6lC8KrrQlnWU5j0n0rTjsbjJcUY1O1u0XC4W85lSpKs+QSr+kitaTIuydnkIVaGI50Pkyb4B2iSP+3fVdelvC/V623XaLRPxlh1OvOqqrGMMbLWqSyHSpJc1jp5XynvzKuqRjLGavv242SM1bHHvkh5Z0FHP+6Z2rLlCTrhLU/k/hUAgE2IGwAAADaBt510Vdyz53bd99XrtXv3bbrvvhtU18UkwBTkfa1Od0Gj4V4lSSZjrIpiWb3eNpXlUCF4dXtbVVUj1VWhJMlU+0pp2lFVjpSmHUlSmnZVlgOFENrMq/0Zmba0EOuTta4NRq42zcSy1irL+qqqkSSpqsZKs66qaqzEparrUkmaK027Gg33ylqnLOtpONyjPJ9TjEF1Xarb26rxaFHOJU0GnzFKklxHH/1Mbd/+FB19zLO0bduxesdpz+eeFgCADY6LPQAAG8hbTvhyHA736N6vXq/hYLd27drZZFQFr3oy1c8lmZxNNRrtVYxRnc58GzDwvlKvt00+VAq+lg+1rHHK877G4yVJkktSSVJVjjQ3d7TG48UmK0tRzibyoZazSduoPbaTAFcm49EDa3070M9y9c97+jvgQy2jJtuq01nQ8vJ9SrOuJMnXlSSp05lXUQwUopeziaxL5Gyq4XCPnEvbgOp4vCRjjLrdrfKhasoTg2/+3Tpt336cdux4mnr97XrcMc9Sr7dNZ53x9dzrAgCwQXBRBwBgnTr59JvjnXdcrtFor2695fNaXPyqgq9VlkM5l6ia9KrqdrdoMNilbneLoqKqaixnE8UYlaS5qrLJkkmzroyMinIgTXpcTd/XuVTG2Ca7xjWNuqty1JQFxqhud0HeV6rqJjsrhrBmrftPHZwGtbA+fa2fp7FWdV0qTXI5l2o0WpyUGVqlWbdp8O/9pAl8kPeV+v0dGo32NcExY5Rn/eb3ddXvZ10VMsbIh1pp2pGR0Wi0r31fY4zStKMQvNK0K2ud5heO0VOf9lL1etv0xCd9vU498XjufwEAWIe4gAMAsA6ccMq1ce+eO/TVe67V7t23as+e2zRY3jXJhDGTpulBZTlSmnXa9wveyzqn4GtZlyhOSvumB/yqGitEr253S1M+mOYK3su5ZNLrKsi6RNY4jcdL6s81gQJNemBFxUnZWBPISpJMIXgZax80iEXwamN4sJ/n9GdvrVNdl23gylgrI6OqGkvGNMHR5V3qdOYVolfwdTMYwDp5X8s6p7oq1O1t1Wi0T9a4pmS1GjUljDHKWNv+bk9/16WmTHX6WLCm6a/VDB4w6ve3a9v247R9+3E65vHP0dZtT9YZpzyHe2IAAI5wXKwBADgC/fpvnhv37L5Vd991tXbt2qnRcK+kKGudjLH0kAIehSYAFiaPI6Nub6t27HianvDE52nb9uP0/vd+N/fIAAAcYbg4AwAwYyedekO8974bdPutX9Lu3bdqsHy/qnrc9hmaTnqLigq+Vghe1roZrxpYv6aPIesSGZk1EzKNsUqTjvpzR2n79uN07HEv0eOOfqZOO/mZ3DcDADBDXIgBADjMfustX4x33XWF7r7rKi0u3q3B8v1K067G4yUlaa5ivCypKcWybbNzMynFMmRgAY/SNAMrxjgpgWyCVyGGtvQ178yprgp1OvOqqpH6c0dpYeEJesITn69jj32RzjrzhdxHAwBwGHHhBQDgMfbGt3wh3n7bl7Tr/p26664rmlfG2PYHqutCzqWyLlExXlKnu0UxhqZv0CQ7hIAV8NiZluZGxfaxNx7tU96Zb6Zx+kpJkrd93rxvJig+6clfr6OOfrqOO+6b9DtnfQP31QAAPIa40AIAcIi9+W2XxjvvvEL33XuDbr/9UoVQy9eVrG2aUA8Gu5R35tuG6sY6KUZ5X2lh4fHas+eOpkG2MbLGtZlXktqMkf2nwAF4+KaPof0fVyF6afL/27Y9WYuL98i5VDJGMfi2cXxdFer3d6gsB/K+njyOrY499sU66uin6ylPeYne9Y4X8yAFAOAQ4sIKAMCj9Oa3Xxbvvusq7d51i26/7VIVxZJijPKhVuJSGdtMAUzTjkajfep2tygE30wADF553ldZjWTUZGOlaUdZ1pMPddvzqp3kNgls7T/hD8DDZ6xtA1XTUsJpTyxnE5XlUFU1brKuFJWlXRXFoA1Ch+g1Hi2q29sqX1fNFNBJjzrnUoVQK8/ndexTXqztO56qJzzx+XrXmS/ivhsAgEeBCykAAAfppFNviPfee73uuP0y3XvvDdq39055X8m5VFU1Upp2ZV2iuiqUZT1V1VjGmLbXjjFWRbGsrduO1Wi4Rz7UytKuQqgVY1SadlSWQ7V9r+xKKWGMkSbuwKM0fQxNA8NRUTGE9jG6+nFrbaKyGsnZRN3eNu3dc3sbhJ6KMShJchXFspIkl6R2L5juDVu2PkmPe9wz9eRjX6SjH/dMnX7ys7gPBwDgIHDhBADgYfitt34p7rz5c7rj9ss0GOxSWQzkXKrxeEl53pdzqcpy1Bx4XaLg60lWh1WYlApalzRBqBDkkkzFeFlp1lEMQT7UyrO+ynIo55L28+7fZHqahdW8DsAjMX0MTSd9rh6SMOV9rSzrqSgHcjaRsVZVOZ40dx/LGCtrncKktNBa2z4uV+8BWdYEsYpioE5nXt5XyvK+5vpH6cnHvkjHPe2l+t2zvpF7cgAAvgYulgAAHMDbT74m3vvV63TbrV/UvV+9XqPRnuYfpj1zKOED8AgZO5kuOgl4dbvb9LhjnqWnHPcNetwxz9aZpz6Xe3QAAPbDxREAgInXvfGz8Z57rtGtOz+vPXtvl68reV/JGCPnUhlj5CcTydK0M+vlAlinqmos51I5lzT98nylGGPzuiTV9u3H6SnHfYOOOeY5eu+7X879OgAAIoAFANjkXvO68+Jtt3xBt976RRXjRcUYVvW2WSkrMsZK0z8l+bqc3aIBrGsuySQ1vbO0qpH86j5504ENeT6v4576TTruuG/Q+9773dy7AwA2LS6CAIBN5Yyz7oq37LxI9913k6675px2QqAPtTr5vOp6LOcy1XWxpnl6CF7e1+3HSSYHUAA4WPWqALhzyaSh/EozeZdk8nXZ9OAqlpsJiTaR95We/dzv1VFHPV3PevZ36i1v3MG9PABg0+CiBwDY8M4468544w2f0c6bLtTi4le1d+/tMsap012Qr0tZl0gxqigGyrKuqqpoD5TW2jbrarXVE8gA4GAcaIpoEygPijG0Zcp1XSjP5yRjFHwlaxONRvtkbaL+3A5t3/4UPeOZ364nH/tinXLC07ivBwBsaFzoAAAb0omnXh9vveXz2nnz57Rv390aDvfI2SbTYTryviyHKsuhur2tbRlPkuTyk4NiCE2/q2mwahrUMtbSxB3AIzbdQ1aXLFvr5Fwqa5tppdY6VdW4LSUcjxaVZX3leV9VNZLUTCkNwavb3aItW5+kpz/j23TsU16i009+Fvf4AIANh4sbAGDDOOm0G+Mdt1+mm2/6rO655xo5m6qqRnIuVQheVTVWnvclNSU8IdSamztaRbEkGaO6KiRjFENYUyK4emJYCF4heDmXzuJLBLABNEFy12RiHWCyaTM8wioE3+5Fnc6Clpfvk3OZpKgs62sw2CVrE3W7W9qgVpLkOvpxz9DxT/82PfnYF+m0k57B/T4AYEPgggYAWNdOOWNn3HnzRbr9tkt15x2XK8bQBpequpCziaQmCGVtomK8pDTrSjG2pYHj8ZI63QVJUlkMlXfmHrRJu5keNmN8rL80ABvU19pHrEuavSjvt9lX0+B7CF4uyTQa7lWvt00xBpXVSNa49uNa69og2JOe/EId+5QX62nHfzNlhgCAdY2LGABgXfqfv/Iv8dZbLtHtt12qshwqTTuTKV7hgD2rAGAzme6FxhhV1VhZ1tOxT3mxjnvqS/Xnf/KfOQMAANYdLl4AgHXjNb95brz11i/qhuvOa3vHGGObJuySfF1JipM+V2RIAdicjDGT3lpGLmkyUoOv295axlg989nfpeOO+wa9773fzXkAALAucMECABzR3vDmS+ItOy/WTTd+VqPhHklNOWBdl0pcKmOdgq9XBbOa6V40WQewWU379gXv26CVdYli8Kp9pSTJ2j2y29umpz/j2/TUp71M737XSzkbAACOWFykAABHnFPO2Blv2XmJrvzK2aqqscbjxWacfGdedVXIJaniJGAVgm9LZZxLFaJv3oYm6wA2Ke8rJWkua5peWNM9cjqF1VgnXzdvU4yXlCS5Op0FpWlHX/effkRPfdpL6ZcFADjicGECABwxXv2aj8ebb75Qt936xbZp8bQRu7VOZTlSlvdUlSPFGNspXsZaKUbKBgFgP8aYdrrqdIqqMUZp1lVZDJVlXYXg5UOtNMlVFAN1ugt6ynHfoOOP/1b90fu+n/MCAOCIwAUJADBTJ55yXbz2mnN0w/XnazjcoyTJVNeFsqwvHyr5ulKe91WWQ9V1qTTrSJISl8mHWjF4SVIIQSF6OZvIuVTeV7P8sgBgZqZ7oA+1rHGyk5JCY52cTVT7ZspqVY6VJJmyrKeiGMglqZxNVZYDJUmuui7V623TM5/1Cj3nud+r0095NmcHAMDMcBECAMzEa37z3Hjpl/5Ru+6/uc2cav6MStKO6qpQWQ7U7W1VVY6aKYNq3q6uS9lJ+aAkJUkmaxNFxbYflrVuVl8aAMzUdA+0LpGRUQi16roJWlnrFGJQkmSSJKNmSmGadTUa7lWW9ZWkuepq3PyraY4LxhjtOOp4vfgl/4XG7wCAmeDiAwA4bN564hXxmqv+Qzff/DkV46VJGaCVdamCr1T7SlnWU1kOm7JBl8gYq2K8pCzvK8agqhyp01lQXRcPKB2clspQTghgMzvQXri6lDBJco3Hi0qzroyxKouB8s58M93V1/KhbvfixKXtHh1CkDFGeWdexx//LXru839A7zz9BZwnAACHBRccAMBj7pdf9eF44w2f1le/eq18XWr1s/oAgPVn2jPr8U94vp75rO/Qn/3xj7KpAwAeU1xoAACPiRNOuTZee/UndPPNF2o03KuqGkuSsqynui4JYAHAOmZdoqocScYoTTvqdrfo+OO/Vc993vfTKwsA8Jjg4gIAOKTe8OZL4pVfOVt33H65qmqsLOtqNFpUlnWVpB0Nlu9vygFDmPVSAQCPgLFWVTlSv79DVTVSWQ7V7W5VVY3kkkzHPfWb9Oxnf7fe++6Xc9YAABwyXFQAAIfEr/zaR+OXvvD3Wly8R9Y6eV8pSXINh3vU629XXY1lXaKyGKg/d5TKYjDrJQMAHoE07Wo02qss7zcN4NOOxqNF9XrbVJQDWWPlXKpt256i5zzv+/WXf/6TnDkAAI8aFxMAwCN20qk3xCuv/Iiuueo/FBVVV4XSrCvFKBkjZxMVxUDGWFlrVftKnXxOo9FiOwELALC+VNVY/f52FcWyzGQirDG2KRH3hdKko/F4Sd5XyjtzStOujnvqN+nrX/hjOuOU53D+AAA8IlxAAAAH7c1vuzRec805uuLL/6r5hWNUlcPJIaaWc5mGwz0yxigEr7m5o+V9qRC8QvBKs+6kkTsAYL1KklxVNZJkZJ1TmnS0vHyfJMn7Wlu2PlHB16qqsYwx6va2aXn5Pj3nOd+jr3vBK3XWmS/kHAIAOChcOAAAD9uv/vrH4s03fVY7b75Y3peamzta+/bdpU5nXmU5krVOadqRc6lckms03CupGd8eY5B1ieqqkHPpbL8QAMCjUtel0jRXCEHWNllYktTtbVMItcpi0PTEcpmSpHliY2Hh8RqPl+Rcoicf+2I957nfq/f//vdwHgEAPCxcMAAAX9Mv/c8Pxi9f/mENh3sUfK0QvJIkmxxgOqrrQmnabQ4t5UjOJU3pSD6nGIPKcjQJcg2Vph15X836SwIAPArWOpXlSN3uFo3HTVm4MVZlOZKxVkZGziVKkk7TC7G3TeNiSWmSTwZ89OR9pfmFY/TCF/24/uJPf4JzCQDgIXGhAAAc0Emn3Rivu/aTuuG687S8fL+sSySJ6YEAgEPCWiepyebqzx2lZz/nu/Wc536vTj3x6ZxRAAAPwMUBALDGyaffFC+/7EPaedPnVFUjeV/LOiejpqdVjFHGcPkAADxyMUZZa2WsU5z0SLQuUZb1dfzx36Kvf9FP6NQTj+diAwBocVEAAEhqMq6uuvKjuvrKf1dUVFWOlCT5pBl7aHpYWSdjrSQysQAAj4wxRsZYxRja3lnWOsUY295axlg97+t+SM//uv9Hp530DM4sAAACWACw2b3+tz4Xb7zh07rxhgtUFINJA/ZUxthJ1lUt72sZY2RdohiD6rqUs8mslw4AWId8qJUkmaxx8r5SjFHOJbI2UVRUDF7eV/K+Vpb39MxnvkLPeNZ36D2//c2cXQBgE+MiAACb1OvfdFG8/trzdPPNF6oYL8u5VEmSTQ4ToSkdtK7tURJjlBSbwJa1ZGABAB6R6TUkxiDJtGXpYVpKOLn2WJfI11UzFKQzp+OP/1Y9+znfrXf/9ss4wwDAJsTmDwCbzG+99Uvxsi/9o3befJGSJFNVjbWw8HgNBrtkjFWSZAqhlnWpYvDNAcMYxRDkQy1nE7kkk6/LWX8pAIB1KEly1XUh7ytZm8i65okSIyNjncLk9XVdKMaofn+HFhfvmUy9LfW0479ZL3rJf9HvvPMlnGUAYBNh0weATeJNb7s0Xn7pB3XLzs/LOqcYgvr97dq37x7F6NXpLLTlgk0Qq3km3Bgjl2RyNlFoyzoqOZfO+ksCAKxDPtSyxsklqaxxCtHL15WmWb7WNqWF1iWyxmk8XpQxTgsLj9dwuFvGWgXv9dSnfZNe+OKf0m+/48WcaQBgE2CzB4AN7g1vviRee/UndO015zQ9RyYlGcYYeV8py/ttNpW1TlU1lnNp06w9RsUY1zTZNcZMygkBADh4KyWDTRnhtKn76uuOD7XSJG+vPy7JVE76NMYY5ZJUwdeq61LPee736jnP+z69+10v5WwDABsYmzwAbFBvetul8cqv/JtuvOHT8r5SpzMv78smwyrNFXw96yUCAHDQnEtV18WkT1ba9nF85rO+Q1/3glfqXWRkAcCGxOYOABvMSafeEC+5+K90x+2XT/qHBFmXNCPLJ2WBMca2OTsAAOtJ0/x9khVsXXttM8YqTTt60pNfqJe+7L/rtJOfyVkHADYQNnUA2CBOPOW6ePllH9J1154rl6QqxktK066sSxR83U52YoIgAGC9m17LpsNFpte6qhor78zJ15We/Zzv1gtf9BM6/ZRnc+YBgA2AzRwA1rkTT70+fvnyf9bOmy5UVY1kjJX3lZK0o+ArhTDpL9KOLY9t/xEAANaj6bVs2pexySy2ci5TVY0mvbKC0rSr45/+rfpPL/wxnX7ys7j4AcA6xiYOAOvYz/78/45XXfnvKotlyRhV5ai9mZ9OcTLGyiWpFKPqupSMWdMYFwCA9cS6RFU1lmJsh474ulJUlLPJpMTQSIpK066iovJsTs9/wQ/pb//PL3D+AYB1ig0cANahX/31j8UvfuHvtLjv7knfD6M07Wo02qs07SpNOwoxTKY5hUnfq9BMeTJGMoYyQgDAujSdVhhCkBQlGVnnZI2TjJE1TlU1Ul0X6na3qCxHzfsZoy1bn6iXfMN/0x+//wc5BwHAOsPGDQDryGtff3788qUf0l13XSnvK6VpRy7JVFdjSUZZ1tNotLdp2B6DrE2avlfGtP9f+1JVOVaSZLP+cgAAOGh1XSrNOnI2VYi+naobY5D3dVsy3+ttVVkOFWNUmnZU18VkemGiJz7x6/T1L/4J/cF7XsF5CADWCTZsAFgH3n7y1fFzn/1z3XXnFW2JoLFWxljVVTNKvAlYrUxkkjFSjM2fkoL3CtHLGieXpO0NPwAA64l1iXxdtdc0a+3KP06ufftPJwzBK0lzxRgUJ70hY4x64pNeoG/5tv+pM099HuciADjCsVEDwBHspNNujFd85V919ZUfk0sy+bpsb7oBAMAjM72WJkku70s97/k/qBd8/Y/q1BOfzvkIAI5QbNAAcIT6+V/4m3jZZf+k0WifkiRTMV5WlvVmvSwAANa9aQCrLIfKO3Oq61Ld7ha96MU/pb/+3/8vZyQAOAKxOQPAEebXf+OT8fOX/I0W992lGKO6vW3at/dO9XrbJKmZvKTm5hsAABy8GKOyrCtJGg73aGHLEzUa7pGxVgsLT9A3vfTn9P7f/x4utABwBGFTBoAjxFtP+Er84hf+Trfd+kVJkksyjUeLMsYqzToyMlpevl87djxNw+EeAlgAADwCMUb1+tu16/6bNTd3lKKiqnKsGIM63QX5upQkPeW4b9A3fOPP6J1n/CcuuABwBGAzBoAZO/GU6+LVV/+Hrr36ExqN9qnTXVBdFfK+Ut6Za8eBW+tU1YWCr5TncwrBz3rpAACsO9Y6FcWyrEuVJJmC98qynkKoVRTLSpK8fRKp292i5zzv+/S85/+gTj/5WZydAGCG2IQBYIZ+5dc+Gj9/yV9r7547laYdJUmuqhorSTLJGNVVoaoaySWZ0iRXkuQajRfVyedVVaNZLx8AgHUnTTsaj5fU7W5RVY9V16V8XbbX4eb6O1aSduTrUlU11rZtT9Y3vuzn9Sfv/yHOTwAwI2zAADADJ5xybfzcZ/9cO2/+nHq97aqqkbrdrdq79w51u1sUgpf3lfr9HSrLgaxN5H0lY62MjMbjJRq6AwDwCJTlQHlnXopRMUZZlygGrzTraTjYLedSWes0HO7Vtm3HajTaqyzraTDYpac+7Zv1rS//XzrjlOdwjgKAw4yNFwAOs5/8r++LV17xb1KMCiHIWqsYo3yolWf9NuPKyKiqxnIukYyRrysZY2WdkyTFEGb8lQAAsP4YYyRjFLxXiF6JS9vrcJZ2FRXl61JJ2lFZDuVsImOtgvcyxshYq697wQ/rn/7hNZylAOAwYtMFgMPkNa87L174mT/V4uJXZY2jCTsAAOtQjFExBi0sHKNvffmr9Ae/951c0AHgMGCzBYDH2AmnXBsvueivdNONn5W1Tt3eVlXViAwqAADWIWud0rSr4WivYvB6+jO+TS992S/o9FOezdkKAB5DbLIA8Bj6uV/463jJRf9HUlOyMO2zUZYjpWlnxqsDAAAHq64LpVlXxlgFX0tqsrJe9s2/oL/+q5/jfAUAjxE2WAB4DLz57ZfFz1zwx7rn7qvVn9uhYrykJO2oKkeq60JbtjxRo9HeWS8TAAAcpG53q/btu6uZWph2VFdj5Z15DZZ36fFPeJ5e/u2/one948WcswDgEGNjBYBD7Md+8t3x6is/JqkZ1T0c7lGnsyDvq8m0I6divKQs6894pQAA4GBNpxgGX8sYK+dSjUb71O9vV1WNJUnPff4P6F8+9EbOWgBwCLGpAsAh8prXnRcvuvADGg73qK4KuSRVXRXyvtLc/NEqxkuq61Jzc0epqkbyvpr1kgEAwEGyLlGW9rS8fJ+SJFeez2l5+T45lylJcwVfy7pE8/OP00u/+Rf0vt/7Ls5cAHAIsJkCwKN08uk3xcsu/Sddd8057euMMQrBK0k7ijGoror29dY6leVQadqd1ZIBAMAjVJZD5XlfftL/SpKSNJcxVlU5UpJkqutSSZLJ+1rPee736iXf+NM6+e1P5ewFAI8CmygAPAr/61f/NV580V+pqkZN2UCMSrNuU1ZgbVteYIyRMba92c2ynqpqNOPVAwCAg5WmHZXlUFKTjaUYFWNUjEHWuvbtYozyvlKadtTpbNFLvvGn9Rd/+uOcvwDgEWIDBYBH4KTTbowXnPf72rPndg0Gu5qygckzrjEGJUmmEPyslwkAAA4za53qupQxtr038L5Uv79D27Ydq+/4rt/QaSc9g3MYABwkNk4AOEi/8msfjRd/7n/L+1JFMZD3pZzL5FyiqKgYwqyXCAAAZsxYKyMj7+v2XiHP+3Iu08u+5Rf1J3/4/3AWA4CDwKYJAA/TGWfdGS+68C917TXnrOlvYaxtg1bGWilGeV+vKSMAAACbQwheziWSMWvuD2II7b1DXZd6znO/V9/8rb+kE97yJM5kAPAwsFkCwMPwa689J1580V9qeek+heCVph3VdSmXpE1vq0np4LTfVQhBxrDFAgCw2cQYZa1t+2IZY+WSTDEG+bpSkmSqqrGsdZqbP1ov++Zf0h/+wfdy0wAAXwMbJQB8Dd/3A2+N9957o5YW71GW91VXhdK0I+8rSc2NqhQnb21krZWxTmHVdCIAALA5WJcoBq8QglbfH0yf2HIuVVWNlaS5ymKg+YXH63GPe4Y+8R/v5GwGAA+BTRIAHsTr3vjZ+NnP/Kn27b2zffa0GC8pSXJJaqcMSk3D1gOVCgAAgM3lQK0FpoNdmuBW8291XSjvzLdZ3Fu2Pknf9vJX6fd+99s4owHAAbA5AsAB/Jf/9kfxK5f/c/v3ELy8r5R35mVkVNdF+wxrUyrg2rdrMrJECSEAAJvQ6vuA1fcHxpg2QztJckVFFeMlOZeu6Zv5n174Y/rHv381NxEAsB82RgBY5c1vvyx+7rN/rrvvvlrOJm0/q5VmrF5VVci5VNJKkCrG2NyYrvo7AADYnFbfD0zvEaZ/lyTvK6VpLmPdquEvK32zHv+E5+lbvvWXddaZL+S8BgATbIgAMPEL/+P/i5dd+kEVxRLlfwAAYGaMtcrzeb3oxT+lv/rAT3NmAwARwAIAnXjKdfGSi/9Kd991lQaDXZKkTneLfF3OeGUAAGCzcUmm8WifJKnf36EnPPH5eunLfkGnn/Jszm4ANjU2QQCb2m+8/oL4mU//kUajfaqrQsYY5fmcynI466UBAIBNKst6KoplxRiVpLm63S16+be/Wr//nu/g/AZg02IDBLBp/czPfSBe9qV/lNQ0V7UuUYxN6WBZDJSm3VkuDwAAbEJVNVKW9yVJxjQTj6dN3l/0kv+iv/ub/8EZDsCmxOYHYNM5+fSb4wWf+gPdccflSlyqshwpz/srI66tU1SkDxYAADjsjLUyMmvuS4pioCzrqvaVjj32Rfr2V/y6Tj3x6ZzlAGwqbHoANpU3vOni+ImPv1OD5ftlXaos60kxKoRata/kbLJm5DUAAMDhtPo+xIdaiUtlbTMNuSyHCr5Wr7dNP/BDJ+p33/VNnOcAbBpseAA2jZ/66T+Ml37xH+RcqiTNJUl1VSjGIGNsO+LaWKu6LuVsMsvlAgCATciHWkmStZngMcb2XiVJc1ljNS6WZWT09S/6cf3TP7yGMx2ATYHNDsCG97YTr4yf+fQf6f77b1ZdFUrSXFU1ljVWzqVN/6tJ2aCvKyVpLl9XbUALAADgcIkxyiWp6qqQS9K2nNBaJ+8rxRjbLC1jrY466ul6xXf9hs445TncuADY0NjkAGxor/nNc+NnLvhjVdVI4/Gi0qyruiqUZl0FX896eQAAAAfFukRVOWqekCtH6nQWlKZdvfw7flXve+93c74DsGGxwQHYsH76Z/40fuHz/1dJkikErzTryrlUy0v3Ke/M0aQdAACsO8ZaFeNlzc0fLe8rVeVI1jrVdalv/Kaf1f/3d6/ijAdgQ2JzA7DhnHz6TfHT579fd991pYx1isGrrkulaUdFMVCS5HJJSgYWAABYd6xL5OtKdV0oz/uqqrGSJGvveR7/hOfrO77zNUwpBLDhsKkB2FBe/6aL4qc/9T4tL9+n8XhJW7Y+SYPl+5Ukmeq6VLe3VXU1VlWN5Vw66+UCAAAcFO8rpWlHSdrRaLi3vcfpzx2lfXvvVJ7PaX7hGH3HK16jd//2yzjvAdgw2NAAbBi/8D/+Pn7hkr9VUQ5kjVOnM6/l5fvU622TZFQUy4qKssYpy7qqqvGslwwAAHBQ0rSjshwpRC8jozyfkxQ1HO7R3NzRGo8XFWNUnvf1km/8Gf2fv/wZznwANgQ2MwAbwo/82LviVVd8RM5l6nQXVIyXVFVj5XlfRTGQtU1Aq6rGbfNTMrAAAMB6433VDqNJ047G4yWF4Nt7njTtqNNZ0Hi8qKoa6+v+0w/r7H9+M+c+AOseGxmAde3k02+Kn/iPd2px392q60LOpRqN9ilNu8rzvspyKGudnMu0vHyfOp15hRDogQUAANalaQ8sa63G4yXNzR0t70uF4JVlPRXFsqpqPGmbUChJc23d8iR97w+8VaeeeDznPwDrFhsYgHXrta8/P1504Qe0Z8/tSlwqaxN5X8lYK2unWVaJal/J2URp2lVdjxVCUIxB1rpZfwkAAAAHJQQvY6ystUqSjqpqJB9qJS6V93WTnRVqKcb23igEr23bj9XLvvkX9Qe/952cAQGsS2xeANal//5Lfxcv/txfznoZAAAA68rLvuWX6IsFYF1i4wKw7vz4T74nXnXlv896GQAAAOvS173glfrQB3+TsyCAdYVNC8C6cfLpN8eLLvwL3XTjZ5VmHcUQZr0kAACAdcVYq7oq9PRnvFwv+5Zf1KknPp0zIYB1gc0KwLpw0mk3xo9/7Azt3XOHJMlapxD8jFcFAACwvkzvoYwxWtjyRP3AD52o0056BudCAEc8NioAR7w3v/2yeM7Hz9K+vXfLuUQuyRSDV4xx1ksDAABYd5xL5X2lui61ZesT9H0/8DaddcbXczYEcERjkwJwRPvVX/9Y/Oxn/kRlMVCS5IqKKouBYoxKkmzWywMAAFhX6rqUtU5Z1pv8vVCez+lbv/1X9Mfv+wHOhwCOWGxQAI5Yv/A//j5edOEH5EOtGLx6/e0aLO+Sc6k6nXmV5XDWSwQAAFhX0rSrshzI+6q9t0qSTNY6vexbfkl/9YH/xhkRwBGJzQnAEemVP3JGvOH68+VDrTTtyNlEg8EudToLkjGqypGcS2e9TAAAgHXF+6rNvhqN9qrf36EQg6pyJGudnvmsV+gjZ5/AORHAEYeNCcAR5YRTro1fuORvtfPmz8kYO+vlAAAAbCoxBj3t+G/RN770/9UZpzyH8yKAIwYbEoAjxttOuip+7rN/prvuvFLGsD0BAADMQoxRT3zS1+lbvu1/6R2nPZ+bMgBHBDYjAEeEt554RfzIv75dRbHcTBmMQTGEWS8LAABgUzHWyhgrX5fK8zm98kfP1DtPfwHnRgAzx0YEYOZe9eqPxE+f/z45l67pwQAAAIDDLwSvNOvKGivvK337K16jP/2jV3J2BDBTbEIAZuqX/ucH40UX/oWMdarKkSTJGKMkyeV9NePVAQAAbC7OparrQjFGSVKadRWD1zd/6y/rL//8pzg/ApgZNiAAM/MTP/XeePllH1K3u0Xj8ZKsTZRlPZXlUFKkiTsAAMBhFmOQZNp7shBqdTrzGo326YUv+gl96IO/yRkSwEyw+QCYiR985Slx500Xyhirqi5kjVWSdhR8paoaK8/nyMACAAA4zJxLVRTLStOOrEtVV2OFGJQmeTuh8GMfPZVzJIDDjo0HwGF12jtui5869726/bYvyVrXNGwPXsY6+bpsel8ZQwN3AACAGTHWSjEqBP+Ae7UQvI59ykv0nd/9Op30tmM5TwI4bNhwABw2J5xybfzUub+n3btukdQ0CAUAAMD6MR20s33HU/Wd3/06nXHKczhTAjgsaDAD4LA4+fSb4rnn/K52775V3teq6mLWSwIAAMBBqupC3tfavftWnXvO7+rk02+Ks14TgM2BABaAx9yJp1wXP/6xM7V71y0aDfcoy7pKXDrrZQEAAOAgJS5VlnU1Gu7R7l236OMfO1MnnnIdQSwAjznSPQE8pt5ywpfjJz/x29q961alaUfOpYoxyPuKKYMAAADrTIxBzqUyxspPhu9s33Gcvuf73qSzzvh6zpcAHjOcHgE8Zt5+8tXxkx9/lxb33a28M9eOY46KIn4OAACwHhlFRZXlUFnWU96Z0+K+u/XJj79Lbz/5ajKxADxmCGABeEy8+W2XxrP/5a1aXPyqQvCyxmk0XpT3pYyxSpJs1ksEAADAQUqSbJJ9VWo0XpQ1TiF4LS5+VWf/y1v1lrdfThALwGOCFAgAh9xrX39+PP/c96qqx/J1qSTtqK7GTfmgYnPTU5eUEAIAAKwzMQa5JFOMQUZG3lcr93pJpjTp6BXf9Rv6g9/7Ts6aAA4pTo8ADqnXvu5T8YJPvU/j8VIbpAq+UohBMQZZm6gshnI0cQcAAFh3nEtVFkNZmyjGoBCDwqS3qa9LjUb7dMH579dvvP4CMrEAHFJExQEcMr/y6/8eP/XJ9yjGKOcSheBnvSQAAAAcRtY2JYUxBn3fD75d73/vd3PmBHBIkIEF4JD49d88N55/3nuVZT05l6iqxrNeEgAAAA6zqhrLukRZ1td5n3y3XvOb55KJBeCQIBoO4FH7+V/82/jp89+vTmdeZTlSnvflJ6nkAAAA2DxiDHIuVTXpf1qWQ33Hd75Gf/WB/8bZE8CjwiYC4FH5rz/zJ/Haa87ReLRPWdZTUQxkjFGadsjCAgAA2GSm94DGWlmbKIRa/d52PfX4b9aH/vE3OH8CeMRIjwDwiP3sz/9lvPrKf9ee3bfJWqfxeElSlLFWw+GeWS8PAAAAh9lwuEfGWilGjUeLssZpz57bddWVH9XP/8LfUE4I4BEjgAXgEfmZn/tAvOjCv1RZDtXpzMv7Wr3eNlXVSMZY9eeOmvUSAQAAcJjNzR0ta5zKcqi5uaNU16XStKvga33uwr/Qz/zcBwhiAXhESOEEcNB+6qf/MF75lbMlYxSDV5J0NBrtkxTV7+9QUSyrqsZK086slwoAAIDDqK5LJUmmLO9rNNyrGKM6nXnFGBRjkCS94Ot/VP/496/mLArgoJCBBeCg/K9f/dd45VfOVoxBvi5VVWP5UCnLurI20Xi82PbAAgAAwOaSZh1Z6zQa7lWSZEqzjuq6UAi1qmqsGIOu+PK/6n/96r+SiQXgoBD1BvCw/fKrPhQ/c8Efz3oZAAAA2ABe/h2/qr/405/gTArgYSEDC8DD8suv+nD83Gf/QpLWpIADAAAAD9fq+8jPffYv9Muv+jCZWAAeFgJYAL6m177+/HjRhR9QXZeq60JJksu5dNbLAgAAwDrjXKokyVXXheq61EUXfkCvff35BLEAfE0EsAA8pNf91oXxo2efpBC9sqyrJMkVQq26Lme9NAAAAKwzdV0qhFpJkivLugrR66Nnn6TX/daFBLEAPCQCWAAe1FtO+HL8+MfOVN6ZU1kMJUk+1JIxstbNeHUAAABYb6x1kjHNPaWkshgq78zp4x87U2854csEsQA8KAJYAA7o7SdfE//lQ2+UkZGfZFuNi2UpRilGuSSb8QoBAACw3rgka+8nx8WyJMnXpYyM/uVDb9QJp1xLEAvAARHAAvAAv/WWL8aPnn2ivK/lXKq6LpR35pRlPSVpLhmjshzOepkAAABYZ8pyKBmjJM2VZT3lnTnVdSHnUnlf69/+9e1609suJYgF4AEIYAFY48RTr4/nffJ3NRrtVZp1tXfvHer1tqmuxiqLgSQphqCEJu4AAAA4SIlLFUMzhbAsBqqrsXq9bdq79w6lWVej4R596pPv0dtOuoogFoA1zKwXAODIccIp18ZP/Mc7tWf3bfS4AgAAwGFnrFXwtbZue7K+9/vfqjNPfS5nVgCSyMACMHHqmbfGT37it7V3z+3yvlSS5LNeEgAAADYZZ5v2FXv33Klzz/kdnXrmrWRiAZBEAAuApJNOuzF+8hPv0r1fvV6S1O1uVVWNZrwqAAAAbDZlOVSnu0WSdN+9N+rcc35HJ59+E0EsAASwgM3ubSdeGT/+sTO1e9etStOOYoxKklwh+FkvDQAAAJtMCF5p0lGMQWmaa/euW/Qf/36G3nbilQSxgE0umfUCAMzW5y/5Gw2W71dVjZRlPVXVWMvL9ynLegSxAAAAcFhleU/Ly/crSTI5l6mYDBH6/CV/M+OVAZg1MrCATewHX3lKvOuuK1SWAzmXqiyHbQZWFE9yAQAA4DCLUUmSKcagshzKuURFMdBdd12h/+eHT+MGFdjECGABm9TP/+Lfxttu+YLKciipSdf2vlaS5jLGqK6KGa8QAAAAm01VjWWMUZJ2FIJXjFHGGJXlULfsvET//Rf/L0EsYJMigAVsQr/8qg/HL37+/6qqxnI2kUuypt9AmsvXpUIISrPurJcJAACATSZNOwohyNelsqyrGIOSJJezicpyqC98/m/1P3/lnwliAZsQASxgk3n9my6Kn7ngjxSilzFGkhR8LWudYmzuBYwxCr6e5TIBAACwCYWw6h41eBlj5X0lSbLWKUSvT5//h3r9my4iiAVsMgSwgE3kLW+/PJ53zrtlrJW1zHAAAADA+mJtImOtzjvn3XrL2y8niAVsIgSwgE3i1DNvjRec/37t23eXfF3R4woAAADrTl0V8nWlffvu0gXnv1+nnnkrQSxgkyCABWwCp7/zjvipc9+je796nRYWHq8877ep2QAAAMB6YYxRnve1sPB43fvV6/Spc9+j0995B0EsYBOghgjYBC7+3P/WPfdcozTtqCiWVFWFjLVylBECAABgHfGhVj1aVJrmStOO7rnnGl38uf8962UBOAzIwAI2uP/6M38Sb7rpMzIyqqqxvK81N3eUkiSb9dIAAACAg5IkmebmjpL3tapqLCOjm276jP7rz/wJWVjABkcAC9jAfu2158QvXPK3MjJK0o5C8MqynkajvfJ1NevlAQAAAAfF15VGo73Ksp5C8ErSjoyMvnDJ3+rXXnsOQSxgAyOABWxQb3jTxfH8896rLOtKxmiwfL+6va0KoVaIQWnWnfUSAQAAgIOSZl2FGBRCrW5vqwbL90vGKMu6Ov+89+oNb76EIBawQdHFGdiA3nriFfEjZ5+gshjMeikAAADAYZPlfb3yR87QO09/AWddYIMhAwvYYE45Y2c875PvVjFenvVSAAAAgMOqGC/rvE++W6ecsZNMLGCDIYAFbCAnnXZj/PT5f6j777uJJu0AAADYdJIk0/333aRPn/+HOum0GwliARsIASxgA7n0i/+gO++4XL3+do1G+2a9HAAAAOCwGo32qdffrjvvuFyXfvEfZr0cAIcQASxgg/jpn/2zeNttX5T3lYrxsjrdhVkvCQAAADisOt0FFeNleV/pttu+qJ/+2T8jCwvYIAhgARvA637rwnjlV87WYHlXO10w+HrGqwIAAAAOr+k9cJp1NVjepSu/crZe91sXEsQCNgACWMA6d8oZO+MF5/2+ynKobndBZTGUtVbGMHgFAAAAm4sxRtZalcXk3rgc6oLzfp+m7sAGQAALWOfOP+/3NRovSpLG4yV1u1sUY1SMXKMBAACwuUzvg7vdLRqPlyRJo/Gizj/v92e8MgCPFgEsYB37kR97V9y96xaVxUAuyWRtorIcyiWZQvCzXh4AAABwWMUYZa1TUSzLuVRp2tV4tKj777tJP/rjv80zvMA6RgALWKd+5dc+Gm+95fMaDHbLuUzOpm3ZYIyBEkIAAABsOiHUMtbJWqcYgyQpy3oaF0vaefNF+tXX/AdBLGCdIoAFrENvfMsX4uc+++daXrpP1jq5JJX3pbyvmgv15JknAAAAYDNxLm3/3/tK3pdKklzWOC0v3avPfebP9IY3X0IQC1iHCGAB68xp77g9fvr892k8XlSWdZVlPSlG1XUpY6ycSxTFNRkAAACbj7VOvi4VY1SS5AohqK4LuSRVp7Og0WifPnPBH+q0d9zODTOwziSzXgCAg/P5i/9au+6/RVneU/C1YgwKwcsYqyTN22CWJMoIAQAAsKmE4BWCV5Jkci5VVY3lQz3pjWXlklS77r9Fn7/4r2e9VAAHiQwsYB3577/0d/Hmmz6rJMkUJxfnZtqgkTFGMXh5X0mKso4SQgAAAGw+1jpFRdV10WRiuVTWWtV1qeBrpVlHN930Gf38L/4tWVjAOkIAC1gnfuutX4qXfekfNRjsUpp2FGOUc0nTA8s1yZR1XbbZWEZkXwEAAGDzMdYqeK+qKiRFWZvI2kTOpQrBK027Gizv0qVf/Ae9+e2XEcQC1glOuMA6cNKpN8R//vAbVRYDOZdO+l0ZheBlV01ZCSG0mVdVOVaSZDNeOQAAAHD4TO+Pp6xLFHzdPsnbBLSczKRXVre3TT/6Y+/SaSc9g7MxcIQjAwtYB8479z2q60LWJaqqcdPrSmovztNSwqaMMCiGQPAKAAAAm87+k7iDr9vXG2OavrFJrroqZK1TWSzrgvN+fxZLBXCQCGABR7gf/8n3xLvu/IrStKtivCznEpXl8AEXZwAAAAAPzVqncdHcU1fVWGnW0223fUk//pPvoZQQOMIRwAKOYK969UfiDTdcoLwzr+Fwj7KsKxkjZxkgCgAAABw0Y2RNcwzO8zmNR/uUZT1df915evVrPk4QCziCEcACjlBvfvtl8YLz/0DDwR7VVaE07aiqikkTSqeqGs96iQAAAMC6UpUjWZfIurRpzZHk8r7ScLhX55/3Xpq6A0cwAljAEejUM2+NF3zqfep2tirGoDzvSzEqTXOV5VCa1O8DAAAAOAjGyNqVlhwhenV7W2WMVZr1dMGn3qdTz7yVIBZwBKIOCTgCfeXL/6Klxa9qNNqnbneLimLQTBt0iYyvFfebrgIAAADga7PGKQYvo2boYPC1yjBQr7dV+/beoboa6ytf/pfZLhLAAZHCARxhXvu6T8WrrvyoimJZed6XD5VC8PKhljWueaYoeBnLwxcAAAA4GNY5eV/LWieXZAoxyPtKdV2o092ioljWVVd+VK99/flkYQFHGE7AwBHkpFNviJdc/H/k60pJmstPxv7meV9JkqkoB7KOxEkAAADgkTAyCrGpZqirQmmSK0kyheAnLTs68nWlSy76PzrptBsJYgFHEE7CwBHky5d/WLt23SJrrIyxMiYohiCvIElyNlHwtYyxiiHMeLUAAADA+hKCb+6pg5cxpglcTcQYFWPz+j27b9Xll/7TDFcKYH9kYAFHiF/59X+PV17xUaVJrizrq66KWS8JAAAA2FSMtUqSXJLR1Vf/h179mo+ThQUcIQhgAUeAU8+8JV702b9QkmSKiqqqkaK4VgIAAACHk68rhejlXCJrrD77mT9hKiFwhCCABRwBPvEf79RotE8xRilGheCVpd1ZLwsAAADYVJxLFEOQtU23nfFon84953dmvCoAEgEsYOZ+5uc+EHfdf7OMMUrSXLWvFGMgAwsAAAA4zKxLVVUjjcdL6nQWlCS5vnrPtfrpn/0zbs6BGSOABczQG950cbzmqo/L+1rOpe0klG53i6pyNOvlAQAAAJtKVY7U621XmuZNhYSivK907TXn6I1v+QJBLGCGCGABM3LGWXfFL33x77W09FXVdSEZIynK+1pFMZBz6ayXCAAAAGw6tW+GKXlfKfhaMQaNhnv0hYv/WmecdRdBLGBGCGABM3LZpR/UXXdeIedSzc0frbIYyBgr65ykKGN5eAIAAACHU5Jk7TTwPO8rxqhud6t8qHX33Vfrsks/OOMVApsXJ2RgBt7wpovjlV/5NxnTPATLVRlXMQQZYxVDmOUSAQAAgE0nBC/nUsXJYCVjjKpqJGcTGWN0xZfP1hvedDFZWMAMEMACDrNTz7w1nvvJdyvL+7NeCgAAAICDkOd9nffJ9+i0d9xGEAs4zJJZLwDYbL582Ye0vHSvYgxKknzWywEAAADwMA0Gu2Vdossv+9CslwJsOmRgAYfRa37z3Hj5ZR9Sns+RgQUAAACsM3neVyef0+WXfki//pvnkoUFHEYEsIDD5K0nfCV++vw/VJb1NB4vKfh61ksCAAAAcBC8rzUeLynLe/r0+e/XW074MkEs4DAhgAUcJpdd9k8qy4GMdYoxKEaudQAAAMD6EhVjkDVOZTnQ5Zf+06wXBGwaBLCAw+BVr/5IvGXnxfK+kq9L5Z05pWln1ssCAAAAcBDStKs8n1Ndl/J1pVtuuUS/8msf5Zlp4DAggAU8xk469YZ42aUfVAxB1jpJRsHXqqrRrJcGAAAA4CCU5VDeVzLGyFqnGIIuu/SDOunUGwhiAY8xAljAY+zKK/5Ne/fcLkkyxipEL+dSheBnvDIAwMNljFl5sXbt31e9POT7PcTHAACsHy7JFIKfPDkt7dl9m6644uwZrwrY+AhgAY+h177uU/HLl/+LjLGyLpH3tbK0q/F4UWnWnfXyAAAPYv+AU4xx5SUEhVUvq/9tf6v/bc377Pd+XysQBgA4MiRJptFwr5I0l/e1rEtkrdMVXz5br339+WRhAY8hAljAY+TUM2+Jl1/2IeV5X86lGo/2Ke/MqSiWlXfm5etq1ksEADyINQGrVYGp6d+tte1Lm1H1UC/GrHmfB/u4DxYIAwAcGbyv1OnMqxgvK+/MaTxalHWpsryvL1/6IZ1yxk42ceAxksx6AcBGdcP1F+iWnRer398haxM5l6ksBkqSXEZGUpTEs+wAsJ6szsha4yCDTtMgFgBgvTEy1ilNOyqLgZxLJUkh1Lr55s/p2Bu+YcbrAzYuMrCAx8Cb33Zp/PLlH9aOHcerKAbyvlSadVXXhVySqSgGbc08AODI86C9qyblfY+k3O+hPgYlhACwPljn2iel67pQmnXl61JlMdCOo47Xly//sN78tkt5hgJ4DJCBBTwGvvD5/6uyGGipuEe93nbFGOTrUkmSqypHSpKMZ94B4Aj2YHv09PWPJMi0f8ngI/04AIDZCb4ZyFSUTRDL16WcS9XpbtHePber05nXFz7/d7NeJrAhkYEFHGKvevW/xbvuukKSNDd3tIbDPXIulbVOdV0oSTKyrwBgHVk9OdC5RM498Pm/NdMF9+t9daAg1fTjPNTbAACOTMZaJUmmui5kXdMqZDTcq7m5oyVJd991hV716n/j2WrgEONuCTiETjjl2vjRs0/SaLSnmUpinYwxCiEoSTKV1UhpMplYQv8TADhiGWMkY5opssZN9nMrY2z7ekkyMjLWNL0NzcqfkqQYFRXbP2OY/F1SjKF5fQyKMSgErxD9qtdzfQCAI5GxVjEEWZeorgqlaUd1XciY6b19lHWJet2t+qEfPk1nnPIcztzAIUIJIXAIXfalf9R4vE8yRi5J2zHpxhh5X8nZRCH4AzcABoANappdNN339i+fM9bKyEyCPE1AZ3Wm6ur9sslYsgq+flifq33d9HNNnrvL8/kmIGWNrE2aYRs2kZk88ZC4bPrOKx98un7Ftmnv2s/1YPv6Ss+rKe+rdi0H+hy1L5uJhMHLh1ph8hJDE/QqiqV2LdP3e8DXrAcvhbQuaYJnITzgfSRNrlX2AT+b1R9zdS+vh/pcALCRTPfCMHmy2vtq5UkNYyQZKUaNRvt02Zc+OMOVAhsP0WDgEHnt6z4VP3nO7yiEWr6u5FzCzTyATW1NWdw0O2ny/4pRITQZRyE2hwFrXFuGF3zdZD9Zt9/brzy73dp/rzVGnXyheX/n5Fwq5zI51wSqpgeNB12rmgBT83q7kl21X4Dn0XhAgG6apTX5XqwOkLVvs58mc6uW97W8L+V9peCb7+m4WDzg96Vdv68lNV/TA7/HTWbB9EmYEJuv1U4y0Fa/vaQ2y+yh1goAm4kP9aRtSKLv+b436Q/e8wrO3cAhwAMJOAROf+cd8SNnn6DFfXcrBD/pd1XS6wrApnWgrKvVAaA1AZxpmV2bRRTXBJlWZ/wY25T0hehljVOS5ErSXGnabf7fZSvZRfsHUh4koDN9xrx95lxSnvfXlAQamf3Wn6wJCB0wm2rV54yrs7NiVAj1qr+uLTVUjCqKwcp3Z/I9ab+ehwhMrazPKfhatS9V14WqaqS6KlTXRfu9C9G3QaqV78P0U4T2e9KWU+rAAbzVP1uysQBsdiF4JUnWtAxxTlu2PFGv/JEzdOJbn8zZG3iUKCEEDoGvfPlftXfPHQrByyXNM/11Xc56WQAwUwcqaZsqy5GsnfSWstPeUlFmVSmcmfagsomcS5WmHSVpR85lyrLug36+4GuFGJqMIdu8v7FOblUfqyYTy7R/n5YOTgNW0wysyQd+wNez+vWSFM0DX/dgb9t8bSsBPGsfGPzqdLesyspqSgmn/bLiJAA2/bsPXjH4SYnhJKMtRskYJUmuNO2o293ygO+/96XqaqyqGjfZW+3HjJPvy0rgKqrJzpq+JEm26mtZHfiKD/hZA8BmYoyRc5miouq61J7dt+srX/7XWS8L2BC4wwAepTe//bL4b//yNsVJxkAxXlaW91RXBRlYADa91f2nVrN22oPJK4SgEL2MTBvU6va2ytl0ErBK1gR8ptlI03K2ZtJrImutzKQMMUlyrb7N2T+oYqb78/4ZUm3wzK68Pu6fBRVXgkRrV3Xg78H+t1vGyBqr1Vlf+2c5TUsJ9+/dNf173K+EcW1wLaqui0lG2+T7G+pJkKoJhK3ONmve38v7WnU1lg+VRsO9bbAqKk4a2U8DfXZNBtmqD0LmFYBNLwSvJM1VFkPleX+y51r9yH9+p84684Wcv4FHgQws4FH6/MV/004eaUfqTiaSrHkGHwA2kTWlZA8IAElVGMu5REmSK8vySXZVV1nWlAJOy7CbwJRrP9Y0sNNkYJl2OmDzNmbV5w3tOlYmB64EiKpq1H68tS+T9VVjTZuyHygos7aP1oO/3ervxdqAUXjIt0vTzpr1r30xStPu5DNPgnnt19Ksof33acBt2m8seElRZTlqv47p5w3BK2Q9heC1ZcsTVdeFynKkuhqpqsaq66YEcTpld2XNK993SggBbHZp2lFVjeVcOslsjYqx0ucv+ZtZLw1Y94gAA4/Cq179kXjOx89S3plTMV5S3pmX1BwIynIoZ4kRA9ic9p+22vSvcpNMHqdef4ecTeSSdE0wyKjpc7U6w6opIUzkXKYkyZv+TtMAVfPBJ+V2WtNHqimvqxV8pdpXCr5aKS9cnSG7uhRwEoyy1q3tObVfv6wHnzj4sL9DekBfq1WfY9pjak321n5N5K2xsi6RdakSl8q6tJmkOA3Ytf279vseqWnIHoKfBKRKeT+ddLiSoRVDWJNVFmOQryv5UGs42NUEvKKflDeu/VkTwAKwWXlfKZtkXklSMV6enBWW9b3f/xb96R+9kjM48Ajx4AEeoZNOuzF+5Oy3a7C8qy1XGY+XFGNUnvfJvgIAScZaOZsqTbvK8p6yrCfnsjYAszooY22iJMnkkkyJy9pyNTMNvkyDU5qOMY9tVpH3VdvH6UATAvfPglqdobX69WsziB4YYNo/w2htaeKD3VY9cELf/hlqB24ovzqTKe73/vaAr19tJfiXTsos3eT9miBhs+KV8sU2Iy141b6Ur0vVdbm2XDDGNgDofamyHKoshqqqkXyo2vHyALBZxRjlklRlMZSxVp18XrUvFENQv79dP/yfz9KpJx7PORx4BEgPAR6hm2+6UIPlXZKaC9U0VVgSwSsA69b+E/+MsU2QaHVj9EnwpO1vdYDeR3k+pyzrKe/Mt+Vwq4Mb075V0zLC6d+nGUOrP1oIXsHX8qHJovLBy9fFg34ND91E/ECBp5XX7/91tG+3fw+tA36Or5119IBeXAfsEfbgvaRW3v9B1rn6o8Qwya564FARl+Ry1k2ytlJZl6yUKDqr3KWKWb+dmOh91ZYPmkmzd2dTdbtb1ettl9RcB4vxkspyqKJYPvDXuep3JcbQ/k5NP38TQDvwZEQAWA+MMQq+boddVNWo/bfBYLduuvEzs1oasO5xVwA8Aieeen38p398rYI/QBNbAFinVgdTjEzbxNsY2zRSt25V4/WVsjFrnVySKc/m1OnMK1nVv0lamUxnbdL0ukrySZP1tb2kpj2cpoGXaXbV9EX7lbPhkVvbw2ulef40S8u5rM1+2/9nJKnth9UEtao10webtzGqq7HG4yUV5bJ8Xa6URZpJ77LJ54qhaSAfJ5ld1ro1TfUpRwSwkbgk04/9xO/qzFOfx1kcOEhkYAGPwOWXfeiBU6UAYB05UJ+itpxNkqydBBmsYgiq63LyfnYy7c8qyzrK8r7ybE4uWQl4xBjbXlUrL0lbztb2sIrT5uJ+Vfnf2qbqa4NX06bt7L+P1jRYuP/31rZlm+P2Zz39uZlJ/zIZozyfU5r1moy4VaWb00BUXRdKs66StKN+3CFflyrKZZXFYNIgX/J11QbE7CQbzMg0jekfohSRHlsA1rMYg6668t9nvQxgXeIOEDhIb3zz5+NH/u0E1XVJk3YAG5b3VRNscs0+N23U7Vwql2Samzt6VZP11YEPN+l71QQk0qSzErRa1atqWlIR1mR0hbYJ+5oyxTW3KwQuDq2139vV5X1tE3hj24wpO/m5ZFlvbUAyeNV1qdoXTbZVWwroH5BJF2PQ8vJ98nUp76u2wb+kplR08rsHABtRjFEhev3ET/2e3nXmiziPAweB0zdwkC679INNv5DU0esKwLq1ptfVATKasrwvX5dNfz+bKMv76na3KM/nlCT5flPnmh5GaZIrTbtNts4kc8uHWlU1bvtX1XW1tin4qt5T0xLGpnyxXmk4vqpheZyUlJGF9ehMv4erA4RNNlSclPIlWvnZBIUQpVDLT962rou2h9nqPlp5Mifbdc3PfhKorOpCxteydiWrqtOZV10XKopljUb7VBYD+VC3v2vhANfXuKqckJ8/gPXKOqdutkUXX/iXs14KsO5w9QcOwq/++sfiOZ94l7K0q/F4UWnanfWSAOAR2X/K3YFKsrKsp25vq7rdLUqSjqTYZlBNe1mlaVMmZo1tS7+m5X/Txt91XTaZOKvKwpqMmwNlUx24STkOt4f6OZiVHmQxTpr9OyVJ1jbkbxvCW9sEJGNQXY1VVSPVddEOPmkyrYzqeqzRaJ9Gw70qy+EDP+OaKY0H/n0FgPWgrsu2wfsrvus39ad/9ErO5MDDxIMFeJhOPv2m+MlP/LYWF+/R8tK96vePWjNVBADWE2Nt2yA7xrim15G1ieYXHidrV02Gi0HOpcqyvrKs1zTgnpSYtVMKQ/MSY1QxXpp8opVbjWm2jzGmbei9xqqghHVJ29C9ff2ajCECGI9O8z1c0/dsUi44naC18qYPvF20k5K/aSBr9ceJiup0FtrG/dYm7ZTBaYloDF5lOVRZDiZlhKsmXoZaS4v3ttMPp73R2owxYx6yRxYAHMnStKPRaJ/yzry2b3+Kvuf73qxTTnga53LgYaCEEHiYbr3l87r/vpsUY1DemVdZDvab4gQA68fqAIW1TmnWU57PNc250047fdDapMmsSTtKXNYEM2JsMq5ilK/LJsvKl/J12fTKmvSwmk6wa7Jl4qo/deCglJGmganVAS5jm712pYSMEsJHa/UUx7Xf36AYV163OhNrTZBq0gReUvtzbn9+MWo8XpRR09vKJZkSt5KdZY1VMFF5Z155Pqfal6qrseq6VAi1rE20bfuxqqqximJZRbGsqhxO+mdNVsX1F8A6VVVjJUmuuip037036padF896ScC6wd0f8DCcdOoN8SNnv13D0V5Zm2g03Kss6816WQA2MeuStvm5pLZca5pV5VzalPuFWtasndxnrFVdl8rSrjrdBXXyBSVp3mbVNB/PKU1zpWmvLXVoptY1U+aKYtA2524ada/uTUSGFFZleGka5Fpp9p/nc6uawze/t95XKsuh6rpY0yctBK+6KjQuFjUeLaqsRkqTfE0QbRp8s5OAma/LNdlaq6cdGuvWZpgBwGFkjFFRDNTtbVUMXt3eVr3yR87UaSc9g7M58DWQgQU8DFdccbaGwz2qqrFiDOp0F2SMlZ+MlQeAw60qRyulWZOeRM1BvclOqif7UzIpCYyK7aE9hqDt25/S9K9K8iZLahIIS5KOkjRXlvXbzxWCbzOsfKjbt13J2CFYhYfW/I4EhSAZEzQa7ZtMq0xWMrNcqm53i6KkshyorgrV9VhGRlneV5p11e1uVVWNtG/vXe3Hnj4GpqWGdVVMylRXyg6tTSePAa9Ql0w5BDAz1qXqdBc0Hu1rrr+KuvIrZ896WcC6QJQX+BreeuIV8SNnn6CqHMoYqzTrydelxuNFJUk+6+UBgKSVptbWNr2EVpfgTf8tTTvqzx2lXm/bpLSveRvnMmVZT0naaYJhakoEva9V+6IJXE16EcUQ2hLBAyEDC421GVj7izG0fa+sdXIuVZLkSpImEzDE0P4u1tVYZTmU901Q1hinGIOGw90aLO+a9KNcmabZZCAmkwzBMHkfbnkBHBnqulSnM68kyVVWQ8XglWY9vfJHztA7T38BmxXwEMjAAr6Gq674qAbLuyZZClGD5fvbw94BmxADwGHgXNpmnEiTEq1JKVYIXsbaScaVUaczr/7cUep05tVMkPOqqpE6nQV1OguyLlHwlfwkM8UlmYaDXfK+lvdl8/EmDdubqXJaaaK933S4BsErrC4pXTU1sA20JmoCXEG+9vtNJkzU6+9oA6fOperPHaXga43HixqPF5vX9Y9Sv79D4/GSBsv3azxebINXTQ83I+tcm5nYfN6mr5v31WH/jgCAJGV5T1U1bp8MjzFqONitq6746KyXBhzxiPACD+E33vDp+PGPnSFnU1XVWHbaNybrqaxGcpYYMIDZmJYKTvv8tGWEqxqdz80dpbn5x8m5dNJXyCtNu8rzvjqdBXlft5kw0yDWtGl2kuST/lbNFMCmqfd+Db31wMyWB3s9NpeH9/ux6vepqS1sM7LqumiHCliXKqz6XXUu0Xi8OJliOJS1TknSkfellpfv0/LS/e3naAcJTJrLTx8f/H4CmJUQvNKsq7IYKEkyxRgn19xa3/+DJ+i97345GxTwIHhwAA/hW1/+qrh7960ajxaV5/1m1PykcTJNYAHM0rRh9bRcMAQva52yrKc062pu7ui2yboxVlnWU5b3lbim9NlY204SLKuhivGy6rqQNVbWpW154fRWwRjT9rx6YEBLmmbcEMCCdKDfg7W/K9Pfy+m0ymnQdcoYp+ArhRiUJLnyzpyytNf0tpr8DsYY5X2pohioqobtY8Aap6Xle1WVI5Xlqtdbt+YxAQCz4FyqEJt9KPhaxlqVxUCdzoK2bX+KLvzMn3IBBR4EDw7gQbzq1R+JF5z/B03ZjKSqLuRsImOtqnIs5xJugAHMzJoAkTGyNlGW9dXtLDRTUo2Rc5mSpGni7lwml2RN+V+MqqrRpGxr1B7wjWmmEDaH/LoNLtDTCofa6t5Yq3+Xpz3WrF25xsa4EqCdDh5I024T+JImpYalQqhV11XTKytGleVQo/GiynLQTDVc9TkZPABgVuJk6mqadRRDE1RPkqyZmhqDvuMVr9Gf/tEPc04HDoAHBnAAZ5x1Z/znf3qDhsM9KoplZVlPzmUqimU5lyrLehqNFykhBDBTTVaoU6ezRb3eNuX53GT6Wi3nMqVZV2nalbWu6Y0Vg6pqpKoaK6zqAdRmVklrMmJW9y9anXm1f5P41Qh4ofHQTdyn2VDTXmr7l6iaSXbg/r+X7fu7VOkkkGVtE3gNMagqh6qqsbwvm+mbMaooljUc7tF4vE/Be7IDAcxUCF6dzvzkiaSmoXtdFyrLkfK8r25vq37sJ96tE9/6ZDYrYD+cvoEDuPaaczQc7mn7xcQYVddFO3a7LIcErwA8KitlUwdmrZv0oFobSFrdrL3X267+3HYlSUcxeIVQK8t66nQWlKad5n0k1VWhuh6rqgqFUB2wB9DK31eCDg/IkmnXEb5GEIDgFR66lLQNTNnVmczxgf9+gN9LSaqrsfzkwJemuZKkI5dkbd+ssmrKB305UpJk2rLlCer3t2sw2K3RcI+MtW1z9/0fX9PH3oP5Wo9dAHgo1jqV5VBSU05YVWNJzaTgELxGw7267tpPznKJwBGLqC6wn9PecVv81w+/ScPRXnpcAXjMTINQ+x+EHxCsmjSgDr5WiEFp2lGW9TU3d9Tk352cS+SSfCUjxSXydaUQmimCta/aJtgNDt/YCKb92ZohBIlL5VzWlMwmTeP3qhqpqgv5upD3dVNKKGl5+X6V5aAZ0DJ5/9WDEB4wPXH6GSeB3HYKJwAcYtYl6nW36kd//Ld10tuewnkdWIUUEmA/N1x/vkbjxWacN1lWAB4jD3YAXp0F0hy4y8mUtVxZ1lfemVOadpQk+eTgnipNO03gyliFGNqMq9pX8pPpg0Zmv2wXYL1rgkvBN32vvHVySa7EpZK6sjZR3plXFvpt6az3lWIMmp8/WlU1r2K8rLIctFM6m35xSRvIesBnjHFNLy0AONSqaqyRWdQN158/66UARxwiusAqZ5x1V/zgP7xG49G+WS8FwAZ3oDK+/f9dkqy1SrOeOvn8JHjVlXWpgq8m2VhzkzHcQVU1bntqxOj3KwGcBq/i1/zcwJFu5Xd4pax1ykyGGiRJ1jR9TzsyxsrXpYpiucm6comCr1RVIxXjZY2LJVXlUCHsX7r4UJ8bAB47ne4W/dR/fZ9OeMsT2XCACdJLgFVuuP58FeNFSgQAPOamvayMjKJi249nKoRa3e4W9fo7lGXdSRNr2xzMXaq8t73txVNN+v1Ms0iahu1e1jgZ6ybBq5VyRQ7fWO9W/w43pbSTrKng5UPdTvmqqnGboeiSXN3uFnW6W1SMF1XHKOcydXtb1ekuqCxHGg52aTTaJ7sqA3v/x6q4NwDwGJq2GCjGZGEB++MOFpg49cxb4z9/6I0aLN8v6YETjwDgUHvAlD9N+vlYp15vm9Ks105BbXr8ZEqSXM6lsi5RXRUqy2VVVaEY1zadbsqhnNZkqLRTBN0D3h5YT6a/wzEEadIrrhGbktlV0zSlpmnytH9cknYUfC3vK9V1odqXk7+XKsuhqnLYDnI50BREGrgDeCytvifozx2lH/uJ39XJbz+OQwkgMrCA1g3Xn6/xeJ/yvN9OAwGAx1KMq7OirJIkV5r1lCa55uaPXjl8u0TZJJglScHXGizfLz85dK8OTE0P8E0GSVSbeRXjmimCwHrW/g4b0wxD0MpkTGuTyb8bWWsVY5CfDDKo61LOpep0FpSkuZI0V1kOVZZDxRjU6Syo290iaxNVdaFqktk4fazyxBaAx9p0QEuadjQe7yMLC1iFbq6ApDPfdU+84itnyxir4XCP0rQjH5hACOCxMz0IG2NkXXOj2ukuaG7uKC1sfaK8r+SSpryp19umLOsphqBivDSZoDZUCFVb3hRjVPDVJPtk5ZDdNoV3ySQjS4qB7Cusb9PfYWtdM0FwVbaVpMnfw2T6ZpS1TsZahVCrLIdaXr5fxXhJMQRlWU+93jZ1e1vlkkzeV1rY+kTNzR2lTndBadqRdW7NYxYAHis+1ErTjobDPTLG6oqvnK0z33UPqZ+AyMACJEnXXXOOfF2qqsbK87l2rDYAPBprSwTjSi8dY5uSpVArcan6ve3q9rYpSXJJkq9L9eeOUuIyWesUY1RZDFRWI/m6VIzhAYfoae++FXG/Naxqcs00Qqxz09/h/Zu3N1b97h8g2GSMUQi1xuMlVXWhLO0qTbvK0q4Sl6nOehoN9ypJcs3PH6Nud6tGwz0aDHap9pWcTWSnkwonveuajAlKDAE8etbYNWcSZ1Ndd805s14WcETgDhab3iln7IxXX/UxjUZ71cnnVBTLcknWHiQB4JGIcdKbZ5L5YW3T2yqGoLoqJEn93nZt2/YUzc0drSTJZIxRlnU1N3eUsrQrGaOqGms8XlRRDOTrQiHUTaN2AI9YCF4h1PJ1oaIYaDxebNoHGKMsnTwGs66MMUqSTHNzR2vbtqeo39suSaqrQjGEJgPM2iYwbV0zAIYSXQCPQpLkckmmolhWJ5/TaLRXV1/1MZ1yxk6i49j0yMDCpnf7bV/S4uI9yjvzk4atUXVVyJKhAOBRSNPupMzPK01zWZsoTEqTkyRTf+4oZWlPadaVc5mcS5SkHaVJR9Y61XWhqhqrmmRdSZoEwtwsvyxgQ3Bu5RbY14V8XahOCqVpV2naUZI0j1mX5KqrsbyvlU2axadZV4Pl+9sm79PHdlkOZa1TlvVU18UMvzoA61nzRFWT3RmCV96Z1+LiPbr9ti/NemnAzFHEj03t5NNvjv/y4d9qJw4ZY7Rly5NUVkMV4yWysAA8YjEGOZfKWNeWKFvrNDd3tObmj5IxTs6l7UuW9ZUkmULwKquhymLYZIj4StKk18+0hxUZHsCjNp1c2GRjNVmNzqWyNlGW95SlvUkwuVRZDuR91b7E6LW8dL+Wl++bBKk7ckmmGLy8r1ZNRQSAg1PXhfLOvLK0p3377lSMsZ1M/J9//Hd06onHc4bHpkUGFja1W3ZerNFwr4wx6va2Kgav0WivYgzK8r6Cp5E7gEfOWNdOQMs7c1pYeII6k2zPplywp053y6Qnj1dZDlVVI1XVqP0YqzNFQvCTiWuRTCzgUQjBy2hS5mvMqsdZVAiVxqN98nWpNO22wxRijBqP9mk8XpTktGXrEyeZEXerKkdNM3nrpEnQGQAeiSzvN5mfdak8n2ueCPOV6uFe3bLz4lkvD5gpnh7CpnXKGTvjZV/6x0mqfzOG3rlMktqyAAB4pJIkbxqvF0P1+tu1Y8fTNDd3VJPhYax6/e3Njakx8nWlYrw06cMzWtUE2kwyOSYT1mKUjCF4BTxKdtKvSpMBC6sfa1LTiL2qRk3/ufGSfN1M/MzzOfX622WNlXOp5uaO0o4dT1Ovv11lMVRZDMjeBvCoxBhWZYVmUoyq61JZ1tNlX/pHemFhUyMDC5vWzps+pxC8hsM96nQXVJUjhTBUkuRK046iuDYAeOS8r5RmXc31j9Lc/OMkSePxorKsr63bniznUpXlSKPhXtV1qRDqdrqgta7JADVGq6v9pxMMjbFtPy0AB8/ayRTBGCYBrNhOC1WM7ZRB7yuF4FXXpZIkU5b11etuVZ71tbj4VRVF85jeseNpyrO+lgf3t2W/APBIpWlHIXiNx4uyNlHemdNwuEe93jbtvOlzs14eMDNkYGFTOvHU6+NVV35UZTlU3plTXY2Vpp32YpEkeZOVBQCPUJb3tXXrkzU3f7Ri9JKiFhYer4WFYxQlleVQZTlQXZdtxuf0WdcY4yRYNQ1erc7EChyQgUep6WMVtH/mlTFGxtq2efLqx+a0F1ZZDhUlLSwco4WFx6sJfnnNzR+trVufrCzvz+rLArABNAHzvO2vl6Yd1dVYeWdOZTnUVVd+VCeeej3PtGNTIgMLm9Idt1+mxcV7miwGX8sYu6ZRclkO5SwPD2AzM8ZMMjKaDA1jbDudtM3U0OT1LpGvK3lfKsv76vd3qN/brjjJ6siynrJsTi5JFUMTgBoM7n/A51wpDdz/vnTt31cCWwAeiZXH0IOdAeOax2OMXjF6lWWlshyo32/KgbO8L+cyleWyynKkNO1o+7anaDDcrcFgl8pi0EwZTVIFX68Kmpl2Dc20sTB5nW33HgCbk7NJO9U0xtgOhmjOLEaLi/fojtsvn/UygZkgAwubzhln3RW/fPmH5Vw666UAOII1QSsj6xK5JJV1a/tOTf/NGKO6KiRJvf52zc8fo05nXpKUJB11ugvK83kZa1VXY43H+zQa7TvsXw+AQ2c02qfxeJ/qaixjrfJ8Xp3ugpKkI0nqdOY1P3+Mev3tkqS6KtbsGatZ5yZ7TELwCsDX5Fyqr1z+YZ1x1l1sFth0SDHBpnPLzou0d8+dyrLurJcC4AjWZEqsKuNrs64axlrF0JT8WevU7W1Tv79dWdZTjHGS9t9VmjYH2rIaqSwGqutCMQYasQPrWF2P5X0p72tleV9Z2lWe9WWNU1Ulqqpx+/gfuN0aDffI+1rWunbvmO4nRpr0u1Ob9dmUNQLAA8UYtGfPHbpl50WzXgpw2HF1xKZy2jtui5df+iHlnTl5TwNkAA/OmKYPTgxhEqgKbT8cY4yC901/iqyrhS1P0Pz80UrTjoxxyrKeur1tSiZ99YpiWcV4SXU1nkw8JQMUWM+cS5vJYNVYxXhJRbHc9NBMO+r2tinLejLGKU07mp8/WgtbnqA06yoEr+B9Gxhv+t6Fdp+ZlisDwIPxvlbemdPll31Yp73jNrKwsKmQgYVN5e67rtJwtFcxBiVJ1o6oBYD9WevaPWLlsLmSmRVjUKczr7m5o9XpbpmU/gSlaa68syAjtU2fq2qsEGoZNQ2iV08WBLAemTaTqq4LheDlfaUs6ytJMnW6W1SMF1WWXmnaVZJ0lLhMy8v3aTxeUozmAf2w2rLlVXsPAOwvSTLFGDQc7tHdd1896+UAhxVP8WDTOO0dt8errvyo6qpQVY5mvRwAR7hptpUkqW24vFJGOD9/tObmHzeZONZkVfX7O5R3FhSDn/TIWVRVjRQnZYbWJYoxqq6LmXxNAA6NphQ4yrqkabQcvKpqpPF4UaPRPsXglXcW1O/vmGRcRmV5X3Pzj9P8/NGStGoQhGlLCJvXhwN/UgCQFBVVFkP5utTVV3xUp7/zDrKwsGmQgYVNY9/eO3XXXVeqk89J6qkolulBA+BBhRA0nTK40v/KKMu6yicHUWuTdgphlvWVZT1V1VjD4Z7JZNPm/aZZVzRnBjaW6b5grJ1MCyvlfSXvK/UmpYQxRoVJtlWez7V98Yqiyc6MMbY5mc3UU/OARu8AMFVXhXq9rZKku+++Snv33jnbBQGHERlY2BTe+bv3x8sv+5CytKu6LrS4eHc7JQwADsRa2460n3JJql5vm7ZsfdLkbZzyzpz6/R1Kkkyj0T4NBrubXleT4Nc0UB5CrRi8jLHtARbA+tT0u7OKwSuEpqemtW7Sv6rpjTUY7NZotE9Jkk2yM+fa/WDL1iep19sml6z0w2tKCa2s5fYcwIPrdOa1b9/dqutCadrV5Zd9SGf97i6eIcOmQAYWNoV9e+7QV++5pnlWNNTq9berLIezXhaAGVtpym4nWVJaOx2snRYWlE/6XWVZT8HXyvM5ZVlPSdpRDEHjYnnSyLlumzCvLgVayfiM7YEXwPo0fQwba9dkT7WMUV03ve9C8MrzOeX5nJxNVJZDlcVAvf52JWlHy8v3qRgvtfvQSjN3s9++tLJfAdi8qmqsubmjVNelQvC6566rtHfvHbNeFnBYcAXEhnfSqTfEa685RyF4VdVY3c6CYqC/BLDZxRhkXSKXZJKk4GvFEGSslXWufZ2xVnNzR2lh4fHqdOaVJLnSrKdOd4usTVRXhYpiqel1FcOarCsAm9M0GyvGoKoaqSiWVFeFrE3U6W5RmvWUJLk6nXktLDxec3NHyVirMJmQbJ1rg1nT17kkm/TR4x4G2MxijIqK6nQXmiES0eu6az+pk067kSwsbHgEsLDhWZfophs/0zZhLsthm3ILYHMzk//WiLE5NAavJMnV7+9Qr79dWdaTtYnStNOU/thEIXgVxbLG46WmMfskawIAjDHSZGjDeLw0ydD0cjZRr7dNadqRtYmyrKdef/ukFDlXCL55om2/nnkH3K8AbDpZ1lVVjlUWA013hhtv+DRPnmFTIICFDe3UM2+JN1z/KQ2HezUe7VOezylJciVJrqJYnvXyAMzQdFR9XZfN6HqXyBijMAleZVlPc/NHT6aIZZKM0rSjNOvJGKPxeFFFsayqGikE39xCTsp9QvCz/eIAzNR0D2hKDM0kC3w0CXgvyhijNOtN+uEZOdf0yZqbn5QpB68Qwpq9aVouxCEV2NyKYqAkyZSmHXU68xqPFzUc7NEN15+vU8+8hSwsbGgEsLDBGV137blKs476/R2Kim3gihtAYHMzxjaHxDgJNsUo72sZ00wKW9jyBOX5vJzLlKZd9Xpb1elukSSNRvs0Gu1TVQ6lGJtyIesksiMArGFkrGvuOWJUVQ7b/UOSOt0t6vW2Kk27ci5Tns9P9p45GWPkfd1mYoXom2A5PbCATW16hhmPlxQV1e/vUJp1dN0157A/YMPjNxwb1qln3hJvv+1LWl66VzGEdly1tYmcS7/2BwCwocXplEDjmjH3k4yJPJ/T/MIxStOOnEuUpnlT7pP1VFdjjUf7VJbDpg/NpMnydPJY80KTZWCzW9kDmn2hHRRhjGIMKsuhxqN9qqux0qw3KSnMJ3tOR/MLxyjP5yQ12VwxRlkz6aslEiyAzc66RNY61VXR3JOEoKWle3X7bV8iCwsbGnfY2NBuveXzKsuhkiRvGjYbJ+cShVDL+2rWywMwQzEEWbsyst65VP3+DvXnjlKe99veNHlnQdY6lcVAw+GeSc+JlSbNTdZVbJqqhumUMDKxgM1sugesTDWNksyaIQ+r9xRrnfLOQttrL8/76s8dNSlhbp50m+5XDKIBNjcfagVft0GsGINckqksh7pl5yWzXh7wmCKAhQ3ppFNviIPBbt2y8xJ1ulvkfSmXpO3knhD8pO8EgE3NmMnhUsrzec0vPE7d7haF4NXtblG3u1XWOo2LJY3HS5KaZz3jJCNiddbV6o/HlDBgc4txErhaE8xu9osm2O1lXSKpKQMaF0uy1qnb3bpmD5pfeJzyfH7yMff/eAA2ozTttFnj0+CVr0t1ugu69ZbPazDYrZNOvYEsLGxIBLCwIVmX6KorPiJrnXxdtpkR06bN0943ADauELyMXcl2iJMJgWYSZHIuVV0VkqSFhcdry5YnyLlMxjrNzR2tTndB3tcaDfeoGC/J+1Ih1M3Hse4BWVbTj032FQDpwfcEY5q+WE3pci3vSxXjJY2Ge+R9rU53QXNzR8tYJ+cybdnyBC0sPF6SVFeFnEsfsJ9Jzb2PsdzfABtd8HWTeRVCc6bxdft6Y6yuvvJjk76cwMZDAAsbziln7IySdOedV8x6KQBmKEkyGZk2G6o57DU9aIwxKqtR26y9090yabScKEu7yrKeqnKkuh7L+3q/jKr9sq4A4KCt3UdiDPK+Vl2PVZUjZVlPWdqVtYmMdep0t7TN3ctq1ATFJnvaSrliMw01SbIZfU0AjgS3336pjDE69cxbuVnBhpPMegHAoRZj1PXXnavl5fvkLL/iwKZljMIk+DQ95IW29K9Jwe/2tqrX26YkyWWtayaBJZlCDCqKZYXg5X3V9JwhswrAYySGIK+mN6f3laxLlaQdGWNVVSM5l7a9bkL08nWl6P2aLKwmwzy2pYkANqflpXt1/bXn6tnP/Z5ZLwU45MjAwoZy2jtuj0mS6bprzlFnMr0HwOYU2sypZlLgtDeVMU2GwsLCE9TpzE+CW1ZZ1leW9xWD12CwS1U1lvelYvBt1lbTsF1tEAwAHomVPcS02VQxeHlfqqrGGgx2KQavLO8ry/rtPtXpzGth4QlNhulkomFT1twMlIgxtOVEADanXn+7rrn6E5LIwsLGw1M02FDqaqz77r9Jg8FuheDb3jcANqfVE7+aOzijLO+r01lQpzMvaxMlSdZkXrlUvi5VFMsqi2XZaQbnfsGr5sB5+L8WABvHgfaUKLXDIcpiWXYStHIuVZb12jJo5zKFUGs8XlQxXp5+hMmUZfpfAZtdWQxUaqC777pSRx/9jFkvBzikyMDChnHaO26PvbkduvrKf5exlimDwCbXNEq2iortoS5NO+p2t6jf3y7FqDTN1e1tU5b35X2pwWC3ynLYjq1v+2ZpdSNmnswEcChMwuqTYNbqflbOpSrLoQaD3fK+VJb31e1tU5rmUozq97er293S3uuE4BXVZGIxSALY3Iy1Mtbqums/qfmFY8jCwoZCBhY2jBBq7d51i3bdv1NGRt5Xs14SgBmKMUpx5YCYpl11e1vV6SzIuUw2bXpeGTXZm+NiWVU1kjVW1qWr9pC48vEA4JCKB9xbrE3k61JVNZoEpZpMrDTttv2uOp0FSdJouFdVNWp69QHY9HxdKUky7bp/p3bdf7M63S2zXhJwyJCBhQ3hzHfdE5Mk0223fEFVNSKFHkB7KGx6XnXU7W1Tv79DeT6nGKP6c0fJuUxFsazBYLfqctIo2SUKoV7zMWKMiiE0LwSyABwCB9pXpn+GUMu6RM6lqsuRBoPdKoplOZepP3eUYozK8zn1+zvU7W1TknRWphGyRwGb2rSceDTap507L1GW9fTO37mPjQEbAgEsbAhlOVSMUTfccL58aBo3T0uAAGxMPtQyxqz0uIprR9JPGxwnSUfzC8eo19vaNDs2RnPzRyvGoLouVFXjJmBljJpsiNC+3fRAOC1HpDwHwKFyoH1l9VTBZghFbCaqhlpVNVZdF4oxaG7+6Pbter2tml84RknSWbX3xTUfS1K7V5KhDmxsZvJYD6HWLTsvlve1qmo041UBhwYBLKx7p73j9mit1e23XarB8v1KXKos66solme9NACPoSTJmsldsSmbmQazpuU2IXh1u1snmVaJJKM8n1Oez0sxajxaVFkOm8Pcqolga/tdAcDht9LkfbIXxSjvK5XlUOPRohSj8nxeeT4nTRq49+eOUre7VSH4drLh6r5aIXgZa5Wk+ay+LACHQTFeVpp2lSS5lpa+qjvvuFyS0WnvuI0sLKx7BLCw7oVQy7lUt932RZXlSDJGVTVSlvVmvTQAjyEjoxhCWzLcjpSf9IHJ87463S3qdheUZX1lWU95Pidrnap6rGLS8yoGv2rSIAAcWabBqBi8qmrU7F31WNY65fmcsqynLOur211Qp7tFed5vyxPbYJbU7o9G7HXARpbn/aanp3UajxZ1+22XylrbPuEHrGcEsLDuWes0HOzRjddfoK3bnqTxaFFJkquuy1kvDcBjKAQ/CV6tlMlMg1kuyTQ/f4ySJJO1ifLOvDrdLYoxaDxeUlkM2lIbY107aXAyyH6GXxUATE33o0kmlXVtoL4sBhqPlxRjaIJWnXlZmyhZtfdJWimJts0eF2OgTyiwwXlfyblURbGsLVueqJtu/IwGy7tkLfPbsP4RwMK6dua77okheN3y/7P3p0+aZfed2Pc9y12eJbdaekOjsQ8JgASXITmjkTgcx9iSbCvCY8uK8CK/8CtFSG9shzWaIWliCBDg4gmF/wbJlmPCjpBlKaSYYFhDSaMhCYIbCAIg0PtW3V17Zj7LvfcsfnGW5z5Z1bXmk89S3w+ioruyMgu3uvLee87v/JY3/gBSKhzf/QCDwQG6bs4UeaJngJQKUqlYShg2emU1wnh8BWU1yin0RTEAEPrlte0ExjSxtEb2SmzuPw2MiGhdwjMp9bNaPLOMadC2E7TtFACWnnVlNcIoPgND0MpDxDJDGYNgRLS7imIAYxoMBoc4Pv4AUiq8+eYfwnuPb/z2NS50aKsxgEVbr5mf4Ic//GcoyxGsbWFth6KoYZmBRbTTUvNjeA9nLQAPXVQYDA4wHB4BAOqUeeUsmvkxum6emxungFXIUDg7XZAbPCJap8Uz6N7nlM9Zp103RzM/hncW9eAAdb0HABiNLqGu9+Nhnoe1YcANYjkiEe0uY5ocxPLeoiiH+NEPfw/z+TG4vqFtxwAWba2vffNtb22LyfQWju9+gK6bYbz3HFKKPKdtEO243OMl9HQoigGGw6PY50qjKAYoigEEQuZV00zgXLeUfdDfFC6mDnJxR0SbQNwzlbDfw0YIAec6NE3IxBJAfu5JWaCu9zEcHuWeoM6FHlipTyAR7aaUmemcxd7e82jmJzg5/hCnp9dhbctm7rTVGMCirSWlhvcOP/qrfwapFKzt0MxPoIsK0+ltjEZX1n2JRLRCKWNKCBEyr4aHGI0uoyxH8N6FLCwh0HazkHnlbN4E9hu/L/6Zfniw0SkRrVN4BoWy6P5k1P5EwRR8D83d52i7MMhmODyC9w5lOcRodBn14AC6qFg6SPSMGI+vYDq9DaV0HFgzh9IlfviD/x+8d+yFRVuNASzaSt/8nQ+9tR2cs3j3nT+Fs2ESodYVrGlRVWNmYBHtgBBwCtlRUipIqQCEzVtR1LC2AwCMx1cxHsegtRDY23seQkpY06JtJrC2XZo0GJq2p09Pm7pFA3du9IhonR72XErPsDSh0Nr4rDMthJTY23sulwqOx1cwHl8FgNxmIQXx03N1keXFxAyibdc0E5TlEN57SKVRFDVMN8d77/55HIBj8M3f+ZA3O20lBrBoK6XJO+++86fozDwv5Jwz8WRBrfkKiehphYWXglIazjmkoLWQEkoXmM9PUJZDjPeuoiwHEEKhLIeoyhEgBOazY7TtNAS58qZsOZuBiGgbLWeNAvAe1nZo2ynms2NACFTlCGU5jM/GQXxWDjGfn0DpAkJKOGfjs9WFJu9KMYhFtOXSoV+/7FhKBWNbvPfun8E5i/n8ZM1XSfRkGMCirfNrX3vVa12iKAZ47dV/Dmu6OB46bHjDBpcBLKJtJ4SA+Jh+VN45CCFzw3atKyhVoKr2oIsa1jQxbX4G7+xS9hUR0S5JWVihlHCGpjmFNQ10UaOq9nKG+nB4hMHgAELIj+2DJRjgJ9oJQio4v+h5J0TISn/t1X+OoqihVIFf+9qrjFbT1mEAi7ZOXe9DqRKnJx/h+kc/gu+l1qdA1sdteoloewgpYa2BtaHxulJFOFF04URxb+8qymocP16EBZku4GyXszTDc0HFLM3Q3yqV4xARbbf0PBMQQsZnXRhkM5+fwNkOSodno5QFlCpQVmPs7V0NmRkuZKwrVUAIAWs7WGvyWoqItpt3rnfI7+C8w0cf/hAnJx9B6wp1vb/mKyR6fHxD0daZTG6imZ/gzTf+AMY0UFLD2ZRhEUsJvV3zVRLReUhNilNZsLUGAFCWIwxHl6B1CSk1qnocRkZ3DebzE3TdLGzo8o/UnJ3BKyLaHeGZlqaoLp55XTfDfH4C0zUoigGqOkxn1brEcHQJZTkCsHimhnIjDrAg2hU+D6uRcWKpgxQKXTfHW29+C838BNPprTVfJdHjYwCLtspXv/6aHw4PUQ8O8Prrv987JfQ5KwNCwFnDjSrRlktlgkppePjYp8WgrEbY238eSpXQukZZjULfKyCUDbbTGMz2S6Pnl58JzNIkom22eIbd+5zzIYjVTtE0pwAQ+mFVI2hdQ6kSe/vPo6xGcC5kuXp4KKUfWF5IRNvDORsO//LaJw7EUQpvvP77qAcHGAwO8NWvv84NE20VBrBoqxRFDWNavP3WH+H4+Fr+eM68sgZK6jy1jIi2V2ri3t9Q1fUehsMjVLF0sKpGKIshrDNomhMY0wBAztjqb+pE7oPFZwMR7QKRn2v9IBaweAYa06BpTmCdQVkMUVWj+OwcYzg8Ql3vAVgcGLCJO9H2S3sgKdVSlmVy9+77ePutP4IxLYqiWss1Ej0pBrBoa3z9N9/1zlkIIXHjxuuwpoWzFt47KF3G9Fibx0GzhwPRtvMQCP1crDNQusRwdBl1tQfAoyhqFOUQEALN/CRO1Akjo9MmLi3ilid2sUyGiLZbeIaF/lf9yarpn947SKUBeMznJ2jmJ4AQKMohiqIG4FFXexiOLkPpEjZOcRa5VyARba2lAFYXWzFoOGfhrIE1LW5cfy00drcGX/vmO7zpaWtwh09bw5gWShXw3uIH3/uni0BVnKrhvYdSBVys+WYKPNFmE1LmrIE08rnPeQcR+7IoqTEaXUZd70GqAmU5xGB4BHiPZr7IvPLO5WdA/v/J2ZiLBu7M0CSibfYozzXnbF4LGdOEIJb3GAyPUBQDSKVR13sYDS8tstfj5LI+2WsOHz6H2weiTZbue+cstC4BANZ28V6WUKrAD77/u/DeQqkC1rbrvFyix8I3EG2Fb/7Oh14pja6b44Nr3+9NFSOireUXjYe992Gz1StdKYsB2mYCABiNL6OqQhPioqhRFANY28GYBsa2OWglpMzlNEREz6pcNh2DTc5ZGNvCmAbWdijLYQhiSY2q3sNofBkA0DYTlMVg6fdJz+Y8EIPPV6Kt5mM/rA8++AGsDQkC3/ydD3lj01ZgBIC2wmx2F4BAUdR4840/QDM/hbXdui+LiJ7C2Q1Wv0+VEAI+lvqV1QjD4SVoXUHrKvS/0hW6doqum8OaBt7ZHAxjjysiIiCUFsagvrOwpkHXzdG10/AsrfegdYWiqDEahUMC733e3Pb7awE8ICDaFca0aJoJ3nzjD2IgW2E+O173ZRE9EgawaCuMRpdhbYf5/ATvv/9d6KJiBhbRljvbhyoHs+IGqevmGAwOMR5fhdZlyL4qQ9mLsyYEr2x7T7nwolk7EdGz6X7PQe8crG3js9NASoWiHEAIBaUKjMZXMBweouvmIUgVn8n3/D7sIUi01aRQ0EWF99/7C8xnxzCmxXB0ad2XRfRIGAGgjffr33jLGzNH205w6+abEBCYTm5Ba07NINpmqXRwqRzF+9zHqtAVxntXczlLVY9RFgOYrkHbTkLwyruwwer100qlLkREz6r0fO33rQrPyRDEattTmK5BWQxQ1SHzqiwGGI4uQ+ty0T/r7POZz1eirVeWA0wntwAAN268jmZ+gq6b4WvffJvplbTx+AaijZdO+kajy3jzjT/A6el1SKly02Yi2k6LaVmL9ZK1YRKWlAp7+y+gLIcAAK1rDAYHYeJgcxoyBFyaNCjzhir8XmkyFxHRsypNXE0N3nvPSefQdXM0zSkgBOp6H7qo4eFRlkPs778AKVUMdpn8Oy5+Lz5fibaZMQ2k1Dg9uY433vh9DEeX8qAGok3HABZttK99821vTBOaj5oG77zzp4AQGO89d8+kMSLaPv3eKilbQCqNweAQg8EBpFTQ5QB1vQfnLNpmAms7OGfymGifswJSyQwXYUT0bAvPwOU+VvmwQAg4Z2Fth7aZwHuHQb2PohxCSoVBfYDB4BBS6XsmD7L/FdH2c85ivHcVQkq8986fxXWVRdfNmYVFG48BLNp4g8EBnLO49v5fYnJ6E4WuMJvegVJ63ZdGRE9hkS2VsgNCw+GiGGA4PMobsEF9gLIcopmfoGlO8+n/IuvKIWVdLUpbuP4iomfZ4tm6yMZyvY+FfzbNKZrmNAzLGBzmXxsOj1AUg6Vnc/p9GcQi2m5CSMymd1AUNaazO/jg2vfgnMVgcMD7mzYeA1i00dIJoRASr73636GqRuhMAykVhFTrvjwiegoiZgGkgJR1BmU5xN74OZTVEEJIjEaXUZYDtO0UbTvL2Vfha86Ws/heMIuI6Fm3/EzsPyvD87eLWVhTtM0kTyOEECirEcbjqyiKGtYZCAhIqZj9TrQDhJSQUsGaDlU5wo9++HsAwAnvtBUYwKKN9evfeNMD4ZTAdHPcuPE6nLeA93kKGRFtL2M7FGVo0N42UxRFjeHoEpQuAYTsSyEkujj63XtunIiIzpv3oXSoMw2EkKHfIACtK4xGl1HoCm07hYdHUQ64ySXaci5OIXXewroON268jq6bIWVrpj0Y0SZiAIs2lpQ69264fv1VnJ5eh3cOShUMXhHtAAEBJXU+0R8MDlDX+1BKQ+sadb0PAGibU3Td7ExfKzYRJiJ6cotnqPcOXTdD25wCQGjqrisoVaAeHGAwPIT3Pmx6hYJkBjzRVhNCwjkLJTW8c5hMbuLmjTcgY687KdmmhTYXA1i0saztwoLJObzx+u+j0BW89yiKGl035wKKaMvpokLbzuC9x2h8GYPBIYQQkFKjrvcgpIzj3mf5eZBwChYR0ZPrP0O996GUsJ3B2hZCSlTVGFKGYNVgcIjR6FJu8qx1tcYrJ6KnpXQJYxoURZ33Vm+++YcAFs8Dok3FABZtpF/56vd8ah7adTN8+MEPQuZVLCFK452JaLsZM0dR1BiPrkCpAlIqlOUQWldomwm6bh4mDqLftD00bCcioiclFlNg47PVOYOum6NtJtBFhbIaQQgJrUqMxldQlAMYM1/nRRPROQjrqsU0UiU1Prj2fTTNBABQFAP8yle/xzJC2kgMYNFGGgwOMZ8fQ0qFWzffQtOeom1ngPcwpkFZDmF4OkC01UzXQOs6TruqIUQ49a/qPVhnMG9OYUwDeN+bhLVoQkxERE9q0dg9TxmMa6x5cwpnTXgeVyMIKVHG6bBa1+G5TERbK9zfo5xp1bahhPjWzbcgpcZ8fozB4HC9F0n0MRjAoo3zj37jDW9Mg8Eg9Fx4++1vwzuLMDVHwnsPDw8p+O1LtM2EEBiNLqOq98LUq3KIqtoDvEfbnMKaFoAHRBoBv9hwMQOTiOjJee/ygUB4ti6etda0aNsp4D3Kagyta0AIDAYHGI0uL5VzE9H2Eb09lFKh35XzFu+88ycQQmAwOIQxDf7Rb7zBm502DiMAtJHqeh+z6W04Z/DB+38JY1qU5QhSKggp0TZT9mAg2nJaV6gH+1CqAIBwjyuNtp2i6xqEDAERA1Y+/7xf+kJERI9vUYq9OCAIAa3wc2MatO0USuqQhSUElCxQD/ahC66/iLaZUgWa5jTf80VRo2vneP+978DaDrPp7TxIh2jTMIBFGymcDErcvfs+JtNbkFLB2AYiTsdQSue+OES0ufqNgvslgEIIHB59ElIqKFVgOLoUmop2DYxp4FwqEfZnfp8QyGITdyKiJydittX9n7GAtS2MCc9jpaswZCM2dT86/OTSs/zsc56INptzJhweCgGpFKzroJTGdHobd+++Hz6J2e60oRjAoo3yjd++5rtuBgCQSuPae9+NZUQC3jk4a+Gdy6WERLS5vPdxARRP96WCcw7ee9SDQyiloXWFohig0DXgPbpuChPveSIiWhcBY1p03QzeO+iiRlkOoHUFqTTq2ObBOQchVX7OQzBDlmjT+dhbtL+3AgSsaXHtve9CFzW6dgpA4Dd+6z3e0LRRGMCiDSMwHB5hOrkFAHjrrT+CdWbpZNB7H6cQ8nlKtOn6fRZEDEopXWA0ugQpNYpigLIcQkgZS1ZmcLZb+joiIrpYQghYG3phWdPGCbEj6KKGUuEZrnQo/xboZ2Dx2U206Zb3UossTOtM2HvZDs4ZSCmhVLneiyU6g28Z2ijeW7TtDGU1QtfNcef2O1AyNBcUUsaFUWjizilkRJtNSpkbBQsh4LyF0gWGg0MURQ0pFbQuIaWGNR3adgpnl0sHiYhoPQQEnDW9IJZGoStIqVAUNYaDQyhdwHmbn/PeO0jJ7QXRZlvspYSQixYtUuPO7Xdim5YQmO66+fouk+g++IahjfGN377mjWmhlEbXzfHOW9+GtQZSKtjY70pKhVROyBIjos0mpIKzIYNSSAlnLapyjGGcYlUUNbSu4eHRtqfouhkgRP46IiJaD+cshFSAEOi6Gdp2AgDQukZR1PDeYzi6jKocw1kbDxlDwEtItearJ6IHW+ylZLxfrYt7Lmvwzlt/HPrfqRLWdviN33qfp4q0MRjAoo3RdXN03QxFOYRSGteu/WU4zYOHswbeOXj4nNXBEz6iDRd7onjvISCgdIGqHoeSQSHz1EFnO3RdEzZMIm6C2DiUiGht0jAdKRWcs+i6Bta2kEqjLEfxGT5EVY+hdAGBRb9DsMUD0Ubr76U8fOyFZeDjkJx33/tzDAYHADyc7WBtu+5LJsoYAaCN8Gtfe9WX5RB7e89jcnoDzjm8+cYfhl/0HlLppZO91HyQiDaXczb3SIEQGA0voSyHAIC63oNUBWwc1e69hYz3dOrNQERE65FbNuReOS6XEipVoK73AABlOcRoeAkQix6Hztk1XjkRPUwahtXPlJdK5+Dzu2//CSaTWzCmxWB4CKUKfO2bbzMyTRuBEQDaCHW9h7adYja7i6Ko8dGHf4WiqMMvCoFCVxAxrVVAxMptPkeJNplzFlpVAEIvlcHwCFrXcM6gqvfi1MEZ2nYaPiduksKpoF7npRMRPdOUKuC9A5AOFMLzuuum8ACqeg/OGWhdYzA8yo3ctaoYwCLacGkfJSDC3koqFLpaBKJVgTu334X3Hk0zgYmDHIg2AQNYtBGs7SCEQFWN4L3H22/9Uf417xycs3DWQOtQi62kjrXbRLQuQspYMhIatUup8sRQIQSU0pjPjyGVxqXLn4L3Lp7c78N7j7abwlqTSw3D16UsLG6AiIjWpR+E8t6FNg7OwTqLrp3COYvR6Aq8t1BK4+jSKxBSomlO73kXSKl67wufG0YT0Xp456CkhrUdtC7hrIFzNu+tnDN4990/hbMdynIArSvYPGSHaL34BqG1+43fes9772G6Bsa0EELg+vXX0HazdV8aET2Ad2nCYNiYOGdzIAoAnHMoihqDwQG89yjLIZQqoHUFZw2safMmKU2wyr83e6gQEa2R7z2HRc7McNbAmCaWGnnUgwMIETIzRsNLULpY9MJCeA+kjXF+zvP5TrTRvPd4561voyiHAAQmpzcghMJv/l+v8+altWMAi9bOuVAyVNV76GIZ4a2bb+ZeOUS0mRZZUyL+3N3z86raw3B4BAAoqxGKooaQCsbM0XXzMKpZCCymivr0m1/Yn4OIiJadPUQQIgSxvLcwpoGx4QCirvehdQkhJIajSyjLERAbQS9+r8W7QQgBxwx6oo1WFDXu3HkPTXOCyeQmRuPLOaueaN0YwKK1S+nlbTPBYHiIt978FgaDAzTzk3VfGhE9kM+bGiCU/4VR6uHVonSBshpB6wpFUUOrClIVMN0cbTuDP5N9tbRh6m1+iIjoYi0OIkKmFbB4Tjtn0bZTOGcghURRhBIjpUpU1Tj2zwqlgrL3Tlg813lAQbTJJpNbGO89hzde/33U9R6MaQEItm+hjcAAFq3Vb/zW+z40BtQoygEmk5u4cf01NM0EWlfrvjwieoC8KfF+qQTQewfnHOr6AGU5AADU9X4IbgFo2gmsbXOwK5Qguvhj+fciIqJ1EPcEsdLzWggB087gnEHbTlGUA1RVyLyq6z1U1V7um7XkTK9DItpMVT3GdHILH334w9yn2DmDshrh17/xFiPQtFZ8g9CaeVjbwtoOxjQQQuLDD34Aa1soXa774ojoAc424vXew1kbx65LDAeH0LqClAXKagzvXCg96ebpd+g1bfc5EBbKCRnAIiJar0XPquVBGwLOh4bubTuBgEBZjSGEClMJBwdLvRHD1wk2cSfaElIoCCFx7f3vxmFaDsa0ca/G9RmtF98gtFZd12Bv73l4Hx6M8/kJ5vNjaF31NrlEtKnyhiQHohyk0hgMjlCUAwghUZYDSCHhvcU8lgaHzw+n+rl0MDaEDxsdpqkTEa1Lmi4rhMylf4tyQg+lNKxpYUyLrptDSpWzsMpyiMHgEErpxXCPpd+DiDZZ00xQVWM0zSlOTj8C4CGlQlEMeA/T2jGARWvz9d9810spMZvdAQAMh0f40V/91wAAqTSkVGu8OiJ6GB8HMACLkhAhBApdYzA8zKWBRTmMp/VmacT64uv7zeDjyR4XSERE69ObQCh6vatCibiFlBrWtvDeoW0nAICyHMFZA6k0hsMj6KKOBxNi6ZCDfXSINltVjdA0pyiKGm+89i+gVAGlNLpuBsDj67/5LhdptDYMYNHapF4KibUtPvjg+6iqMaxpGeEn2nBCCMh4wm5MA6WKMJVqcJCniA6GR5BSwZoWbTOFlCqWlIilMpJFrxUbTv5ZYkJEtDZCpt6EixLAREoVS8U1rO1grYHpGggpMRxfhvceZTXCYHAIeA+lClgTphYqXbAEiWjDGdNASgWlitgHy8RsSgcpNfvY0Vrxu4/Wpuvm+UEIeMxnx2iaSZhs4x0zsIg2nPce3jkIIaFUAWNaDIaHKIo6ZF4VNZQM06i6bhYat+em7Xbdl09ERE/Ie5uf59a26LoZvPdQslh6BwyGhzCmhVJFePY7xwNKog2nVAFrO3TdHNPpbRgT9mxaV/njROvCABatxa9/4y1fFBVSuZD3HjdvvoG2ncA5CwHRG7dMRJto0f9K5J5W49EVaFXG3lej3Celbadxko3sZWEREdE2CmWEKgawuvCMNy2U0ijLEYSQ0KrEeHQFiwmGi0buRLS5pNT5Xp3N7uD2rXfg4oElABRFxWmEtDYMYNFapKbtUqq8qX3v3e/A2Q66qEJ6Oje4RBstlIH4PF65qvdQ1WMIqVCWQ+iigvMOXTeFcyZ/HTcvRETbr/8sd86EZ7130EWFshxCSIWqHqOq9+CcWXpnENHmsq6DUgW0LuG9x7vv/hmklLm00JiWw3ZobRjAorXw3uUeOc6ZUGP90Q/hnIMUKn4ON7lEmy9kSzpnMR5fhYj3b1WNAQBdO0XXzSEgoHWJ0ATYskSYiGiLhT5YFoCH1iUEBLpujq6dAli8A4RQGI+vhqzb/qAOItpYzlpIGSaQSilx7b2/CBPiYwCrLIcMYNHaMIBFF+6rX3/Nh345DZwzkFKhmZ9gcnoDzodm0Gl8MxFtLtGbLlUUA9T1PgBA6yr0xOoadN08ZFlKtUhJ76WhExHR9un3s5JSQ8SM+q6bw3RNzN6oAAB1vY+iGOQyQq7viDZdKB80XQMAODn5EM38FELIpcE9X/36a8w2oAvHHQRduKIYoN/7SkqNa9f+MkT1ReiNE5o885lItNHiJkQKhfHe1fDvSqOqxnBxtLpzJvS0A3K/LPa3IyLaATEYldZrAqGcvG0ncN6hqsaQSgMAxntXc4Y93wFEmy0dMoZJpCGY9f77fwGty14PUxH3dEQXiwEsunAh5dTDWpMn2Fx7/y/D9BqlIaWCVJoBLKJNlzYtQmI0ugxrWyipUVZDWNPCmHByJ6RCKh1Mn8/UcyKi7RUy5dMmN5QSilgabkwDa1qU1RBKaljbYjS6vMi85fqOaOMJKXO7BykVrr3/XShVAACsNQjrOq7l6OIxgEUXLo1gVaqAUhpdN8P16z/KY5eNabi4IdoAIUMyLF7SiVsq/Uj/VLrE3v7z+XNTmUjXTePJXQhYn/mdL+qP8MyTMmQ/GNPCu7DQFCKU+tBuC8GCmP3oHKw1vftY3fPxcGgkel93b7+idBKfvpfS7xGyK2X+fuP317Pi3md7eu533TSXl4d+WR57+89D6RLAve+S9L2ZPpeI1ius5eYAAKUKXL/+Gpr5KaTUUKqAtV0uEya6SAxg0YX6xm9/4ENZkYW1HZxzsKbF5PRm7H3l+TAk2iAeKctK3FP+55xFXe+FBr5CoK73oXSJZn6KLvZNoPWxtoO1HaTUKMshVDw8aNsJhsNL6748WiHvPYxp8/RPpUuU1SiX8FvbhnJ9qVAUNZQK97B3NgYSfHxHm16wSoQMaakhVRH6HgkJIRWEELH/0QzeexTFcF1/dNoQXdegmZ9C6RJ1vQ8hwiCPut7rlSAhlyGmQJbnAQfRZvAeRVEDALpujsnpDVjbwXsX3w8WbTvBN377A960dKH0ui+Ani2z2R1U1RjD0RjN/ATWtqExYHOaT261LkPTZ/ZIIForIUQvG1Lk0r+QVSUhlcZgcAilSgACZTWGEALz5qQ3Mp3WJZyQmtg83+asG60rfOZzfwt7e8+v+Qrpadg48MQ5C+sMnDVxc2HhvcN8foLZ7C5OTz7CfH4M283z0IV+fxNrF9lUQobsqxBsSIdJPv7/mJgZsygdTpmXUmpIGYJY8CwroTBhet6cYFxcQVmN0bYzKFViMDjEdHo7Zu45CJ+y/uL3TOqVSERrI+J06TB0q4UQAk1zipOTD6GLGlIqDEeXYLo5ZrM7675cesYwgEUXSoqQGn5y/CGGwyO07RTXrn0PShWQSsOaFj6e/OqiWipTIKL1SM3XPTxcmjqlJIbDI2hdxXRyDQHAmhaOAeiNIKWOpWEuTgwqIaVGUQzwiU98BVW1t+5LpJVYBJ3TJCkhBKwzaJsJZrM7aJpT3L3zPk5Pb+D4+Brms+MYdApfY0wHIJUFKgAi9z5JnLMQ8DFgFQKkWlfw3sLaNpcf07NJCAFnO1jT5pYRQAigD4dHmE5vwxkL5xykWjSD57uDaAMIAWvaOITBQ8bn/7Vr38PR0SvQusLJ8Yeo6/3FcAaiC8IAFl2YX/vaq344PIJzBkUxgHMGWpd4790/h1LFcto4FzBEa3e/jURo3CugZIHh8AjeO6g4edBag7adpq8Ge12tV8hkDQGINL4eALp2yh4zO8A505sEuuh3dU/fqhjEkkJhMDjAYHAIwOPFF38iBzetbdE0pzi+ew03rr+G4+MPMJsdwzkTM69CcCtkW6n4fSXiSHUDa1sAXSxFlBDg4ROF78O2naIsR6iqMZrmFMbMMRweoZmfwon0vbW8Ae5PNiSiNfD+nr2YUgXee/fP8ZWf+nt5L6d1ibIc4te+9qr/2q99nps3uhAMYNGFKcshppNb8PAYDA4xn92FkAq3b78NAHA2NvAUCkpqNnIn2gDpRLxfTiiVRlWNoFQJ7x20rqCLGs38JE8eTIEuWh/nLLQuc3PuIGXSmXVeGp2DVHa/zOeNf2rGfv/TcQHnLWRssl0UA9T1AQ4OPoFPvvJzAIC7d9/HycmHuHnjddy69TZm09u5/4kQEsY0vQzMImf7ATKWItKzLHyfqJj9WaCq92Bth6Y5hVIlqmoE6zpY0y2VDTILi2j90qGHFAoWgDUdpAp7NhdL1uvBAWazOxAQKKvRui+ZniEMYNGF6bo5BsNDNM0p2nYCIRVu3nwDzpqcHeC9h/OxuedS/x0iumhLJ+C9iVFaVajrg9DgsxxCFzW8s7ExtElfzEzKNQuZMgrGzCFjvyIhQglPCGwxS2abee9CA+w8ORBI/auARYaWwHJzbPkxgS3nDDzCpkUIiYODl3Bw8BJefvln4LzF5PQGrl9/FR9c+x7u3H4Hw+ERum4O50KfNa0LONfBO8sAFuVeaKHPWgvvLHRRoyiHMO0MdX2Atp3B2UUmYVrzMfuKaP3CviyVli8SDW7efAOXLn0abTsJwelqjPn8ZI1XSs8aBrDowpTlEPP5Mbz3KMsBjGnx0Yc/hNIlnDVQuoTp5uE0Dh5SaHiWIRBthLQJFkJC6RJFOYBzFlU5gpIaTTuBMW3uWyekAksI16y3GdRFHXsThbJCazuUJYMM22wRtEpC9lUOVJ3J0Pr4cHLI0LtfRpfzFvAeUmrs7T2Pvb3n8fLLP422meCdd/4UN66/ijt33gO8h9JV/v8P/S7tvf9X9MwQUsHHaYPGtGi7GapyhKocoW0mKMoBlC4hulkvyEpEm0BIGfdjgS6q3M/u+oc/wuXLn4HWJdp2hvn8GGXJDCy6OFy90oX42jff8SlSX5YDdF0oM/rw2vdQFANYZ2C6JmYMhD4bzrLEhWjdpAyDF8IUmpDFMxweQakilh7VYZRyM4FzNjT8zKd2tFZCwHsbnqcujLxOf4cPCmfQtgqZWKns43G+7uNIoe4JbJXlCOO95/BjX/wf4hd/6d/F3/47/x4++amfg9ZF7rlmzByAgI0Z1lKGiZjWduiXs+ZpiM7BWhMn0zGMsQtShqBUeukdURQ1imIAKTWGg8Nckhq+NxCbRhPROjkb7tX8c2fCGk9qfPDB9+C9R9tMURQ1tK7QdTN87Zvv8OFNF4JvCbow9eAAs+kdCCFgTIvh8BAnpx+FckIISBUX3N5zAUu0IVIvKxlHKQ8GB7nfTRV7HlgbgiMhAyR8XdiY8j4m2lVSKDhnsLf/Ar7yU38Pk8kNvP3WH+PDD76P+fwEXTeDUjr2zWpyg3dnOzjvYnA8lKkIqaBFWJL6WHrGPkjbLQTLU0DSw7mQAap1iaKoQi8sXaAeHGA+O4ZUOgYwefhBtH6LbF4hQsm5EwZdN8PJyUehr/H0NkTsezoYHPaG+BCtFjOw6EJU1RhtcwoAKIoadb2HW7fexnRyKzQGlAoCYlF+xIUr0UZYNHEPm5Hh6BK0LiGEQFmO4OIUM+9t3qgAvIeJdp11HaTUYWPjLUajK/jil/41/Pzf+LfxpS//69jffx7e+5B5XY1hzBzOdiirEVQcyQ7v43u/H+z27H+5AxbvgFja6i2MaeC8Q1mOIISE1hVGo8s5C0uIxTqQiNYnZ8fGA4X0MWs7TCY3cfv2OxgM9lEUNbz3aJoTlOVwnZdMzxAGsGjlvvHb1/x0ehumazAYHuZGfzdvvBGmXMSx3N47WGfihllyA0y0AVI2pLMGVTWOCxSBohjk/nXGtvnzzv6TiHaTkiljKmXNhHt+NLqCVz718/jFX/r38OWf+J9C6wqzyW2U5QhSacxmdwCEd7+QMpa6hgwdZ+MaQD5OCSRtovu9E4xtc8/TUJ4kUJZDVNWYbSOINkh/D+acDVNrpQqHD97j1s034b3HbHaMwfAQpmswm93Bb/zW+1z80coxgEUrp1QJKRXqwT7ms7uo6z107Qy3br21WMBiscgRQuQFLRGtj5CLQLJ1BqPxlfhzj6oaw8fsK2e7mKW1+MEyEKJdJ+C8hRACShYABIxpYGJJiZQan/7M38T/4O/+H/ETX/k3YE2Lppmgrg9iyXH4PcIhloaUKkxNjH0wabulMtD+D2e7mLHrUFV7AEKG73jvaj7ADAFMbk+I1sn7kAmbM/BjZmToVSxx88braNsp6nov7O0G+5BSQff6ZhGtCt8QtHLz+TGU0phOb6MoBpjNjlFWQxzfvRZPXG1Y6EgJJXVYuMTTWCJaH4FFILkoagwG+zFrsoBSBazpYvaV601EE+EHA9BEO815G5vFC1jbwtoWWlfQusq/bl0HpUp8/gt/B3/n7/4f8JnP/ks5wBV655leoGPR0J3v/x2Qh0UsJth672BsC2s6KF1CqRIAUNd7Sw2jBYdMEK1VKh0MWVch29Y5m3/cvXst7unu5n5YShVo5sdrvnJ6FjCARSsnpYYQElW1B+csBoMDtO0M197/LoBUfuAhEE7owAauRBvEA0JgPL4KIJy+VfU49r4KPW2AuNjpndAR0W7rTzpUahGMcN7m4JaSYTKhMXNU1Rg/9dP/C/zMX/+3UFVjFOUQUipYa3IgC0BsHMwA+C5I74L+dMmQhTWHdxZlNYKI30fj8dWYebVoHk1E6yGEgHMOHouS7n458LX3vwvTzTEcHua9XWj/wtACrR6/y2ilvvHbH3jAo21n+bS16+Y4Pb0eJ5vpWG4UFiyhDwY3wUSbIN2TQkiMRpdhTAupCpTlENa0cbrYolTQ+ZA1IYRkCQjRM8Z7B+cMpJCQQsVMq7Dh0bqG1iHD5vkXvohf/KV/F6PRZRTFIG6UbH7WhEMvvv+3XShBD++B9G4AwveJtR2s7VDFvmjGtBiNLkFAwHnHDF6iNQt7MH/PZNBQ4h3WeKen12FMC+csjGnRtlN47/CN377GG5hWijsMWinnDKw1OTU8lB9JfPThD0Owypp7Js/kgBYXMERr5ePp22h4CUAITA2HR7G8x6PrZv3PjpPFPKxt13G5dEZqii2lgoplXSnIkKfAXch1LJozW9dd2P/veVks3n0cNtLhvDOE+k3Qz/5/bks2Ugo+pZKxUEp4bya1FAp1fYB/5Rf/HXzms38LWldwzsbeKiJk58Q/fyolTD1YfC5Lo20Q3gWLd0PSdTN472GdwXB4FANdAqPR5ZiFvx3f80S7yjm7VNYN3Ls/u3791Vwa7L1HUQzyQA6iVWIAi1Yqn74502vu7HF899qar4yIHoVWRViUOBsmEMaFizEMUm06rSsIGTJhrGlCdozUKMsR5hfQpyIHMre0HLzrpgDCeywF4YSQuWH5o/N5Ul//JLs/vW9RMp+GmZzpKYdFT6ldGZDgnMXnv/BL+Llf+N/i4OClmNHpMRgcwpgGQqilwJWMfVi8s3lDRdsr9UIDgLIcwjuLohhA63KNV0VEj8I7h7t3r+X30dlMWqJV0uu+AHo2hEj+YlT2jeuvrfuSiOgRlOUIRTmA8w5lOcyb+a6br/vS6CG8t/F01ENKHU9NPYyZ4603v5V7Fq3Kpz/zNzAcHi31StqmhW1RDPO/v/H6v0DTTML3v+3itLwH/1nScAMpNbQuURR12KAXNZTSODh4CUIqKBGy4Zy3sKaBlHrRT8qZnJ0kpQbif8sUjNxm6fqvXPkcfuFv/u/wR3/4f8fp6Q1Y20FJvcjC8hbChSweIUKJWfhaZulss66boygGkFKhrEZo2ymKcoCiHKJtJuu+PCJ6iBvXX8vvubDHY+YVXYztXv3QRvvq11/zYZG9vMg3psGdu++t6aqI6HFU1ThvFpUqIaSE6VpY07DP1Yaz1kDrKk4RKsLpqAtZPO++82crz+R56RM/ieHwCMAimJOmiy1Prtxc3js4b/Heu3+Ok+MPIVUKrDw8A0tKlSc5eWeXGlMLCNhYyrm//wJeePGLuHr1CxiOLvUa5oZAzdlA1a5kYAEhS0+pElW9j3/5F/8d/Mm3/wmuXfsuimIQyl9j0MraRZN3TqjbDdY04e9fj6BkkSed1dUeA1hEW+DunfdgTIOiGOSPhUwsg69+/TX/6/+Xz/FhTSvBABatTFEM0HXz3PsgpZbOZ3fRtTMolTICiGgTKVWgrEYAfCgfjBtwa1o476BYhb7RQk+hkIFl4mYxlRBa0648AGl7JUIePhTDbVU5YRguEkoGg9Rc/FGCSF03D6XzEKGhdZq0GwMwocm1wnR6Gz/64e/hL7/7X6HQFa4893k899xfw4svfTk2Py/z6PKUibUNwb+HScGrpjlBVY0BpfDXf+F/g+/82X+KD659H9bNIZWGzCWbsf+VEPDOMoC+5cIk2ya+Y8KasW2nKKvQ2N1Z85DfgYjWRQiBtp1iNr0DvV/Hj0lIKWPv48FDfgeiJ8cAFq1M20wgYlPWfqDq9u13t2wTQ/RsKqtxbMSMvBixpoUxLe/hLRCevQ5Sql5vilj6dua5vAqu33Db+/ivIRCxDQEY730ufxRCxqmcNv63fHgGWWqUn+6VRTaWg/MORVHDOQNjwjCTqhrBe4dbN9/C3Tvv4/vf+6f4xMtfwac+/TdwePhyLxPLhzK6LZ/Up1QJY+aoqr04XKCDUiV++mf+Tfyg/l28+cYfxEERYum/pZQFLHvwbb2QWdfBmjAUoSyH6LoZtK5QlWPMZnfWfYlE9ABCCNy+/S729p/HIis5vOOZRUmrxAAWrUxZjWBtt7TY997ixo3XclYAEW2uweAgZ3xIVUBAxE2FZxnPFghTJB2kKuC9jUEAEbOxuhycXJV++fiifG57gi/9ISShf6OJJ8wKgHroO8zHSUz+bLBXCEhIdN0s9g6RCI3ew8hy6w2MmUNKjbfe/Bbee/fPcfnKZ/GpT/8CXnjhSwBCBhLU5v83fBBrW2hdIwU00zQrazv8+Bf/VQDAu+/8CSaTW1CqiAFAC6UUs692QFoHNs0JBoNDeHhIGZ5Vg8EBA1hEGyw1a79x/VW88qmfy89vwIe2BczAohXiCoBW4te/8Za3touLTpezAIQQOL57jdkbRFugiqUdSmkICEil0bZTpDIe2mxCKjhvkUq4Q/ZKeA6HcddupT8+NkNpyw4vnLPQuoSSxdIwkof9+aXSOQt5+YeEVBpFMciZRSlDTqoCWle5YXlRDOG9x4cffB/f+bP/D/7iO/8Z7t59b+UN+C9CblTvHazrcmlkCqz++Bf/VVy+/BkURQ2ly5yxkwKKtN3SOrBtp3nCpNbhfkhlhUS0udKeLvy7zO8xpQpY2+HXv/EWH9S0Egxg0YqEUhVjmtyHJZQdSdy88TqcczxBJdoAQi6yIYUIvXq6boZLlz8dPyZRlmNIqTCb3u6dstHm8/kQQcrF9DogTSg8G1g53x+LQFXoI5Wan6dr2Xzh+rUue1M3RQzOPfzPn06j7/f7hpI5k38vmcvtbZ7kZEybP65kAWtbvP7af49vf+s/wZtv/EEMTiJ+bpN/vm33pxRqqc9Y31d++n+Ol176ScxndwEIaF0irS9ou6WSWiEkZtPbUFKjLMd5otmly58OWYpSLpXhcu1ItH5CSjjncPPmm1BKx8m4IWPf2i7es4xf0WrwLUArEca2L/pfpUX6ZHITznHMKtHGyH2R4gbBudBENwYZpNRhoeJdvHeXP5+IVkPrCs7ZGJwKPbPKcojp9BZee/W/xXe/85+jaU4Wnxuzk8KBUfOQ3317fPkn/w288OKX8hCC0Byfy9dtt3iPhIxG58PBZur1JqVCWY3gnVv+fGbfEW0M7x0mpzfyv6egdJrCS7QKXAHQSgyHlzCbHSOdVqfmwbdvvbU4HeaDjWgj9INR1hkMB4c5czKUMsncvD1tJsAeWEQrF7KzNAAfs8DCfTeZ3MSHH3wf3/rD/xiTSdg8aF3HwLNfeX+zi6JUiaIY4Cs/9fdQ1/twzqKqxrGUmbbb4tDEmDZMRu29c6RUGA4OYd1iGiEPTog2RNzDee9w69bbvd7G4eOz2TGGw0trvEDaZQxg0bn72jff9pPJTQyHR/lj4eRM4eaNN3IzX0bmidbPe5/7WXnvAe9R1weQQkEIFUt2QsNl50yvGTcRrVIqMQyBKY2um8HZDkUxQFmOMZvdxZ3b7+Jbf/gf4/j4Wvyq0Cdqlxgzx2BwiJ/+2X8rDh8oc+8w2n4eYUCCtWGypNYlhFCQQqGuDwDvF+vFC5ieSkQPlxITPDxu3nwjl/6m+3M4PMJkchNf++bbvGHp3DGARStRFDXadoI0WSml+9++/W7+HC5CiNarf5qd7kelCuiiAoSAUhpSangfTsi9dxDgBoLoIqTekc6FgShaV6Exv7PouimkVCiKASanN/Dtb/0/cHx8Dc4ZKFUu9cfaVqlfm9Y1um6Kq1c/j89/4W/j7t0PMBgcrPnq6Dx47+M7ZfGOkVJDKQ0IAV1UOVjZf+8wE4tovfr34524t0tZWN57tO0ERVGv6/JoxzGARSsg0DYTKFXmdFIhJKxtcXLy4eKzuAAh2gy9hUhV7+WR9lpXuXwwnY6HBroMYBGtWupD553LDfBTjxFAxElPLZQqMJncwh//0f8T0+ntEAQQ29Io/+P1m/0XxRDWtvjil/51XL36OUynt9d4ZXR+Fk3ZrV2UEaZ3jxASVb3X+3S+e4g2Qd7DeY+T4w9hbdvrTeihVIm2mYDtJmgVGMCic+e9hfM2nKABSA+vtp2GxbVbTHAiovVLJ2ZCCAwGh4D38RQ8lA8a08BZk/tiMQOLaPW896GcSio4a0JpYByQUpZDALG01xoURY3J5Cb+9E/+X2iak62bRHh/Al03i/++KHX+qZ/5N1EUg/VdFp2blKEv4/d4Gj6gVBl6v3mPweCwNxCI7x6iTeK9w3R6+56+hEppuN5UXaLzxAAWnauvfv11r3WYlBQmBS2CVKZr0LWzpV4GRLQ+ZzcEQkiU5RAePo5DVrE/SZwQJSSANAWKGwmi1Url9x7OOyhVQOkSzlk0zSmcsyiKAYSUcWy5xMnxB/juX/wXOzGlzznTC1QJqDidbm//eXz+C397fRdG58THd4mAEItJt2ffP2U5XPp+ZiCLaP1S5qT3Hl03g+lC8Dns+wS6bo6yHELrGl/9+uu8Yelcbf8KhzaKlBLGzOO/a/h4Wmxthzt33s1N/oSUTAUn2gD9UeaDwQHKcgjTNRgMDiCVRtdOY5lS2Dym0zRuIIhWL/WBCvdfaHYthMjDFaTUsDY1e69gTIvbt97GX/3gd/PvkbJalvtibf79K6U+85HwnAKAz37uX0FZjnLgTus69lAK2aO7EMB7JgiR3ylKaRjToG0mkFKhrvfzJjj0PPPM3ifaEN65HMQCgDt33oVzNmRTOpuf38bMISWfx3S++B1F5yqNQHbO5klI3oeSwdOTj9BfNHMDTLReoSzD5bLAohzB2hZlNQwbC2djzx3eq0Qbx/v8fk1lWFIqTKe38c7bf4zr118FAGhdwdo29sVK9/L2BgEEBCAEvvDX/g5CL7AS8/kxtC5RFAPYGMiibRUyDqXSqKoxrG1RlKNcbugcS5KINkUKKJ+cfARgseeztoNzFkoVPFCgc8fvKDpX3rt8GlwUde+kTODmzTeRF81cXBKtnxC5NFApjboaw5gWVbUXBy90cbPgl8s2eApOtHZCyjzFzTkDY9q8WZhMbuG1H/03AJAnEwKAjRld2ys8ewQEXn7lZ3F49HLM+g6laN672HdlF3qAPTsW75dYsm47CCFQ13swpkVdjUNT/3zowvcP0eYQuHXzzdyrDgjT6Pt7QqLzxAAWnTshRJ4+kR5kQgjcvft+XnSkhtFEtEZp8+stynIEGceVF8UAArF5+1IGFgPPRJsibfilCiVzqXy/qsaoqjGuX38Nb735h0un39t1Ev5xvfZCEEvJAp/+9C/A2g5lOYb3Dm07gdY1D8m2xGIdGP6+vA8BLGOaOMSgAgBIVaCq98KEzThMhIjWK0zIDfu5O3feW9rXpWn03OvRKvANQOfmG799zaeNrjENymoEICxQnDWYTe+EppxcWBJthNSjzlmLenAA7y2Koo7NcwFrO/j7lGtwQUK0AbyHsyb3gJIiTHJzLkwsVErjL7/7X8LDw9oWAGIZ4S4IgfcXX/pJHB6+nAMboRdYySExWyxkbYSJm0IqaF3Be4u63o9TrCUzOog2iJASs9kd2Pg+8t6jrEa5/6L3Ht/47Wvc/NG5YQCLzk1aUITFdIW2mcSPe0ynt9HF0+H0MS4widZPCAEpZew1spj65WMfO5ZrEG0mpcsQnDItvLcQUsWywjDNTQgFY+Z49Ye/B6XKXF4HANZ1a776RyHwoF5dUoTgxsuv/Cya5jSUQssi99+k7ZP6Mlpr4OMUzqoawVqDqhrnz3OOASyiTWK6OabT20jZlG0zgdZVzpZk0JnOEwNYdG6kLGL6dzgB1rEHlnMWJycfxpNhu5giw0wsorVKgamiGOSpZqlkI9zHdqkMOH4VtrkBNNEukVLDw8cJfC5O+g2BHWc7DIeX8OqP/hvM53cB9A6aduQetq7DCy98EXW9H9YXUuZTf9psZ7PxwzsmtZmwcDb0a0vvpNSkf/G5RLRuQgh4Fw5NTo4/zPs8XdR5Pxiy/Yt1XyrtEAaw6Nx03TT2vwqBrHAKGprLTia38jSzFMBiKSHRmsX7UOsagICMk8wQA8+LEzNuFog2TdtOIKVCUQygVBhZHrKvDLy3kEpjOr0FQODNN76VM5S6bpZHnG+Xe3tiCSExGBzi8pXP9NYYYRoybZ9Fn1QXyl59aM4vhQQgcgBLqm38/iXaLUKIPFjBOYvp9FYOPIcMfh8Hiwh03XTNV0u7hAEsOhdf/fprHgDKcoSuayClDGNUTYuiGODGjdegVAEp5VJWBxGtj7MWUioMR0dhUpkuQ1mSd2i7WdxMnN00flxjZSK6SFpXsd9V6G+VNv/97BQlC3jv8M7b3wYAuNjnbjvdm/2Zenp99nN/C9aGKYzWtlxjbIH7ZVGFIGQ4OEmloLqoIOPf62B4GPs2bvs0TaLtFipsHJy14dBAF7hx/TUoXeYsrNSPsarGsKbD1775Dh/MdC4YwKJzoVQBrWvMprfzyacQIvfjmM+O4ZwFhOD0GKINkTImlSrgnAljj50DvA//JKKt5VzIwkKc7PbhB9+HFLs0SCVNrnMYDA6xt/8CwoRCNvneBakPlncOZTnIDfqZXUe0fqmiJiUseOcwnx8DCGtLrUtIqVDXBzg9vQ5d1Hwu07lhJIHORVEMMJ8fox4coGlOoHXVm0bhMDm9AevCiZmQ/LYj2hRa17HBs0dRDOHhY5bkvdMHiWh7pJ5YQOhp99ZbfxQ+viMZlC5uhrx3GA4v4eqVz4XSSaG4UdoBzhk428EjvJuAkHUYSt6JaCPEMkLrDE5Prsdnr0ATB3kdH3+A8d5zAICyHK7xQmmXMJJA56JpTuOkmBZlOYQxDVwMWBnThKi892EsMvvpEG2Mskobg3BaJiBgzHyHsjSInk0CAtZ2ORP65o3XYcx8597BKUh35ernYEybs85ou3nvYEwDAQGpdD5oSe8sIlqvswO5ZrM74Z0Ts/vreh9VNcLk9AaMadB18wf8bkSPjgEsOhfhwdQAEDDxn3W9DyEE5vMTGNvGbCy/aLTKTCyitRJSoigGcLZDWQ5zmW+4l4lomwmpYOO7FxAwpsHdu+/vzAQ3GQNXKYC1f/BiCMILGbICaKuJ+C4K5Uk2vKNsh6IY7Mz3MNG2c84C3kMKha6bo5mfAgglhvP5CbpujuHwCHW9n/s1Ej0tRhDoqf3Of3jXl+UQUkoAHvVgH0ppTE5vwHuPyemNkHkVF5khs4Ono0TrVhQDaFXGxs5DAB7eWTjXrfvSiOgpnd3kK1Xgow9/FDYcO0HkUkHnDKp6D3t7z4dfYYBjJzjX5Ym4RTGA8w5alXkaIRGtkRChlLs3XX46vbW0zxNCYja7m4dsEJ0HBrDoqd288Rq0rlEUQzTNKbpujq6bYzS+DAA4Oflo6fPDwlKwSTTRmlXlCEJKSKkhlYaQCl03AwD2kCHacs7ZmGFpAIRDpOsf/WgnT8GFkFCywNXnvsBn147puhmEVJBKhww7qVDVe+u+LKJnmu8lJgiIPLU69cGSUqEsB1BKo6pGMKaFMS1+5z+8ywwGemoMYNFT2z94CV03Q9dNc2q3lApd14QU0tnd+JlhYgWnEBJthnSKrVQBAQElNYxpAQj2kCHacs4ZaF3BeQvvHJyzODn+IN7ju0EIAedtXlccXfok+/ftiPD3KNCZBlIqAICUGgBQFuyDRbRO3rvQny6WbKfn7iz2PPbeo5mfQusK0+kdlOUAVTXCdHprzVdOu4CRBDoH4aHl4gJZqQKma6BUASklbt58M/ajELDWxM/Ra71iomfB2TKalJmQmjqniTBlNYK1Hbx3sLaFdzY0QiairaVUEZqai5C1IqWCVAXu3nlv3Zd2rmScdgwA49EVWMsS6F0gpQol7bYDvIezBlU9BuBRFHXYQMvUmmI5644lpESrJaXKk25NTFhQusRHH/4VlC4gpY49jx20rtC2MxjToig4RZSeHgNY9NSsNbCmRVFUqKoxmmYCqdKDy6OZn+RsjnSKtitjvIk22dlMhH72o+4tIoSQkFLFXiN+6TSNiHZD6H3lMZ3dWfelnJP0jBI5YCGVRlkO2aJgB/TfRc7ZRYP+6Ow77J6vJaKVSnu5tLdD3POlgV1SaTTNBFU1RlFUsKaFtWaNV0y7ggEsOgce473nMJsdo21DGaFSBdp2Cu8dJr100RzA4uKS6EKEbKsziwwAda+HiJKht4gxTe5dwD4yRNsuZqHE4E4IYAkc33l/fZd0jpx3yH/GqChqDIdHPCTbAf13kYllhEouMoP777C8tuSEa6ILk/Zy/bXlZHoL3ju07RRKFSiKAdp2itnsGOO958AhXnQe+JSnp/Kb//iGt7bD6clHqKpx6EfhDLz3ofeGNZjPjheLSaZ1E10ogdBYMzXcTBPIynIUJ8dIiHiybUwTvkZI9sAi2npnJ/6GPpTHxx+u64LOlegFr1KQXukKo/GVpV+jLdVrEm1Ms/SughDhHYYQmBUiHdR4/t0TXbS4t/PwmM+O4WzovxiyJw2EEKiqMU5PPoK1HX7zH9/gApOeCgNY9FS6dgYhJOrBPqztYoq3QNfNoJRG203hXEoX9bmxH8AeBUQXzXsHH6eRaV0CAGRs4O7h2TuGaMf037cpGDCfH+9EhmW/bCyXsgiF8fgys3B2jLVdeHdBQKoCAKB1GQJX8Dvx/Uy0TdIeznsfDzxTP2SDtptCKR0miMbBXtZ2qAf7EEKia2drvHLaBXzD01MRQiwaxcYUUms6DAYH6NoZppNbvWwOsWgizeAV0YVIASshRJ4ao3UFIUKwWasQyHLO5pMy7x2zJYm2XM5IifdyylKxtoUx8/Ve3DnrZ93U9QHOlhbSFkrvrJjZn7KHtSpjQFaFdxkWn5cCWkS0eosgViznjlmT08ktdO0Mg8EBrAkHo6FNRRumXnN9SU+JASx6KsY00LqC6eZomjAuVSqNtp1BqgKnpzeglIZzDjL24hFCsEk00QVJPQrCJiD0FCmKOgectS7h4eFsB+9cLjPkAoNouy3uYdErIQ4l/l23GwGsxaFYWs56TrnaEeGdFcsDnQvvKPhF9nDvXeacW2ym2WOVaOXSkAUR93NSSjjnoJTG6ekNSFXEvaCG1hWa5hSmm4c9Y2xXQfSkGMCip1LX+zg5/hD1YB+j0SXMZneXShZm0zt5lOrZoBVTvolWr38yDXhIpaHiCTYQSggRpzwFYnGaRkQ7wudMFgA7s4E4u45w3i3WHLTllt9FzlnA+1xCGCoASkilgTOZxkS0Wv37bDExNDx/Z9M7SyWGs9ldjEaXUA/inrHeX9dl045gAIueSttOMBwdoevmaNtZyMCKmR3OWZyeXs/p3D6ekEmlQ8mh0g/6rYnoHKTMhDSG3JoWZTkEICBl6H8lpELbzUImljOcQki0A3yvCTYQ+ggpVcJ7B2vaNV7Z+en/+QBAComyHPYC8rSt0hRC5ww8PNpuFpq4x3cXAFTVCM4aCCFh4z+lYgCTaNVy+xilQ+C4l/l4enoD3vt4D0sURR33iVPUgwN0HXtg0dNhAIue2Dd/5yMfShIcFpOOUjPNcNrbNKcxA2T5W41TYohWbznjMZyQhf4D4X5USudTM3C4AtFOEwjlHvC73PQ6ZJtKweXtrsjvpPR9K0R4d6W/67iBBmIz/9hzlYhWJw1VAPrDQiSct2iak8Xnfcz75pu/8xH7yNAT4xuenth8foyU4p16W/mlKYMSk9ObOfMKWEyrSItoIlodEfsThIbs4X4ryiGUDNmPKvYScTY0yA2LES78iXaByGX7Pn0AQNh4uB0JYN2vYbeQEiJmgtMuEBAI/bCcDSWw6d0VJupWi6EjcQ3KgxiiFVvayy0OQL1zmJzejD+XZ/aFi7Vo2EMSPRkGsOiJleVwqd9Av4lq+vfJ5GbIwJKLXwsLTjZxJ7oQZ4LHRV7s+94EQpNPtsMCg4t/ol2x/K4N797dK7Fb/jOezfqmbbU4hPHe5R5u6d0FAEWcRAjgzEaZiFYllaj3DxGElPDeYTK5CSA0dj/bly79e2hlQfRk+IanJ5amGC0CWItR3UDI6uinkQZiEbUnopXq32fp35Wu8sdSs2Nru9zsPWBwmYiI1q2X2dF7V8mYRey9D33dzr6zuMYkuhj3SUZompOYLSl6e8PlIPOuTMKl9WAAi55YUdRLqaHA8klv205yU81+fx1mXhFdkNRYMzVzjj2wws9V/vV+D6zFl3IDQLQLlu/lcIAkd67EbvnPuLs9vp4d97yDYi8d70K2sJQKQohQQni/zyeilVsaFhL/3TmLtpueeQ6nAFb4WFHUF3yltEsYwKInlkoQUp+d1KhPCAFnDebzkzDWWEqmdROtQ1rwex8X+zL8U0ro2EPEewfn3WJaaA5K814l2maLXkCL/kBA6Ci0K03O7zcQxjsHv3Mlks+i5b6qqXdb2gArVUBKDaXTNF25OCTlQSnRhelnV4XDEYG2mcBZk+/h/uekIBfRk9qNFQxduF//xpu91UFaIC82y85bdN0MUkpIoZYauzMDi+jiuF6PuhTAAhaZWIBfGn8McPFPtIs8fJ5Gurs9onwOytMO6A8hAOK7KryjpNSQUkHJYvE9faZMiYhWY6kk8ExwSkqJrpvDuu6+VTrpa5f3kkSPbldXMLRiiwdSmj4YN8nxxKwoBjg9vQHvPazt8sPKOcssLKIL4r3PmRZSKihVxCCyg1IlhBAwpo2ZkxI2TniSSjODgWjLSangrIGUCt65ELSGh3MGxQ400E3PrcS6DoDAvDmBUnp9F0bnwjsLGf8eUzsK7x2MaXPpoLUdPDy0rqCkXgS4iGil+sGodAgqhIh96jxOTj7KjdqX+7Eu1poMNNOTYgCLnkhVjePksuXJP2m6mfcOXTtd1+URUbYIHqdpTSkbKxVm5M9kcJloZyy9n2NplRAhAzOVEG+zs729EmtasAR6t5z9u/ZYZBULCBS66pUk8e+eaN26bpZbywDL7yMhBJwzqKrxui6PthwDWPREmuY0ToHpp4P6XCLovcN8frzWaySiRY86azuUcbGQ+mAhLy5CJuVSPxkGs4h2Quo/kjKWlCqg9S400F1MTe03Em6aUwbjd0E/ayNPM/N56IiQMg8jKKtxzvbn3z3R+jXN6ZkBQcvlg1JqNM3pmq6Oth0DWPREimIAa7ulj/Wb9AEC8/nJxV8YEd2XcxZFMYBH6B0Syn3d0gkZ0G/iTkS7JN3nZTmM5YS7Ia09pAjBjOn0Np9hO+LeSdeLd5aAgJQaHqFtBZtCE22O+ewY6ZDhbP/j1F6mKAZrujradgxg0RNpmlMURQVgcdrV3wRLKRlZJ9oQaYOnVBGnxMj8cefsYuogT66JdkuvuW643w1G48s70sS9f6K/yMaanN44M76dtl78O15+Z4W1pvc+9ncUDFwSbYj5/DjvD++9Nz2KouI+kZ7YLqxgaA20LnMTvrRwzJPM4kOKJYREmyMt8BEzsHyeGrpI8V5utMlgFtHOiAMdvLM4PPwkdqHR9f2CFca0mExureFq6Lzd933kF++tlE2cSuB3KauQaNst7wFTm5nFPW2t2YlejLQeDGDRY/vNf3zDhxOw/rSXXpQ99qOYz+6u7RqJaFlRDOI9K3IJYeod48/cx7uwuSUi9PqPAEIqOO9wdPTyGi/o/CxnkYU/pzFNPPnn8nY3LL+b0voS8LmEELEcnuVIRJujiW1kfJ5Wv7yu9N7BOYvf/Mc3uOCkx8Y3PD22+ewYVTXOvQgALPW+SidkbTdb30USUWjUHilVwjsXesXExrdpI7Dcv46IdsPyviDc9x6j0WXs2qQ25x2ct3DOwJiGAawdtNgE+14JoQofdw5KLbI5+u8+Irp4XTdfZEt6f0+mv/cOVTWOvbKIHg+f8PTYnO3QdTMURQ0pNZwzoa+OCv+udNgom26+7ksleqY5ayGVBgAoXQAxeCWlhvcOxjQARCgt8osS4NAMd7c2uETPGiEklC5hbQsgBKylUBgMD9d7YefIOQNrO0ihIIXCndvv9rJNabuJ8C6KG1/vHaSQAASMaXIJoZQaECKXI0mlFy0tiGgtmuYEQsi4T7RQuoDL96VAUdTouhncmYFgRI+CASx6bOO95yClhjEtFie8aYER/mld1ytLIqJ1EELkxX86qRZCxpRuiXDf3nufCgaviLZef1qbkCFIfXTpFYiYgbkThMiZN9Z1uHHjtfBnZkbpTrj/u2hRQpjKk4QQOeuKwUuizXB2Wn2fMS2k1BjvPXeBV0S7ggEsemzz+V00zSm0rvL0srOjjk03X+q9QUQXTwiRR4srVUIICRFHzYdfc7inEbII0wi5ASTabrl0I05wc87ghRe/1Ateb7ezgQpnO1z/6NU4sp1BjG0n4rvo7HTcMInQhY/7dBgjoGRo4p5K5YlovbpulocHnZ1CqHWYQjifs18yPT4GsOixWdNhODxC181wdqoEEBYX7H9FtAGEyNkISulQQiRVLq8IwS1/5ksYvCLaHamBbrjnr1z9XPz49t/jQsh4UBaeYU0zwXx2F1Lq3pRk2mb3fx/5fDAT3mmLMvn+9zoRrVfbTNB/1/Tv5a6bYTg8gjUsIaTHxwAWPbaiHMSouozNnxffRmmx0bUMYBFtAucdRK/vVWrk7LyD92ETcPaEG7j/iHoi2j6pge5gcIDh8NJOZUeHYFXYAN298x5cDF4wCL/97vsOyg2gF72xwuGMC9N1peplHRLROjXNJA9f8H7RaibtHbtuhqLk9FB6fAxg0WOTUmM+P8kji5cXiuFB1bbT9VwcES340CdESQ0pVWikqVKZhc0n1Yt7eHc2tkTPuv7ocqk0rlz9XG50vQvS80upAt47fPjhXyFk53Q5K4d2xb0TzFIWlox//1JqKP69E22Mtj3t/Wy5YqcoBpjPT/ispifCABY9NqUKjMdX0cxPlnpg9RtCG9Mwg4NoAwghIVWR+8KkXljO2d49+nGNcoloe8UhDt6jKGq89NJXAIiYhblLBGazO7h54/VcPsgMrF1wv3dQCmB5OBf+npUs4JxdetftUpYh0bbqunkv6Lx8TzbzE4zHV/OhKtHjYACLHsvXvvmOb9spZrM7KKshFkGrfoM+/8DJE0R0cYQQkELlxs1SqtAbC/7MIv/eXnZEtL1Eus8BaF3j8pXPpF/ZiT5BQkg4HzJJJ6c3MZncgi5q9kHaEfe+g0T/FxcZxFL2soklg5dEG2JpLxgTHpKyGmI2u4O2neJr33yHC056LAxg0WPz3kLrCtZ2OZMjneqmfljN/ISLCKI1SxsApQtY24UpTek0zNk8dryfPZnw/iXabOkdDIg8mCH9e7/fiJAKr3zq5yClhnMG9xu+spkevKfx3kEKBQ+PH/zgdzEYHqJrp6Hfn2MAa9vdr3l7LiVMQSshIISEViWcM7lElgcwROuV2smEjFgJGXvVpV7J1nZxmr1d96XSFmLhKT2Vs6mh3jt452BtxwUE0YYQ6dQrjh0HuMAn2nZFMYC1XQxKCUgfNgZS6Xy4VFVjSKnwyVd+Fs7bXr+Rbbj/HxxkS+PZp6c3cXz3WtgkSRWC9YrL212X32G9pu1iB6ZrEu0KZ028PxftZrbj8IQ2HTOw6Fx57+HhYSx7YBFtAiEEROx5058YyhIbou2WGllLqVEUgxi0MnDWwJoWUirM58f4/Bd+CUUxPPPV27iJ8Gd+hA3RtWt/ia6b50beMmal0W7rv8PSu01IxQ0y0YawtgXQPzD1SxMJiZ4UA1h0ThYPIwEBY1ouIog2hIyLegawiHZHKCEUUKqElCpkQHsPISWElDCmwWh0CZ/81F+HtS2kUHlDsV0WAavlH8BsdgfvvvOnqKpR7n0lVRGz0miXnQ1gCbGLAwqItldnmnVfAu0oBrDoqfQj6TlgJQQsA1hEm0GIXDaUFvcCIo8gJ6LtJKXKfa26dhqnjBaQssj3/Jd+4n8C78L0UQC9+37bTsDvv554790/w+np9TwRObQvsCwlewY4t/h7Tu82KXUuJySi9TKmWZT3pixJ3p90DhjAonPhe9MlhBBLDy0iWq/F4l7lqWTMwCLadotmuM47aF1BCIGum6Jtp3jhxS/hxRd/AlpXcLFRblEM4r2/Le/njwu0ecxmd/D2W3+MshqjbacxC0fCWgNd1Bd6lXTx0jvMp+m6ADOwiDaEEAI2ZWCx9xWdMwaw6Nyk9H3vPYxpc7NoIlofAXHvyRfHzBNtPR8nAIcyQg2lChjTwjmLvf3n8bnP/yJSAMj3Mi791mVfLfM+DIp5681vYTa7AxnLxwAPKTU3Ss+INIUQWLzbhJDMviPaAGEv2AGxN3L6GPtf0XlgAIvOl/exsSynEBJtisWGbrGwZwCLaLulzBMBAe8cjGlhbYfR6BI+9elfwNHRKwAE2nYCpUo4Z2BdBynUFveI8qFRvTN44/XfR1EMMJ3eRl3vw9oOQMjCadvJmq+TVm35HbYcyCKi9cvvmRS44r6QzgkDWPTYnLOwtotTj8JioX+6K6WKE4H4oCJaN5EncvXGjPPeJNp43rn8T+9TdlEokQvTB1Vs2h5Kg53tUNd7uHzls/jsZ//l/PuU5QhA6A+kZJH/fdOlsscwbdAhNXJXqsAP/+qfwXsLa1sURR2a1EsFH79GqWJdl00XJGRbIU6dXLzrhJBcfxJtgK6bQchFBUA/6FwUg1D+zn6s9AQYwKJH9hu/9b53zqAoBlBKYz47Xvr1tGDw3ueFNxGtV5rOlH6wNx3RdvCxJE7pkD3VthN471AUA2hdw3uPrpsBCAEpD4/Do5fxk1/5n21xhtWCFAqAgDHzELiLf6aPPvoR3n7rj9Z7cbR2qWWFR7+EUOR3HhGtTyoX7O8N++azYyilURQDOGfwG7/1PqPO9MgYwKJHVhQDAGGqRFEMlvtoxP4TAADvYV23+DkRrUUaKy6wPAWG5YNEmy9NGAzZVjpmTYVT7BDUife3kHDOYG/vefz0z/wvoXW1FRlWD5OeUzJmUymp0TQn+O53/r9hUAw907xzIXujP0QI8Z6Q3N4QrZu1XS/j3y8doHp4FMUgP8vTHpPoUfAJT49sNrsD711eLGtd5oi6gFiKrqdeFES0XkLI2LR9sXhIJ9dEtLlCuWAHHycMLgJaJpdJSalhTIP9/Rfw83/j30ZZDuNXb//9LYRE100hhYIxcwAC3/vuf4mTk49QVXvrvjzaACnIKXrvOCEky+SJNoC1bf537/3SgAUdM4vDu8xhNruzhiukbcUAFj2yenCQRxS37Wzp14Rc9Bzw8LCmw/aM6SbaTd77nHUFLBYP7DlAtPmc7XLmlXMm9wsRQkLrKgezDg5exM/+3P8Kw+GlHNDanfdvyO7Wusbrr//3uHbtexgOj9A0p+u+MFqzkGXVC1rFoC17YBGtnxACLiUznDlETdJeUkqFenBw0ZdIW4wBLHpkd26/EycZWShVwLmzE2DiQgIiRtV3ZQFNtMWEWEyA6WVgEdFmc95CqRLeO3TdHEpplOUQ1naYTe+gLEe4fOUz+Jt/63+P0egy0gZe66rXAH2b+VhWInD37nv4q+//Loqixmx2l+sLAmLmv0AvaHWfTTIRXTwhBKyzeV8I+KXgsnMu7iXDe+7O7XfWe8G0VRjAokd2dPRKLh1USiMtlkOWR6/HTpw0wR4EROuX7kkgNEUOywjPDSDRhkvZk6kMIwVzpJAY713FS5/4Sfz1n/tfoyzHsdxuhvReNt18TVd9fpx3sXn9Kf7k2/8EUmp03QzOWWhdrfvyaAMsSgjjejNnYxHROgkhFxPqe0MWFjyU0rmU8OjolYu/SNpa29/lky5M05zE8gUH59zHLhKEEGGDDLEDXTiItpuAyP1B0hTCcBrWG7xARBsnnFSHU2ulVMi8mt3F/v4L+LEf/7t4+ZM/C2vbvIkvitD/ytoWZTla45WfDykUnDf4wz/4j3B6egNKFbC2w2h0CU1zmlsa0LPK35NNLPL7jYjWKu0FhbinpDe1t+i6BjK2oGmakzVdKG0jBrDoMYgcPVdKwzkbRqQ6C6H0UiaWd5ZlSkRr5r2HVArWmjiZScX7lvcm0cOF95m1HYqijh9LZRDusbIY++VN4euWy3ml1KFnSLw/hRBQcfqelArGtBgMBvj8F/42XvnUz+Pg4CUAgFLlPf9f9/vYpnLeQooQiLKugxASUqicdfYn3/4nuH3rbVTVOExjFOG/BYMUlIRhBgrwHs47KKXzwCEiWg/v3SIDCyloFT6eDh8W9+rinUj0KBjAoqcihIDvj0X1i2g7m2gSEdG2E0LCmBbWGShRQEqJ0IHhwe+49D4UQsaFu49fswheSanhvUXXTeG9h1YlZDwQ8t6hbefQusLzL/w4PvXpX8ALL3wJQMiy2qZA1f30/wzeOygZAnZtO0FZjvAX3/nPcOv22/DewTkLZ7sQoBACUhXwO9Hni4hoB8V9IPeCtAoMYNFTO3sK7b2HZ2kS0Ua4X6bCYiNNRB8vBJuk1BBSQqkiN531zkKqBy+hvDOL6UuIJ9LeLS3ohQi/f1UtglFpuqCUCq986ufx6U//DRwefXLx++5Idkk/AOe8hYp/prIc4jt//p/inbf/BNZ2S/2uZGwCzCxSejBmcxCt08ftBdl/lc4DA1h0/mKpRL+kkIgunug1zuS9SPR4UjmfUiWsaUMJm4wDTOKwkgd+vbeADeUS6R4UQudyCSEknOtgbQd4j66bQyqFK1c+hxde/BJe+sRPQus6Bs1M6EEpJZQsdiKAFYQNjpIFjGkghMCf/sn/Gx9e+x6cd7FxfQjqCali+aaNfxfsgfUsuyezQwgID04hJNoUqXQeWLov79cXi+hxMIBF5yudNGO5VIKI1qS/aIBgdiTRIwrBqkWpnxSLskEp1UMX4GU5ytmOufecd/B5UpqHtR2GwyO88OKX8dzzP4bR6BKqei+W0y3eoULIfD1A6PWTekdtK+ctnA2TjQHAmDm+9Qf/EWbz4xCoQwj8WdPC+eXJg0oVzMKihTPvOR7YEK2X7+0H2bOQzhsDWHTuuEEm2ixcPBA9Pus6eOcAeFy5+jmM965CALDOAMBDA0g2lgEqqaF0Ca1rFEWNohhA6QKHhy+jqkZ5emAKTAGLMkHnQ7mikKr3/7cb97MUClJLAALHx9fwJ9/+J5jPj3MPLGs7OBey3aSIfcHif3tVlLnROxGQJmAT0aZY2g/2DnyYfUVPiwEsemppskR6OC02y7uxyCbaVssjxXk/Ej2ulPXz41/8H8Vm7E9eund22lLXzfJ0w/RrZ4NiUihAqfw5aWrftmdfASFAqGSB9977c/zV938XTXMKY1pU1R7m8+NYPuiXJzTG03wXA1lE92D2FdFGSOvPfhZW3jMSPQUGsGglmPFBRETbLE3FSw3Vg9Tf8VECWctl9GfLmlJ/p/Br4fdz3sYSqPT7p5Pq8DG1M72vwn/f7/7Ff4533v5jOGcB76F1BWs7lOUQgICzXRj4GKc+pjJKazv2wCIiInoG7c5KiFbqa99826eShv4EoH6TaOfDVCYPD6VL9iAg2gDWdRBSwXsXNn1C8t4kegwhaCLyj0fPwjp7n4n7fOzM/5dQZ37/h3/NOqWssPtPNb3/tEDvHabTW/i9//r/hvfe+w6cjSWZqshfY20H70PT+vQ16fcMgSwGr551QojQuF0IOGvy4CBrW77jiNZMCAEV+xsqVYTDmd6eEUiTeX3cWzp87Ztvs7aQHgkzsOhcnK1n3p0JSUS7gGsCIloNcSbI5nzIpuqXXBrT5KDTu+/8Kb7/vX8KxAbtQNrQLAJeDFDRE4tTsIlovc7uBXlf0nlhAIvOjcBiLOpiWhIRrRUXDES0Ata2UKrM/w4ASpWhP1eMZ4U+XwNoXeH2rbfw+uv/Atc/+hG6bpb7eAkpF9ndzsUeRiGgRfTxmGVFtMkWk3w5iZDOF6MM9FRSyjaQIu1hwakUv7WI1o2nXUS0KkqVsT+YzoEsY+YARG5+XxQDzGa38dqr/xxvv/VH6Lo5ynIErWs4Z840xo/PK+8BwWcXPSYfZp7xtUe0GRZ7wUXfSCEE16b01BhloHPhfRh17b0HvM+LWSJar3BLeq7qieichabqzlt4Z6FUAa3r/GvOWbz6o9/DW2/+EebzE2hdoa73YUwDYxqU5Sh/btjQ+F7PK88+RkREW0ypclHSy8AVnSMGsOic+KWoulLFmq+HiIiIVsU6AyULSKHgxGLi4unpddy4/hpee/W/Rdc1EEKgLIcwpollhwWqahwmDyI18g1DYlLvK+/tuv5YtM28h8+TQhkAJVqn/l4w9TkkOg8MYNE5EHnxCTZgJdoYPi7mF9lXXDwQ0flQsshlgFJqnJ5ex9tvfRsffvB9NM0pnLNxbSDgnM3lhgBgbQcAHxtkYPCBiGi75b2g90CcNMghX3QeGMCi8+E9hBR5e8wHFBER0e5KTdxPjj/AW29+C9eu/SWa5hQCAs5baF3BWgspVWjuLlUIqvdKmoVUMXvbLn4NLCGkxxUOaxaNohcZgUS0Hv29oBAC3nnelnQuGMCiJ5YWmN47SKVhTQupCsCHNFEhZZgoRERrIaWEdzYs7NOUL+/jplHmkfVEdH/WdVCy6E3cy8c067ysh7g30zIFhkSe8Hf28x/9z2PMHLPZXbz/3ndw/aNXcfv22wiN28swjRgeRTGAcyY38U0lgamMZNHravEM6peYMHhFj0LFjD7nbA5eMcuDaP3CM36x3rSmhdJluFcFq3To6TCARU/tnoWmD41d2TSaaL1yCSHi6RdCI02OMyZ6OOctZFxoLwaThCBL/9fWxaWgEMSZDfu99/eDA0Lh16zr4J2DkDL0tfIWSoYeJta2mE5u4fbtd/DBB9/HrZtvQSkNYxpIoSCVDr9PfL4wOE5rw7Un0fr194K91w8PJ+g8MIBF58L3euyk01dOmyBaP+/s4l7sZWHw/iR6sLMBqkVmh4DcgAyP5evzMcPS5aC1kkX+eQhyicXneAchVfxziPz56P2xuuYEt09v4PpHP8L1j17FZHIDzprYJNthPjcodAWpdO53JeNpO9HqhczBnBMpZei1FstRuVEmWh/v414QPt+lXHfSeWEAi85BXCSkTbH3KMshFxBEa+a9j5O+0kI/3J/cYBI9XMqyMmYOpcreQvx+ZXjr0C9nDAGq+97bcYT5x31Omg7YtlMcH3+AWzffxPHda7h79xoAHxuwWwghoXWZG7GnBu6pQTtyJpiIv7YJ/41od4n8PebTO857eMcJlkTr5uNeEKm3YX4f8L1AT48BLDony1H1qt5b03UQUV86jQaQF/YMYBE9XMpw0roGkJbdIfvI2g5alx/7tRfjfhsBv/TrQsh8vztv0TanmM3uom2nOD35CKen13H3zvuYTm/nIBXg4awJ5YBCQqkiBq1iMMsauJhtBW8AhBLL/P/jTOx/VYBoVVIw1nuX+61672AZPCXaCPfuBTlcgc4HA1h0bnKJAoC62uMCgmjN0pCFsGhYlBctJn8xnZvo46QeU1IoHB9fCyVyQoVhJfCYzdab6WG6Obx3cN6FoJIzsLYL1+09ZrM7mM9PcHp6A9PJLXTx86VUEFLl8uJUUgikMkkRfj0+O8LheT+DS0BBwJoGHj6XDabAnhACWlfsg0Ur1gtgxXs1BLOYgUW0bkII1NVe/vcw4IvofDCARU8tb4TTdCMhQtooEa2ddy5PH3TOhRJCuVj4E9H9hQwsD2MafPcv/gvcuf1uKI2DyNMJ10nI+zWRXwSlU0ZVCDCloDViICtMgpJS5V9PmSwe4XWesrEW/bVSsMsvBanCx20uVw7/X3y+0GqF7EIB52KJUu/7lAc0ROtXlsOlvSHAJu50PhjAoqdyvz5XAgJKl1xAEG2SuPkEwCmERI8g9XjSukLXztB1MxTFAEVRh0wnZ9Z6fbn/T2+ISuLTBKhY9pdK/RADTyHAFBqvOxt+TUgZg2L3BgFCIEwCSEGz0OcqBbUEBJQqYiDMouvmUIpLTFodIRab4v5a03sPISWnERKtkRBxL3if9SZ7JNPT4uqCnlgqJbCmg1QaxsyhdQXrDOrBAYNXRBvCWQMndc7IsLE/zbo34ESbTEqF0K8jvMu0Cj2v2na6EYvvB2U4hetbTB1F73pD4GpRZiVkvyeeX/r6xZ/T3/edHtYBKl9PuiYGr2jVpFRwzkJKBWs7WGvgnQ2BV8fsP6J18t6jHhzAOgMd79GiqOGsgdIF94j0VNjJl55KKh0Mp71hESuEQFkM1nxlRJS42NcGQJykJjZiA05ERPQkhBAQabpu/Llj2SrRxiiLQV5rSqmW9oxET4NHZPTUUqNoGUsPBASnEBJtgEWJkY1p3B6xIzMnERIR0dbK77DY/0pAxN5u95YVEtHFq+q9vPaUcTAID0/pPHAHQ08l1DGnXgOLZu5FMThTlkBEFy0t4K1p86lXukfv3wCaiIho8wmp7nmvWdMCYPCKaN2ElCiKQS/jSoQhQkLy/qSnxggDPZXlSPqiSbSUKvcLIaI1EgImjrbv96hhBhYREW2r9A5L7zUR33VghgfR2mlV5tYyYd25CFoxC4ueFncwdC6ElLlpZkjjdiir0Zqviojgfe9U2sHF5s2SASwiItpS6R3m4jRNIGYbM7uDaO3KapQn1AKAd46VOXRu+J1ETyWN2Q4poS6M2lZh2lld7a/78oieabmE0HUAljOwcJ/RxkRERNsh9bpK7zUR33UsISRat7raD1NClV7aI4Y9I9ef9HQYwKJzEAJYLj6cUqlSUXISIdEm8C5kXXnv8+k0FxBERLSt8jss9cDC4l1HROtVlINc2tvfI/ZLCYmeFANY9FS893DO9rI6PIxpoVWJ4ehS/hwg9MUSvfGpkk2kiVZK9tK1jZmjKGq07RRSSEipoXQFaw3SAAbnLITgfUlERJtBCBXXmaERtLUGSleQqoAQAk1zCq0rGDMHAGZ4EF2ARX+rcL/1fw4Ao9FlaF3BmpAVGe5JD+8cMyTpqel1XwDtjv5pGABU1XhpEeHiydhixLEDEa1WWig4a+F1GDeeG7lDLN2jgmWFRES0YfrvJiFE+Ln3vVwOD2eZfUV0URYDgdIk0MUeTwiR+yB7eAik/sgMXNH5YAYWPZVFMMrH1FABjzDOeDS6DAix9DlAaPguhIBzDGARXRRjW4TUbQ/nHTw8pJRxY8BFBRERbToPAQEpJXw8jPE+ZHWEdxz7XxFdBOdieaBM00B77SmEwHh8JQeaw8cXIQdOwaanxe8gemrpZCxPmogPq73950PWx8cuJrjIIFo17z2ElLC27fUJSSdnKo8cX2RieW4AiIho7cK76EzfRiFyqXvoeRWHldg2vs/4/iJavfvfZ96HbMjx3nPxs+LnpRYyLO+lc8AAFj21EH33yxth7zEaXkJ/4ZEzsXL9Mx9iRKuUTrkERO5DACCPNg7TYUT/Cy76EomIiB5MLJcQSqVjSVKYPggAxrSLdx7fZUQrJnL2I7C8zwM8RqPLsXxw+V4UDDLTOWAAi57KUiAqnpQJEVK7q2oMFZtsLqWWRlxgEF2EEFw2pll8JPYukELhvoFkBpiJiGitFuVHZz8uYwaW6/VStaZdbJa5viRaqfvt51JDd6UKVNU4TiGMoYZeKSGz/OlpMYBFTyVMLQvt+VKaqJQK3jtoXaGuDyCkyg3cceYhR0Sr5X04AbO2zePGXW62Ke9ZhHBhQUREm+LsejFkeqS+Ow6pr6NlDyyiC7O0Xoz3p3MWQirU9QG0KnMLi1BI6HOWFod40dNiAIueSoiuLzKwUkZWemiV1Qgyj0DuReIBnpARrZjv/c85G0+rfZze9PFBZM/0biIiWrOPexcJEQ5NFy0pwjsuNXa/f+YWEZ2bpaCyhPcOzllIoVBWIwipkKpyAPTuSZHLDomeFANY9Eik1EunXkA45VKqiNMEfXxYhaaaShVw1mB///kQuJISSpdw1uQphHyAEa2Ws3ZpCoxzBgBgbZfv5bIcwlqTJ4k6Z6BUsbZrJiIiAhDXmCaXHVlrUJZDAGHTbG0HeL/I8kdYrzILi2jFYmakkBLOGihdQsgQyNrffx7OdpBSw6X1ZazOcc5CquV7NFUDSKnX+AeibcIAFj0SIQSMaePGNwWyHr5AGA6P4OGhpF6kjHJhQXQhwoJgUcJrTJs3AT4v+MWZ5psJ71MiIlqX5XfQ4j2VWlG43rst9Hj0ua0FEa1SDkCl6dbehb0ePIbDo0f5HXLgytouDmHgvUuPhgEseiTGtCjLAbQuIWJJoIwZVw+yt/9CzrrqZ1zxIUV0MdKJmJASXTcFEDKxnLNxHPlyZiUREdEmyn0bhYB3NmQVC4GunYZMEGdjzx0iukjeubjXs9g/ePGhn58OV4VQ0LpEWQ5gTHsBV0q7gE95eiRaV2ibaUjXBmJPq4dnaIzHV/IJ2VKzPwawiC5EKAu0EEKi6+a5gabzobxQSBUDWCI3fCciItoEAqlZdDhsEVLFj8WejkB8t0k473qfT0Srcna4Qlo/OmcxHl99pK9P+0NrO7TNFFpXK7te2i0MYNEj+ZX/4AVR1Xsx+8rETKyHb3TD18h7+l1xk0x08Yxp8sLeewcIASkkpFRn7mduAIiIaH1S0CpJJfFSSECIOJQkMHECIbznASnRhfBnGrmLfFhaVeOHfrUQAlqXscedQlXv4Vf+gxd489IjYQCLHlnbTnMTaO/dI21wy2KIqhrBew+pYslh3kBzg0y0crE5O7yHj9NAAcDZDgKpJCNkYBEREW0mkd9XAuEdlrI4nDWA96G1BdeWRBein+0Y2lV4lNUIRRy08CDe+8V61Bm07XSl10q7hQEsemRlOYTWJaRUsNY80rSIshpiOLoMIE2GWQS+2AeLaPU8fO41EBq4h6lNxoRy4EUAi4iIaHP131dd18B7B9sLZKVf4/qSaLWWp9K7vCccDi+hLAcP/XopddxLph5YDw96ESXctdAjM2Yep0SkBcTDT7m0rjEY7IfUb6GWIu5EdAFin4Jw78XTau/gXJf70XGxT0REmy41cIcQcK6LkwgNgPB+E1LCc4Iu0YVJa0spQiuKwWAfWteP8pV5P2lMC2PmK79W2h0MYNEjE0LlhtBKhch5+HgYa3zPJlgIGDPH1atfgFIFptNb0EUFIIxM5aaZaLWECE3aUwmvlBKz6R1oXcI7B9PNIYWE1hW8D800pdKhvJD3JxERrYkQAs52kCpkdnhvoXUFKSRMN4d3DlpXmM+OQ28spcIktDSpkIhWRgiR94G6qDCd3oLSJa4+99dCMOrMPXh2r2itgVI6Z04K8fDJ9kQJA1i0UkJIDIdHi/TSmA3CkiWi1UsZj9770APLezhvw+QXIWBdCkKnKYTxc7n4JyKidcvZww6pBxaA8O6KTaOdt0vvuEft0UpET0f0MvilKuC9w3B4BMlgFK0Yowi0UkJI7B+8AO8dlCpyancqaSKi1UmLetHbBDhrYG0oBXa2gwegVLHU/FYIyfuTiIjWxqcBJOEnkFLFdWQcQiIkrG3hrMlBKyFEDmQR0WrlTEfvoWKf4/2DF5ikQCvH7zBaLe8xGl+BVEXYRDv2vyK6SGcX8s4ZdF0TF/9h4S+kCkMWsAhgERERrVN6F4VhJDqWxDtYayCERNc1eTp2wuAV0er1s/WdsxBSQskC49EV9qGjleMuhVbKeYeyGGI4OATAhQXRRUqnY0KmR30oE0zNMp0zcNZACAGlCggI5OEMvFeJiGhd8jvIQyC+o4SAsyYHrYyZ5/JCYPGuYw8sogsQ79GU7T8YHqIohxzWRSvHABatnIfHwdHLS8ErBrKIVi+VDorYODP83KHr5rnkwroOQCgjFLJXOsgNABERrUt8B6XpgkoVAADrulwSn95l6f0mIBalhES0Umf3dYeHL/Pwky4EA1i0UlIqOGdw6egVAOhtovmAI7oYPvyv1wvLmAbehamDoX+Ij6fbqQ8W708iIlq31Mcx9r/yHi5OPvPOhndZv88j+P4iuigpuCxj5uPRpVdgXccm7rRyDGDRSkmp4KzBaHwFQEzvFr0yJSJaKefd0olY2AB0cN7Gn7u4QZCheTvYAJeIiNYvBaXS+wl5IiHCRF3bLb+vvA/vPCJaqdyiojcddDy+EvthMYBFq8UAFj0W7x20LiGlRtfN8sfDgyyOU41p3AKhV4FUGpcuvYK2ncYeO6Hhn+QDjmilnHPQ8dQaWKR7a12haU5jP6wmBq0cqnqcP4f3JxERrYuUGkBYd1bVKOUSx6wrh6Y5hdZV/JzFO06rAo4Dg4hWSkoN50xu2N51M1y69KnwcdvlfSBi5U3eI0ZdN4OUGlqX7JlFj40BLHpkv/bLnxRSarTtDNZ2qOv9h39RfFgVRY16sB8yPJyLqeB8YBGt0v37gHhYZ2BME36WSjKEgBQSUkiEDEn2ECEionUK2VfpQMU7mxtGG9PAOoP7ZfSzBxbRajlvw17OOQghUdf7KIo6/OIj3H91vQ9rO7RtCGT92i9/kjctPTIGsOixaV3CdPNHXiAIIVGUQxwefCKXJ0mlWaZEdMHSPeusQdfOcjlGauQupe7dm7w/iYhofbxzkFKH/owArO2Q+jp27Sz3w2LAiuhieefyetHD4+DwEyiKwWPsDQVMN4fW5YqvlHYRA1j0WNIUM6l0XEg8ytdICAhcvvJZWNPmjzOARXSxcp+rWDqY+mO5eC8LISFjdiQzJImIaF28d3A+ZOynDCxrFxMIUylh7o9FRGthTYsrVz4bM/kfrf2EtV0MgDkGoOmx8YlPj8XFyWU5TfQRSKlgncGVq5+FtSYEwZzlA4voggkhwyAFhEB0CihbZ+GdA4SAkvFEjQFmIiJak3CI4qGUDiVJ3oc1qPewpou/LiAkA1hE65D2ctZ2uHzls3DOhDXmI64f014y7S2JHhWf+PRYrGkhZci+etQFQzotC+mlVR53TESr5b1f6kXg4ePEmNBYs+2mcN7FviJhY6B1uEcfdQFCRES0CkJIKF3l4JVzBs47tO0kN4cWELmRdPwirjGJLkB/MNDB4UtwqUfdIxBChiwsqZeqc4geBQNY9Fik0qFxZsykehiBkG0lpcZweITh6BK898y+IrpgKZDcX+i3zSSUaTgbFh7wUHHKaMjUIiIiunihebuGVmV8T5lc3t60k/x5aYoug1ZEFyu1lRmNLmE4PMqTCR+liXvI3AoDhaTSF3C1tEu4Q6HHIqWGlBpFUT9SyqeQEtYZKFWg0DUGg8NQ7ywfrUaaiJ5cOp0OPLxzoVQw6sw8bwhSaYaME59YkkFEROuSpg9KqRYHMPGH6eb58xbvtRDAylnGRLRSQkg47zAYHkHrCkoVcM721p0fzzmLoqjzvpLocXCHQo/FOZPLBx+4QIi/ZkyDshzmkcfPv/DjIW3UPFoDeCJ6OinQfDYgFRb9Fl03g3MWXTfPTXO1rnqn2SL+wJkAGDcIRET0ZMI7SXxsz0XnDIpiAI/QD6tpJvld5VLfxnt+P/bTIboIqfeVkhovvvQTucRX6wrGtumTHvj1qYzQOXNBV027ggEseixaV6iqMaaTW9D64Y3cpVC5tllIicPDT676EonoMbTtDEppWNuGjYQLU5+A1N9gubfI4uNERERP5lGm3aYpZUCYliulRtfOLuYCieghwppwf/9FAD5kZMWqm4fRusZ0cgtVNYbW1Yqvk3YNA1j0WH71H7wkjJljNL6Mtp0+9PNTz6xA4PKVz8RaZ/bBItoEbXMKQITsShcyI5UqcyP3jwtiLX2MiIjoMXjn8rCQ+60HpVTQqgxTB20H60Lv1aY9vehLJaKPIZXGpUuvhP7GEHCx7/HDtO0Uo/FlGDPHr/6Dl7ghpMfCABY9NqVKmMeYGCGkyo2jB4MDDAeHcN49UpM/Ilod7z2MaWFtC0Cga2eh54jSkOkErZdtJcSitwizsIiI6KmI5X5VqZzQew+pCgipIKRC180hhIQxDUzXPOA3JKKLNBpewmBwkH8uhHxoZmViTAulylVdGu0wBrDosaWMKvkIjdi9S/10wsPMOYPDo1BG+ChN/oho1Tzm8xMoVaBtp7HxO8LJtxD3HUnO7EkiInoqOXgVfnjvw4FJfN8UvbKitp1C6xLz+QmY/Uu0KTyOLr0C512YSAgPrUtY+/A+x2kPuajSIXp0DGDRY0tN+h6l6Z73binQZU2Lq1c/D/kYEXoiWh0hJObzYwgRyghTdqXW5dI0QmZcERHReUnBq3wgksoJZZg+mDIzrGnielPEdxW3LkSbQAiJK1c+C+dML/NKPNL+7nH2kkRn8S1Aj02pIkyeeIQmfRACzpo8tVAImftgcUNMtBm6dgpjWkip0DSngBCQUkMItTRx1J8pJyQiInoS6X2y1GcxrhOl1LFfKjBvTiFlGDTSNpM1XS0R9XnvIaTE0aVPhXVi/J+Lkwkf5rH2kkRnMIBFjy1NmXiUUzABAWPb8FgTElpXGI4uQ0rNDCyiDWGtyQuJrp3m8l4h5ccEqhi8IiKip3B2QAhSn0UVsn9jdlbbTPJm1zrDw0+iDSGExHB4BK3KvCe0toPSD+9r9Th7SaKz+F1Dj82YFlU1hjHNUlPne9LBhQgNOIWAdQbwHsY0KIoaV69+/p6HFjM6iC6elGGzMDm9AUDAeYemnUBIhUG9H6YTWhMnE8owOYqIiOgpCCkBCHhnAQgoXcFaA+c6VNUYAHLGlRACp6c3oKSGVA/vv0pE5+t+e7Tnn/9xVPUYnZmH4DJ8GNzVG9R1dm+Y9o3eO2hdsoSQnggDWPTY6sE+mub0kaLm3jvIdJoWP1+rEkexkfvy5/JUjeiiee/gvYdzBl0XphA628F7ByFVKOXIvQ14jxIR0Xnzcb0YygfT9GrnDKSQaNtpfC/5pcm4RHQxzu7RvPc4uvTJ3KtOCpn3e49y0CmERNvO8NVf+TSzF+ixMYBFj+0f/p+viH5A6n5yzxxnc2004oQKIRWef+HHL+pyiegB0qLEOoNmfhJGldsOzoaNg1IFhOwNXWCmJBERnZfcY9FByPDOkULCOwtjOwipMJ8fw9gWIdDlmbFPtGZCCDz33I+FQV3e56nVojek60H3qfeO5YP0xPidQ0/EmBZKady/F07vYzFN1HmbH2TOGRwevYyiGHzs798vTSSi1UkLDecMmjaUa1jTwrou962TsgA3DkREdN5COVHohyVlAa0rCCFDz6s4FbdtJrnUMGUNE9HqPGwfVhQDHB29DGu7+Pmhp5V39sxB5/33idYa6EfolUV0Pwxg0ROpqjG6rsk/X+6DtfiYlArOuzxaVUDAmhZVtYfDo0987O/PxQnR6vXvW+8cTDeHMQ28s7mMUKkiBqvzV63nYomIaAct3ilKaShVwHsHa9vYg7GN2VfslUp0kR60Fzs8+gTK3A85DPxxzsJ5F6dYL+8H+/8Ewr3O+5meFANY9ES6btYbffrxDyAhJKSQMU3U57HIAPDCC196wJQzBrGILsbi/nPOomlO4bzLkwml1PFe7y9APBjIIiKiJxfeJYs1oAjlg1LD2g7GhJ5XTXP6SCVJRHR+Pm4PJoSAkBIvvPjl/LG0t0uBrAffp+HXpFRwHApET4gBLHoiVTV+yOSIWC5oTW4EbW0HERcozhk8/8IXc2+shEErovURQmA+PwYQRiEb2wJC5NM0bh6IiOi8pfeLlBoQAiZmXwHAbHYX8KGEPawR+R4iukhLezMRqmleePFLsLYLfVKFDH1TpYIUatEz9QH3aig95J6PngwDWPREmuY0LDQeIvTRCaWEqU5a6RLOGhwcvJgfhIJBLKILd797rWun4decDQFoIGZQCqTFCO9RIiJ6Wot3SXi/hKE/4fAzNHkW6NppL3gVP5uHKUQX4ux9lxIPDg5ehHMmZOh7HzP2VQhAx951DyKlDp9P9AQYwKIn8o9+9TNi0XzvfpvZsNhQsoB3DtZ20KqEh0fXzSGkgpASzz//YzEjy+XFSvp97QMzvIjoPEgVFhDOWXjvIVWB2fQ2IAS6bgaPkB5elsOQRSlkPA1n6vems9bk7FcpNbSuYa2B9x4uNkRe7Q9gUW7qcyn59mRQCDhv4ZyFMQ2kKuCd7S26V/vfL40i997DOxd/HhpepwMhom2VeuYA4cCkqschk8O7vAGeTm5BxnYV6Z0jleIhCtGKpaE9RVHne857D6VKPP/8jwEIQShjWnj4uJezgPdQUufBDPf5nQEAShX41X/wiW1ZDNCGYQCLnth8dvzAXxdiuTzwfp57/sfRtlMoXcRm7z5ukgV07rFFRKuSNslpU25NGzYPMcjRdbNc+qt1Gco64qhk2nQhaKRUAWtaNM0pAA9d1NC6QlhIrvIH4PKUSxuvaXvWq9Z1kCKUwBfFIPf+WASQVvvfT/Z6zyldQcamt1IqVNXexfxHIFoR7x2kVPHgRMd7TYUpuKYBvIcxbZ5EmN5Rnn1ziFZOKgUhJIxp4KwN96vSaJpTPBcDWB/rEVpOPGwPSfQg3IHQE1M5A+vhG5KUcnq2XPDFl74MY1ooqWOzdxEyr7hBJroQ6SRbShXuP9vBmDmMbeG9C+PL4aF0iaIYwDnL8o0toVQRJ3nZ2Isw9qeIgclVZxAJqcKzf1v7XPROkJ0zYWMdS5tCCf1q//t13Qw+T/FF2Eg4i7adom0nF/AfgGh1vPcxKOWhdZXfQV03g3UGxrYwZp4PNXMAi9lXRCsn4t7OOpN71KmY0f1ir4F7v6wwfc3Dfmegv4ckenwPb2JE9LSEiBuBe34Bo9FljMdX0HWzsHiRKpQyObetWx6irZKCUbkkMAaxmvkJRuMrMKYJZVOqQFEMcpP3rQ1KPEOkLNB105CFpUt4Z2FNaI683Gh1NQQWBxGLzafbmsMJpcIC27lQiilVAdgO3rtFucQKCSGhdbXU7LYsh5BSx7873oO0xeK60HuPshxCSAVrTZhyLTUmk5vhe//MO4oHKESrlw4r+8O3rO0wHl/BeO8qPjZ5gfcnXQAGsOiJFUWNrpt/zK8++qn7iy99Ga/+6L+D1iUWDaO3a6NDtK1kDBqHxYoMvQvgMZ8fY7x3NfT/sS2KGARRqoT3IcgsJO/PTZYCVVJpONvBWQPnHRQkdDmAs6vtM+i87T3Hz25CN/97JwSuQuAtfa+rVEYL8UiDTJ5GP4AWfthYzmHg4dkAl7aakBIu9pTTRZ1L1sNksxLz+XHI/o39dNKzJL2ziGh1wrtaLmU+GjPHK5/6eTx6K4CP/7yiqJ/6GunZtfkrSNpYv/z3nxeLk7BFaeD9PnZWP+vjpU/8VF7IOGt6vw+/PYlWLt5vqVeRlAreOXTdPAeoTdfkMo6yHKztUunxOGcgYo+Ztp1CSImyHKLr5phN7/QCI6v54b2D8/duNLclgyIs3EOgylmDZn4SM9hsCAiu+L9f183CJt6HEqvh8AipNDP0MCPaZgLeu1w+6KyBMQ0AwJjw/vHO5Q2062UJE9FqidjWJbWWSAHkT7z80w/NhgwfX94Tnv3YL//953kj0xNjBhY9NSHEw3sSCAHhAS8Q/olF352jS5/EcHCIpjnNp3FCSjbqJLoIqQeWiPedd3mhMp3cxt7+c7C2hbUFCgxiGeEJpNIrL0Gjp5P6T6VnacroEUJgb+85zOcnK/3/L4rBUqliWBBvz8GEjRlsxsyhdImyGkHrKpQ4XUAJodYKQAmtK0ynt6F1BWMalOUwTEVkBhZtMRF7nVbVGM7Z2K8vZDdOTm8BQHwfheEJ0sfvd/bAIroYsQVMWhPWgz0cXfrk0nt8qf/VIwSXt+UAizYbA1i0NmHxolCWQwxHl0KvHe8hpISAgIsjXIloNVLAClhMnElNv4uiwHx+F+O9K6EvXZwSquJ0UHEBPZToKcXnp1QahZRwzqBpJhiNLuGLX/rXMN57bqX/92U5jAtdD+ddr0Tcb0WJuJKh70dRDPHlL/+PQ0BOacznx3nTvXLe4/T0Or73l/8VZrO7EEKiKAboujkDWLT1ZMwmtLG/jvceUkhMp7cgpULXdQBC6a5UYQKh946HnEQr5r2DyIVaoQ/WcHiEshhASX3f7Gqii8IAFj0VazuU5RDWmtwvxMa+Kg/LzAoLFQHnLD7z2X8J3/7WfwIhBLSqMG9OIAUX50Sr1N8AhMEJIaiglMyb8/n8BHW9h7adoigGEELg8PATuHnzTShV5DTzRY+SRZo4m0yvnxAyN2MNgcnQu/Dw6JMYDA4v6irOPM8fPmJ7U6Q+V0eXPpU/NhxeutBrqOoxmmYSm7qHMeaaE5xo4y3eA977e94Vxsxx+fKn8+Fl181hbZszQ52z+cCk36/Pe88sLKIVE0Kia2eo6314H9pIfPozfxPGtCirEbwxD3yPL+51D6V0rrBRSqNtpxf4J6FdtNnHn7Tx6nofzfw0P8SaJoz2LsvBQ0+nhRCwzqCu9nD5ymfzabKxDbQqoBTjq0Tr1rbTGIj2oWxJFbDWoChSLyyff32xmPFg8IqI6Fm2eA+Ed8PiXQGEEmNrDaQqYu8rn/v1EdF6CSlRFHXuZwkAV69+DoPhIYxpH3oI5ZzNPVPT3lAIgWZ+irreX+3F085jAIueyj/896+Kqt6Dcyamlx4ibXStbQE8uN7ZewcIgf295zHeu5obebJJJ9FmaJvTMMocQNfNIRCag4fysMVpOhER0YOkUvQwEGQYBk0AeWCItR3a5nS9F0lEcdJ0mvgpMBpfxv7BS3EK6MdPME57PmvbHJgeDg9j30iDqt7DP/z3r3KTR0+FASx6asY0eWJZ181DPwPTPVJ5ipIabTsBhMCLL/5EbvLrneOYZKIN4JxF25zCew9r0jRCGcsJVVis+HSyzjUJERGdJXLpX+p/Gt4hEtZ2sLGMsI3DfIhovbx3eTK8VAovvfSTAIBmfpJL6x9kMDiENV0cfLLYI6ZJo0RPgwEsempFMcBofAVal5BSYTq5haIc5BO1+xFplGqvCe0nXv5K7nkQmkuzBIlonVKz3Nn8GNZ2cN6hbSeQSkMqDa3L+zbi5r1LRET3exeEXm5lfo+07QTOO1jbYTY/XhouQkTrkdZ2QkjAe7z8yZ+BdxbO29yDUTzg0LLr5ijKAaaTW3FYQ4nR+Eqv/QTRk2MAi57adHoLzfwE3jt03RyD4VFs6C6RMjKEuHfMqoCAtR2KONHi4PATkEqHlPINn05F9KyQQsF0DZr5CQCPtp3BxxNyrStIVYR7+56yX2ZjERE9u5bfAWkdKFUBrSsAgHcWbTsD4NHMT2C6hgN8iDZEGv6iVInDw09ASAWt6zAYJt3fvb3dYh0oIOPk48HwCF03h/cOzfwE0+mttf15aHcwSkBPrSyHGA6PYEyLqhrFyLzoNeJ8QA+s+BD08NC6wgsvfDGkjzODg2jthJB5suBsdgfOWXhn0TSngA/3rJKqd1LHoBURES1L7wYhJJRUIYDlPZrmNGR1OIvZ7E7sq+h4iEm0Zil70jmL557/MShdQggBJTWsaR/wleFeD3tAAa1LVNUIxrQYDo9QlsPVXzztPL4h6Kn92i+/IqbT27Ehp8PpyXUAQFmOHvq1UmlY18HaDkoVePmTP5M3zSGDi4jWRUgZpkRJhaaZwLswdKHrZvDwkEov+mCd/VoGs4iInlkf914QQkEqDQ+PrpsBQsA7h6aZQEoFaw0E139EayeEhFIan3j5KxBChkPM2FriYdIe8PTkOpxzKMshptPb+LVffoWLQ3pqfEPQuSiKAbwP0weLcgitS9gHjVmNH/feQckilxO+/PJPw5gWSpWw9uOnXBDR6qVSjpSFNZneylOk5rO7MQurhFQFnLNw1kBKDSl1nlxI67XIZhB5HLaUClKyTGdbhHspNMC2tov3WLHuyyJ6oMX3qoazBs7ZWD5YAvEdEgb2GJxOboTsK3gA/oG9dYho9cJaQaPrGnzykz+bq2OWsiM/Zo8nRKjCKasRinIYnwWKAxro3DCARefi5ORD1PUeqmqc++MsR+jFch+s9FEhYWwLFRsCQgi88OIXYUzDDRbRmqXAlfceUiq07QTz+UmeKuO9h1QFiqKGUuEeDgsUlgBvAik1vHOwtoWUCkUxhBAyTgJqgbhZ5I/N/OH8otccEHoHKRUCV217ep+/caJN4/OmVakSRVFDqiIfeCpdYT4/QddOIaUKWb4QbOJOtGZSKhjT4IUXv5gDVUqXMLZdCmIt979a7O8Gg3008xN03Qz1YB/z2TGGw6OL/mPQjmIAi87FpUufxs0br8OYOap6HCaWPSzSLkRMSTVhUe7DqdunPv0Lj5yiSkSrkzYRIYCl0bUzzGZ3ACFgbYvOzCEgUOgaWpfw8PDOwp89paO18N5B6RJSKDhn4JwBYjCyLAcIi03+2NQfMt5D1hpYG3qOpCEnjzLGnGidQjuI+E5AyNYtdA0Bgc7MYUwT+itO76BtZyHg7n0+NCGi9UnTQD/16V8IQSrvoVSxGLT1kDYRXdfAOYvx+ApOjj/EeO85zOfHF3T1tOu4w6Bz8ff/Twfi4PBlCCFznXSaMvOwXjhhcxWDXULgxRe/jLIcxpM4IlqXtIlIjXUBoOtmmE3vQEqNZn6aU8Ol1BAQcPHzmEG5ft7Z8PciJYxpwsIzlg+yRHsbhHenlBJKFaFnpO0Whz5EGyy9A5x3EBCxnFDB2g7N/BRSKMymd2DMfOkdQ0Tr52Pfqhdf/HIOVjlnHzoldDGwQaAsh3HA1xhdN8M/+tXPsDaYzgWP8OjcOGfQtbPcC0cX1ccOE0yTB7130LqCMU1OQR0Oj3B06RV8+MEPmMVBtEbpJDyNUtZFCEqfHH+Aq899AdY0sK6DRgmlCihdwv//2fv3IMmu/D7w+57XfWRmVfUTjQbQQDe6G0ADgxkAM4N5kMMhORxyxEdoKZKyHrG0NtZ2hPdPPWYwAAbgjDg011z/43+8EV77n92IdThshyPsjfWupNVKlrTWytqlFFqvSIrvGc7g0d1VlZn3cZ7+45x782ZWVnU30NVV1f37TJBdXZmVVdmovHnO7/wetkUsgaLX7lFjXMA5DecsBFd9qbZzBtY0CPnkiH9CcpCulN45ixACvLPpkIj2AOQkYABiGbqQWR90dd7A2RZcKExv/TEAxL6pzg5K1jllYRFyhELwOH3maYxGp+GDQ0B8T5Iyhw8uvhfh4PeiptmNhy9c0vsWua8ogEXum66BOxDLh7rFCNBthGMQPwAYRrYYFwh20Wg49sF6CR9+8PvU8I+Q44AxBO8geQ7nDZpmGss/wGJz3lSqJmUep9R4B3BarBwH1rbgTEBmJaxp4L2FUiXK0Sk6IDjmlCoBAFLGzYK1DaTMwVgMTNKGgBxnIXgEHxtBS5lDyAw+ePiU/Wlti7rZhZQZBFdwrqLSWEKOCSEUHu+yrwIDUtIB4wJwg73ZoP/V8D1JqRJCqJRZyVBV2w/4GZCHGa1eyX0lZZbGrqq+mft+WPqfdwZSZGm6RZyUdfHiiyjLrQf0UxNC1gkhxD4IPgaYfXBpQyIwm32AgNiI15rUCystWOLXUjnIccFTj0Fr2/5z8/lNHHWTcvq/OzRx93Gj39Q7kDLvS7CsbVb/ExNy7HTvAUIoKFWCgcGa2PsqIGA++wCcxcbtXUaH94vBIYSQo1OWW7h48cXU8yr2wJIig3em378dpKpuwegaAFJ1zakH8FOTRwUddZD7RsoMWld9tD3Lx0sbpnXiqXKLLB/DpYui9x5bW08gzzcwn996MD88IWSPEAIEE7Ah9tzxzsI5g6LYQDW/hdHoDIxpIISCVAW4iBvsOzX3JA9G15MwBAdrLTgXKMtTmM0+xO/+zn8F3GEBSo5a6BthN80OsmycspsNyvIUBbLI8cdY7JEoZH/gESfYesznt6BUgVbPAcReb9YZCK7graEMQ0KOUJ5vYGvridjnVMS+V0Jm0O2873F8kCwbQwgJgEHrCt955xq9oMl9Q79M5L769nf/KChVoq62kReTNKo9iidqIf6ZTtdC8LBOp7IIHse9M4G62cUH7/8e/pt//H8AYyxOJAwB3ntwzmNvF6upBIaQI5TnE5w7fw3OtijHp5FnYzhn48mbadLiJVo0hO9es3TCTgghJ1XXH7H7GEBfSgTEEsEsG2E8OQfOBdp2hvnsJpQqcfPDP6CJZIQcIcY5OBOwVsMHB5EyfLvWLZ/7wl/DhcdvoCw2YW0LIVTfVxNgEF257z4lhFJmaJsZytEpGFPj3bcuU8yB3De0+yf3VQgBWldQ2eiuplzxrrkfWN8vAYwhzyc4depJKFUAAHxqYiuEhPceIfh+2hkh5Gg4Z1BVtyBkBqPrdFKX+p30wavFwiYubgaBbEIIISceG2xio5BKBwtwxuGsgdE1pMxRVbfSJpgQclRi/1KXhmnFAS9d8EoIhdOnL8WJ8GmvFbOBY4VNtzc78PG9Q5aPU2UOrffI/UUBLHJf5cUGACxF8e9GQMzK8sHBewspM4wn53D23BUAcQxzPO3joLmNaQABAABJREFU/cWUU/YVIUfKeYP57EMg9TYxpgYDkGUjcK76+8XNTRzSEAIFrwgh5GGwuJazpezaeOCo+kEExlSxVyLjmM8+hHPmSH5eQkjUVcMEhH5KYLe/OnP2GWxsXog9F52Oe7Q0jfpO/Y07Lk3NBRZ7Q0LuF4oAkPvqm3/zHAMAzuXBTZxTmmlsUptSz7kAZzHw5ZwBYxxPP/NZMB5HtTLG0ufj13JBLdwIOVIhwJgaWs/AOIcxLZwzaSJh1t1pb8CKAliEEHKirZYPRovrfTd50DkDY1owztG2UxhTxw0xIeTIdFnynPG4FxuUAT5z+fXUkzhmaMV+mqxPHOgTFA7sUxf6qaLd3pCQ+4UCWOS+kzJHk0YjD+uhu4+XPxebDLN0eidkBs5FCn4FPP74DUgRP9dldXEh41Q0auFGyJELIWC6+z4YE/DexCwsxuPUKRYbf4a0CBqiBr2EEHKSLV/D+zYQiFn4WTYCYxzG1PDegDGB2ezDmIXrqQUEIUepGxASJ9vqPkglZY7HL77UZ0kKkfX9rriQEDJbWs+t39sxCKHQttO7avhOyL2iABa570LwfcBpr8GCh3V9cXgsHUwXy0UaOkNebODU6af6+8fPxjTXeylRJITcf10T37rejqfq3sM5C+8spMqhVA7GBMJqFtZSrxRCCCEn1TATK5YjCShV9NlX1hl472Btg7raTqVKlIFFyFGK2VVhsedKr8lTp59CWW4BiNlZnAv44GGtRvB+sbdbOoTcu56LZYn84GocQj4iCmCR++5b33yKFeUWqvltAAdnWnjv+oun83blQhebPV++8gVwIeGdTU3cHbpeOoSQo9W9DmezD1MPO4e2nQIhpDHKKmZLLk2pIoQQ8lAJAQwxgyPLxgAA3c5is2jvMJt+mO5GazdCjlr3OvQ+TiDsKlwuX/lCvI2xvsk7EDPp498Pfv12a7xqfgtFuYVvffMpWvSR+44CWORQVLObmGw8dlf3jdlaclFK2DV6Tinml55+DYKrOOGsu8hyDs7p15eQo8R4TEEXMkM1v9X3S2jbOZyzi2mEKyd1FMQihJCTbs1GljFwLiFVAe8s2nYeSwuDx3x+s++NSOs3Qo4WYwyc8xjAEnGPJbjCpadfAxAzs7osLSFUPIxMZYbsLoZobWxeQDW7efhPhDyS6B2EHIqAkBq0L9dGs0GTQMSP4F3MvOKMx6/rGgZyjuA9gne4fOXzkDKD9xZCKrTt/IieGSGk450F5xwhBZVnsw9hTAUhM9TNDnzwyPMNSJnDBwfORRrGYPcpMSaEEHISxAPFuM5jjMP5eGiR5xN4Z1HV2xAyg7Ut5rObabNs+/cAQsjRYYyhbeepsiVOf7985fOpZ2msgOmasMfXeRS8X8moZ9jbBysO3aJhDeSwUACLHIqNjQuo650D78MYu8MEi9gwUKoCTz71ydhkkAswMGTZiNLQCTlijHEg9TPx3sOaBm07h9U1gndwNk6eyvNJDGL5QbCa+iIQQsiJFa/lAnHyoINSBfJ8AsY5nNMI3sHoCm07g7VNzKxP6zY6wCDkaIUQkGWj2I+YCxjT4smnPgmpiju/PtmdM+nregcbGxfu409MyAIFsMih+Ppf32J5Pkl/u3O5EEMMZrGV8iLvHRgYzp2/ho2NCwjUuJ2QY4OxRW8rIMDaFm0zhTY1QgjQukLwHioroVSJ4OPwBdZPGiWEEHIShRDitdzH6YNZNuoPF7WuEEKA0TXadgZjmrWTywghR4elfVfwDhubF3Du/LVYGTPYa3X36fZod/GoAIA8n+Drf32LXujkUFAAixwaIdTd3XHfhUy8qDpvwRnHs9d+pL+oxn5YdIJHyFELfSp5zKoytoE1DUJwMKaGNhUYGJQqwYUcfCWtawgh5CTrAlFcSChVAgCMruJU2uBgbJM+Xkw7G2ZiEUKOBucCNk1/997h6rUfBU+lwCENy1rrLoPPd70HJOQjoAAWOTRaVwfcencXQMYFGOOwtsXTz3wGWTbqGw5SbTUhR6sPXvHYsw6pp502NXQbs6+saWNzUJkhy0appwK9dgkh5GQLfUZtlo3AUyNoYxoEH4d5GNPAp35Xi/cJQshRCwj99EGlSjz99KdhbQvG+Mph40H238sdvAck5OOhdxJyaL79rWfZsKHfuiZ/+6WR96d6qekzGEORb+DsuWdhrYZSJaxpD/kZEEIOwtb0QQjBQ+s55tWtfpiDtfG1mmVjKFX0DUIJIYScTCEEIARImUOpEQDA2KZv3lxVt6F1nELIBuVH6943CCEPVr+Xsi3Onb+KvNjoe1vF3nb7l/p2zduH91n93Le/9Sy9yMmhoQAWOXR3tVDZp8Y6hJAmnUkEBFy+/DkIIeG8ues0VkLIIUmvwa4HSjdeOY5Pn8Louj+Rt6YB52LQIJRev4QQclJ1mRoqKyGEhDUNrGnhvYXWFdp2Cu/soHTQD3omEkKOUux1ZSGEwuXLnwPQTRZ1SxUuS3uzu9h3UXCaPAgUwCLHVncR9MGBMw4lCzzx1CeR5xMYXSNL/RYIIUck9TLp/o8xBi4kGOcI3qNppnDOwDkNY2oAgBQZOJe0yCGEkBMsBrAUpMwBAMbUcE7HAFY7g3cOjPPFe8LgvYIQcrRUVkKbGnk+wRNPvgwpczDG0rToQGs0cqxRAIscMpayLQKsaZHnk5heHjx46pnDGO/LBJemEYIBCBBCwQefGrdLPHP5dYTg+4k2jPNYasg5XXAJeYAWDdxj2nmXMRl8fG1OZ+8DiKnqxjSxvwIXGI1Op6/ji9N579PjsaXHJoQQ8uB11/G92bKxVCgEj7LYAgODtS2MqWFtixA8dqfvx/cE75feE/rHpus7IQ8MY2xprwTEjMjgPZ65/Dq4kP3erGu+3u/DhnuzlGUf93ZxcI9zBnk+SW1dAmXYkweCAljkUL3z5iUWL4oBebGB6fR9FMUGpMzu6uu7OmzOYvNPaxs8+dSnADCwNIUweB9TXtMGmPorEHI8SJlhZ/v7fcBZ6woMgPcWRbmFuAkaNIJnMWgNUBo6IYQcpUXD9e5gYXFNZoyhLLcQggNjDG07T2swj+3b34ekCWSEHLnh4eJwrxRvi6/vJ596Bda24FzcsffVKikzFGlvlxcbCCHAOYN33rxECzhyqCiARQ4dYxxS5rC2xWh0Ck0zBecCWtd3/NqAEGuyQ7zociZw7vxVnD13Gc7q5ZOE7kRvT7N4QshR4Fyiqm6jaXbhvYMxdQxiMZ6mVsl+cbU41e/KEentiRBCjgpjYk/J36JUXCHLx2CMQ+sK1jbwwaOpd1HX22naLCHkqPR7ILbIah9WrljT4szZZ3Du/FUIHgPOPvjYczj4tY85pHUNzgWaZorR6BSsbVMZIq3dyOGj3zJy6EII/RQyazWEUGlizQEp5F3/q9TA3TkDHxzyYgPeO1y9+qOxHAmLlFaeMjgWpUiEkKMUvIOUOWazD1JpSeg3NyEEZKqMG500lZCCzoQQchyFvgk75xJZNoqDO7hAXW8jeA9rW8zmH0LK/K42wISQw9VlXjHG0h6J9xNBrW1x7dqXELxDlo/hnYVzum/kDuAOTdsDlBpBCAVrNQD06zxCDhsFsMihe/etZ5gxDTiXUKoAYwyz6fvI843BhpUt98EC4oUzNRRkYP2m1zmDJ596BaPxmZgO25cNdtlY6cSQNsOEHCnnLITMYK1GVd2OPRa8h9ZzuDTCWQjVN30fNg6lDRAhhBydELrJsotrMuMcUmZQqowTZnWF4D2ct6iq2/GQUmaLDTAh5GgwtpRB2QWvQgjw3mE8ORvLB51Or/W4h/Lexj5WXTXLoP9VV0bMGEOeb2CWet0pVYBzCWMavPvWM7T5IoeOAljkgRiNTsM5A2tbZPkEPnh4bwEcXOonhII1DYTMIGWOtp1CqQJ5MUm9sOKiyns/GPuaLtbURJCQI+eshpQZ6uo22mYKLmJZofc2bYZyCJmncuBYSrgoKySEEHIU4iHCorSbcwEhcwiR9dPKquo2uFBomynqahtSZnBW0/WbkCO22AOF9P9D3Culw8GnLr2KvNiIe6tmGtdiIoO1bV9SuPZxuwoZb+GDR5ZPYG0L50w/oIeQw0YBLPJAGFOjKDbgrMFs+gHKchN5Prnj1w0nYHTp690JwDPPvA6lSnAu+mkawOCU4aASRULIoeOcw3sHBgYfPOp6G20zi2PWTQ1nDYRQyFQJIbK06QmLyaSEEEKOHGMMQmSxdyGXcGmyrPc2Bq/qbfjg+rUa57S9IOQoBaxUp6TgFecCSpV4+unPoFtvdffn99C/Ks8nKMtNzKYfwFmDotiAMXfubUzI/UDvMOSB+LW3r7Cm2UWWjzAen0HTTNG2szt+nQ8OUmQxe8s0yPIJtK7AmcCZs88gLyapaSDrywaHEzcIIUeHMQ4hFYxtIWUGrWtMZ+9Dyhy6ncO6Ng55UEUavbz01UfyMxNCCImGk2GFkFCySBOhW7TtDFIWmM7ehzENlMz7PqfUyJmQo7XUliHtixhjkDJHXkxw5szT4EzAmBp5sQFnNZy3cc+VKmQO0rYzNM0U4/EZZPkITbOLX3v7Ci3cyANB7zDkgcmyMdpmBq0rKFUspZh3tdXDPlixQXv8FeVCggsF5zSUKuBSX6wbL34N1mn4lBLrnQUYi2nszhzF0ySEJN3IZilUCigHGFNjNv0AQig09Q7aNk4lLYpNiDR6nTGOkL626+GwuF6w/rEJIYR8NItr6HBKWegPALs2DyE1bs+LzThBup2jbecQQmE2fR/G1KmVg4MQsQE0XZ8JOVrDiaHOGgCxDNiYBi++9OfAGI8BqzQlnnHRHyRyLvp92LD/1TAzPoQApQpoXaFtZsiy8dE8UfJIogAWeWCq6hbK0Slk2RjeeyiV3/XXMqy/gF68+BKybAzBJTjnEDJD8B5tO0dRbBzCsyCEfBTd6zd4D2MaNM1umjBqYU1cPOX5JE3AiYFoNpiaA6AvMYyPR29fhBDyUS2uocNGz/HgkHHeTyPrpg4CQKvnMKZBCB5Nsxs/9rFXFpV9E3J8ZNmor15RqoAQCiEEFOUWLjx+o7/fcG91L72DlcrhvUeWjVGOTqGqbh3CsyBkPdoBkAfmu99+kbXtHMbU8N7CmPbjPSBjGI3P4MknPxmnmIUAZ3U8OeAc1un784MTQj6+vrw3TiHsphJa20LrORACsmwEmSZYxc3VypRSoN9o7S05JIQQcre6a+gweDW85nIuASANzokHgkbXcLbtG7hrPe+nFdLkZ0KOD2sbSJkBYHECdApUX7r0Wmy2/jFfr8a0aS9Xo23n+O63X6QLAHlgKIBFHqg8n8B7i6LYOLjJ5/DCesBF1ugKz179UXAu01ScuPHtejEQQo4f52wfxLK2gbUa2lQAY1CqTH3t4lTCODFnMZ2QEELI/bUIXg2vuYAQGZQqwcBgU9N2HxyaZhdaz+HcnXvlEEIePOsMuFDgnPdtV4RUuHL1Cwc3W7/L/RfnHEWxAe/tXQ3lIuR+ogAWeaBCcOm0j8E5u7Qh7T6+m03qIhvD4/SZSzh79jIAQGUlnDNwzkLJuy9RJIQcnhACEBYTcRhjQAiYzz6EtTpOJWznsKaJDUbzSZ/ujtSTZWmaDo1oJ4SQj22RfcUXw3D6ay5HlpUQQkHrCk0zTSVJLWazD9de0+naTMjxkKkSWlcAACVzhOBx4cLz2Nx8vL/Pvey3VvdrMXidhmYF6nlHHiwKYJEH6q1vXGR5PkFV3d6nR9Vy5L+vx+4auy+luHdjXwWuXf8ynLPwKSjm72KCBiHkcK02/FwEomK5idYVtJ7D2hbG1NC6So1BSyhVxBKWtDFKj7inlJAQQsi9W1s6mKY5cy6R5+O+MbMxdcqWjSXfWld9WXg/+XnPYB5CyJFhLLZVESr2GnUG165/GcBqr6tB/6suWDX4uLvPqqLYQFXdRp5P8NY3LtILnjxQFMAiD5zWFcbjs/3JwEdd6HRf57zFYxeew+kzl2CtBucSnAtKbSfkGFh9fXebnOA9OBeo6x3U9Ta8d2k0+xTeO0iZL4JYwFJZCyGEkPupKx0EOJdQqoBKjdu1qWIPndS4va53wJlIzdv3HiZQ8IqQo+dsnNoOAM5pnDnzDM6fvwYgwAf3sfdeq3s5Qh4kCmCRB04IBed0v1i6k4OmYkiZwzsDhIBnnnk9NYC2YIxDSHW/fmRCyH3QB69C3CwJodA2MzTNFCEEeGfRtnNY24BzEQNYQg6+JqxkDRBCCPkohtmsw2srF7Lf+Go9R1PvwlkN7z3qegdNM4WQCiH4pWs6IeT44FxAyAxG11BZictXPp96AzMIsf/+6G4nEYbg4Zw+8LEIOSwUwCIP3DtvXmKM8TQBZ7m2ejjO9WDx9q5puxAZnrn8ep+xEYJH8FSTTchROqishDGOEDyyrETbzLC782dw3gIIaNsZAmImQJ6NIVWRygjDot/KPYx7JoQQsteit2A6VJA58mwMnjalTbPbN27f3fkBmnoXShVp8iBfepzO6nWfEPLgheBjFlZWQoocTz/9aShVwHvbZ0/eaR21uidbvM5ZnPjOON558xItxsgDRwEsciSsbe+4wLmbscyM8ZihwRiybIRnLn8Ozpm0OaYFFCHHmfcejAuorIC1LabT92FtC84l6uo2GOOQMo9TCdPIdyCWHzpHU0YJIeSjcs4geN9vUrvSwW4KbF3dBucKzhlMd9+HtQ2UKsA4H2yACSHHUTeIwVmNZy6/jiwbASxmX7GDpsADfX+7Oz2+te19/IkJuXsUwCJHoisfiu5iCkZqKMj2ZGfFIJX3FowLXLn6RUiaPkjIiRG8A2cC3ntU81to6t1+KqE2FRhjyPJxKmlhCN7F4Q2DgBYhhJB7wxhHQEiZ7AxKFciyERhjfaN27w2aZhdVdQvee3AhKXhFyAkiZY5nr34RjIt+wNVqZvxwj3Vn8T5xUjRdC8jRoAAWORLf/tZV5py5uzvvewrQ9W/wQAhwTuP0qadw4fEX0pdRVishxxnnHN57OGfAOY+n/vUO5vNbAGOoq20YE/thZdkYQmYIKWgtKFBNCCEfWXfYFw8UM2TZCJwLGNOgqXcAAFV1G3W9E7PdOYd3NpUP0vqKkOOse41eePwFnDp9qe8XvAg67fMavsvXtnMG3/7WVboQkCNBASxyZJQqD7j1bq+JMfW975HDGK48+wUoVcLTKSEhx1oIAZzzvhmwVDmMqTGbvg/nNLy3cXy7acGFRJFPIGUBljKxCCGEfDTeOzAwKFUizyfgQsHaFsbUcM7C2haz2Yewpo2HB2nzy4WkFg2EHHPee2TZCM9e/SKAGKiWaTjD3Qeg97/fwXs4Qg4XBbDIkXnrG4+zYUPAdU0C97vILqbneAABnEswxmFNg/OPXcfZs5dx1xlehJAj4bzt+624dDoIxPHM89ktAAzWtmjbGbwzkKpAWW6CCwVj6qP94Qkh5AQzpgYXCkWxCaUKOKvRtDNY24Ixhmp+G1pXALqJYwacC0iRp4EbhJDjyjmDM2eewbnz1+Jrmos05Cr0ZcAH77HWD9nqPn7rG49T9hU5MhTAIkfurk4C9qnR7r7WOd1PxOFM4Jkrn4PKikP5eQkh9wdnot8IMcZTf4Y4FatpdtDUOzCmgXM69mNxMeCVZSU4l0f7wxNCyAkmuESWjSBVDudMzLyyGsY0qKtt1M02eJr66p3t11jeW3BGPQgJOc5UVuCZK5/rX6vxoDANvxlOhB7ure5iP0blw+Q4oAAWObEYi1NzOBNwVoNxAakKaFPjqUuvYjQ6fdQ/IiHkAFJm0G0F7x2kyvuyFCEkvHfY3f1hP+XGmAZtO0MAkGVj5Pn4CH9yQgg52fJiEieThQCt5zCmAYA0EfY9BD8cthOv1957aFNDSLXfwxJCjoHR6DSeuvQqjGmgZNFPJBRcQnBJgShyolEAixypd958msVNa4CzBkIoCKHgnIaUGbpsDMbYniysLhPLeZvquuNI11F5Crqd48aLP7PUp2GxOVY0PYOQY8A5AykzcC7gXZeJxZZet9Pd91CnhsLGNDC6ghAqNnUXGQCkdPh4rVikx9PijBDyKGMIPvYXjNlTrC8dik3bxxBCQesqlQoG1PUOdnd+0PcQ9YNeg920QsFlf70mhByNbpp7F2Re3e/cePFnoNs5ynILxjYAAqQqYtb7cB813Fsx1l8rpMzgnF7sy6wBEBBCwDtvPk0LLHKkKIBFjpwQEowJjCZn49QxXSPLRmia3Tt+rfcOITUi5UzEPg3eoig3ceHxGyjKTXARS424iGm02tTQpqYGhIScAM4bVFXsxRLHu1do2inyPGYPSFkAjMF722+wGOcAqMkwIeRRFsB4KgH0LpZoMwYpC2TZCHk+QdNO0bZzAAy6rVDX2/DeUnYGIcecUmW/nwEWexwu5NIeyPk4OZQz0Q/A8XcxBKdpdpFlIxhdo662MZqcBWMCQlD7BnL0KIBFjlwIAUZXaJtd5MUG8mICazWKYvOOXytSHxwffDw1CAHWNmBgGI/P4sqVz8Oats/K4CKmziKE1G+HEHKcBe/R1Duo5rfgnIFzBrqt4JyBykZQWQkh4oSsblHW9WohhJBH2aJvlUMIAUJkUFkJlY1gnYZu5/DewDuDeXULTb1DEwYJOQG8t0AIEFzGyaAp29KaFleufB7j8VkwMFjbACkL06fKE3EXPUSLYhPWauTFBHmxgbbZhdEVXR/IsUCrfHLkvvXNp9hofAbWagghoXWF4F3f+2atdDrIhQTjMfMqDKcROg1rGly7/mVIlYOnU8jgHYTMUmosTSkk5LhjPC666nobVXU7fTZgOn0/joUWGbJ8lKYZsjTqPdAiixDySBteCxljcQBGPoIUGULwmO6+318nq+o2mnonHgZy2hoQctx1LRiEzGIlCmPgnEOqHNeufxnWNLBpwBXnEgEBIfg4jbDLojog09LaFsE7aF1BCAlrNUbjM/jWN5+i9Exy5OhdihwL8UKcw3sPpQpIVaRgVHedZMt9sACAMThn+prtEGKGlZJFP6GsHJ3ClStfgLUaUuawzsCaFmBsqTkpIeR4Ct5DyphhNZu+jzplCGhdQbczhBCQqRHyYhJ7YoW0SKMSGELIIywG9H3M0hBZbNquRvH62c6g9Rxd36vpLB0IyKzvk0UIOb6EUABjsKaFTXsoazWuXPkCytEpAADnaU8kZFoXxcN850wfvBr2v+p6h3ZDsqQqoFQB7z2kzOngnxwbFMAix8LbbzzB4kVVw1oNpQrYNBHnoI2osxo8TdQIwcM7Cx88OOMQMoPRFV648dXU/8H1kze8u3P9NyHkaHW9WzgTEFKhbWfY3f0B2nYGISTadhbT4xmDknGhxak/AyGE9LiQUKqASv0CrW3SNVShbWbY3fkB2ib+nTPR9xIkhBxv3g0GK6R9zgs3vhqH3cgMPJUNehf7YAkuwbmEs3rfx+xe+9Y0cS9mNZzTYIzh7TeeoAsDORYogEWODSkLcB6bEHpvIWR2x69hXMTsK8QeVwGxt5V1Op48MobJxmN45vLrcM6ACwnOBRhjsAdcwAkhx0Ps2xADzkJkMLrGbPZB3wdL6wpGVwBjyLJRDGLdRX8HQgh52HEeg1dZNgIYg0kTB50zi2upruN6Kw3DWJ0ESwg5fqzVKVMqlgQ6Z/DM5dcx2XgMSNmX1ml4b5f2SIxxsLTXOoiQWd8rmHMRB+YQckxQAIscG20qBxJCwZjmrjahQqg4eTClwypZ9KWB3jtIWaCud/CpV34xps1aA+ds7J1FJ4yEHGshBAip4J2DdxZZNoIQCnW1jdnsAwAM1rbQpkbwDlwoCJmDc0EbMELIIy2EAM5FvCYKFfvZmDr1F2WYzT5AXe9Aygx5NoazJmaqU3sFQo49xlgKXFk4G9upfOqVX0yv6aIfaiOE6rMvnTMxE+suXuOcSxjTpH1WQNvODvspEXLXKIBFjo1vf+tZ5p2FUmVaYC02oF1tNmMsjYXmfd8rACktVvTjYrvbndPIshLl6BQuPf3p2Ow9fQ2VGhFy/Hm3GOneDXbgXKBtZ9i+/adgYPDOYnf3h3C2xag8hTyf9OWHMZDF+msCwPqppIQQclJ1U8fWXd+8d+BcoCg2MBqdhrMtprvvxespGLZv/ynadtZnvVvb9v1Eu40vIeT44lz0PT+BgEtPfxrl6BSyrEwlf4t9kvM2BrNTYsBwn8TSkKu+13AvwNoWSpXwzuLb33qWTv3JsUEBLHK8MIam2cVodPq+lAHl+QRNM4WUOa5e+xICArJs1G96CSEnl3MG29vfhzE1VDZCXe+gqm5DZSXG43OQKRurE4JfpMRTlgEh5ATjfba57Q/mgK7cJ8d4fBYqG6GqbqOud6GyEYypsb39fWrGTMgJ55wFGEOejxFCwNVrX4KUOZpmiiwbf+zH51xiNDqNptk9cFohIUeBAljkWPnOO9dYXIgxGFMv3TackHEn3SmCdzamyoaA02eexlNPvQLnDYxp0mklIeSkcs7EzVl1G94ZeG/RtjN4Z5EXE+TFBkQaGd9lFXRTeAgh5KTrsqYApIxTnyYObiDPJ3BWo21m8N7AOY26uo2quk0BLEJOOM5FmkCo8eRTn8KZM8+kiaOqP6i7+7XOavYV0h4s9tL6zjvXaNFEjhXawZNjiKGpdyDE/k3cuwst6wJajIFh7xhYl0bL+uDgvcULL/40vLN9I3dCyMkmpEJV3cbu7g/BWMy2ms9vwZgGeTaGykrwNKGn67HXlRcTQshJ1ZUJdT1qYtmghMpK5NkY2tSYz28BCGBMYHf3h6iq2xCSsk8JOem6Bu7exb2N8wY+OEiRLbVe6NuvgPWZVGywT9qPEBmaegd3mzhAyINEASxy7OT5JI5/5QdnSuwJYq0hZAafThoFVzh79jIuPP5CvOhTDxxCTjTGGDgTcM5gPr/ZZxZ4b9DUO/DeQakSRbkJKfPULyL2jKEm74SQk2zpWhYCpMxRlJuxZ4136Rpo+kzV+fxmnMbM6ACPkJPOew/OBS48/gLOnr0MwRclxQdNcb+b4FUMjnEImSHPJ/f3ByfkPqAAFjl23vz6YyzLRjAmNmzee5G9+4WXcyaNgnUxS4txvHDjp+OUQ3HnMbKEkGOMsTSxVCB4j+3bf4pqfgucK1jboq63gRCQ5xPkxQSMi75fDE3aIoScZN0UZu8tGBexbDqfACGgrrf7ac7z+U1s3/5TBB8bNxvTUE8bQk44IeKUwBdufDWWEbPY21fI7B5LhJevBd2ey5gWWTbCm19/jC4W5NihABY5Ue6lnhsAvDOxGXwI8N7Ce4fz56/h/GPXwRkFsAg5yeIUrrgp40LC2hbz+U3UKRPLmAZtO4VzBpkaoSg20nCIQBkIhJATLV7DAjiXKIoNZGoE5wzadgpjGjin+8wra1twLmKwP3iAMlAJOdEY4zj/2HWcP38d3rulapOuB9a99g0m5KSgABY5lt78+gUmD0iB7d3hopvlE7TtDFIVECKWEzpv8ImXfw7WtvfppyWEHIUQPJQqYoZlCMiLDWhTY3v7e+kEMqBppmjqHTDGUBSbyLISAGgKKSHkROuuYVlWoig2wVjsH9o0UwABzhps3/5TGF0jLzYQEFJZdUEtFAg54azV+MTLPweXBjQImUGqAk07vXPZ310ErKTM8ObXL1BkixxLFMAix1acFhb/r+tX003bCSEsGrH3Ddw5GBh4P2WMwZoGZXmqX9BxLiFljs3Nizj/2HUwztG2MwiZQQgF50ya6kPXbEKOO8Z4P13QewdnNURq2P7hB7+Ptp3DOdOXEzpnUJRbKMtTAGNLPWRi7ywHxgQYiyWJhBByVGLJX7weee/gnFm6ZjEukOcbyItN+ODRNFMYU8PaFrqtcPPmH/aDK5zV/TUtXudojUPIcdftR5wzEEJByAxtOwPjHOcfu4bNzYuQMu/7XzXNFGV5CkbHCYKxTyhf2iMhPWbMxty7txruvQg5rui3kxxb3lsIkcHoGkWxsViEhdi4sG3nizt3i7HBoowxBh8cgneQQoFziYDYxHk0Oo1r134M3lmMxmdgTQNr40QfNrioE0JOrtn0fRjTIIQAa3UsJ7QGSpWYTM6lBVosJxQiS8MdbN9ThhBCjgobXI84FxAi68sGGeMoig2U5RYYgPn8Jtp2Bs5V7Ae4/b2j/vEJIR9TF6hmjMNaDWsajMZn4J3FtWs/htHoNEIICN0BvVAI3sGHlSD1mj1S2877kmJnNYRQKIoNGF3HihVPWerk+KIAFjm23nnzaWZMTH2vqtuwNo69F0LFaTvFBoA7jYFV8MGBC5kmkHk4Fx/n4hMv4dy5q6kXBOsDYyF4CmAR8hCom13U9TaaZhfWtrBWw5gaASFOJ0w9sZZOIdNELzp9JIQcpXXXo5h9HnteFeUWnDNomt24afUW8/lNzGYfUIsEQh4CIe1b+t51YEAIOHfuKi4+8RIAwDnd97XjQsIHd+CQmm7PVBQbMXsr3dfa2DMvLzZgTI133nya0jTJsUUrdHKscS7gnI4lPwjIiwmEkNC6gtYVMBwHm0oJ+z8Rmxl2ASnnLTiXYIxD6zm4UHj+xlfjWGkRm5syzuGdA+f00iDkpBNcoql3MZt+AK0reO9gbYu22YXWVeyJlY/TFEMXG8JzDsZ5WiwSQsjRWL0eBe/AuUCWj1EUm3BWo6530loIMKbBdPeHqOptiLvpIUoIOdZ42pMwzuMQBiHgnMHzN74KLhS0nschNlzCedsHvLqSwqU90VJ7FNbvo4SQyIsJgICyPAXnNDhloJNjjnbp5Fh7582nWRz7XIFzgabehbUawbs+A2u/KRsMqYQwnV7Gi7qEUmWfRnvx4ou48PgLsKYF47zP0hr23SKEnEzdqaXWFarqdszESuXCWlcIwcfphOUWpCrS4i++7kPqrUUIIUehuwZ11yWpChTlFjI1Qgge8/mt/vbp9H1Md38YWy9wSUMqCDnhhnsXhADGOaxpceHxF3Dx4ovxToxBqRKCy6W9iw+uP8jfa5GBFbyDtRpNvQvOBYypwBin7Cty7FEAixx7UuapiamHkBnyfAIuFJyzS6cJq1lYYAzeOwgu+9OEeELhUyZWLBu88eLXwLmEd65vDh8QAFAAi5CTzDkDKTNwEYPf09330LSzOHLaO1TVbQQElMUmimITQmQxiO39XU3pIYSQQ8NYvBaFACEyFMUmymITAQFVdRtAgHMxCyv2wJoDjIELSRmkhJx4XW+r2Jc3VodI3HjxaylYxVILBA+X+lVxLvpBNlitTEnDrQCkxvAWXCjk+QRCZvBpaISU+RE+Z0LuDgWwyLEXx7jGRst5sYHp9P10Mtn1rdl/o9lP0uhOMtKkMoY41cM6g8ceu46nLr3aPw5Li0bqgUPISceWNnLGNKjmN+NEQttCt3O0zRQ2BbryYgKZlalpKgWwCCFHhzEGxgVkVsZrk8xgnUHbTKHbOULwmE0/wHT6Xsy8kgrexTUOlQARcrLFPYtf2ps8delVPPbYdVhn4tR0sDRh1C3tdQ7avyzWNgHBO0yn7yMvNvoBEXHPRcjxRjt0cmJwLtA2U0iZYzQ+A3dAinyXOtuVENlU082FAmMcIk3qyLIS1mlcvfYjMdOLd41SPS0ACTnhpMphrU6TBwsIIVFV25hO34c2NcAYtJ6jrm7De4dMlciy0YENUAkh5EERQiHLRshUCe8d6uo2tI6ZVlV1G3W9DaNrAABncc0SQqAMUkJOuEXjdoBxDilzXL32I7BOI8tKBB+btTPGwYUC5wLW6aX9y/5lhIBLU9ilzNE2U9rzkBOFAljkROBcwjkDIRSEkKjrnf5ie2CvqjReVgiV7hcXdvGxsniCwTguPH4Dj114DoxxtO0cebEB58yDeXKEkEPRjYbmXMDaFt47SJnBWY1bN/8Idb0D5wycs2jbKazVyFSJsjwFpcqla0vXh2bYJ4sQQj6O/a4rIcRJqWV5CpkqYa1G207hnIVzBnW9g+3b34MxTRpC4dN6hvV/J4ScXNZq5MUG2nYGxjjOP3Ydj114oc+66vYwSJlTIaS9DkKarr5ed53hXKCudyCEhBAqDrTi8gE9O0I+HgpgkRPh7TeeYEqVMKYBwCDEAU1Ku3RbLP+59q5gEFzC6ArP3/gqAGA8PoOm3qUpPoQ85GbT99G2c3hvoHWFptmNwW2pkOcbyLIROF9kYzHG+vR8CmIRQj6OMCj3GZYscx6zrvJ8A0LGjWWTJqd6b9C2c8ym7x/hT04IOWxCSFTz2xiNzgAh4IUXfxrWNhAyAzsgW2rP3mefbEzvLISQABiMaaBUibffeIJSN8mJQAEscqJk2QjWNAjBQ2UlgGE9N7v7vjV9TTmHMTU4l3js/HU89dQr/VhZmkJGyMPNWo3p9D1Md9+Dc3HAQ13vQLdzZFmZglhlH8TqglZdIIsQQj6qYeBqkRWhlq49up2jrndio2ZnMd19D9Ppe7BWH+WPTgg5ZCEESJmh1fPY++r8dXAmYEy9WH/c5Z5ntYE7AKisjC1WTIMsGx3GUyDk0NAKnJwYb7/xBAshTiJkjMPatr9tT+CKsaX/Y1hM4Ojvm25z3oELBes0rj/3E2CMQ8oiTvEghDy0hFQwusa8uoW2ncFZnTKxpmiaKYRUUKpElpVxQiHiaPtuXDUhhHxUMZPT94dlQmTIshJKlRBS9dchrSs4q9G2M8yrWzC6hpDUp4+Qh1kIIfbk5BLXn/uJ2MtXSDhrYokgGwak4t5mOIW9/7+B4V7J2jb2BJYZQvCUfUVOFFqBkxOFcwmeRsSunhjsCVBh//LB/j7pDcI7g+AdNrcex7XrX0bTTmmDSshDzjsLpQoAwHT6HnZ330MIMUA1n9/smyNn2RhFsQGZ7uu9QwgU4CaEfHQhuP6gTKoCRbGBLBsDQAysz2/GAFdw2E2ZVwCgVLF/CwVCyEOBc46mmeL6cz+Ora2LcYq6M8jyUexzhf2nsA/3Puv2RkCsaPHe9fsqQk4S2qGTE+WtbzzOumaFxjT7X7zZ4mLdnUgMs7C6+0QBjAv44MDA8NwLPwkp1N2XIxJCTqyAgOA9rGlRVbcwm92EbudACKi6iV+I6fZ5NobMSnAuKEOTEPKxxM2jgEzXlq4tgtZzVNVtIATodo7Z7Caq6hasaRG87zevhJCHmxAS15//CQCADy5NSO56cS63TxnudYDlfdAqxmLfq264VdxbEXJyUACLnDici6Xsq6WMq0GA6mCL+8TJGwLeezAuMBqdxrXrP05jqAl5yDHO4VPvq9jMFKjmNzGbfQBjGhhTo23ncfqXNZAyR5FPYlq/oCEPhJCPLpYMjlDkE0iZw1mDtp2ibecwpoYxDWazD1DNb6b7S4Tg4Z0F47R8J+RhxhjHtes/jtHoNBgXCCGAMwG/NCH97vY7e/dJURxUs39DeEKOK3oHJCfO2288yZzTd3fRHQah2GrmVfxcnG5YI89j6r41DV548achRX4/f2xCyDHjnQMXsp84GoIHwKBNhe3t74ExBmsbNPUutJ4hIECqAlk27ksPCSHko1DpWiJVgYAArWdo6l1YG7PLt7e/B20qACxdmwAhM3Ah4R1lgBLyMFOqxI2XvgZnNRhjyLIRtKkgZR57YCVLfX0Xn7zj43Mu4JzG2288Saf15MShABY5kWJfiADGYikPYyz2xnIWUmbL5T3DlNql0woGzgWMrqBUnMZhTIMsG4OB4RMv/3y8F+dQquibxguh0LYzmtpByAnHGEPwPmVhhT4tP3gP5ww+/PAPYG1snFrXO5ju/hDWtJAyj5kTxSaEzONjeIcutR8Ago/BsMF3S4+fbg9UBkTISbaYStq9rpdf7/F2BsZE/LuP6xYhcxTlFopiE1LmsKbFbPo+mmYKMAatK3z44R/AOYPgfT/1NIQQr1Xpc4SQk0upEm07g5Q5GOdwzvQHY947vPTyz/X3s6ncT8oCWs8HpYTLe5t+j5OuTd67uCdyFpxLMMbSnilmdHWBcUJOGgpgkRPp3bcus9iA0ELKHCEEOKdjSVC6YN/NBrELdLFBTbkPDnkxwYWLN7C5+TgAoGmmKIrN/k1mNDqNqto+zKdICDlizhrsbH8fu7s/7BudzucfoqpupabLm7EvlirAwOC9XVxTOEfXr69bKHaB92GgixByMnVBq9XXd9dXJm4uQ7ouxKbrUubIszGKfAOMc8znNzGbvg/GODgXmM8+xHT6fgqAE0IeVm07w2h8BsbU8M5BZSXqegdcSJw5exkXLryALBvBpZJBzkW8pqR9yoEYSwGveKAf9y46fS6H9xZZNsK7b12mSDg5kWgFTU6s2ezDpROELBtBqQJtM4VzdnGxX6P7POciNXCPj8EZh7UtQgjY3LiA5298NWZ1qRxaVwBSmRFj6QSEEPKw4lzAWo1qfgvT3R+iaaYIIcBajfnsQ4TgF4GsYiP2xeo3sMuNVBljg+sVZV8R8nAIWGSEL17rUcrCCgFCKOTFRp91FYLHfHYTLvWzaupd7Gz/APP5TTirKUOTkEdBep0LIeGsjgEra3D9uR/HZOM8gnewTqeAVAyScy7BmVjOvlpTPhhLBC3aZprKlUfpW8br1Wz24YN9roTcRzQ3k5xYk8k5eG/7E8+m3kVAQJaPoVSJJp1kMMYQALAABJb+ROjT8mMDdwvGOITM4Z2Bsy0Cl3j6mc/gj//on+K9H/4OgFgWxIWEbucoig0Y0xztPwIh5NBwLsCFhLMGu9P3YWyLzc3HwVKZj/cOedfUPfWm0e08lf64lIW1CF4xhv56RRVAhJx0AYsywsWo+i4Dy3sLBgYhY7P2LJ/01w7dzvtWBNZqTKfvoaq2IWUGkUp+CCEPL6ny/hoQ9ySxguSxC8/h0qVX4Z2F83HIlBAxkyoGsEQqKXZLbVGGgSzGGJzVKMotcC7QNFMwMEhVgHMJIRSKYuOonjohHxtlYJET65t/6zwzpkFdbyMEj6LciqmxzkLrKo2kHjRuXzNm1jkTSwfB4ikpl7EenXEEBATv8ImXfwHeWxTlZhx7zUTfL4sQ8vAKwcNZDSBACgWjK9y+9SeYz25CqRJaz9HqObSuEIKHUiWKYhNKlfHrve9PTTvdqSllWBBysi0Hr7rPpdd8KgGUWYm82Ih9Nr2D0TV0O499bLjE7u4PcevWH6Nt55AySz34HE0ZJORhl/pugjEY3cR+eFbj5U/9ebA0pIpzCaVKCC7j/VP7Aev0Ing12NPEv8aPVVbGgzYXW60U5RZC8KjrbRjT4Jt/6zwdo5ETi94hyYnGucTW1pPw3sHaBlJmyPIxgneDRu77lBGmoBVnoi8HtLbt683jm4TB6TNP48qzX0BdbcegFkJ/GkIIebj5vjwoNlFu23nft4YzAWdb1PUO2mYXCDEDtCg2keXjfhEavEcYXI+Wy4wIISfR4nWcgtLe9YErxgXyfIKy2EKexQnHbTtFXe/A2hacCcznN1HNb0G38/hYnMP3AyEIIQ8z5yyEUDEoxTmaZopnr34Rp089BWMaMM5TVpZdDJGSWX+IDmBP6eCwfNl7h+AdsnwMKTNY28B7h62tJ8E5FWCRk41W0OTEe+Ot3w5bp59CNb8F5wyKYhMh+H46YZfO3/WiCF3/mZUMCB9cmkbm0xtBLC/Uukbb7OLv/p3fgjUNhFD9mwdlURDy8OqyILpMKsY4GOf9lMJTp56EUiWkyiFEKhPKxqks2cGYGs6Z2FfPu/66EtG1g5CTr8uo9DFDggtImUMIhSwbxR6bzkLrOYypYW0La1oY22B354fg/SbV9esKGvBAyMOv65snhIL3FkqV+Imf+uvIshhw6ipGuutCV/oXv9b314nV0sHh1r4rN2yaXQihMBqfwc7t7+E3v/sK7f/JiUbvkuTEO3XmaRhdgYFhMjkHIMCaBnwpBZ8tlxECAGPgQsI6Des0OJeQqoBUBYSIbx7Be0ihMBqdxtWrP7q0sKRTUkIebt65tCmNwWwAfYYF5xI3b/4hqup2f9LZNLuoqlswpgYXEmW5hTwfQ8iMSoIIecgxziFkhjwfoyy3wLiAMTWq6haaZrcPUlXVbdz88A/7kfZdI3chFAWvCHmEdJPPvXd45vLrGJWnkKkSQmQICHFfInNImcem7FbDWb02g2o1q5tzDmsaAAGTyTkwMBhd4dSZpx/QsyPk8NA7JTnx3vgbZxgQF4/WtvHCnhaGwN6L+pBzBkIocC7hvUvjrt2g3AexUTwCnnvhK8jzCazVYFzsyb6ikiBCHi795EDv177es2yMut6JfbGqW32Ddq0r1NVtWKuhVInx6AyUKhdTgxhLgbBB+VEIg+/BaCNLyBGLr0HWvzZXX6NdBgUQs7ulLDAanYZSJZy3mM8+hG7nAOKB12z6Pm7e/CPU9U7fJ48x3l8P6FCMkIfHnVoFhODBuICzsXLk+RtfRUCAcxqh67eb2qH0k07TYBnv9xvysGhR4FPWN+cS1rb9IVq3ZyLkJKMVMnkodA2Uu1RZKXPk+Z0nbHTZWHveZNiiLEBlozi9Q2Z47oWvICDAOwsh1crPQCVBhDxKus2rcwZNvYv5/MM+AwuIPW/adgYAGI1Ooxyd7ssLuRieoLI48ZALxI2xpylkhByxrqVA104gBptiUAtI2RPOgnOFycb5Psuhaaeoq22AMVjboqpuo5rfRNNM+9c1HXgR8nBbDnjvJaSK15h0QN6VDapstL7HFRbXjWHT9v3k+QakzNE0u2CMx0ESg4EyhJxkFMAiD4V337rMrG0RQuj7T8znN/vbhyOu90zswPo3iGHtORBLhq5c+QLOnHkGWs/BmTjU50QIOQnidULrCvPZTcxnH6Kud6DbOazVaNsZ2naKEALyfILR6AyybJS+tuvPt8jw6k5PA/XIIuRIxdH2y43au9dsxJDlY4zHZ5DnE4TgY9C6mcHaFrqdo663MZ99iPk8BrZjQIyGOBDysLtTAIszAa3nOHPmGVy58oWlssCuFy+wN9i9Z/8yuEYN7zuf34QQClLmCCHA2hbvvnWZLjzkoUBjCMhDRWUl6mobxtQoy61+csc6DItNYnwT6Pq6h750qEu97YJeKivx3PM/gZ3t7/fTCtc+NluUBRFCHl6cxzHYXaN3rWP2lXMaRbEFlRaPzlnk+QRZPgLnAm07hTFtLAUIHj7YpQyPuJil6wchR6VrmAwAIaQJg4ylbCyBLCuR5RNwLtA0U7R6Du8svDOwTqOa3+6bt3eTTGltQMij404tTLJsjOee/wmorIxDplLWZhfMGk4VZHc4fF9Vllv9tScvNtA204/9fAg5LigSSx4q3/7uH4UQApQqY5bUSq+qpYmEwCLDKk0nXNx38TXOmZhtxRicbcG4wD//Z/8pfv/f/L/7PhbrLCYgEkIeVowxsNTgfbXkSMoco/FZlOUmujLBblIhSwtVa1sY08a+F92kw64vDqX7E3JkGOMpiyJOGARjECKDUgWkzKBUCe8d2nYGred9JmXbzlDNb0HrObz3iIdifGmqKSHk0RUzohpcvfYlfPqzfxnBOwiZAyHAB7cUPB+WLC9PHOT951ezr7oeWFk2hjE1GGOUfUUeKpSBRR4qXZlOXW1DyAzDbKoDMQYWkLKw0gddryuhUoNVC8YFhFC4eu1L+N73frtf2K57fApeEfLwCyEgODsoC4qLSuds33zVO4O82IAQCm07SyOzR5CqAE9DJKyVsFbHTI/g036Z1puEHJXhIBjGJaTM4qRimUNwCa0rGFOn123MsmzqHdT1NrSuBhvMFLwarBXogIuQh9tB2ZaMMeTFBq5e+xKEUHCIA6M4i3sM72zqk7k+eHU335dzibaZohyd6ntxEvKwoB5Y5KHya29fYW07g8q6ZoXLNeSrJxUMbE8a7jBlN5YYxkyI4B2kzGFNg9OnL+Hq1S/teUOhBSkhj6au30UXyOquI1pXmE7fwyxNJLNWQ+sKVXUbWlf9dSXPN5AXE0hZpGbuhJCjxhiHlAXyYoI8n0CKDN5ZtHrev4a7flez6QeYzt5H286xtPEcbGSH/e4IIQ+3ddOLeZokePXql3D69CVY08Q+VenAa7j36L5m6TEG+5Y9e5rh/iV4qKxE287wa29fodMw8lChABZ5KA17Tex/n723rwazhOiyuGKfG85ELBdiDM/f+Km+NxajIBYhj5zVYNWqEHyaOugxn32I6fS9FLSKWVnV/FZ/MipVjiwbQ/VZWRTEIuQoMcYhZBZfm2rUN0PWeo5qfgtAANLft3e+j+n0PXjnIITsM6z6Rs60LiDkkbJoVTKo0mAsthhgYrGH4KJvUxKzNkPaeyys63d1N3ucLguUkIcNRWTJQ6nrhSWEgrW6H4FtTQOpChhdxUDUsD9WWox2jd27fln9x4Pbuq/7gz/4J/gXv/1/SyWGLn4fzvvSw64EgRBCQgjgQqAotlAWm8jyMRACpCpidofM+7JDxhhmsw/WPkZn/eJ0uUyJkEfV8utg72uh6zE3zFoYvudvbDy26EvHBaxt0TYzuDQcRusKdbOLptmBd45eb4SQJd47SJkhIMBZ02dfvfLqL+Hy5c/FOw0qQrB0ILa3fHBP1Yd3UNmo39uE4Pvv6Zyh3lfkoUU9sMhDiXMJzgWMafoLeexhxRGCh1Rpowjc08nocHIhADx16VX88R/9t9jd+cHSfbx3qQcXIYQsNsneWdTVbeh2hvH4LLJ8DB88rGmQ5WOU5SlwkcNZjcnkPLSuoHUVr1+M99MJV4PjsTTJx4xQzlMDamoWTR5dcYiLjxNCu0bqK0HfmOnIEIKLPWi4RJaN+gEtUhXw3sXpxrqKG1FnoHWF+exDOGcGwxeorxUhJBIyg09TiYOP2dhCKGxuXcQTT7y8dN87TRRchzEGofJ4/eEczulU8hz3PCpduwh5GFFuIXkofeubTzFr2/40AkBalBapibJbLGSHp6ZstbYci49X7gcA49EZ3Hjxa7BW99kT3scJIs6aw32ShJBjb1g60GWChuBhTIOdnT/DbPoBnDMAY2jbGba3v4dqfhOMC0hVoCy3MB6fRVFsgnMJ7wx8ahofA1SLLJOPsggm5FGwXOof+ixH72wfuCqKzfhaK7egVAHGBar5LWzf/l4s9WUMzhnMZh9iZ/vPYEyzNHW0WxdQEIsQ4p2BEBLOWThvoVQJ5wxefOnPYTQ6He+0uv9Y7Xe1T1ZnVx7YTUFVqkCWjeL3TVnc1rb41jefokUBeShRBhZ5aAmh+h5WcTrQLgCkMfYj1NU2uJBxsZmmEHbZVYtMq8WCt9PfxhiadoqnLr2CJ5/6JL7/vX/Z963hQsJZPfh6QsijZmkKkfcAjxvdgDiRDIzFiWWmwnh0BkW5CcYE2nYOaw3yfAwhYg8eITMIoaBNDWd1n3GFEDOuAJamFqEP3FNJE3mUda+BxesitgXoMrKAWBooZNZnXTHG4KyBdi2MruGcTl/rMJ/dxnx+E9ZqCCEB8P7QK3SPOxjkQIEsQh5d3WE24MGZgDE1nnzqFVx6+jU09Q64UADWZV+tDJ9aKR/sPu+sRjk6BcY42qbrpVlACJm+L11/yMOLVrfkofZrv/6HwZgGWVZCygLG1DF7gYt0MhKzpIZNVrteWADgl0pwwp77+fT11mr8F//5r8OYJjVtdv2fhJBHE+MxULXUxBWDhSmPWaDOGgQElOUWNjYuIMtKOGchZZ5KAhSUGkGqHAgBrZ7D6DqdtMasz1g6KPrMrO4aRMijqu9LyXh8DXqHgJA+J8C56A+0GOMwpoHW874ssFsrGFNjd/eHqOsdAIBMG89hk+ZOP9SBMQRPJbyEPKoYY/DeQ0gF7yyUKvAzf+7tmN3JFsHvdOc9vfrW9b4a9sfqsruCd+BCQqkS1jbQuoZSBU0eJA81ysAiDzUhFEajM5jPP4S1sR8WZIa2nQ/eLOKJ6VI/LMaAdJIaPz04yehuA4OQOXQ7x3hyDs+98BX8q3/5/+ybxlPwipBHm3c2Nm3tevGsZGRYqyGFij35nEVd78CaBmW5hSyfAEAfhGKsiX9PC1UlC2hdwTkDaxs4Z8E9gBQUo+AVedR1r4GuD5YPHkJISFlACNUHrnzw8Fb3ryNnNXxwMKZB28zQNDsx64rHzAYfXN+QGRgEpFNZTx/8oglghDyyumxM7ywA4LnnfxKj8RnU1TbyYgOh2yPsUza4f0uA1E/Tx759eT4GAFjbwHuHra0n0LbT+/+ECDlGKDpLHnpvvPXbYev0U6jmt+CcQVFs9lkLwxLBfnO5NInQpz/D2vv54KBkgXl1C4Ir/JN//L/HD3/wP0JlxdIClxDy6BlOJu2C492mNgQPziW0qRG8R5aVcdKZaeGDg+ASk43zyLMJsnycgmAxeyTLx8iyUd+/x1oN6zR8yhyJFhPVCHk0LV4DjHFwoSBFBimzOOhFyMWQhBRw8t6ibWfQ7Qyz2Ydw3oIzAZmaJRtdgzEOlZXwziy9ntM3WppKTAh5NIXgIYSCMQ0ev3gDX/ji/wzOaYzHZ2Ft22dhAcuTUldLB4cfd/frMq27bNKm2Y0H9uMz2Ln9Pfzmd1+h/T15qFEGFnnonTp9CVrPwcAwmZyDte1S0/XOup4VXW+LfftZhAAfPDJVIgSPq1d/FLdu/TG8sxBdfy1CyCNJCLm0oQWQFpyxtMD7NpYTIDaH9il7U3IF7z2mu++jzWYoyk1k2Tj1tshi+aCzyIsNSCEhZQ5rNYypYEyLEBwoeEVIF7wSUCqPZbgyi6/JENDUu3DOwFkd/3QGWs/R1LvQeg7OBZSMgStrmj5whRD6QFaMTYfl1zfnENQDi5BHGk8lflLlePbZH4nZnyoHEFuQrIsw3U3wqn98LmFtXENMJufQ1LswusKp05cO+6kRcuQoQkseCb/xv34vhBAwn32IycZ51NU2hMwArMmuWtMLK/SZV8s9L7oTEGd16j/D8Y//4X+IH/zgf+h7b6yWEnb9MajEgBByJ92UszyfoBydRpFPwFJJopQ5pMwgZQEuZLzeOAtjYlZJzArZm2XaLYS7SWyLE93lzFNqAk+OUljJWlz8joa+PGf1dzp95SJbMRtBqVEa2BJL+6xtYtZiyoII3qFpZ6ir22jbWf+aI4SQ/YQQ0kG1x7AfHksTh+O04RbPXP4sPv+Ffwfex556CGExQArD91m2PE34gB5Zq43cZ9MPMJ6cA2MMb379Ar1xk4cevUOTR0JT78LaBptbF1FVt5GlmvG1Dqw/X/lcCEuBKGdbvPaZ/wlkatJobBtPY2UGa+M0I84ljG7SlBBCCFmPpamFANA0U+zsfB/b299HXe/0WSGxBGqeNuMMWVYiyyfIsjGUKuNC2jsE7/uFNYC+/0ZsMJ8mGqYAfde3i5CjtPx7uPg97TZ+/ZRBLgCw+HsefMq4KpFl4/RaiNMFrW2h9RxaV7CmQQgedb2D7e3vY2fn+2iaaf99uwELhBCyjpAqDW6KwShrW0iVg3EOmw61s6zEq6/9CqzTYIynnntuzYCHvfuNYfBqP1k+RlXdxubWRVjb9NPWCXnYUZSWPDJ+7df/MHhnkeUjOGeXxsx/1CwsxjisbcCZAOMC3hkoVeJ3f/fv45/90/8EeT6GsS0QQj95JE44CpTdQAg5UJfhGTM2Y8PWYVZJWW5BSAXOYzcAzuPGPc8nsWeP9/2mfVFauJi6ytYGqZZPkgk5Ksu/g3t/F4N3S5kJnAtImfUTO3nqKde2sziBOAVtvbdw1qCud/psxdizSoKLmCER1wcUxCKE7K/PuEqZWNa0AGNQqoBu53jtM38JN278NFo9g+AKjMdppyq1Hfk42VddlqkQErqtwIWkyYPkkUG/6OSR8uu/+f0AsHRqwpd6VAxLExaf890Hg8buiyBW16jVOQOG+CZWVbcxGp3B3/0v/33c/PAPkeVj1NU2inITgkvU9Q6yfAxrWspyIITsq1scd9PN4uc8vPephDBDUWyhLLfiyS9YyvjMIUWGvNjo21g7q2FMDWvbQVlzQLdwHn7PEHwKcNEGnhyd4H3avPE9v6Pd7y4Qs5pj4KqEkFn/O982U1in4WyL4D0CAqxpUdc7/WTB2MeKL72+4muAAriEkP157yBVjraZYTQ6BectmnoXo9FptHqOc+eexVe++jdRzW+hHJ0eBNxj2TIXXRvqxXvwUu+rQQB9WOo//Jz3HkoVAALefuNJumCRRwY1cSePFJ9KDJSKI+iHAaTYTyO+d/S16amJOxgDC+iDWN10I5cyrpzVCIintqPRGeh2jlde/WX8vb/zW5AyR1FsQLdV6leTU5N3QsgdSZnBBwfvHBgLff88zjm8B6zVqKpbMKZCnk+QF5tQMoezcSKhMTWkzFM5YQEpMzhnYEyTphe2iwbU3TWvL1tkfcYWIUeBC4WudNC7xcj5rhRHyhxCqP5PMAZnTRpm0CyCUd7D2BZts5uysZo+w4pznpq6LwJXXAgIFg+mCCFkndj/1kCpAsbEvnpFsQEpc7R6jlde/SXotkJZnorlzamiI8tGqOa3kQmJYR7Jnsbt3efXBK8AwDmLLBvBpfJEQh4lFK0lj5xf+/U/DACgVAlrm7VZWP3fU536+lLC+Ldu88eFgrMtVDbCfH4TZXkKv/3f/V/wP/yr/wx5PgHnAm07w2h0BtY2VKJACLkrq1NQ2WAT301P6yakFfkERbGFLB+hL0tgAkoVMUMlnfr64GNZlbOwVsM5vTIpkYMmGZKjxVLG4eL3UogMUmbgQsYeb13/yTS8YLlU1kO3FZpmB007g9F1P9peCLWnpxawfhoxIYSs6oY9KFWiqm4hzyfw3kHrOV76xM/hU6/+EppmF0WxCWdbSFXAmiYF5peHU6wrHVzOgN6bfSVlAWNqAKDSQfLIoQws8kiSMk8ZWHzPJKP4YVrAxnSsmInFsMhSSF8jRAZjdqFUAc44HGNo6l2U5SlYU+OFG1/F9/70v8ds9gFGo9Nxo+gNuFCwzkBQAIsQsg/nbeqvx8EZX8oSCcHBe536XhUp+0RjZm6iaWfIsjHG4zMA0kmx06n3Rg4pCwihkGVjBO8gpYG1LZwz8D72BwzeUQkhOVJdyY2UGTiXS9lWXf+2OE2wgTFNzDwMrg94zee34oADEwccSJX3/a1iG4HlDGzGeDyg8h4+OAhOS2RCyHo+eGQyh3MaPF2bYkP1J/D8ja9C6wrj0RnMq1vIstGiibszyPJJOngaxJ1WAlmDG/YErwBA6wpKFbC2fQDPlpDjhSK25JH07e/+URBC9SUC+2VhrWvoHgZZCc6ZeCrMFVo9A2ciBsdMlYJkNd5/73fwz/7pf4ym2cVodAZVdRtKFRAyg0uTCQkhZJUQqg8oAfHEtgsqBe/BhYR3dulrYt8+Bi4EgvcYj89gND4LpQp4Z+GDh5Q5lMqRZZM+OAbELBZrGxjbpmsTZaKQo8QgZAYlu6DrInsweJ+GEzT9BE7OJaxtUc1voqpu98MPgLAn27l77QxfT13Pyzj9UFIJISFkX90ewpgao9FpVNVtFMUmXv/8r+LChefBher7UoYQ4JyGEBlEuk4JmfWP1ZUP7m3cnm5dE8Dqvv+7b12mvTx55NDxEnkkaV2jKGS/SI3TvmTfMyaWLqRAVsrCArCnF1Z3guu8gRAZEAKs0+A8Lo4FF3jq0iv4vd/9r7G9/T3U9U7sh7XSf4sQQlZ1G+jh5ns4fns1eDW8b/BxwtFsFjfzeb6B0fgM8nwCIF4Dta6hVIEsG0MIlaa4FRAiAysYjKlhTAuXTni5kIOyxbgYX+3PMWwCn36gpQlK6VlQk+yHwOK/4d7/tl1DyeHvx9KglBD6982unK/7fRYpwBondYXUq0qkTaDpA1cxMCUghELbzlBVt9G209QzLmVP7/n5ou57DV9Pi0bugYJXhJADddmeRbmV3mMnOH3maTx16dVY2hcCAouZpAysf7/0YdjAfbn3VfzE3sCVtS2UKuG9BcDTNTNA6/rBPWFCjhFaPZJH1nd+40+C1hU2Ny+irm+DMY6i2MTOzg/6tNxuPP1+WVjrsrX6DK208DamQVXdxt/7u7+FLBvHDCyZ931rCCHkMHAu+pKoOHKbQ2UjFMUmsmwEpQo4ZwEESFkgLybI1Kg/MQaQmsGnEi2n++mEjAl4bw8MYCyacC/3FlzcnzK8TrZ1/x0XQavh78cwwNn9TnAuEYLrpw0KkaVebcWgTwyL2VamQtvMYG0DgEEICWMaaF2hbabQpuqDtt0GcBicIoSQ+ykEDyEzGNNgVJ6C1nN85atfx2h8Bkrm8SBnZbrguqyqddlXAOC9hZQ5jGmwtXURTbOLEDzK8jR2d3+ALBvhnTefpn08eSRRBhZ5ZIXgkWUj1PVtOBtPW2f2Q0iZI4SALBvDOR0X3MMsLCwmhIR+lPeaDK002YgLgbPnruC557+Cf/3/+y8ghaIG7oSQQ+e9iw3ZU7mUMW3qGRRPc/NsDJWNkGUlgIC62kbDdiBlAZkyYITMkGWjvm+Q1nNY26bgRGz03pVeAeizZeKI726K4TDgv9Leg5xgq/9d43th10dy2Ci9nyIY75h+P2zs4ZaX/aRMzgVcKps1poY1bT9sJTZxV9C6RlPvoNXzlCXYACH0vbFCKjEkhJDDwhiHswZSKDTNFDde/GmcPXcFbQo0rQavBl+5+PzeB01/sLQHMZAyx2z2Yb8HqevbyLLR0vsuIY8aWkaSR9r/6rc+CE0z7Rsb7+7+EBsbj2G6+x5UNsLqAr3PsNpnIuGenllAP0WJc4H/13/2t1HX2wBidsRig0cIIfdXV+LFOF8E3YOHT02qVWqILVWJLBshy0aQMl8q7euzYrIRhJB9eZUbTC7sJiF2C+q+Wa23fQ+Q4XJjcT9agpxki8DV8DAmZfyhy7DyS78XnEtImYExHhuyy1hCyBiLkwR1tcj2G3wfa1toXUHrCtbUsfeMbcGZSMNYePfd+4xD+v0ihBwWLmTfx3YyOYev/ew7aTgEhxAZAsKanlaLANWeyYOD4FW6AUZX2Ni8gOn0fWxuPp4GVrQoig1882+dpwsceWRRBhZ5pGk9B+cc3nvM5zcxHp9FVd2GVAWybAStK8Q+Gyujtbs3mLB8G2Mshq3S5ELGBbSu4oIdDK+89kv4//yT/2Pa3FHwihByeLpG7rHfDwPnHGDpTx97bFmrUxnWLrJsjLyYQKkSnMtUYhgztppmCpmysYTMkRcTOGvgvYP3Nt1PDyYZ2r4EOwYTup+KpQAXoxPkE67rSxUNDnvShqzL0uv6XMUpgllsbsw4hJB90ErrCtbqNJqe9eX33lsYU6NtZtB6ngKl8X23C1512c7euz5Tq/vdJ4SQw+Cd7a+Bn3r1l8G4gJAK1mqobDBgZal0cBCgWhNgHwavuiyrqrqN8fgs5vOb6b2ZQ+v5IT87Qo43it6SR953fuNPQwgOQmQpo8DvDVgd0OdqtR/WMFvLOd2nAWtdIS8m+Of/3/8T/s3v/oO+1IYQQg7T6vWsCxB4H5vJMrA+mMU4R56NkWVjlOUWhFSp+SzvgwtcKEihoFK/LMY4GOJ0OJdKFGNgy6XAwmKSIk+TFLvHIydX998weA+/MsGve3+LgwFiphVnHAGxqXEIPpYIOgPfB6Xi4zmn4axBXe9A6zlaPUfwHjJlawWEwebR7/ndXn7vJoSQ+697j7v+/I/jM5/9K4jVHAWEUDCmhuBqJatqb9+r4cfD4FWnu551WV3OaTAm8M6bl2j/Th5p9AIgBMB3//0fhKaZphPiHEBA2877SR/RmhLBg0oJARhdYzw5i9nsQyiZAwDm1S38N//oP8Lu7g8f4DMkhDxqutLlLkjVlXP1GaOcwzvb9+QTUoGn5uzWGXDG+0BWlo9TqVfX44rHE2cuUoZNlr4P+izUrrF2F8DqAloLFGg42YYbrUXAinMJxjmULPpsrC7o5JxOJadxeMAic8rHg5523geufPCQQsWpvsHB2W5icPydRghLv8tdGaF3NgVbqc8kIeTwbG5dxBd+5N/FaHQ6HVpbTDbOYTr9AFk2ArAIXnUf7ykd7D5euZ9zBnk+BsBgbQvnDIpiA2994yLt3ckjj0oICQFgTIOi2ETbzmDTyHilirSxW1M+mEoEAw4++c3yMeoqNlz0zkCpEmWxiede+En8d//8/7xIMSaEkPtMygzeO1gTr2mci9QPK2aMehczsITMgBDifYNN/YmyVMZVx1JrIZHnGyiKjdjcnUsEBNhUKh17G6mlYFaWjfufJTbyjhMNrdVpHDg56bqeVt3kwGHQqGvkb23bb8D6bLz0XulSiWDTTNG2U3iXyg5lBp6yu6xt+9/JvlzQub6/GxAnDjpv0s8kIGRG76+EkEPDucDzL3wFo/JUyrpqkOUj1PUO8ny8Zz+w2pNvderg6v3iNPTYY8t7h6LYhDH1IT0bQk4WiuISknz7u38UQgjIiw3sbv8ZxpOz/ZvHvWVhLUoKu2yD7jTYe4tMjTCvbuFf/cv/B/7g9/8x8nyCEHyf8SWEhLEtBKf4MiHk6A17/DHOwVnMwNraeiL+PWVkxfvwfhpcno1Ttkxs0t1lzMRywgDnLaxp+l5Hyw3fQ9/DaJFds2hEv1/54fAUe9191pVppGd5l/8aw6/7uBlkBz/W8nS/5fsvDkxWBo0MH70PJoW1t3f3Wb6fX/p3H/636BqzK1VAqiK9R7F+6iTSz+Rd7I0WS//cUoP/PuPKe+zs/Fn8e3B94/Xl50sIIUeDcwGtayiV98NLpMrBmYC1La48+wW89PLPYzw+C63nEFwtZ36ulAXeS/YVEA+g5rOb2Dz1BNpmCsYY3n3rMl0cCQFlYBHS6wJOs+n72Ny6eHCTxLQZ2+dGdI3fOVewtkXwDkKpWCJhKpTlFp57/ifx3nu/g/nsQwihUJZbaNsZwBgFrwghR64LkiwFFEJAQAxmvP/+7yLLRqnEcBIzZIA+i1W3cwghwbkaZGcpcKFiLyzHIUWGotiMwQ8f+x/FLK0WQmZ9wMN7s/SzLPcNWQ4EBe8QEFZKwPcKw0EaeyZArQ8KYXBosa4J7z3pAmz7PM7en2XYexFgXGB10zP8WudMHxTcMykwHcT4YPvH73qjcSH7HmlS5qmvSxYDWoN/EyEUfMqsi2WBGtYaeB9LBJd/fh8HBrSzVCJYQWVlfLw1gSvqZUUIOUrx+hczkZ3TKIrNOGzCt5hMzuP68z+JsjwFo6tYlcE5nDVgCFCygA/d+8sB7xMHvIc4Z7C5dRGz6fuptQmVRBPSoUguIQO//pt/FkLwUKqMgaW0IQOw9rS7P+E/IAuryyyQqohNa61Gno/BGMfv/94/xH/7T/8T5MUklfnECUrO2b78hxBCjkIXUNgvkLDaPFsIBZWNUplhASkLDIMlMVsrlpxxLlEUm/01MwS/uI52PQRNPQhgdf2zuu/JlsoQVwM4w0zZfZ/f0hCNvZlMfM9BwmEHVJafg3dmTxPgxce4c4ncyvQrYN3zW/x7DvtYMcahVLn0/cAWEyQZGJpmN/ZLSyWhwfuloGIc+d6gaaYwuuonCC5+vIMDdxTAIoQclbgWN/2anDEGpUq07Qyfef2v4vr1L8MHD93OIWUGqQpY0wCI7y0HZV/FP7qs5eX7dZzVGE/OwZgajHG8/cYTtGcnJKE0D0IGnIslg9PpexiNzizVm8cTYWC4ien7YO3JyOo2GBoiNYXv+ngomcNZDR88Lj/7Bbz33u/gT/7knwMhQGUlnDWH/0QJIeQODsxeCgFCxD5YsfzLw5gmNeKe9ZPosqxEXmwiz8fgqcSibWZw3mI2+wBKlciyEZQaxcbcAFia7lqOTqWywxjE6rJ8vHfwwacMK7+nr1IfRLlDE+/lDKF1nzv4AOHjBljuVCq3KOFbf392xym2yyXvYGxpSmBAAE9Bqz47risHHWRwYRAw02YGrav03hizhblQ4FzBw6Bt52ibXWhdL/236fpJsm4KJdieLK3+p6bAFSHkiMUDk5gJKqSC0XE/8Mzl13H5yufQ6jn4oDefszq9hzE426a1/4phBvHyDXuuhUW5hen0vb4ZPCFkgaK5hKz49d/8sxADWf08rUHG1aIXFoC+V0hYKu1Y9Bvx3kLKHM4ZGF1DSNX/vStfmVe38F/+57+xKJdxFkKoPuBFCCFHYU/54J7bfZ+10wXxh9lSKisXmVWMQckCeT5BUW71i/Kun1WXbSpEbAjeDdEYBlwWi//IpWlzPrg0TdHC9z2cwt7rdZrAuOjHNOjtlTKLFhsJtiaA9VH7Zu3n4Mfrrv9dVm8XjOreY9jgJL97DsPH7Z8P5ylQJcGF7HuYiRQw7L9rHyy0/b+9ST3KusOdfgJl+l5aV2jqHbTtDMY2/X9rxjiMrpeyuoa/I3eaEnin3z1CCDlMcQrgBM7pxftPCPjq176JotiMZfBp4IS1LZw1UFkccGKd7jN4++yrleBVN4BiNbN2uedhgBAZZV8RsoJeEISs8Zv/wc1QzW9BSAVg+UT4Tg3dh5MJu6wALuTiNBsx0yuWFDYQQuHf/O4/wL/8F//3Oy7qCSHkQblTU+2uT1EXGOp7KHEBxkUqp0jlE6nJN0ulamAsTm9KE+wEV6kJuO8fT3QBF6EgUiCr76HFRcrqWZS0dYEdnwJbsRfXcvCqC7ANg0Wrga7lzz34puL7T69iezY3XRP1rpH6MIglZT7oabX8bxSC7/8Nux5W3lu49HfvLJy3g+Be7H/lfJwk6axGVW/3Qa/+/S8syuilKhAGAc3h78hBPa6omTsh5DjorkHOWXAu8MlXfhHXr38ZxrZpSmALKWKrkW7IRXc43WUUA4OejXdo3L70Pa3BaHwGb/zNs3QhJGQFlRASssbuzg+wuXUxNlVPDdmHi+r4cdpADMsHGQMLi4wsxhict5AsB5O8z7xy3oE7izwbo6q38cKNr+L73/sX+OCDfwPG4mhxpQoaA04IOTJ3CiDEQFDX+Jv3ARLvHeBdXMCngIZzFgEBrJtaxzmm0/cRh13IGMiSOVQ2RpaVfaYq0mbAWb3UJ4txjiwb9wEawWU88Waszyzqmsp31+hYAb4IuDlvFhlN3iME1wdgAsLg+rtPBu59KyFcfwLfZS3xPsNK9A3Z47+jXAStWNoarRkwEhCzhZ2PQakuwKf1vM8iHva36ko0438Djbadw+g5jG1j+bu3MRjFOYJPUwUH/205531JTfffikMM/p3DgYc1FLgihBw1LiSMrvsM4HPnr+KFF34KVXUbo9FpWNvGa2m6XYrY8F3bFlyo/nGG2VfxE+uv+8sfM4zGZ7C784NDfpaEnEy0SiBkH9/5jT8NizHsy2PID2riPszC4lzCmBpS5rEhsXfIsnHcmKVsA+8MOJe4efOP8I/+4f8O1moIqeCspmwsQsiRuddm2sNAfxegGGYFdQGM1fsvl/ItAjJ5vpGCWqN+GtTi52LL19+uv1PK1mJMpADWct+lOzyB5b931/JBVlEX/Oqe48cxfD7x4+VMtbv5+Zb+OuhHFvsuaoTgFllVXZ+wpSbCYen5WKthdAVjW7TtdCngt/rfaSlLbfDvOyzVHD7He/k9io9DvbAIIUcjhADO4zTWLBvhR3/sf4lTp5+CcxZq0N8qBroqMC6gZMzKUqrspxCuy76Kf6w2cV+8t3W3v/PmJdqnE7IGZWARso9F03agK9MAYvlffGOLI8xDWMnCwqLG3aXglPc2ZgfwWErYbYqA2IjXe4szZ5/BjRd/Br/zr/8u6npnMWIcWDrtBuIbprOGTqoJIYfmXgMIy2V3i/5N+zVDX1cqNrx/Nb/V3865gJQ5pCwgVQ4hVN9Ha1GS5uFsi+67NXU3FW9R1thlMy1K7Lq+V3yQ3QSAMfgUoIqPv/fnZ4wt948a9EJcuWP8Y6kPyv7/viknLL7HpMyxEDyCW0xiDCH0JZIhhNT7azCtMb1nrPt5u8Bb287gnIE1LaxtYkaBd/uW8K3+d1r6mb3f0xFseABzL79LFLgihBy2rjl7l2nbrbGHGbBa11BZgede+ArOnHkGzptUHWH6IRre2b5huw8OXCg4b8HXHUAPsmy7bFeAQXRliGH5gIcQsh69Ogg5wK//5p+Ftp2hKDbR1DvgQkKpEs5paF33JSrD5rrpEwDQb4CWSk4G9+uaRFrToNVzCJHhH/z9/y1m0/dhrQbnvO/b0pXddG+wtMgnhDzM+gBMGDQtHzTEDd4tlR9KVUCKPPbN4mLxNd3jDZc8bHEoEb/F3uvpUoAsZRitZoENG6mvO2Xfk5271EB+OftpOYMqNkjf828yeD5Lkxe77zF4Pn05oLOwroU1zVIZIOsDZGHPvzGApWw5Qgh52HRr6WE5dNdPsMs6fezCdXz+i/8ujKkxmZyPTd1Xm7IzNrg2pwBYF8Da537WamRZCSEyGFPDO4ui3ELT7CLPJ9S4nZADUAYWIXcgUi17XkzQNFNImcOaFlk2gveDHlUr/a/ip1b6ZXWfH7zBee/gvMV4dAZNO8Prn/u38ff+zm8NykoWASue3gC99xBC9pO7CCHkYTM8DQdSdlYK8ATEJu9d83FrGqDZXQogFfkkZV+lRvBCQQjZ9zQxpukDUbwLQPUZWkDbTPvHWncaftD1ty+nO2BS4TCANnyOXVCqawLcT04MAW6QgSVljoA4NdA5G/8t0r9HCB5NO1sbQOuCZtY0fVBu6fkNygUJIeRhxLlIzdnj4YTvh0ws1t4heLz+uV8FA8N4dCZWYHgHLvO9mbYA1vW1ip9d6YOFeEBiTQOe3seKYgPAYs9BCNkfRXcJuYPf/N/cCk29g66JrnMmvvHYBj6NaweWNx4Bi1P1/rbulsH9uo1R28xQlJt909vf+93/Gr/93/9f48StvnTR9Kf/3jsoVcReWoQQ8hCK18/lKYbphpX7rfYnTBmw3vVZUYt+XIssrrLcWpQYslRiyAW6JulSxbKQ/XpnsT4AtX564dJ9lzYvXYbTPqWV6AJMbZoamBqlewcfFiWCdb2zZ/rfcCLgIkC2HIDbE4wb/LsOpwhSD0ZCyMNKCAVjmv46GYLvg0fdtNpXP/0ruHzl8xA8Vl/Mq1soy60+8ARgcMCxOowjZevumTwYP8s5h5QFtK4ghEI3RKQot/DG3zhD+3NCDkAvEELuwjvf/r3QlQ+27SyewAiJxUtonyDWoFxwtWQEAASX0KaClDl0WyHLx2ibKYRU+Cf/6D/CD/7sX4ExDqlyOBuDVVwIOGsgZUYZWISQR9awRHC1vHAYdBqW53V/j1+zt0fU4C99w/M+wDVsBt9law2+H+N7v//wfSD4sPz3FIgalg4OA1SrvRX39J1aeR6rZY6r33+YWbVaXkkIIY8SzkU/NMm7uJYWUsWDg+Dx5JOfxBd/9H+Opp1iNDoDa2oImceetkwsZVTtKSlf07h9tcQQadIt4wJ5PunLCL/z7nW6MBNyB1RCSMhdyIsJlBphNn0fjAuMNs6gqXf62+OeYJFVhRD6kfL9n6kpfLw59cDyFoLHEx+l4kmMyko4Z/CJT/4Cdnd+gNnsA3gnFo0lmYBnloJXhJCH2vJUw+XSbCBuNpaCMyuNxBcNcZezuDhE30NrNXtrmC27LoNr+P39Sonj8LZVe4NPccLV8Lb1GVT7lKQwBi6yPc/fDzLQ1gXohgG4rnnxun9b6rNICHmYee/idZQJBBbfK7yz8N5iMjmPl17+eWhdYXPzIqr5LXAhYtaWrqGKAi61EFkbvBr8uVw6uBzIGm+cR11to22mmGw8BmP29j0khOxFUV5C7tLbv/avA2cCRbmFqrqFPJ/0JXz7lQgOpw2GPvtqsVlxtsVofAbT6QfI8zE4l5hN309vZDV+93f+K/ze7/x9tO2sb0rcpT0LIWmDQQh5pOzXZHxPNtbAna6T/f33a/gOrM1gWheA6u+9NMlvtbRkbwBsKYNs9fsunsi9PZ/+y9ZnXa02ySeEkEcFYwzO2b4dRzf0Is8nuP78T+D557+SAv0GKhvB2hbBO2TZGNbpld6B6ZBkmHG1J/tq+fovhELbzjAaxQNxHxx+/ddeoH05IXeBMrAIuUtFsZnG6s6XglfAmtPqYenHShlI19CdMQaVjVDNb6WxvLER8cbm46iq2xBC4vr1L+OHP/gf0X7w+/3j+OBiRhcXCG7QRJ4QQh5S3aJ/eEDAOF+enrdiXVBmtSn80v2WJvrtb11WGIA+oLXarHc18LSa9dW/f4SDWr7vte65DD/eLzusC5YNA4BL/76EEPKQi2toAx9SNUMKMm1sPo7r17+MEDycc8iyElrHVh9gAta2YFwsBa+WH5it/xjL1+RuCrnWcxTlJlVVEHIPKNJLyD34zm/8Sb+67ydDDaxmWB3cD2tQ4rLP/TiX2Nn+Pv7RP/wPMZt9CCkzAFTeQQghhBBCyEfBOE+9B0PKxjKYTM7jR770v8DW1hN9YGtdP6v4R+o9eJd9r/YeKCxPf33nzadpT07IXaIRM4Tcg3fefJp1k7G6lON7sd80q/3uZ0yDra0ncPX6l6Cyoh+rzrns6+8JIYQQQgghd8dZ008djEOaCly99qPY2noCxjQA7n3Nfre6gBnAEIKn4BUh94gCWITcIylzAAFKFQCWU4LX1bkDi5OZ5fut772CwWkOZww+ODz/wk/h3Lln+zdJa3WcgkIIIYQQQgi5a90Uws7Zc1fw/As/BR/cYtgFsH59vq7f4koPw/2yr7qP4x4ipD0FIeReUACLkHv01jcuMms1ukwsYN3kqcEb32ra8D4Nfdc18GVcgIHBe4tPfuoXIWWe3nQbSEVveoQQQgghhNwLKXMYU4MLASULfOqVvwDnDRjjaQLswvAQenXtvif7amndv18PrJh5Za3GW9+4SNlXhNwjCmAR8hF8551rbNFwcf83qMEnl98AMbwPW5+tlT7HhYI1Lc6dexYvfuJnYWyLLB/DDU6OCCGEEEIIIXdmbYui2ICzBi9+4mdx9uwVWNOCc7m0Dt+bVTWotFidOrh0YH3wAbf3Dt955xoFrwj5CCiARchHlGWjO6YIM7a3cePeINbga1ZuY2CwpsZk4zzqegdXrnweTz/9aQTvl6YgEkIIIYQQQu7MOQPvHS49/RquXPk8qnob48k5WFPvXaevWcuvLTHE8rr/oBYjWTY6hGdFyKOBAliEfERvfv0CA9a9Qe39OH1izRST9dla8TOL+1qrIVUOrSu8+tqvYDw52/fgIoQQQgghhNwdqXKMJ2fx6qf/IrSpoWQO5xaVDesDVOv71+7Nvrrz3qDbQxBC7h0FsAi5b9a9F+2XQjy4xwG3SZkDIcB7C+8t8nyCLBvhEy//AgLCx/2BCSGEEEIIebSEgE+8/AvIszHyfBLX2S5O9z6osfrdref33w8QQj4+CmAR8jG88+bTjHMJ5wykzBBCQJaNYW0LxvhSvXxXItj9b/hxd78+9Tj9n/MWYAycC3AmYEwDlY1w7vxVPPfcT8J7By5k//NwIWFM3Y8GJoQQQggh5FEjhIIxzdKaWAiFEDyef+GncPbcFQih4GwLITIwxhEQ+1P1PbDYyhp9zRoeg/ss1vIc1rbIsjFCCJAyg3MGnEu88+bTFM0i5GOgABYhH9PbbzzBhFBomxkAoG2nBweQ9ptckj47FN9oA7yzYGkqitZzFPkGrlz9Is6cfQbWtPErOQdCQJ5PoHV14CkRIYQQQgghDyPGGLSpkRcThODBuQBjDNa2OH3mGTxz5XMYjc7AOQPnbF/VsH7tvPdz+/XAGhJCoW2nAIC2mUEIhbffeIIW54R8TBTAIuQ+UKpAXmyAMQalSihV9k3W92v0nm7sbllbI++9RWq0BcElhFRw1iAEj82NC3j5k7+ALBtBCAXdVmBcoGl2URSbcCkVmhBCCCGEkEeFcxZFvoGm3gHnEm07BxcKSpV4+ZO/gI2NCwjBwzoNISQ4l31WVUhTxlfX5Qc1bl9tGeKc6fcDjDHkxQb1riXkPqEAFiH3wZtfv8DadgbOJby30O0cjC1eXmsDV2zvG+Hqm6D3DkLmcRphKkuUMoPzFk0zxcWLn8ALL/402naGLCthdA2lRrGMUFIZISGEEEIIebQIqWBtgywbQ+sKWVaibWa48eLP4OITn4A1NYyuwRiDVAVC8PHQmIuVqYMrh8/DtfuBjds5dDuH9zYF0GbUuJ2Q+4QCWITcJ9955xoLIcB7B6n2NoAc1tD3nxuO6F1KUY4fcy4hUlDMmAYIAUJmEEJBCIlWz/Hs1R/FxSc+gRAChFTIshG0ruJpEiGEEEIIIY8QziW0rqBUCSFjO46LT7yEK1d/BN2Bs5AKQmQI3sOYBsG7ft0drazX17QAWbe270iVw3uHEAK+8841Cl4Rcp9QAIuQ+8iYGnk+gXMGeT7etw8VG5zusJU3yNUpJj44MMahVAHGBZzVCMFDpCkpnDG88tovYzI5B2tatO0M5egUtK4O74kSQgghhBByDGldoSxPQes5rNWYTM7h1dd+GZzz2Gqdi1gpEQICAgQXqZF7GqA0qIZYXaf3nz9gjZ/n47QXmMCY+rCfLiGPFApgEXIf/e13n2NNM0WWjVBVtwHsraFfagY5DGKt6YEFhH7SYKyj53HUr3fwzkDKHIxxbG4+jhc/8bMAYto0QjjU50kIIYQQQshxxMAQEPpJ3S9+4mexsfk4GOMQModzOq6n0yGxVAW4kAjBIwQfH2OldHB9D6z1PWyr6jaybISmmeJvv/scZV8Rch9RAIuQ+yx4hxA8imLzYz0OYwycS3AuEEKAdRrOaQiR9Y0gdTuPDeNti8cuPI/rz/8EAKSeWKOP/VwIIYQQQgg5SbJshLaJEwCvP/fjeOzC83C2hVIltK4guFq02ggBIQQ4Z+C96xuvfxxFsRmDYakhPCHk/qEAFiH32Xfevc7qehcheEiZw5r4humdRQihb87efdw1guyysIb/895heLrTvdl67wDGoLISPniEdNsnP/XnMSpPgXPZnyBxLuC9g3MmjhHmPKVHE0IIIYQQcvI4b8E4B+cC1upYsZAOfX2I/axG5Sl88lN/Pq6LgRSgKhAQKxU4i03bQ/DgXIBzCefM0lp8uEbvGrx3PW/7j52FUiWsaSFljhA86noX33n3OmVfEXKfUQCLkEPw3W/fYCF4VNVtjCfn0NQ7kCqHlLG+XsoMnAsA+0woXGPdaZD3Ft4ZMMagVAFrWrz+hb8GxngfwAoIYIyjKDagdQ2jGyiZg3F6+RNCCCGEkJOFcwElcxjdwJgGZbmZgkl+8CfH61/4a+kguYgHyM7ArznE3Tfjap9Jg5yLpTW9VDmaegfjyTlU1W2E4PHdb9+g4BUhh4B2sIQckhA8traejNNORByhK0QGYxo0zXTvlMA9kwiHb6grn0//41zGEyjGIYQCGMPZs5fxiZd/rj+NYozDBwfvHYSQkDIDGIN3lNZMCCGEEEJOFucsMDgQ9t7BBx+HHXkLazU+8fLP4ezZywBjEEKBsViBwLlcZFctWTRoX/4s2xPI4lyiaaYwpoEQ2dJaf2vryf4QmRBy/1EAi5BD8u5bl9n29vdiYAkM4/E5zOc3oVSB8fgMrG2x7s1ymKa8fBtblBwO7ivSG7ExNaRQaOpdvPDiz+DJJz+ZShU9pFBoU78sIRSMaT52fT8hhBBCCCEPGmMsBY8UlCrRtnNIoVLfKY8nn/wkXnjxZ9DUu5BCwZh6ac08eKClAUv92njY3mPwPdNHsLbFeHwGShWYz29iPD4HIAbKtre/h3ffukyLbEIOCQWwCDlEv/GdlxgA5PkYWs+R5xMwJqDbCkJ0GViDN83hVMLhn+vKDBmL01O4AOMCxjQAYyhHp2Bti1de/SWcPXcFup1DiAxAzAqztkXwsT8XIYQQQgghJ4mQGYJPa9qU7SREBt3OcfbcFbzy6i/B2hbl6BSQgl3detkHt3RQ3GH7rMEXQa742fi9JHRbgTGBPJ+kNf4YwGLtTwg5HBTAIuSQ6XYOravUXDK+5KSKzd3ZyskPgDsEsZbH9QqRwdkWjPHY1yr1vrK2xebm43jhxleRZaN0SiX7uv8sK+GcPvwnTwghhBBCyH3krEaWlQBiP9iuuiDLRrhx46exufl4H9warpGdbftDXWDv2npd8GqB9et2a1pIFQ+COefw3kHrCrqdH/pzJ+RRRwEsQg7Zd969zmKPKgnGBNp2CiEyqPTGu8DWZ1oB2K83FmccATGzSqoCDAx1vYOy3EJVb+OJJ1/GtetfTtle8WtkehO3zhzCsyWEEEIIIeTwOGdSD6xFNYGQCteu/zieePJlVPU2ynILdb0DBgapilheiLh2BvbpdRVvWP786kEzAJWVqffVFIyJtMbnNHWQkAeAAliEPADvvvUMkzKHMTXyfAPG1LB2kQF14CTCPb2qFhlZWs9R5BsI3sFZDe8tyvIUnNVxTLB3uPHi17C59QQAwHuPEDy0qWMzd0IIIYQQQk4QKTMYXachRbGEcGvrCdx46WvwwUGpAs5qlOUpeG/hrEbwDkW+Aa3n+w5JOmj9PVyrW6uX1vRS5nj3rWcoeEXIA0ABLEIeEGt1ChoFeGdTc/e9hg0k+ykp3cdLJYcMQuawToMxDsY4uFDw6VQKAHwIEFLh81/8d1CWW33ZoBx8b8Y5OBdgnFNjd0IIIYQQcmwwxpbWqh0hFFhqqF6Um/jc5/+nEFwspmwzBu8MeJpAGKsPNITM0a2ju3X10lp7MHVwv3WxEAreWQABUmZLh9KEkMNFASxCHpB333qGuVS2V45OgbF1L7+DA0h7R/4efD+lCnjvoGSBV179pRjk4jK9qcd+WMH7OK3Qe4QQBkEyQgghhBBCHrxuPRpCWFqrAoD3DoxzCKHAucCrr/4yVDZCCL5v0XGva+aD7rH3Z+OxQTxiOSNlXxHy4FAAi5AH6N23LjPvHarqNtxKD6ph0GhtXf6a25fG/S5u7L8meAfOBbiQePKpT+H6cz+OptkFZyIGq9JJVggxeLX09RTEIoQQQgghD9jq+jaE0E8bZJwjhADOJep6F9ef/wk8eekVCC7AuUTwbn0/q5X1LVu5bb9+s3vuixi0qqrb8N7h3bcu04KZkAeIAliEPGBZNoZSBZTK98l2Gryxrhvzi33egNe8+TpvERvIK2hd4aWXfx7nzl9D286gUtP3+DNw8FRC2GViEUIIIYQQchS6zCvGWFqj8r7cT6ocbTPFufNX8dJLPwvdzmOFAeLad2hdSeDq1MHFnVMp4T49srp1u1I5lCqQZeP7/KwJIXdCASxCHrA3v/4Y41yiHYza3XsatPcNdekNGMP7LQfB+vsxBiEUnDPxRAoBShV47dN/EWW5Be9tTMfuywa7bKwQA1iUgUUIIYQQQh60rnQwHah2wasQQioldCjLLbz66V+BykqE4MGFhPOpx2wXiMJqFtViouAwS2u10iHdMPi65SysNgXM3vz6Y7RYJuQBowAWIUfg7TeeYFk2wvCNtDMMYq3N0Nrn1KjP2Brc1r3hW1OjKDbRNlOcPn0Jn/zUvwWbShhD8HE6Ibqsq7D28QkhhBBCCDlsizVoSP8/9JO0AcA6g09+6t/CmdNPo21nKEenYG0LzmKz96XHWLOWXltiCAzW3fu104i3ZdkIb7/xBC2UCTkCFMAi5IjseTM9oNY+fXLPG+7ajK2VHlhS5n2wSqkCTTvFlatfxOXLn4NSJTgXsQdWaozZn3KByggJIYQQQsiDFbBSHZCCV5wLKFXiypXP48rVH+lbYgBx2reQObyz+wSo1vePXZ99dYfetFSlQMiRoQAWIUfk7TeeZPuWDPbu3FD9wDfRdJuUGbSuoLIRinwDTTPFZz77l5EXE0iZ92nZ3SlV13eAEEIIIYSQB2k4GbsrJ2SMQcoceTHBpz/zl9A0u8jyMZQq0bZzSKH6DK393N16+s5r8rffeJIiWIQcEQpgEXKE3nnzaea9BWMMzlkUxebSm++wXr97E+/+N/y4u1+f+jy4b/AenEtIoWBtCx8clMwBAF/6sX8PzhkIocAYg3exJ5ZzBjLdhxBCCCGEkAdFyhzOmdjzyjmwQV/XL/3YvwcAUDJHCB7WtpBCgQsFhBCztgbN2JfWyGvW0BjcZ7WvbAgeRbEJ5+Ja3XuLd958moJXhBwhCmARcsRGozNpHLBA207hne0nqay13+SU9NmDrH6NkBle/9yvwjkbpxIOpqsYU9/rUyGEEEIIIeRjMaZemtatVAHnLF7/3K9CyGzpvnfu2bqmPHCfHlhDnEt4Z9G209RuI2A0OnOvT4UQcp9RAIuQI/aNv3GaSZkhBA/GBIpyM00OTE0oV5q6LxkEs9bW6u9X358+zrIRLj75CTz/wldgTNPfzIWCc8tjiAkhhBBCCDlsztmYUZUY0+D5F76Ci09+AnEIEvasa/fvE4s++2rP1/X3W/4azgWcMyjKTTAWe8VKmeEbf+M0ZV8RcsQogEXIMfDWNy4yITKE4KB1zHzaW0o4MJg4iD2Bq/VNKruPh2/gIXg4Z3Hjpa/h3PmrAOJkF85EHENMCCGEEELIAySEAmeiH0J07vxV3Hjpa3DOxvXxHQ5o9z38Ha6ND2jM3q3Bta4RgoMQGd76xkUKXhFyDFAAi5BjIk5WGSHPx/CpL9XQsIa//9xwRPBSivTeINbw9u5jo2uMRqdhTYPXP/+rGE/OQnCJtp1BSApgEUIIIYSQB0tIFdeiXGI8OYvXP/+rsKbBaHQaJh307lnXHjChe+l27D34XT0oFkLBO4M8H0OpUV8VQQg5ehTAIuSYePuNJ5j3BlpXKMotOGf2nZayaEq59w189Y17T8Br8HVZPkZTb6MoNiFlgc989q+mr+FwVt/vp0gIIYQQQsiBnNWxGTuAz3z2r0LKAkWxiabeRpaP9z3AXbcGXneAO1xHr4qDlQyKcgtaV/De4O03nqDsK0KOCQpgEXKMvP3Gk4wxDmPqvpH73t5Wa1KlV1Ko1wax1qVYp68zpkGWldjYeAyfevUvQAjZLxwIIYQQQgh5UBjjEELiU6/+BWxsPIYsK2Ov1v16WbGDD3D3/bp9eshyLmFMDcY43n7jSQpeEXKM0A6VkGPm3beeYTFVOXysx9nvZGlwBzhvwBiHykq0zQxFuYlLl17Dpadfg/fuY31/QgghhBBC7pX3Dpeefg2XLr2GotxE28ygsjJWCHhz4PRA4C7WwHcUp4O/+9YzFLwi5JihABYhx5AQWQogMTC2WncfEEJAf2qU/q/Lplr6X5+xtbjv8u0cnEtoXSEvJjCmQZ5P8PIn/zw2tx6H8xZKFfG7Bg/GGLx3kDKH8zSlkBBCCCGE3BvvHZQq4bwF56JfYypVwHuHU6efwkuf+DkU5Wa8b1ZC6wpZNgaApbXsIvtqsd7dczsG6+V037iWXj4sjmvuuNYVInvA/yqEkLtBASxCjqG3vvE4E0JBygzGxGaVRbmFptkFAEiZ9RNS1k4oXPrrnW7nafEQELxHq+fIiw185rN/BaPRaTTNNH3PHN47ZNkIrZ5DSnpjJ4QQQggh90aqHHW9g7LcgtY18nwC7x20rlCOTuG1T/9FjMZn0TRTWNOCcwnBBVyalN275zVv/HsIvl/HNs0uinILAGBMDSkzCKHw1jcep+wrQo4hCmARckx965tPsRA8vHfgXKKa3cTm5uP97evepJcnEa7a27Cyu38MXjlk+RicS3hv8diF53HjxZ+Byso+28p7B2tbKJnDOyoxJIQQQggh98ZZjaLYQF3vQMoMWlfgXIBzgRdf+nM4d/4aAIAzsTQV2zkNLuTSY+3pD7titU/s4muizc3HUc1upvWvQwge3/rmUxS8IuSYogAWIceY1jW2tp6AEBIheLTtDEoVcM6k1OYDJg0OAlp7GlQOmrqH4CGEhA8OnHEoVcCYBk0zxbNXfwTXrv0YOONoml2U3XRELuCphJAQQgghhNyjEAK8t5BC9VUAWtd4/sZXceXK59E2U+h2DqWKGFhyph9uFLxfKQeMlqZzr6yDh7cDDEJkcM5AqQJtO+vXwltbT0Dr+oH9OxBC7h0FsAg5xr7zzjVW17cxn91EOToFITIY04AxDqOrdK+9kwb3Gxm8J+DFGIJ3ULIAZwJNO4sLCplBygzeGbxw46dx9uwVKFXC2Aaj8RlU81uQKn8g/waEEEIIIeThIaSC1hWEyFKLCosnnnwZ165/GSF4ZNkIAOCDg7MtvLcQMgNniwPUYUCKHbD+XTeh0OgqrqVNAyEylKNTmM9uoq5v4zvvXKPsK0KOMQpgEXLMvfvWZTbZOI+mmcJ7iywbwXuHotyMjSpXU6fvcAI1DGJJkcF5Cx8chMzAUkBLcAUhYsp2QMBnP/9vYzQ6A+8cprs/xHh8lkoICSGEEELIPQveI8vHaNsZquo2Tp++hFde+2VIoeCDh5Q5GOcIwYNzmbKwbPy7UHsCUvGjNetetrz+7dbNXXP4uKa2aJopJhvn8e5blyl4RcgxRwEsQk4EBs5j00prNYRQfXP14X0OGhvM1twe0phgZzUAQKkyLhKCg9EVuFCQQmE0Oo1XP/0X4b1FUWzCOX0fRhQTQgghhJBHUgipYXqGl17++b7PqxQZWj0DZzz1wMrAhYTzBkAcPjTE9hzUYs/tqz2ymmYKIRRsWv/GNTatawk5CSiARcgJ8ObXH2NS5hBCoWvs3qVXA3eeurLn710KtYmTXziXsLZFN06YMb7U54oxjlOnn8Srr/1KbOTuzP18eoQQQggh5BHBGIOxLcAYPvXKL+LsuSsI3oFxEQNVIUCqAgEhrU8BITKI1N4iPcrqgx749+FauatmiL2vFKTM8ebXH6MIFiEnAAWwCDkh3n7jCRaCB2McnMeXrnd2kVrtLQAG53TsJxBczLpK/+tSqodlh1LmcWHAWOor4OIbfghgYAghIC820DS7UDLHtes/hotPvBRvZ/H2Tpch5r2j7CxCCCGEkEcYYyyuK7FYIwJYrB1DwOOP38C1574MKRSadoo8nyCEAM4lnNXxQJXx2LgdSCWEEsNywKU1bvqfDw5S5nBOA2Dw3i6VIsafKT128Hj7jSdo4UrICUEBLEJOkHfefJoB8c3fOYNydArOaRhTg4FBqRxKlWjqnZihdY+BpNUUbKUKVNU2xuOzCAC0rvDaZ/4STp16Es5Z5MUE1rZgKaAWFx0CKp1sEUIIIYSQR4v3Diob9RMGAYBxDmvbuHZ0BqdOPYlPf+YvQ7dzBADj8VlU89tQqlh6rIPKA9diDFk2QlPvQKkSSuVgYDCmhnM6rZ1N/3N1a2tCyMlAASxCTpyYFcUYR1XdhvcOeT6BykrU9U4sL8zHsCamXC8FsQZ9AvaMHl65HwBoXaMoNtA2s77pZZ5P8OnP/hXk+QRNvQspcyAEOGfhvUVebGA2/WDPAoQQQgghhDz8lCowm36AvNiA9xbO2dTzKkdT76JIa8ksH6Mot8AYQ9vMUBQb0LqOD7K6fl1dt2LQuH1wPwCwpkWWj+G9Q13vQGUl8nwC7x2q6jYY48iLDXStMwghJwcFsAg5Yd596zKrZjcBBBTFJrJsBK2r1BdrDOdik/eAsHizX2lwufh4b2PL4eQWISTadoa8iCnd1jQIwePs2cu48dLXYhZYeSqNQpbI8nFasEzgqE8WIYQQQsgjxzmDvJhgNv0AWT6GEBJaVyjLmP1046X/P3v/HW1Zfh32nd9fOOne+96r1DlHdA5ooANCAyBNgjAFCRRFSZYhMYiyKDnIlk2Ezo0GQFC25TUea83MGo/smbFnPPZYtixpOY0lkhKTSJEECZkUiUAiNzpU1Xs3nPAL88c597yb3qvqRld1V9X+9Kr17rnnnPvCWn3O7+zf/u39IY4fv5EYA66ZdSUrRpTVGKPNckftJfvj1rVxrdqfoI1EjEnwviZN20BWXU9J0wF5vg1EpuNXpOugEBcgCWAJcQF64bm3qSQpmE5PErt2w1W5R5oNSdMB3jebM60Wb/BLgwK1lIU132dtRvAOpTRJklOWe6TpkKqecOttj3PX3T/AePwSWTbqZ9cAEpvjuwLwQgghhBDi0uGDI7FdJn6XpZ9lI8bjl7jr7h/g1lvfS1VPSNMhZblHkhRdrSuP7TL4FydUVzsJLu1jc2aW9w1pOiDNhlTlHtZmxBiYTk+SJAUvPPc2CV4JcQGS/3GFuID9jb95Ou7tvchwdILp5FWgCzoFR4yB9n/xNqgUY4QYiewXz4yL+4hLhTVp38HajOn0JFk6BKBxFYnN8KHBu4Zf/qX/G9958ff7QUOWbzEZv0yaDfuim0IIIYQQ4tKgtKauJgxHJ6jKPaAda15+xe089q6/iDEWY9J+TIlSVNWYQXEE5+ulAFX7pQ1gbVo62Bdx7yds27Fv2/TI9l0MB8NjTMYvs7V1BR/76zvyDCzEBUoysIS4gE2nr2JMwnjvO2TZCKXaApkh+IUaVJtrYK0XeFdLSw7bL5q6npBlI6p6grFp21UmerxrMDbh0cd+nKLYIU2HaGOpupk0CV4JIYQQQlx6YggkSUFV7qGNJU2HFMUOjz724xib4HxDiB6t2o7YddWONetmilLd4+lK8GrJQTWwuuOSJCcE3zYaUrrN/tr7DsYkTKevnuPfXghxLkn0WYgL3As/8/UYYyDGgFIGaDsUtq2B58UpX38W1pw2tkvzzonBo01C8A0oxclXv8Yv/Nz/EefqbtDgQCkJYgkhhBBCXGKU1hAjWluapsTalMff/29y9Nh1/fs+NP3+PN8i+Lb0RCSu1bR6bdlXXR2sGDAmARQxepTSKKV5+pPXyvOvEBcwycAS4gL39CevVd677iZNV6Ry2AW0FusG7Ne5mv/X3vQ1CoXubuztP9UOPhbqYgXv2qyuGEGptqtM8GhtOXb8Bh548IfJsiHO1cQY29pZej+I1g4m9l8LIYQQQogLk9LtY2RcmPCcjz2Dd23zH1eTZUMeePCHOXb8hi5w5QldQIkY24nPLnjVj0t1NxbtxqW6G6sqpTeMY5fHufPgVZoOqespQFfQ3UnwSoiLgASwhLgIDIfHqapJ3yZ4PH5pYQnhBmcMIB2+f7/Ie0pVjYnBc+11b+eGGx/pBw9amz4YNh/caGOA5cGOEEIIIYS4sMyz7LUx/VivDT6ZbgzYjgdvuPERrr3u7cTgqaox1qbApg6Dq86w/5CxbJLkfZOhJC2oqgnD4fHX8usJId6iJIAlxEXgY399R2XZiNn0FCF4RqPLCMH3+5c6ES7UudpUD2sxDXu1Jtbia0U7w6W1RSmNsQn33vdhrrjyjnaGzTti9zPEGAghdLNn7flamzfwLyCEEEIIIc4HrU0XsGrHkiGErnkQxODx3qG15Yor7+De+z6MsUlfVD3GsLke64aaV+qA8efysay9XhwLz6anyLKRFG4X4iIhASwhLhJPfeJqFYMnSQqcK2nq2dL+jUUwObgV8fJ5B+yPEWtTfHCE4Ikx8K53/yR5sY0xlhA8WhuMsbT1tcJ+9pUsIxRCCCGEuGDFGPsJU2MTtLGEEDDGkhfbvOvdP9lNYnp8cG321UoW/kEBqY37N2ZlqbXzmnqGc2XXVMjz1CeulkGnEBcJCWAJcRF54bm3Ke9rvHdk+dZCDaxF+zUC5jWuFgcEanH/Yu2shf3z8yKRxOa4piTGiLEZzje8570/xXB4nBADKIXWdmm2DtivdyCEEEIIIS4Y3rulsaHWbXYVtFn3w+Fx3vPen8L5BmOzth5WU5LYvG0etGn8uaGW1er4tD9vaZzK0mcopcjyLbx3eF/zwnNvk+CVEBcRCWAJcZGJMZJlI5yr1vatdmlZ2neGGa4+4LWw3+iE6ewUw+FxEptRlrsMiiOk6ZD7H/xTFPk2wTuaLsDVfRDaWKmDJYQQQghxQYptnauFQu6uKQnekRfb3P/gnyJNhwyKI5TlLonNGA6PM52dwui26dDSCoCDMq/m+w/IvGp3r+9zriLLRjLWFOIiJAEsIS4yzzxxnarrSd86GA6qEXDmGlcbA14rNbDa+lcpdTPrByfaWK686k5uue1xBoNjhLCfbRVD6Iu7CyGEEEKIC8u8WPvickDvGwaDY9xy63u58qo70cb2k5x1M8PYFKX0wTWwFsasr6dG1uKY1ZiEup7wzBPXyWBTiIuMBLCEuAg9//Qti3f8Q489UyDp0P1KYU3CeO8lBsURptOTWJtiTUpdT7nn3j/GZZffSpIW3cBFtbWygpdZMSGEEEKIC1CMkRg8IXiUUhibkiQ5l11+C3ff84PU9RRrUqxNmU5PMiiOMN57CWuSQ2ugfldj0vaI/tXyWFgIcbGQ/7GFuIh9+nPfjCE4nKsxpu0AY4xlNjtNmg7wfR2q2AaUuqBSpAsuLWy3AaduO67vJ8a181AK7xp+5Zf/Nt958feJMaK1RindF/2cf9Ziva4Y41K9LCGEEEIIcX70HQZXxmWwH0TSxnZBrIBSisuvuJ1HH/uJrnFPZ6Vz4Gpm1eqqgLX9a8sMuxIWxlLXU4pip+16HQPeN1iborWVou1CXMQkA0uIi1hdT9Hatl1fOtPpSfJ8uw8gLXkNM1ub9y7vj8EToufRx36Cre0r0FoTY6RxVVs7YakQ5+YBkhBCCCGEOH8OGpfN/2lt+vqmWmu2ti7nkcd+nBDaYNLSZ50xX+IM+zeMB0Pw5Pk20+nJ/r158Kqup2f+BYUQFywJYAlxEfvUM7equp6SpkPaTKyK4fAE3teEpQ4yGzoNwgH1sBaCSyszawsH9F/zfBtrU97x8L+KtRlJUgD0AbTVANba9xBCCCGEEOfN4hhsU6a8944YAkmSY8x8jJeSF9uLH7L0+uDsq811rzZ3KGxfh67D4HB4AucqQnCk6ZC6nvKpZ26VAaQQFzEJYAlxkfvUM7eqyfhljEkoih1ms1Nobdvim2wogLkhbXtp/2rhzEMGKNZm1NUE52q2t6/k4Ud/jKaZUeTtAGdxZm/+mfNtqZElhBBCCHH+LY7FVoNZ85ISRbFNXU955LEfY2v7SpyrqaspNsnPOMF50ATqwUsHWTpPaYPWltnsFEWxgzEJk/HLErwS4hIgASwhLgEvPPc2FWOgqsZdd0KWlhUuBqa6N9ovB7YwXg9iLc2Uda/rekaSFt3M2IDLr7iNe+79Y1TVmCQpiDFsDGIJIYQQQog316bgVYyBJCkoqzH33PdhLr/8NtJ0QAiOJMmp61l77uq4cEPwauP+AzoULv4s8zGsMQlVNSbGwAvPvU0GkEJcAiSAJcQl4tknb1TzDKdwYBdAtZZZtToAWR14rC09XDhPa413FYPBUapqAjFyy22Pc8ut76Usd1Fq+RJ00HJCIYQQQghxfmxaNjinlKYsd7n11vdyy62PE4nU1YTB4Cje122zngMmQDeNITdNgC4Hu9bjUotjWaUUzz55owSvhLhESABLiEuItTlKKdJ0QFXtba5rtfj6gBTwjUGsDSng1maE0HaG0UrRuIo0HXDnXR/kiivvwNgUbcxyFtaGwZIQQgghhDh/Fsd283GaNgZjU6686i7uuvtDpOkA52qU1njfEELAmHT+AYsfdugE6NnUyFp8XVV7pOkApRTW5m/sLy6EeEuTAJYQl5AnP36lCt5R1xOKYufQY88URDpjkEkpvG9IkhwfGrS2JDbDuQpjUh557Mewpu0Y05KlhEIIIYQQb7b1Iu7t+ExrizUpjz724xiT4n1NYjO0Nv0SwhDcGbtaf7djzKLYoa4nBO948uNXyoBRiEuIBLCEuMR86tnbVF3P+tk0pfRS4Ehr0w1EfJvarXU3c6b3/83/61O7VT9Tt/Sf0sQY0MoQmRcEDWhjSJKc9zz+V7AmxbmSNB0AELxHaSNLCIUQQggh3gQ+OLRJ2m5/wZEkBd7XGG1593v/MjbJugz60J+jVbu9NE7sMvhXx4uL48T5P7oxp1KKEHw/Hp1bHLPGGKnrGZ969jYJXglxiZEAlhCXoM88f6eKMaC1QSmNtWlXj6odHFTlmCwbsTHNu31j4eXB+zZtL9Y6GG1dxn0PfIQ836asxt1ntYErYyxCCCGEEOL8siZB0dZN1UpT11PyfJv7HvgIo63L++OWG/xw5jHghnIT6/sUWTaiKsdLY9P5WFXrNlD2mefvlOCVEJcgCWAJcYmKMeC9wxhLXU26WbR21itJBzhXdUceEIBaS+8+vHbVWitlQCvN9Te8k9ve9gFiCGiTkCQF08mrqIVZNyGEEEIIcX5obZlMXiFJC4xJiDFw29s+wA03PIxZHZ+tdape3b2hEPuGRkHdDgCcq0jSASF4QBFjoK4mGGPx3i1lfgkhLi0SwBLiEvXskzcqYxKcqxhuXUaaDokxYG0GgHf1wtH7SwS7reWvqxlZC8sJuzcXPmo/ddwHTwye2257Pzfe9AhaGZyrSNMhwTfn7pcXQgghhBAbed+0BdqbCqUNN970KLfe9j5CcPjgl5YH9lYb/6w05VEHjCGXlxh2378bg1qbEWMgTYcMty7r6qgm0nVQiEuYBLCEuIQ988R1ChRVuct0+irGWEJwWJtibLqxffLhQawNAa1NrZS7/cbYtjaWUjz0zn+F4eg4MQbyfEtqYAkhhBBCvAliDGT5FiF6hsPjPPSOP9O/32dgbehUvZhRtbgk8LDg1aL5uNPYFGtTQmhXCkynr1KVu4Dqxq5CiEuVBLCEuMQ9++QNyrma7e2rAJhOXm07yCyYB6f6wcji17XU8YUg1ob9i4MWrQyuqSiKHYJ3PPrYj7O9fSVVNT4Xv6oQQgghhDiDth7qHtvbV/Dou36cEAJFvk3TlG336E0Bq42ZV5v3d9+k+7IyxuyE4JhOXgVge/sqnKt59skbJHglxCVOAlhCCF549na1u/stkmRAmo3Q2mJMsvHYtSDW/P3XUQOrbmbkxTbT6UnSbMhgcJSHH/1RkqTolzIKIYQQQojzx9qMJCl4+JG/wHBwjDQbMp2dIu+CWEvOogbWQcXeDxo3GpOgtSXNRiTJgN3db/HCs7dL8EoIIQEsIUQry0Y0zZQkyfG+WSjivuiAscOGgu6H7Z8PZLJsSF2337NpSkJwbO9cybvf+69R1ZPX94sIIYQQQojXra6nvPu9f5mdnasIMeBdRZLk1PWULB8BZ9GB8Iz7DziOtoi79003Ppx2nbGFEEICWEKIztOfvFbFGAnBkaYDQBF8Ww8L5rNkkRgCxNjVKdDtP+Yp4xqt9PK+bpuF9+avXVOSJDlK6b6jjFKaYnCU97z3L+NcjbEpIXiUbi9XMQaMSQ7N9hJCCCGEEAdTuh17aW3Q2tA0s/69d7/3X6MYHEGbBAU436CUJstHNPV0aSy3/3p97KcX96OWx4WxG1MS+zGdtSnBO0CRpgNCcMQYefqT18qgTwgBSABLCLHguaduUsYk+K4DYJoNqcoxdT0lTYc4V6GNJUkLVmfMDksfh81p4kppgneE4NDaoLRBKU2ejTh69Dre/tCfxjUlxiZoZfDBobvC721rZSGEEEII8VqE4NHaoo2l7gJSRXGEGAL33Pdhjh69jjwbtcGmLsAVgiN41wakVpxpUnF9jKhI0gJtbN99uq6nVOWYNBsCbSdEYxKee+omCV4JIXpyQRBCrHn2hS/FNB1SVWPyfBvva7xv0Nrifd0X90yz4X63wBjbjoIL3QMjcaGbYPd6sbugUgTfEGNAdV1tYheY0trig+N3Pv93+f1/8Q8xJukGOBO8d6RpIUEsIYQQQojXSGuDc+14ziYZrmnLRtx2+/u4464PkiZF39BncXymlEabZG0st9qJeilgNd9eqHtVVxOyfKvLqp93G0wwJqUsd8myEXU94fmnb5FnVSHEEsnAEkKsUUrTNDOszXCuZDJ5BaVUv7zQu5rh6ER37H5R902F2tfaKB+QiaWVQaEIIeCD7wdOd9/zg1x9zX0AOFd2hT3NIbUUhBBCCCHEgZRqg0d2v2HPZZffyh13fn8fvGrHYgFF2zV6U+bVpuDV2v6V4BXAcHQC7+p+maBSisnkFZwrsTZrlzNu+n5CiEuePAEKITb67N94MTbNjCQZEEJb+8D7hrLcI8+3umWGbV0soM+uiizMyi1st5lYixlZ+9lWwFJAKsbQ/Yv9d/jHP/e3eOnlL2G0Jc+3mUxfxWh7zn5/IYQQQoiLkfcNg8FRqmpMjJHjx2/kXe/5S2ht2zpU0e/Xt5pbGL/Ns7KAPoA1D06tTmbu10ndn9CEiDFJP6Y0JunqcSVdQ6GCJz52hTynCiHWSGhbCLHREx+7QhmTMJudIsZIVY77JYXLS/cWZtU2tEpWS7Nyaml2bl5boV9KGHxf5HN+ju6CVA8/9qNsb1+BNpa9ve+Q2Ozc/fJCCCGEEBepJMnb7HqtKQZHeOejf540HZCkBU3XhXrepCcGT/BNO8bTy5lYG4NXCzYHr1ohePJ8m6oaU5VtIG02O4UxiQSvhBAHkouDEOJQn/rsVyPQB5KMTamrcdsh0CQH1rjqM7EWtudZWO3bsR8ExW7JYCT2g5/QdRt0TdV1xWkHNj//j/5j6mrSvhfC+fgTCCGEEEJcNOadnROb8573/VVGwxNt5lVw3fLCiJ6P0bqxmdZ2vx5WDGslIvrg1Wowa8MyQ+8brE1JsxHe1QB96Yhnnrhenk+FEAeSDCwhxKGeeeJ65b3ra2CN976DUpokKYDN9Q6AtYHMwgH9eSG4frBkbIYxaXu8Um3wytUkaYFSCmsSBoOjPPj2HyFNB7huwCOEEEIIIc5e8A5rMh586E+zs3MVNslomhJt2q7PxiQL47EUY7M2W74bt23KqGo3Dx8Dzs9LkgKlNOO97/Sf572T4JUQ4ozkIiGEOCvPffor0doUgKap0F1W1KLVDKulbKy1elisHbuatTVfWqhNQvAN3jusTfn613+LX/+n/yVKaZyrsTYlxjYbK4QA7Gd3CSGEEEJcakLwbWZUNx7S2tC4qh0zhcA7H/ko1173YJtRrw1a27YboM32a5Su1LVaDVyt1r1az7rq9m4IZIUQSJK2HIRzNc89dZM8lwohzkie8IQQZ6UojjAZv9IPcKzN1rOvzmC1NsKZ9gffEKFv26yNRWvL8RM3c8+9H8b7trh86DrlxBhJkhznKpIkf62/ohBCCCHEBc/aDO/rPls+xkAIHq0M3jXcc9+HOX78JrS2aG3QJkEpTaQdey16rWO3M1FKYW1GCA6tLZPxKxTFkdf0GUKIS5dEuoUQZ+0zP/ut2AaHCmbTU9hu5myps+BiFtZCjarNWVgr561kYbV1s0Jffyt0Aat55tXnf+vv8NU/+rU2MyvJ8K5ug13a9MEtIYQQQohLSezqiIbg29c2xTUVxlhuuPFh7r3/IyQ2Wx5nxUiIvn99cPZV9+5B2Vfs19hab97TvnZNRTE4QtPMsDbjyY9fJc+kQoizIk93Qoiz9uTHr+o6E54mSQesppDvW6h9sJo2vtKVcDWOvph+bkyKVqbvUKi1JcaA8w3GJtz/4A9z9Oj15PkWTVMCbYp82yVRxkJCCCGEuBSpNuPKtBOATVOSF9scPXYD9z3wJ7Emwc3HVsr0zXS0apcSrtWyWvjcw7oOLo/7Nte/AkWSDpjNTmNMIsErIcRrIgEsIcRr8tQnrlGDwdG+W8xhA5SFN/sZunbP+oBIqfX98wLv0HXB6Wo0AF1AS/Oe9/1VlDbk2RYheOp6SpoNX/PyRiGEEEKIi4FSiiwbUVcTQgzk2RZaGd7z+F9Ba02IAWLsOwtGYpdlpfvx3UFdBPvvsbifxcAV/bEHTXCG4BgMjvLUJ66RwZoQ4jWRAJYQ4jX75E9fppZrYG1OEVdrKecsBanOtH++ZNCYtN3uBlVat8sI2zbPig9877+D1gabZGhtcU3ZF3UXQgghhLiUxBhomhlaW6xN0drw/u/9t9FKdWMnjTamq43lULRZ70rrdux1SBdBtVKsfdP++evF9xeDWtZmfPKnL5PglRDiNZMAlhDidWprVW0KXK2+7t44cMDTvbl/Tvd1nm01T0mPwROi72tbheAxNmMwOMojj/0oWTpiMDxGXc+++19PCCGEEOICFGOkrmcMBkfJ0hGPPPajDAZHMSbtyiy0E4Xz4u7z+qIASpv2Q5YCURvGbSs1sJZ3nWlsuNzFWgghzpYEsIQQr8t62vfmoBRsSiGf7z18vzZtx8P57KDSBqOTtl4DkcRmeFdRVxMuv+IOHnjwh5lMXiFNC6zNXvfvJoQQQghxoUqSnDQtmExe4f4H/ySXX/E26mqC8zXWpgBdB0KLVhpUm+UevMOYZONnHlj3amX/YePBOVk6KIR4vSSAJYR43Z554no17/oXgsPanBgDMYZuNk91M3rtV9Ut/VOo/Zm++X9qvzDovB5W7OozaGX62cEYw1IWVqQdqNXVhKuvvY+HH/4oztWE6NtZRd0uNWw/yxBjlPpYQgghhLigqX6cZPpu0O2Ypx0nOVfz8CN/nmuuvZ+6mpIkeXtMlzEVYpeJpc3+WGz+WWphPMb+ssH9icf9sdx8bNeP9bqx33w8aG3eFojX7VjumSeul0GYEOJ1kwCWEOK78vQnr1UAxqRMpydJkoI0HR5eg2pxqeABBT4PCzItFXmHrk5Wm6119TX3ce/9fxzvGpIkp6lnGJugtaZpyn7m0fvm9fy6QgghhBBvqvkYxtqUpinRWqONpalLbJLjXcO99/9xrr7mPkJwGGMXyi+sFGnf4MBsqsVx2yHjtBgDaTokSQqm05MY04695mNGIYR4vSSAJYT4rj39yWuVUoo836Kup9T15Mz1D1brJSwVglcHH7tYBF4btNL44DA2JXhPkuTcetv7uPmWd1NVE9JsiHc12iSEroYWcGCKvBBCCCHEW9l8DDPPNtcmwbuaLBtSlWNuvuXd3Hrb+0iSnOA9xqb44NBK9xlXwObx1Yax2Fqw68BC7fuv63pCXU/J8y2UUhK8EkK8ISSAJYR4Qzz9yWtVO+M22C++vuCgFsx98c95evohQay1AVSM2CQneNcWdDeWup5ibcZdd/8A11x7X5fCHvGuZjQ6wXRyEmtzWUYohBBCiAtS28kvZzo5yWh0Au/qrlxC4Jpr7+Ouu38AazPqetplqHuCd9gkh7hcQH2xCPuBwavFcdpa5taGjtK0NbbSdECMQYJXQog3jASwhBBvGK0NzlULHW02DWqW61ytBqbU4n72ay8s7p+f531b3N3aFNdlWaXpAOcq0mzIOx/+KDs7V6O1QRvLdHaKnZ2rmE5fPS9/DyGEEEKIN1qMken0Vba3r2Q6O4U2Fq0N2ztX886HP0qaDduxUDpAmwTn2uLtinbstHH8tTLuWs28WgpkLY3TWPqMeQ2sEDzOVeh5V0MhhHgDSABLCPGGeeoT1yhrM2IMGwcsZ8yuOmSGrw94sV+3IUly6nqCsRnWJHhXARBDgBhJ0wHvee9PMRwdJ3hHDKFNZy922gGcEEIIIcQFxgdHXuxQ11NiCATvGI6O857Hf4o0HUCM7VgI8K7CmgRjM+p6slzMHfqA1KJNGfKHZWmtagvLB6zNpOOgEOINJQEsIcQb6qlPXK3StCCEwKbBzWtZIrixiOhCEMvYlNClzCttCCHgXA1KYWxG4yqsTXn/B/4aSZIzGBxBa0NdTciy4Rv9qwshhBBCnHNZ2ta6MsYyGBwhSXLe/4G/hu2yrYzNQKm2K3MIXXfBQIgR02ViASv1SDcHpM42eLW4L4RAmhY89YmrJXglhHhDSQBLCPGGe+oT16j9LoSHjV0OmL1TmwZL6+q6DUSF4KjrKUlakOWjvuOg1qYPZr3vA38NrS1VNaYodqiqyXfxGwohhBBCvDnqetqNZcZobXnfB/5aW99KqYUxkCbLRyRpQV1PCcGRZUPq+uDxz1LznNVA1kGdCZePAtouhJJ5JYQ4FySAJYQ4J5598gbV1sHSXe2FDJgXHk0Jwa3XuVpZPthvqeWaDPOBlTEpwTu0MiRJTuzqLSilMdqgu047VbnLkaPX8MhjP8podBmTyaskaYFzNUprjElwrsLYlCQpqOsJ2qwXohdCCCGEONe0sd1yvwJj03aMYhKUbsdUSVpQlrsMh8d57D0/yfb2FdTdxJw2CUabbvxVEUPboVkrQ/AOY9KNtazUAWMwFo6ZHxeCa2tqdUEta7N2TNWN+5598gYJXgkhzgkJYAkhzqFICI483wagaUrSbMTp09/q31uzUudq/+31YqEbT19Mi4+Rpik5cvQ66mrKzpFreecjH2UwOMJseorB8CjBe8pyj6LYIfiGstxlNLoM75rX/VsLIYQQQrxe3jWMRpdRlrsE31AUO5TlHsF7BsOjlLPTpNmQR9/1EwyHxwnRs7V1Od47QnAHjqU221wDq32x+fw83+b06W+RZiOapuzfC8EBceM5QgjxRpAAlhDinHnmieuVMQkQqespWTainO1y9Oh1VOUesJySvnEpIasDsMUZw5VjVs7XJkEpjfc1xliUUlxx5Z3c98APUQyOMJudxiYZxiQ0TUmMEaU07fJHGYAJIYQQ4s3Q1fdUmthNxhmTYJOM2ew0RXGE++//CFdceUdbE1S3meTz10sWa4wulGdYnRg8KGi1eNx87FWVexw9eh3lbJcsG1HXUyBiTMIzT1wv2VdCiHNGAlhCiHPq6U9eq5yr2+V8SpEkGTH6pQHSQTWw1joTHlIAfun0edp7jCRpwWx2GmNTvKupqjG33PIe7rr7QxhtcU3bZnpes2s+ODQ2PSd/DyGEEEKIwxib9pNs0NaUStMBrqkw2nLnXR/k1tvfz2TyCihFjKELcrXlDzZ1cz6sEPvGjoMH1sCi+56eJMlQSqG1wbmapz95rQSvhBDnlFxkhBDnxc/8+y/FEBzlbBeb5OwXed8XY6SddYzzN9ov7G/PX8+P3X+9sL/bdr7pa2P54LA26wu+Z9mI3/3n/xO/93v/K87V5F0a/PxzjW3rawkhhBBCnE/aWLyrmWedJ0lOWY2xNuWOO76PO+/6IHUzw5iELB0y65YUzsc7Rnd1PBcDUmzOel/avyFTa2OGPLQ1tpqSvNhGa8snf/oyea4UQpxzkoElhDgvPvnTl6nZ7DTF4AjG2D4ja5PVYu2LAyrF8qBq//XSB4BSWJMQfIM2lhgCqiv87n2DUppbb3sft9/+PWhlmM12u5MjSVL0NR2EEEIIIc6npilJkoL5RN1stotWhttv/x5uve19KG1ousm4xpUYmxCDB+g7MB/WRfDA4NVacfd184wrY2xfjkGCV0KI80UuNkKI8+r5z/xhdK5uM6O6LKw+g4rlzKqlfSvZVQChz+KK68cBWlu8rwnBo7XBuwalNdZmlOUuWTqkcRVf+O3/gT/8yq+0NbC0RqH6ehNCCCGEEOeTn2eQE/sJuBtvepR77vvjJDajrqd9xlXTZUFV1YQ0KVBaE7pg1nr2Vftaq4UchgOztLpP2FDyQSlN05RYm/LskzfK86QQ4ryRC44Q4rz77N94MTbNrN8+LIDVv7e4nLB7vRjAWjxuHsAKwZEkBWGhK888aKa7+lc2yZhNT/GF3/n7fPWPfg3VDeq0sbKEUAghhBDn3eIYJMbA9Te8k3vu/WMUgyPt2KWr0+l8Q5oW1PWMLBsSY8C7GqUNsB/AWq171QewVrPc17KuNgewAJKk4ImPXSHPkkKI80qWEAohzrsY5xlT7bjH2hRjkq7eQ8SYdGH/wnJCDkpxXz5u/p/RCcE7IrEPTCnVZljF4MnyEZPxywxHx7n/wT/J5VfcjtaGEHybraVUm71lLDFGfHDorpuh0nL5FEIIIcRrNx+/GJMQgm87DnaZU0q33ZDn711+xe08+PYfYWv7CiaTV0izQb/fGIv3DdYkeN8QQ0Bru1/EfcM46cASDQvHxdiOxSDiXd12QOyb26iFcZwQQpxf8gQmhDjvnvz4lcqYpKuFZZnNThOCIy920Noymby8MFBasKHbYPv25k47a6evJJ1OJ6+ys3M1dT2DGHnksR9nMDxGkhZoY3C+IS+2aeoZxiak6YCq3AOlJDtLCCGEEK+L921WeFWNSdMBxiQ0dbsUMHgHMZKmA7a2ruDRd/1FfGiYzU6zs3M1Zbm39Flr3Qb7HZtrYB3UnXCRtSmTyctobcmLHUJwzGan0dpijMWYhCc/fqVkXwkhzjsJYAkh3hRPf/Ja1TQlTT1jODxBCIEQHDEGjhy5lrqebiw42m1tfL103Kasrf6w9nWaDtrip9qQ5VsQIx/4nn+HLB0BkNiMqtzrAldjvKsZDo9TlXuYTQE2IYQQQogzsEk7vhgMjuJ93davytpJMmMSYowkyYD3f8+/DTGSZ1sYbWiaGWk6aD9kZVyz1EFwQ90rOHj8tNoYp66nHDlyLTG2Y7MQAsPhCZp6RtOUPP3JayV4JYR4U8jFRwjxpvrcf/hqnI5f6QZuY0L0XeedfYt1sdbqYbVvtoVO+3T2hWMX9q++1toSgyfEtgjqcHCM6fQkjSv5hZ/7W+ztvoi1KTEGtLEQIyEErG07GQohhBBCvB7GJDhXo7uSBCF4lNI4V7OzcyXvefyvYEzCYHicstwlTYo2MLUwjtnYRZDljoPz7bVj2x0HThYCNM0MrQxZPqKupgxGx/nEv3tMnh+FEG8aycASQrypPvHvHlPaWEIIpNmQ0egy0nTYd9CB9RnEjQMw1MqAbTkba9OsYwgO52qU0mTZiMn0VQbDY1iT8sijP8r29pXt7GMMpMmAGCPOVQBS+0EIIYQQ3xXnSmKMpNmI0NW12t6+kocf+zGMTRkMjzOdvEKWDkEpXFO1TWnYkE21lnV15uAVi5+wsB2CJ027MVk2JIR2Ik+CV0KIN5tchIQQbwnPf+YPo+sKhVbVmK2tK6jrSb9/MbtqKXi00p0wLmVfHZC1tfA6BI8xCUppfBecArBJzte/+pt8/vP/PePxSxDbQvBJklPXU4xJztFfQgghhBAXM6UUztUkaUHTlO17KIajE9x//0e4+tr78L5BK00kopUhRE/wHptk/Tjm4C6C+6/7Yu4bAlerSwfn0nTI3t6LZNmoLRJvU5598kZ5bhRCvOnkQiSEeMv4G3/zdJzNTqJU2/45Rr8UrFoLSu3v2LhEcFMQa/E4bWzX+bDtThhjwHtHnm8xmbxCnm/zta/9Bp//zb/DdHqyq0sRSNMhZbkrQSwhhBBCvGY+OPJsi6oao7XBB8dwcIz7HvgI1173ILPpKba2LqeqJ2ht2hIGMaCUIkmKduyyGqA6JHi1+hrYePz8/cVxWFEc5WN/fUeeGYUQbwmyhFAI8ZbRDpAUEPsU+YMs1Wk4YIngGT6gXabYfU4kglIkSc6s3CVNB4TguOrqe7jr7g9RDI4QgscmuQSvhBBCCPG6WZNQlrvYJMMHR1HscNfdP8BVV99DCI5icIRZudsHr5TSGJOglcE15YHdlhcdtMQQNnRvXtGOwSKgJHglhHhLkQCWEOItJcaA1qYPEHnfoLUhSXKCbwCF1pbg3RkHYIt1IJTaT6FfHdQppeffHB8ajLHEGPolhjfd/Bh33PF9mC5jqyh28MGhje0zwZqmRCmFsSnOVVibnYO/jhBCCCHe6qzNcK7C2BSlVL9MEEAbS9NUFMUOwTusTbnjju/jhpseIYaAUprg98cisFz+QOk2O6ofz/TZVyv1Pw+glCJ4h9YWUATfkCR5mwnWNagxJkFr039/IYR4q5AAlhDiLeW5p25S82BQkhTk+TaT8ct470izITF4vKsxNgU2zCKuFCk90/7VWczF911TkedbNK7i+hvewb33f4QYA+PxywyKI9TVtA9aZfkI7x3e1aTZkLLcewP/KkIIIYS4UJTlHmk2xLu6L00wH7fU1ZTB4Ajj8cvEGLnv/o9w3Q0P4ZqKLB/hmmp9rDJ3pjHMWe43NsW7mhh8+3N6x2T8Mnm+TZIUfdDtuadukuwrIcRbigSwhBBvOc8/fYsCGO+9hDaW7Z2r+o6BSVq0BU21Yanw6IYCpctBrOWuhIv7+3NX3tcm6bKpUrJ8ixtufJi33fl9pOmAstwlSTK0sdRVW2ze2KTvUqi7GVIhhBBCXFrmYwDnaoxNiETqaoI2FmtTqmpMmg64487v4/ob3kmebWFtimvKpQyr9sXhXQRXxzgbx0IrNbK0NkQiSVrgXE0Iju2dq9DGMt57CdgfiwkhxFuJBLCEEG9JT33iGjUcHaeuJlTVBO8bsmzUdwDcT8c/d0GsNC1o6hlKaep6itaGO+78fm5/2/cA4L3DaNtnaymlUdrgXU2S5Of2DySEEEKIt6QkyfGuLYGglO6zqrQybf1NFLff8b3ccdf3o7WhbrqxRjMjSfJzGryCtuyBMQl1Pe07DVbVhLqaMBwd56lPXCPBKyHEW5JcnIQQb2mf+dlvRecq0nTIbHoKm+RYm1LX0/6YTd0GgbPrTLiyf/G1UpoQHMF70mxAXc/a1tdNye/97v/KH/z+z6GUIk0HNE2JD47EZt3gVAghhBCXMq0Njasw2pIkOVWXsX372z7A2+78PqzNiDGSpgV1NUUbg1ZmfxxyQBfBs+o42B54YLfBNB3gXI1rSorBEep6grUZT378Knk+FEK8ZUkGlhDiLe3Jj1+ltLbMZqdBKWIM7O5+e2mJ3n7x0v1MrKWC7QuZWauFTjdlbs3/875BKU2S5F1h1faYedr/rbc9jveOshpjTEIMbbFTvVB4VQghhBCXlhA82lgAYggYm1JVE2IM3Hrb4205gqQgxohSihhCm3mlNM43S+MXWM6k2lSwfXGs0593SPBKa8Pu7rfbsYpSzGan0dpK8EoI8ZYnFykhxAVhnollbQ5EnKvXgkQHZWLBfgefTZlYi8cvZWLFgA+eLBv2g7s8GzGbnSbLR0ynJ/ntz/9dvvG132wHoVrvB7G0kUwsIYQQ4hI0Hw/EGNHGtOMRpbj22ge574GPUBRHKMtdimKHqhwTY6AYHKGqxmil2+7IBy4D7N7dELza331w8KrdrbE2BRTOlZJ5JYS4YEgGlhDigjAfWNX1pKt/FQ9oFb2SibW2dzUTa/N+lMLYDGsSytkuaTpoX5d7pOmAqpqQZSPuu/9PcOVVd+F9g9EJQJ+5JYQQQohL035TF4tzNVdeeRf3PfARsmzUF3EvZ7sYm+y/NgnGZgd3IZy/e9j+DTWvlncrINI0JXXdLmmU4JUQ4kIhT1hCiAuIIk2HBO/6+lV5sUNdTYgxkiQ5oQseed90p5xpTHbw/hAcKNUWZO+ys4yxhOCwJsG7trD8Ox/5C1x73QM0TYlSCmOS/vv74FBaY23WfaaXDoVCCCHEBU5pTQieGCPWZv02gGsqsmyEUooQHNdcez8PPPjD5Pk2ztVYkxCD77KgIMbQvw7BHfZdz/BDtfvnE2nBN20ZhNh2QcyLne77RYJ3pOnwzJ8phBBvIRLAEkJcMJ598gbVNDOyvG03HWNkvPcd8mIbrdtOgUk6wLmK0dblS+cu1pLY5KCMrQ0H9i+1bi+h3lU8+q6f4MSJm3HdYHH+mUZbYghMp68CUBQ7+IUAnBBCCCEuLPMAUF5so5RiOn2VGELbdVB3tTNju4RwZ+caHnvXT/Tjk/nYATjrccfmjPOF/StBqNHW5ThXkaSDrouyJi+2Ge99pwu4pWT5Fk0z49knb5AIlhDigiEXLCHEBef5z/xRnM9WhuAJwZMkBc6VbVZUPmJ399vk+Tawub4VsFYPa7Er4eL+je/Ftg5XUezQuJKmnpGmA/7h//Y3OX36m+0Mq033i78rRfCeGAPGJmhl9rPEhBBCCHHBMCYhBIf3DqXUSmMZ3Y9NTpy4mcc/8G/gmopicIQQPHU9xZpkY8fA/jNW3puXPVhbOnhAnayy3GV7+0qqcoyxCdbmNM0MrQ1aG5yrUUpL8EoIccGRDCwhxAXn2SdvUElS0DQVWhtiDDTNjLqeYmyK946iOMJqPaylAd+GzoT9DOdqF8P5e4uUIk0HjMcvtcVQk4yqGvOB7/m3GQ1PtME170m72U+ALBsC83oY1Tn8CwkhhBDiXHGuQpuESCTLRqBUnwXeLisMHD12PY9/4N/AuzYzuyrHfe2rTWMKYK2LYLtrc8fBg4u8K4riCN47jE2p6ylNMyPGNkOsaSqSpJDglRDigiQBLCHEBenJj1+pkiRD6wSlNDEGdnauQWtDVY0XjlwY+K0GpdgfLC4OENe69SwEsRbPD9Fjk4IQHFoZjM1oXMXjH/g3OX78Jqpqrw10ZUNcU+F9g9amD7QJIYQQ4sIzDwxpZXC+xjUVaTdJVVV7HD9+E+/7wL9F05RYm6K0IQTX1ursalwtBatYL8i+Px7pxiYHjF9YOG5xcU1VjdHasLNzDTEGlNJonZAkGU9+/EoJXgkhLkgSwBJCXLCe+sQ1qqrGfYH03d1v4VxFUbRLB9XKjKTaMGO5NOu50JmwP/awdP0YsaYNoDnfoLUmS4dYm3HfAz/Eddc/xOlT30RrS5aNKMtdgG5ZoVx+hRBCiAuRUpoYPEopytkuWTZCa8vpU9/kuusf4qGH/xwhuLZou29wrmYwPEbssrM2jinm2xvGLgdlkC8Hr5bHPUWxjXMVu7vfAsDaNlP8qU9cI8ErIcQFS56ghBAXtOefvlk1TUmeb2Nt1i3Zm63Uo1DLr1ezsVb3r8xiHjQ7amxKCA7XVF0HRI8PDcYkbG9fwYMP/QiXX34bTT0jxLZOV5oOSNOCcnb6nPw9hBBCCHFulbPT3f28/Reip6lnXH75bTz49h9he+uKtk6Wb4jBk6YFrinbZX1mOQN7c6mCldIG3f7VJYZr45tOm+3d1ua0NiPPt2makuefvlmCV0KIC5pcxIQQF4XnP/OHcX5Ja1Pl1VqnvzMWa+8Kve+fd4ZjYwCl0NrSNCXGWGLw3QDV4r2jcSW/8kt/mxe//XsMhsdo6v0iqvN220IIIYS4cMzv4T440nTAdPIqV1x5B4++6ydIkgKFQmtNCIEkyfG+BsAmeVs/S5mDM7xXM6o2LTM8oD7W3HwMtJ/tHXn2yRvluU8IccGTDCwhxEXh2SdvVGphQKe1xfs2G2r+3nxAF2NoA1KrqfjsLyXcHxTq9aWH7QeitEGhiMFjjO0/09i2u1CSFmhteOTRH+Wyy25lMn6ZLBuilOrqYmQ41w5qkyTHB9d2BtJyaRZCCCHeTEprnKvxXe0qoOswnNE0JUop8mzEZPwyl112K488+qNobUiSHG3aAJU2be0rpQ1aW4J3aG03jymU6gJO++OQ1fFJX9qgG8u0Qar9AJYxSVdv07I4JpLglRDiYiFPSUKIi8YzT1yvoM208r4hz7epqwl1NcHanLqaoJQmy4ZoY5fOXV1KuGoxiLWyY/1zOnU1YTg8jrEp73jkoxw/fiOzWVsHK8+3Kcs9imIHpTXT6SmsTcnzLWIIr/tvIIQQQojvXgyBPN/C2pTp9BRKa4pih7LcI8/bWpuz2S7Hj9/IOx75KMamDIfHqatJ/xmrpQcOGkesZlCt7V/5HG1sNyGml8Y4dTUhz7fxvukzyOdjIyGEuBhIAEsIcZGJZPlWO6irpxSDoxSDI9T1hLzYJsaA900XzFLrgamFGhOLmVib9i/aFABLkpyqG0yOhid49+M/RZ5vEYLHuZI0G1BVY4L3pNmgraHla7SxbZaYEEIIIc67GAPaWLyvl+7RVTUmzQY4VxKCJ8+3ePfjP8VoeII836aqJn22Vm9DAGpTDc7VzKu1/Wp/f11NuiBVIC+2qesJxeAIxeAodT1tJ+vyLWC5lIIQQlzoJIAlhLioPPvkjWo6fgWIaG1omhmTySsYkxBjIMtGuKaiGBxhtePgQV1+1mpMbDp+bmHgmaQD6npCDB6bZKTpkO/9/p8GIASPNSnOVSilSGxOjKFdUhhlwCmEEEK8qWLEuZoYA4nNUUrhXIU1aV/D8nu//6dJ0yE2yYjBU9cTknRwYAAKNnRBXhljbOqSvNqZsBgcwTUVWTYixoAxCZPJKzTNvIlNZDp+RZYOCiEuOnJRE0JclD77N16MdT1tuwMFj9YG52qqao80HeJ9s1DcFPqC7YvF2hcCSfvF3bv9q8e2by699sGT2IwQfds6G3Cuoir3+Me/8H9iMn6ZNBsSg8f5BmtTFArvHVrrtSL0QgghhDj3lFKEENrmLLSBLGsSlDZteYDRCd77+F8hy7ewNmt7BmqDVobGVRht1gNW89ftN1gKSK3Wu1qdJFvNBp8Hrep6Qpa1yxznY5352OeJj10hz3lCiIuOXNiEEBetz/zst2JZ7pEkBU09betiFdtr3f/Wug5uCEzNt9eCWN3+xYBX7Pe3xeJ1l/1Vd0sLtLZ885tf4Ld+87+lnJ3uisKmKK37+lebuigKIYQQ4txbvAfP783ze3Ve7PDAgz/M1VffQwiOpilJu3pUwTddwKmdIFsKQrGaddUdsSGj+6Dg1WqtLK0N5WwXYxKSdEDTzMjzLZ78+FXyjCeEuCjJEkIhxEXryY9fpZKkACJpNqQYHGnbWyu9FMRaHBD2NbEOqEGxP5A8cw0spTTGZkynJ1FKkxc7eO9oXMU119zH3ff8y4y2LkMphbUZwft+SaEEr4QQQog3x7y7n3MVwfs2y0opRluXcfc9/zLXXHMfjavw3pEXOyilmU5PYmy2kt3NxhpY83HEUkBqddyxUtx98XUIHqU0SVJQDI6QZkMgkiSFBK+EEBc1CWAJIS5qzzxxnQrBY0wCwHj8EkC/PbdWrH3VxgHo/r6lze64tsV1YFAcIQRHCA5rU9KkoKrG3HzLu7nl1vcyGB5jNjuNNqZf8nhoRyIhhBBCnDPtEkJPmg7QxjCbnWYwPMYtt76Xm295d1vMPSm6pXvt/X1QHOnv+3CWHQjZPAG2dsTK/k1jmhA8zzxxnQwehBAXNQlgCSEues89dZMCRVPPKIojQOxmLnOCdyilMCbBuRKtLcChXQD7QquLs6NqZdYUhVamX1aolO5f+9Bgk4xytsuttz7Ovff9cYbDY8QQaFyF1oYY2yL082CW1gbvm77GhRBCCCFeH6UUxqYA+ODQ2nT33tAuGezuwY2riCEwHB7j3vv+OLfe+jjlbBebZPjQtB8W437WVYxoZdbGA2wYNxw2UTUfg2htca7EmKQNqnlHkuTd94sUxRGaegaobqwjhBAXNwlgCSEuCU987HKljcWYhKqaoJSiKscUw6N475jNTpOmw3b5XvBYm67XolhwWE2K7s0zvpekBd7XXHnVXbzj4Y+itCZNB/3ywbqekWVDYoxtUdZs2J3ToI397v4gQgghxCVqfl81JiFJcqpq0nYqzrfabsDdMWk6QGnNOx7+KFdedRfe1yRpsfxhZzkGWK17tbZ/oe6VtSmxm8BK0yGz2Wm8dxTDo1TluB3DVBOMSdDG8sTHLpfglRDikiAXOyHEJeW5T38lZtmIstxtOxM2FaYrylrOTlNVYwaDo+2M5nyAudKZMK4WcV/pTNgXf587oLMhQOMqRqMTTCav8srLX+ZXfvk/w+iEstwlTQfUzQyAxGYAfe0uqZMlhBBCfPfmwSTn24yqxGY0TUmeb+NDw6OP/TjHT9zMcHiM8fjl/n688AFrRdj7XazWslqe+Or3r54fI0laMJ2eJMtG/RjFuxqbZITgyfNtqmosmVdCiEuKXPCEEJecT332q7Fdnhe6pYNVPxOrtcHalKqa9Ev11joTrnUbXOlMuNrFsN2x1tXQB48xlrqakBc71PWUV1/5Q37xH/9fiDFik4y6mmBtijYJdT1FK42xKa6pZCmhEEII8TrEGEiSAucqfHCkSdF1FKxI0wLflRd493v/MseO30iaDihnp0mzId47zPz+uxKImlvvIti9u6nL4IZjQ/Bk2RDnakLweN+QpgOszdosbK27mlfXy7OcEOKSIhc9IcQl6VOf/Wqc15SyNu0GhQ7nqn5g67vZWIibA1ML22tBrJX98+3VoJZNcsrZLiF6RqPLmExe4aUXf5/f+s3/lr297zAancD5mrqakKQFRrcBNyGEEEK8Pm2NKdVmM/mGup6RF9tYkzIev8RodBkPPPjDXHbF7QyHxxmPX0IrQ15s45pyPVi1ITDVflkOXq3tXwtetdvGJDTNDKU01mYYY3GuwrkarQ3GJBK8EkJckuTCJ4S4ZH3mZ78dldLU9YQkKWiaWd/Jx7kKY5KlZYKvOYi1sMRvU+aW1pay3KUojlDXU2LwDIbHGO99h1de/gq//fm/y2x2krqekaYFxqQ0TUmIbWck39XpEEIIIcTZ09rQNG3jFmtTvG9wriJJC/J8h/vv/wjHT9zEaOtyppNXUbrtEjybnSLPtwnBAQdkUs23X2fwSimF9w3WZn0Dl/kYJU2HxBh48uNXyjOcEOKSJEXchRCXrCc/fqWadfUlJuOX+45/zlUkSQ5sKLp60Cwr6wNQFo5fO5b2+2TpkNnsFGlaYJOM6eRVkiTnuhse4u57/2VGW5d3M7A5IbaBNa30oV0ShRBCCHEwpTTGJHjfEGPAdnWthsPj3HXXB7nuhodIkpzp5FVskpGmBbPZKbJ0iHNVfx/vPmzxg7/r4BVAkuTt91GKEDyT8ctk2YjZ9KQEr4QQlzQJYAkhLmmD4TGapiRJC9J0QAgere1SgfS1bkEHBLEWDlj7Pps6GVqbgVJk2Yi6mgJgbEIIgaocc8OND3P77R9ga/sKJpNXIEbyYhtoW2kLIYQQ4rWblwgoim0AptOT7By5mjvv+iA33/oeqnLc1sm0CQB1NSXLRl2HwGzt8zbd49fGAmcYOyyONWKMaG0Joc24TtKCpikZDI+9nl9XCCEuGhLAEkJc0j7505epNk3fUpV7KKVJ04IYQ1co1aC1IfgGUF0qf95nQK0uH1ALs6n96/mMLMtZWTH4ti5WDBhj+8/UWqO1pq6m3HTLu7jvvj/O9vaVRCKuKdFaE2PsCtDXfebYPOimtcEHCXAJIYS4NPnglhqxzDOZnKv7UgHzZYQheEZbl3HvfX+Cm256jNnsdHsfNl2h9hj7e3SMoV8+uOnevmkMsKlGVltrM+8CaYqwMN6YZ4WlaYFSmqrc65Y6Znzypy+T7CshxCVNAlhCiEveEx+7XEFkMDoOQDnbJcbIYHAU52qapkQpTZJkJEnObHqKJB2sz6Yu2LQkYOWAte3Vz4lE6mrKFVfdxTsf+VfbQbRNgXZ5wWx2mqLYxiYZzjcYm6CUoumWJgohhBCXoiwd0nRL8IxNcL7BJhlFsc1sdposG/WdBrU2PPrYj3HZZbcym53GmGTjPRr2SwCsZ15vKDmwun9hwitJB+1YIslJkgylNE1T4lzNYHCUGCPlbBegG5vEbqwihBCXNrkQCiFE59kXvhStzfraGNPJq/0SvxgDZbmLMWmbkRX8/omLxdkXOg0uFoDvt1c7EXbnbyryrpSmqWcMh8eZTk/yyit/yK/+yn+O0Zbp9CRpNsQ18wF62s4Me9/P+i4ugxRCCCEuFfN7YIwRbQxKabyriTFik4ymKcnSISF63vXun+TYsRvJ8hHTyatk+dZykfZNk1WL763UvJp//6X9G5YNzscS3tfk+XabbVWNIUYGw2N9JpZzFc8/fYs8swkhBJKBJYQQveefvkWF0M7IjscvkRc7pOmAup52dSiGeF933QnD8hJBlgeqq8sJYb+w++J/3Y61QfL8vzQdsLf3Imk64LLLb+Xd7/lLfYdEo233c7SXcu+aNphlEpqmPO9/PyGEEOKtoGlKjGmzkr1r612prgGK0RZoJ4ve+/hf5eixGzC2nbTKix1i8GuZVksBqIX7+MaC7av7Vwq2t8G10BWRr0nTISF46npKmg7Iix3G45e6ZY9OgldCCLFAAlhCCLHg2SdvVDEG8nyb6fRkO1trM6pyjzQbkqYDnKu7Ael+nYvVINZqIOug7oRrg9yFfY2rMDbtg2hZNmJr+0oefddPsLNzNbu7L1IUOxibUpVjtDZ9V6V5F0UhhBDiUjOvL2VMgtaGqhxjbEpR7LC7+yI7O1fx6GM/ztb2FeT5Fk09I00HWJO2E0AbAlUbtzd0G1w9vt29OBaYdyKuSdMBaTakKvewNiPGyHR6kjzfJsbAs0/eKMErIYRYIBdFIYTY4NOf+0ZM0xF7ey8yHJ1olxPGiE1yQnB95tPiMsH5EsFuq3t7f7s9dnV5IQcuQQSo6ynD4XHqatzXxphOT3Ly5Nf4jX/2X1OWp6mrKdamWJv1Sw7mRWqFEEKIS828GPq8JIBzVRswygbk+Q7veOefZWv7SgaDY13wKMUmOZPxyxTFkb6pCrA+QdW/vR68Wju+216dyJqPIbS2uC5gNhgeYzJ+ma2tK6jrMU994hp5ThNCiBVyYRRCiAM8/5k/jACuqciLHep62g5qYyRJi74N9+sNYs2t1cZaOF6hKMtd8mIHYuyK0mqsTfnm13+b3/3d/5mXX/oyWT4CwLu6XyYxX1oohBBCXEr2J5lC3/ykKsecuOxm7rzzg1xz3QPtPT14smyE0prx3ksUxQ5a73cFPhfBK6Bd6l/Puv2aNB1Qzk5jkwxAMq+EEOIAcnEUQohDfPpz34ghhIWAUMS5um/PPTcPTPXBrA1BrLi4fyGItXjOQcXc2++pIUZCCCitSZKcr331N/i93/1fePmlL2NthrEJoeusJEXchRBCXIrm90BtLN41OFdx4rKbuePO7+e6699OXU1RWveF1IN3ZPmIGAI+NOiuThawHpzaULD9wHpZ/fHrnQlD8FibAosZWVoyr4QQ4hAyPS+EEId46hPXKGvbGdGmnvYzpQDBO7S2aG27jkUK72uszQjxTMv3DhmfrgxyY/CYhYCZ1u2lu2lKrr32Ae6598McO3Y9EKmrabtcossOc67u6moEmqak7bKo+uwxIYQQ4kLjg+sncpyriDG2da+6RixNU7bbribGwJGj13DPvR/muuvfTtOUaK1RtPdXpRTWpnhXE6JvJ6tWJ4AOCF4dJETfLeuvgbYYez9e8G2HwzQddN2GpwBYm0nwSgghzkACWEIIcQZPfOxyBTAYHSfGSFXuEWOgGBzB+5qmmaFQJElGkhSUs9N9kGux7bZam4FdHRAv7trcdnvxzKZplx9cfvlt3Hv/R7BJTlHs4FzVf39rU8pyD60Ng8ERnKsIwUuRdyGEEBesxGYE72iakqLYQSnFbLbbdeeNDIbHmM1OY0xCXmzz9of+DMeP39QGqboAErB8fz3odf/WevBqafkg+/f8+ZLAJClIkgyFomlmeF9TDNoaW+1YIjIYHQf2xxpCCCEOJhdKIYQ4S8++8KU4z2AyJmU6PQlAlo2IMVCWuxiTtksSvGsHwAcUaF9e3rfw3gG1sObbi0sMbZIznZ4ky0aE4JmMX+Yf/W//Ub/csGlK8nwb72uUNnhX41zdB7mEEEKIC5WxKeVsF2tTjE2JwaNN0r+njcWalHe/96fY2rqcvNimLPcwxi59zlK9qk21rFa6DfbnrR6zeG63fDEEj/c1eb6NUpqqGgMwGBzF+5oYI85VPP/0LfJMJoQQZ0EysIQQ4iw9//QtKgSHUprx+CXyfJs0HVDXU0LwpOkQ72uMSfaDTouttBdabCu1/28pE+tMbbgX3ve+ab9/NWlnmfNt3vc9f43B4ChVNemDV2W519b3yEZYm1LVkzfnDyiEEEK8QZp6hrUZWb5F8I6qGhOCYzA4gvcNWTri3e/9KUZbl5HlIyaTV9DaoFW7JP9M99pNwavFe/fSMQufA+3EkzEJ3tek6ZAQPHU9JU0H5Pk24/FLKKUJwUnwSgghXgO5YAohxGv06c99M7YZV3tk2RBQlLPTbO1cSV2NiTG2hdS7WlUHFWmfW+1OuLEQ/IbMrMZV5N3Ava6nbb0P79jbe5Ff+6f/BadOfr3PDquqMVm+hVKacrZLXmzjXX1O/05CCCHEuWBtxmx2mqLYYfF+rLShKvc4evQ6Hnrnv8LW9pUkSU5TzzDGYkxK05T7WVgHdhnU3dcDug3uH7hcwH0ewAoBbSxKKdJsxN7pb7fdhIndBFN7P37qE1fLs5gQQrwGkoElhBCv0VOfuFoppdjZuZqmKUmzITbJmU1PoeYzu1rTzhEszN6uztIuDJw3tdleW8KwsrQhy0b9MkabZNAVok2SnEcf+wmOHLmGqpr0M9TTyauE4CR4JYQQ4oLmugkc72vG45fJsiHGpFTlHjtHruahd/458mKHIt/um5YYm1HXU4xNlrKuVjsIqtV78WrwauEevh686u77eh4AM8ymp7BJTpoNaZqSnZ2rUUpJ8EoIIV4HuXAKIcTr9NynvxKhHUgXxRHqekqMAYA0LXCuXqh1FfsaV93W/gctvPdaMrGcqxkURxiPX8LYrO2i5BuCd6TZkJMnv8av/tLf5tVXv8r29pU4X+NdjdKapi679t1CCCHEhcW5iiTJCcFjbIq1GXu73+bI0et57F0/wYnLbmE8fgmtLYPiCI0rmU5PMhpdRvBNn2EFLE8WdduHBq/296wcvx/Isjalrmfddtu9eDY7xbyr8XNP3STPYEII8TrIxVMIIb4LL/zM12OMgRhDl30V8SuD43lQajUgBesF2hcDXvvnsrb8MBJRKJyrSbMBwTucb9BKtW25uxbik8kr/No//S/55jd+m9HoMmIMOFdjbUoI/hz+ZYQQQohzQ2vT38uU0uztfYdrrr2fdz78rzIcHqduZmTpkBAc3jts1yW4rsagVF8Ha1Pwqv2yHJBazdLqrRy/2FU4xoAxCaCI0aOURinN05+8Vp6/hBDidZILqBBCfJd+5t9/Kdb1FNeUJOkArTVuwxK9xewqaGtkHBzAggODWBtet0ev19dS2rC3+yK/+c/+G1566YtobbDzZRTGok2Cayq8b0jSHIDgHcYkEuASQgjxptDa4H2D7mpVNXWJMQk2yQi+wXVNTLyriTFw4sQtPPjQj7C1fQUh+OUHnEO6C669PqDb4NoyQ71YhWU5cDXXThQFmnraLiFMB3zypy+TZy8hhPguSA0sIYT4Ls0HpIPRcQDKcq9fSrhOrWwtL0dYHgSvDqgXd63PAK++VtrgXUOWb/HYe36SI0euwQfXdUq01PUM17TLMNJsgHcNxIhZWPoghBBCnG91PcPYFGLEu4Y0G5AkOa6p2n3aEnyDD46dI9fwrvf8JbJ8C+dq9IblgYe+7t86JHjV71k9b3M8al5YHvbHBhK8EkKI755cSIUQ4g3y7AtfisakaK3ROqFppisZVXBoTayFrKoDM7HOkHm1WFsreE+S5ChtmE5fxdqcX/i5/4RXXvkKWhm0MQTvAIU2pv3slZ9XCCGEeDOprmB68B6IaGMJ3hOi5/jxm3jfB/5NmmbGYHCMGDx1M9vvMshKraoDMrEOCl4tHXNIzavVnzdJBoTQEELA+5rnn75FnrmEEOINIBdTIYR4Az336a/EJMmZTk+SpgNgNRi1v72UpbWhxtXy8ctBrP6Y1eMXto1OqOoJWlvMQr2Qn/+5/4RTp75ODL7L0mqXO9okx7sa52qyfCSdCoUQQrwpjE2pyjHWphib4pqyf39+7zpy5Fre9/5/A+cbrEnwwROCI0uH+NBsDlZ124cVbGd/a/n4xX1q3mVwPXgFUNdTBoOjNE0pBduFEOINJBdUIYR4g336c9+IIYQuQLUpo2pDUKp9sbGO1UHdCTcGwLrXPaVompI0HRCDp3EVaVLwS//k/8q3vvXPUUpjTEKMAe9du1xCqbaGiJJV5kIIIc6/GANaG2KXGWyMRSmN9w0xBq666m7e9Z6/RN3MsDZFa0tdT0mSfO0eCJxFAGql2+DC+QfVyDooeNXu02iteeoT18izlhBCvIHk6UQIId5gT33iGqX7Aq8HLzFo9y0MghcHykotDbw3LVdQqLUZ4sXzI5EYfD8L3LiKLB3SuIoHHvoRbrzpEaCt2aW1JQRHjJEkKaSAuxBCiDdNCJ4kKYgxEoJDa9vXlLrxpkd48KE/3WYLp0NcU9HUMwbFEWLw7WSOUuv3RZbvmwcGrxbuwevBq/Vug6ufBUjwSgghzhG5sAohxDny/Gf+aGEa+LBMrHb/2vLA/YP69w5dTrhwLLQzzHU9xSYZWhnKcpckyQkxkiQ54/FL/N7//r/w9a//FsE3/c+ijSXGQAwHFaIXQgghzh2lNUrprk5jGyDSJuHaax/gjru+n62ty6nrGVop6mZGke8Qosc1FWk2JC5OwmxaQnhY8Gp/z8rxh01IweJj1bNP3iDPWEIIcQ5IBpYQQpwjG7sHnumYA7KrVg7aePzqsc7X/dJB72vyYocQQjvgr6cMB8e474Ef4oYbH8a5GqV124GwmqKVeU2/qxBCCPFG0cpQV1OMTVFa41zNDTc+zH0P/BDDwbHuPqUIIVDkOzhfE4InTQd4V+1/0CH3yLV5/LO4/76u+7oQQog3jFxhhRDiHPrUZ78aQeF907YAXxxYLzi0JtbC6wO7Ex5w/MI36M7Y3x9CQGtN4yq+/KVf5Hf/+f/Ud3Kq6wnWZjRNibVptxwxoJTC+Qaj9zs8CSGEEK/F4r1kscZV05TYJMO7mjQdMp2exNqMO+/+IDff8u62Ocr8nndIcGp12eCmGlaLP8vZHH9QYGp+rzQmASLPPHG9PF8JIcQ5IhlYQghxDj3zxPUqxkCSZITgiTGQ5VsH1JhaX56wWFBWrQ2gNy9n6N48PItLqfYhwTvSpODmW97NnXd9kMHgKJPJK2htmM1OUwyO4FxNDG1B3RA8eXbQzy+EEEKc2eK9xBhLCB7nKorBEcrZLkppJpNXGAyOctc9H+KWW9/bdhd0DdokG+9psJA9teG+eGjwqt+jDj1+8efP8i1iDF29rowYgwSvhBDiHJMAlhBCnGPPPnmD8t7hmpKiOMJscvKMNTSU2jwbvHzs+vFrHZRgKYi1uL+qxgxHx/HBo5Xhjru+n7fd8S+1SzC8oyh2KGdt3aymKYkxkKZDJpOX21lwIYQQ4nWwSc5k8jJZNiLG0GYw2ZRytksxOIIPjiQpeNsd38udd34/RrfdcgfDY5Tlbv85a5lTK+b7DwpeLWwcWCNr7dhuezY5SVEcwTUl3jupeyWEEOeBXGiFEOI8+dRnvxqbpiRNBxiT0DQzYLmw+/LrhSLq8yWBG4q8n21h97VC70rhXN22Kg+h/37f+Mbn+Z3P/w/U9RSlVDu7nBbE4Nui8DZDKbVWkF4IIYR4LZyrSbMBirY2Y7sMD5Kk4N77PszV196PQqGNRSmF9w6jDUp1c/AHLCM8rGA7+1v7x6xNFOmF1+tBryQp8L6hrqckSS6ZV0IIcZ5IBpYQQpwnzzxxvUqSHK0NVTVm45LBbrC9+K/bsbEV+P6ywpXMrdX24Ru2E5vjfRvASrMBITiStOC66x/i7nt/sO1YGDxKKYy2eO9Q2nQDd3c+/3RCCCEuIj440nTQLk33Dq3bGlht5lXOPfd9mOtueAdpUuB9TZLkaGUIviFJB2d9n9vUbXB1ef1qzauN92CWM6WraozWRoJXQghxnskFVwghzrPnP/NHMcawNMO7VpB96XXcXKi92+6O2FwIfvWchfdD9Bid4H1NhLbIfFPSuIo0KfijP/o1/vnv/AOms1N9oCxJim6W3EoGlhBCiNctBE+WDanrKaHLAB4UR7j73h/kxhsfoeqaiViT0rgKrRTGZgTfLN8/z7jcfj94tXj86jlrk0EbPmdufg+XZYNCCHF+yUVXCCHeBJ/67NfierDpLIJYG5YQfjdBrLqZYW2K1pamnqG0wdqU+VLHP/zKr/CF3/571M0UrdrMsTQb4l29EoATQgghzk6MEWMTqnJMnm8RoidNBtxz34e58cZHqJtZ17m3JgbfZQQ7nG8O7kT4eoJX3XtnG7xa3H7mievkOUoIIc4zufAKIcSb5FOf/WofSTpzEGs5C6vftxCUiovHrH7OptpZwbdBKKUgRkL0hBD6JYPONxhj+dpXf4Pf/vx/z2x6iiwb0TQzCV4JIYR43ZTWeNeQpAVVOWY4PMZ9D3yEa697EO/ae0/bYEShtOmDTe19LqC13f+s1fpXG4JOBxZ7X8m+OrvgFbJsUAgh3iTyBCKEEG+S/QGw6lqJJ8QY15bmtXU4dPdPobRG6TNdvlcG3KstxWMEpfqHgRhDWyhX665we1sot6rG3HjTIzzy6I8yGB6jaWYYm6K07ovqzn/e+c8UY1zr2CSEEOLS0d4b2mWBq/cGbSwxBIxNcE3JYHiURx77Ua6/4Z3U1aRboh7Qen+CJcbQT8AopZcmcro3++/bvXHozxdjwCZtHUildH8P1trgfdP/vDFGjEkIwfefKcErIYR480gASwgh3kTPPHG9ijGQJBkheGIMZPlWN1jeZKWV92JL8JXZ44Paf3dvrhWyXd3vfMNoeIKy3OPIkWt593v+NbJ8C+8agvfU1QStLWlaAHSFeI3UxxJCiEtcCAFjEpTWhK7pR5oWaG2pyjExRoL32CTnfR/4t9jevoq6npIXO/jgN96TYL+Bydp+NgevlpYPsn/PTNKCcnaaJClIkgyFomlmOFczGBxt63PlW8QY2k68SUaMQYJXQgjxJpOLsBBCvAU8/5k/it7VDIbHmE5ebTOctFkLBB1aE2uhztXyeQvvHVALa3Up4uL300oTiRidsLv3Iv/w//cforslhJPJqyRJQZaPqMpx3y1q/WcQQghxqZgHk5qmwtqUNBtSlWOaZsZweIzQZf1+/4eewJoMa9M289ek1M0MY9olgmdc+sd6t8HVn6E/ZmXCRmtDCB7va/J8G6V02yE4xj5LbH5PNjaVgu1CCPEWIBdiIYR4i/jUZ78a58XTjUlomhmwHgiab8+XZ3QbfRALWAtCrQaxlo45YFspjXM1oWt37lzdzqYHzy/83H/CKy9/meHoBFW5R1WNGQyOAlBVk262WgJYQghxKVJK4VxNmg0hRmaztoZimo2YjF/h+Ikb+Z7v/es41056NK7CGItrKtJsSJxnIa8GrzZsrxZsZ39r/5iVrK0YA2k6oCx3SdMhAN43JEmO1u3yeO8b6npKkuSSeSWEEG8RcjEWQoi3kE999qvRmIS6nnZFajdlVG0ISrUvloJY/bEHdSc8QyBrXuTd2JTx3ktk+RZJUrQBq3rMP/u1/4q9vRepyj3mtxNtDEq1xXmlDpYQQly6tLFtg5Dg+/tOnm+xtX0Fjzz2Y3hXs7V9BXU9RQE+eIw2aG33610dErhqvxzQbXButYB79zWG0NdxTLMRe6e/TV7sAJGqGmNtRpoO8L6R4JUQQryFSA0sIYR4C3nmieuVc/VCl7/Ndaz2W34vzDgvDtSVWhrwb2wRrjYvq5jXGLFdC/O6nnH02PVUVbv8wxjL9vaVPPrYj3Hs6PWE2BbjVUrhmmq/+K4QQohLktKaGANNUwJgbUqMgaNHr+ORx36MPNtiMDxGWe7hmhKbFCTdPWfedXBj8EqtB6PWglcL98D14FV339QGAK0ts+kpbJKTZkOaesbOztV9BrIEr4QQ4q1FLspCCPEW9KnPfi0uLRE8NBOr3b9xeWB7UP/exkys7phNtbF8cF1XwkCejZhMXiHPt6nqCUWxQznb5Xd++3/gy1/6RbKsXYYxnZ7sloAs/vxCCCEuFUprqnLMcHgMaJeW33zLu7j3vj9BXmyzt/cdtrYup6mnAHjv2uV7xlJXU6xNuw9aCV7NP/+w4NX+nv691Ukca7N+mT4o0rRgNjuNtRnQBraeeeI6eU4SQoi3GLkwCyHEW9SnPvvVuBiggs2F0edBqdWlge1Zy8sLD/y8TbWzuhokkYhWpi2wazOapkRrjWsqkiSnbmZ88fd/nt/73f8V79sOTnX3UCKEEOLSlCQF0+lJrE15253fx223vY80HVA3M7J0SFVPSGyGNglKaZp6RiSSpoOlGo+HLRucb5+x2LtazlhuJ2Z82ylRaUJwKKVRSvP0J6+V5yMhhHiLkjUeQgjxFvXME9ereaFZ52pijP0AGyB4h9YWYxJCV6/K+xqb5ITYBp9Wi9iqDTPR8/1LYtxfgqHapSDzz9daQ4zYJKOupxTFEe68+4Pccdf3k2ZDynKv70Q4L/qutO6/t5LlhUIIcUFbnUxRSvUZuzFGkiSnqsZk+Yg77vogd939AxTd5EaS5ITQZlyhFDF4gm8wNum7Ea7Wcjxw2eABwasQPTbJ8b7uAlRtsEprS/Cu+xkLQFFXEwCszSR4JYQQb3FykRZCiAvApz/3jaiUoWlmfXH3JCkoy902QIQizdpAV11NyIttnKuXM6sWlwmyuTvhQUsP59uL+0MI5PkW08mrxBhI0oIvf+mX+MLv/D2qctz+DE3ZFn6vJ9j5w0Nw0qFQCCEuYPNJDW3agJD3DVk2omlmWJtRlntk+Yh77v0wN9/yLpp6hlK6r3u1WCdxY/bU6lLAM3UbXFlGaG1KOdslzYZYm1JX0zabWBvyfJvZ9BQ+OLJsSJIU1PWUZ5+8QZ6LhBDiLU4u1EIIcYF4+rl/EbN8hPeOGAPeNwBk2YgYA2W5izEpWhuCd/sPAAcEsTYuJzygFtbGIFa339gM7ypc14L8W9/4Av/s1/8rZrPTGGOxSY5CMZudwtqcLBsynZ7ar3EihBDiguJczWBwpGvuUTIYHCUScU1JCJ483+ahd/xZrrrmHpqmxJqkv1cAG2tbbVz6tyF41e5e2b8a+IqxDa4Fj/c1eb6NUpqqGgNQFDt43xBjxPua55++RZ6JhBDiAiAXayGEuIA886kvxra1d4217TKMpikxJgGgrifk+TZ1PUV3XZbWiruvZFZtysRa3H/QNkrhXQNKLc2mV+WYvb0X+fVf+3/jXcXu7ouMti4DwDUVIXoSmxG6GltCCCEuLFobGldhtMXYFIViPH6Jra0rsDbjoXf+Wba2riDLR/05IQSIEWOTpfsIbKhztVaAvXt30/4Nx4bgSdMBZblLmrYNRnw3yaK1ZTo9yWBwFOcqybwSQogLiBQiEUKIC8innrlVed+glGY6PUmMAWszqnKPNBvSBreabkC/ULR2Qxvy/r/Vmlgr+w/ani8bDMHhXE2aDokxEmPgiivv5LF3/QRNUzLauoy6mhB8g1KKPBu1yxuFEEJckJyrybOtrhi6o6onjEaX0TQzHnv3X+SKK+8kxkCMkTQd4lzd1r1Ki7ZA+1neZzZ1G1w9vt29eC9r3/e+IU0HpNmQqtzD2owYA9PpSYpiG4gSvBJCiAuMXLSFEOIC9MLPfD1m2RZ7ey8yHJ1gOnkVaIvQtjWmQld8fX+Z4Jmyq9YyseYOWFYYou+Kued4V3cFe7ewNmvrYhExJuV/+R8/Q1nu4X3dB9i0NlIHSwghLlBt4CpgjKWup1ibkeVbfPAHnsT7doJiMDyGcxVVuUeWjTA2xTVlm7WrzOKHtV8WlhPOvwfzPRuWCW4OXtEVku9qdGmL65YtDobHmIxfZmvrCqpqTwq2CyHEBUgu3EIIcYF67tNfiQDOVRTFEep62rceT9Oiz3I6Z0EspfoaItYkRCJNU6KUZr7MMYSAdxU/94/+D9TVFO9r6npKmg5kCaEQQlygtDb9tdyYlCwb8r7v+WsYk2K0QZukvyclXR1E12XhGnPAEsI3KHgFtIXb61n3XntPauswZgA899RN8gwkhBAXILl4CyHEBeyFn/l6bJdpBJQyQGS+xHDRPDDVB6UO6DC4sbD7puNpu1BpZQjRE4NHadO1K3d47/rzjE2oqwm/8sv/OS995w/6Gl2LXaSEEEJcOGIMpOmQ2ew0l19xO48+9mOk2bCviwhgjEVr2y4l7O4R83vG4j1qLTi1oWD7YZ0K5wGs1XtKjKGrD6mI3fdUSkvmlRBCXMCkBpYQQlzAnv7ktcraHICmngKKJGm35xlO8+UUWhtcU7bd/w4ohKtW64govV5Dq6NQfcaX0qYNgnXf0xjbdp0yFu8a8nybdz7yUa6/4R3dLHjbgTDGtq35/MFj3llRabk9CSHEm2XeBKS/Jiu1tPTb2ozZ7BQ33PhO3vnIR8nzbbxrlq79QHtPiLG9R9AGlVbvI9036O4/msX6jYcFr2y3JLH9ucJSAXeguxeq7t4I1uYSvBJCiAucPCEIIcQF7omPXa4ABqPjAJTlHjEGsmzUtQh3hOBQypDlW1TVpJ2V3tS6vLM6k70YxFo79oClHZGI1hZjE3xwFMUOd939IW67/f3UzawNqhmD964r/h4pBkfa7lbd0g8hhBDnX13P0MZSDI7074XgMcYSY6RuZtx2+/u56+4PURQ7+OAwNmkzrrpM3QOX/a1S69lTmzJ0Fz/PmISqmpDlWyhl+szfGGN37wuU5R6wf2+c3yuFEEJcuORCLoQQF4lnX/hStDZDKY0xCePxS11tklFfSDfNhm2AqKtVBSwvD1ysdcV895mXH27aVkrjXI02pn/wSNMhJ099jS/+wS/w5S/+E4xN8a5uu0VlQ1xT4lxNlg2lRpYQQrxJtLFU5RhrM2ySUddTjLZYm+Fcxc23vodbb3uco0euo64nQHsPCN5jbdpn5x647O8slwHOs69Wj5/X1grBU3eBLGszqmqM9zWj0WVdjcaAcxXPP32LPPMIIcRFQDKwhBDiIvH807eoNtNKMx6/zHB4AmMSytlplNIUgyNU1RigX7a3tjxwoU35/IFh7cHikPbni/uBNvOrW4pYNzPKao/t7Su7TKwP9MsQk66TYV1PyfOt/YcfIYQQ510MnrzYpmmmBN+Q2KyfxLj9bd/DXXd/iO3tKymrPepm1i43RxFCV/9ww71l032jPXT5HrN0D1q5t8zvW/MljlU1phgcQSlNOTuNMQnD4QnG45f7mowSvBJCiIuHXNCFEOIi8+nPfTNCbGfPk7bjUl3P2Nq+gnJ2mhCWC+ieqTvh/L2NHQoP62gYPFrbvlthCB7TFXqPMdC4iq9/7Tf5nc//XULweN8w2rqc8d53uhn85UwwIYQQ54dSbdfArdHl7I2/g9EWbSz33vcnuO66B7E27a/lPni0Nn13wRBc29TjrLKuuj2LgaoDzlnsNgj0tR3zYoe93RdJ0wIA11Rk+QhQPPWJq+VZRwghLiKSgSWEEBeZ+YB9tHU53juKoq0rNdl7CWszjEnajlArDw8bHzIWZ8Q3tCrfOKveH69R2hB809UlGaK65YshBPJ8m+uvfwcPvfNfQSlFUexw6uRX259PgldCCPGmiTFiTcLJk1+lKHZQSvHQO/4s19/wDvJimxBCuxRdG7JsSIyR4Ju+G+1ag5CNWVewFrw64F60ev+JwWNMgrUZk72X0NpQFEfw3jHauhxAgldCCHERkgu7EEJcpJ594cvRGItrKtJs0Bbl7bpIGWP7GlP7waLlTCz2312qjbV4/NL2Sv0shcKHBu9d25XKptT1jBAceb5FXc9QXXbWeO8l/vHP/y28b9C6Ley+qYivEEKIcy/GiLHtZIc2CY+/719nNLqsLeJO2+GvLPfQ2pKmBd7VON92ITQ6WbsXbApcLW6vLRfsT948ebJ4nwjBk6YFdTXFJhneO55/+ma5gQghxEVILu5CCHER+9Rnvxrb9uIGrQ3OVXjfYG22VGfqoELtsLw8MC4es/CAsnEJIl0L9YXPUSgisXvw0NA9JHnv2Nt7kd/6jf8vL37799oZfu/e2D+GEEKIs2JMQlnucvkVb+PBt/8Io63LsSbB+QZol+8ZY/tr+mLgSXX1qWBTFtX+nvbt9ezd/UMOLvDeNgmp+iysEDwxtsvjn3nienm+EUKIi5QsIRRCiIvYM09cr5JkQIyBqtzDmKQvkh68Q2uL1pZ58XfvG5Ikb4NQq8XZ2V9KuDE7avUBJMY2SLXhc4yxaK3RxtB0mVjHj9/EA2//U9xw48PU1aQv0qt0+3Mp3d6y5g8tQgghXh9jEpyrgPVrrNaGstzj+hvewQMP/jDHjt+IUoq6nrbXba0xxvaftVSkvZuY6N+H/t6wSCmFni813BC8isS2uYdv+mLs/f3KO2IM5PkWxiRU5V7XDGQgwSshhLjISQBLCCEuck987HIFkcHoOADlbJcYI8XwKN7XuKZEKY21GUmSM5udJkmKpc9YfMhYfHetJtbi8auvVx5SvHddbawRMUbK2WmOHb2eu+7+EDff8m7qeoa1GXU1Jc+38a6d+R8Oj1PX0zfiTyOEEJekup4yHLb3BO8a8ny7XYJnM+p6xi23voc77/4QR49dTzk73V+riZHg28zaA4u0r7xuD1lcOri+VHC1BlaSFN29KMfarM24akq8rymGR7t7xi5Ad2+L3b1OCCHExUwu9EIIcYl49oUvxfmDgDEJ0+lJFIo0GwKR2WwXa1O0Nn19LNhfHrjaaTAsLEFcqod1SGfC1fONSQi+q5OVZFib0dRTZuUuX/7iL/LPv/AP2m5SMaK0wbumLeAbo9TIEkKI12l+DV2sdYVSVOWYu+/5QW6+5V3kxQ5pOsC5CtdUGJt0GVDNfifbgzoMblw6uH/N1gvnb8rUUkr19yLnaopiG1DU1YRIZDA4ivcNMQacq3j+6VvkhiCEEJcAycASQohLxPNP36LapYKK8fgl8nybNBvQNDNC8GTZEOfqrkthYCm7akOXKLXhwaTvZrih89Tq+W23wdAX/rU2o5ztUlUTdrav4rbb38d99/8Jgvcobairab9sRYJXQgjx+s2vocZY6mradYz13Hf/n+C229/H9s5V1NWE2ew0xqQYY3Gu7mpfpevdAg+67m+4R6zeJ7odS/tjCN0yx5osGxKCp2lmpNmAPN9mPH6pK+DuJHglhBCXELngCyHEJebTn/tGjDFSlnvtkhCgLHfZ3r6Sqhq39bGC359hB1Y7FM47E/avOaA74SHZWApF4yqSJEcpTdV1tEqSnMZVENsaKF/84i/wG//svyZNir4A/bx2ixBCiNdnfi01JqFuZrz9oT/Nrbc+TtOUQNtpsGlKQnBkXe3EpilJbLZcuP0ssq7UyjFrGVwrx8cY0NqglCbLRuzufps83wagqsbk+RZKKZ76xDXyLCOEEJcQuegLIcQl6NOf+0ZM0xF7ey8yHJ1gNj1J7AJGIThCCP0DxWJg6qCg1HoQi6Uuh5sCXyF6tLZd8fia4H3b1UppXFdMfjJ+mcHgKC+++C/4J7/wf+5/Jh8cRu8XERZCCHH2Fq+hMUbe8/hPccUVb2M6PclwdIKmnmFtSowB7x3aGIxpt+PiBMeBSwD1wuuVTK0D9i92GowxdgXjLU1TopSiGBxlMn6Zra0rqOuxBK+EEOISJBd+IYS4RD336a9EAO9q8mKHppn1QackKZaynNrA1HKQajVAdWgm1soxADF4bJLT1FNCCKTZANeUNE1Jlm9RVWMGg6Nd0fnAePwyv/rL/zm7u98iL3bwrn7D/yZCCHEpMDalnJ1me/sqHnnsxxiNTqCUJi+2mU5PkmUjynKXJClIkpy6mqKNIU0GNK5cDkAtBaYOybzaEODaFLyCNjusaWb9sUlSUM5OY2wKwHNP3STPMEIIcQmSi78QQlzCXviZr8cYQzfbbYgx4n2D1nopmwr2g1gbA1KrWVksB7g2ZW7NlyqaLgurcRVGG3TX3l11M/uNq9DKkKQFL33nD/j8b/13nHz1q2htztFfRQghLm4heI4eu577H/ghLrv8Npp6Roi+Xx4YQiCxGT40/etIe38w2p5h2SDrAa7umPm20otL1Ne72bb1rdo6WO1r39XH0jz9yWvl+UUIIS5RcgMQQohL3LMvfCkmSYH3NUoZtDaU5S7GJF0NlMV6U7Er8L5sUyDrsEys/pwDamT1nxsDIQS01oQQsDbl1Olv8vnf/Du8+spXUEoTgkdr0we6rE3bBzDvvvs/jhBCXICU1ihUX3jdJhkxhG6iInD8xM3cc++HOXHZzVTlGKUNWuu2I6xNl6/Fm4JVG4qvd2/02wfWyFr5ORcfR5Iko2lKvG/I821C8MToMSalaWZSsF0IIS5xchMQQggBwPOf+cPovUNrg7UZAFW5R4ie4fAEk8nLJEnRd4bqM6w2BKQAwuISw8OWEx4UxFqYdbc26zpladJ0wN7ui/zmb/w3fP1rv0WaFu0DUoxtd0OdMJudIkmKN/6PJIQQFwDnKoriCD40ECNKaSKRpp5x7XUP8MCDf4rB8BjBNzjfkKYDYvBtYw2b7V/fNwSv+u0DglcAerEJyMaAl8baFO8bmmbW32O0MmT5Vv87hNDWRnz2yRvlmUUIIYQEsIQQQuz73H/wSizLXWKMhOAoiiPE6GmaEq0NrqnQxlJXE2yS75/4WrsTducctgRRK9MWd+8yr5yrcb4iTQcoFGW5xxf/4Of53f/9fyZJi/4BqWlKimKHup6eiz+REEK85VmbMZudJlm4TjfNjDvv+iC33v5+imKHEDze1SjdZq6G4IkhkKQFIexnsL6W4NVqt8GDiry7piTNhgTvsElGCL7rSGuYzU51DT4Ueb7NJ/694/K8IoQQApAAlhBCiBWf+uzXolKqn4GfTU+Rdw87SZJTlXvkxXYfINq4NHDD9mIheGBpKeKmc0LwaKXxwaOVwpi2eK/3NU1TkqYDnKv54hd/gX/+O/8AYxO8azMJptOTpOngjf/jCCHEBaBpZgwGR6nrKcYkeN9w970/yC23Po61aT8JYbtsK+8boA1AzWsiHrYEcLWG1abA1cbt7muaDihnu2T5Vj9BUs5OUwyOdMe1dRifeeI6eVYRQgjRk5uCEEKINZ/67NdijIH92liaEBxVNSbLRjhXLxTpPfsaV4vZWEtF4jdkY7XLWgpibJe9aK0xJu0zAxpXYUxCjJEvf/Ef84Xf+ftk+RbjvZfI8pHUwBJCXLKMSaiqMaPRZZTlLvfc92FuufW9KMB7h7EJSun+2j4v1K60oa6nWJO0H3RgF0HFa8m6Ws3UirHNrJ3fU7S2xBj6WldKaQleCSGEWCM3BiGEEBt95me/FcvZLkla0DQlIXiKYhvn6r5wOixnVi0GpRa7EL7m4u60D0Pzz3C+6WtceV+TJDlaW4iRqp6QJDnf/tbv8su/+J+SpkOcrzYWmxdCiEuFtRlVPeFd7/5JrrjyTlwzI82G/bXV+abrCGhQSqGVbgNJC5myr6dYe/tyoQvhwjnz1/N7iLUps9kuWpu2aUg9Iy+2efLjV8kzihBCiDVycxBCCHGgT332qxFog0WAsSl1Nca5GjOfoeeAINaGJYWLD0Znc05dT7E2RXUPVlobmmaG1hbnaryrKAZHCb6hrPbY232RX/vV/4Lx+KW+EL0QQlxqQvAMRyd4+JGPsrV1BVm+hdGW6fQk1qb9Nb0NXrVZWM7VAG321RmyqNRisGqxJtZZnuN9g7UpaTbCd993nl37zBPXy/OJEEKIjeQGIYQQ4lDPfforMUkKnKuoyj2yfAutTV8zBdYLtcOGGldnU9x9cVkh4ENDmgxomlnb3j3J8L5BAcakON9mg5kuGwylOHXy6/zGr/9/2N399hv3RxBCiAvI9vaVvP0df4YjR6/tJg8geLff/S+0HWdjDMQYMdqium1YrneFUhszr5aOWwx4sV4ja/EcaJc4huD7e4q1GU0z47mnbpJnEyGEEAeSm4QQQogz+pn/4OVYzk6TpgOapuxqpyicq9HaoLXtAloR59olfiH49uRDirsfuJyQbgniAef2+xceiIiREGP3QBb41V/+z3j5pS/RNCVZNiLG0LaIT/K281ZXJHj+UBW7c7U2fdFjIYR4M2hjCd71S+3mxdXn16wQPDbJaJqyrV2lNFU1IUkyTlx2K4+96y+2H6QWl/qxnim16T2lDlwCuP9Zhxdrb7NlS6xNAdUFrNrfx9q0v94mSU5dT8mLHT75752Q5xIhhBCH0mc+RAghxKWufbBQKNUu4ZsXT0+SnCTJKWen24capcmyUd+hEDjwAad9uXlW/2zOXdw3X8Iyf7BSSvPQO/8c113/ENZmOFfRNCV5toV3DcamKK3RxnQBONO/jjH2S2mEEOLN4F3TdwPU2qDm1yndTh5Ym+JdTZ61Xfycq7A25brrH+Id7/xz7fVxfk1cCF7118u5w66xnOEafci5dT0ly0b9ZEc5O93fL2KMGJN0xdoNoCR4JYQQ4qzIzUIIIcRZe/aFL8c836KqxsC81XmgKvc4euwGJpOX+4eTeT2Ts6mJddASxE1ZW/sHLC83bN8KxO7zrE2p6ylf/IOf5w/+xT8iRE9VjhkOj3UBtpU6Lt0DHzESQlgPpgkhxHkSY2iDP1q318ql7NO2fmCaDphMXiXLR2hluO3293Pr7e8nTQp8d/1dy7racF3blE112BLAs6l5Nc/KVUoxHJ7g5Kt/RJZv9fcMgCwbUZZ7PP/0zXKxFUIIcVbkhiGEEOI1ef4zfxSV0njfoLUhBEcxOMru6W9hbUYxOMJschI1r0t1QI2rxS6FmwJZazW02gP2tzcFsBbed67uC8B/9av/jN/49f8KpTR1Pe2WOO4HqULwbReurqDxvC6MEEK8GZYD6r57rw0qtZlZmqYpSdMBMQbe/o4/y/XXP0SIocvGyvYH+UqtBZ0i8eBlgMxrWB1Q72rhZ+k/fyVTKwZPMTzKbHoK5yq2d65iNj2J1ratW2gSYgw8++QN8iwihBDirMlNQwghxGv2/Gf+MCbJAOfKhYLuCucqAJKkIAR3cI2rlY6Em7KxFgNcS8dv2t9/l5XAllJ47/C+Zm/3Rf7pr/4/qcq9btd+nZcQ/FI9LCGEeKuYX5t0NykwD7jHGMnzbd75yEfZ2r4CY1KMsf019LAAFgv7+vfUeoBqU9bV6vamZYZaW5pmBtB1hI194XZrc5pmyrNP3igXXCGEEK+J3DiEEEK8Ls++8OWYJDmz2WmKYrtfMhKCJwS3NEO/lFl1yJLCxe15gOpsliBu2qe0gRjbQsJJBjFy6tQ3+fVf+y+ZjF/eLzKPQmu9/L2EEOJNNg9czZfzxRD666LWhuHoBO98+KPs7FwFSuGatkkFShHn17eVgutnKr7eB6zmAayzOn69PlbbEMP2TTFCcMxmuxTFDk1TyrJBIYQQr4vcPIQQQnxXPv25b0SApikByLItZrNTGJMsHTev27K0fcYOheuZW/P982UwfSBrw2fVzYzh8DjBO8pyF2MzXDPjl37xP2UyfoW6nuJ90y411Lp7QIxoY5aWMAohxPnUdhoMfeZVCB7naoxJSNMBw9Fx3vXun8QmBd5V5Pk22limk1dJ0mL/c+YNLjY10TggeDWvD3hY8Go5W3V1G7xvKIojVFWb8ZokOQBPfeIaefYQQgjxuslNRAghxHftmU99MaZp0bZyL8ek2WCtk99hywnbd5eX/4V+ieDmGlpK6/69tnj7So2tLsjlg4euZowxKXW3rOWXf/E/Zbz3ErPZqb5YcvAeiGhjJYAlhHjTtAEsDyiMsd0y50BRHGG0dRmPvesvglKkSYHzNTGEtrNql3m68EEHLx9cPGZlGaBerXF1SLBrebtlbUpdTcnyETEG6nrGp565VZ47hBBCfFf0mQ8RQgghDvepZ25V3jvmDzPO1SilyIsd6mpCjLEtnO4b5gXgN1rtCti+2t9e+Dd/oFuqpbWSXRBpA1fzJYLO132h9ve+769y1dV3d8WEI961mVjGJLimWvo5Ygz44NoHRGMP/vmFEOIshOC7a5Faahox/xpCQGvTFmvvagsam3LV1Xfz3sf/CkobtDY4X6MArXX/WatWM1Qjcelaemgw6oC6gL67lgffkCQ5MUbqakJe7KCUWpjAaOsQSvBKCCHEG0FuJkIIId4wz336KzFJCmJsl7s4V/Vdsrx3WJtR1xNGW5cznby6f+Ih9a3OqhD86vkHfua+qtxjODzO7/+Lf8jnf+u/wxiL965/qJxT2rQ/v2sf2Ixtl0YG776Lv5QQ4lI278I3D4Ybk7ShpS6TKnjfX4eMTXFNxT33/iBvu+NfYjo7RZaN+s9ScGCNqk3vnakA+9oxGz5zMDzGeO87pOkQ5yqMsX2XV2uzrgOsoWlmPPfUTfK8IYQQ4g0hNxQhhBBvqOc/80cxxoC1aVfQ3ZMkBc6VeNeQ5SN2d79Nnm8DZ1ekfTWIBSwt8TuoBtbS/qXvQZ9ppbTmxW/9Lr/+a/8v6npKCI6iOEJdTwgxYE2CNgne1dKpUAjxhph3EWyLnZv+GuN9g9YGm+SUs12SJCfNhrz9oT/DZZffBjGSZm3QaLHLIBzSXbDbXtw/LwzfbfU/U3/OGYq8l+Uu29tXUpVjjE26zoKzLmvMdFm4mmefvEEumEIIId4wclMRQgjxhvvMz3471vWUJMlomhKlNE0zI02H7bKT4DZnVi0GneJKgIrlQNbZdjOcv7cW2FKK9mcsMCbhlZe/zK/+yv+Dup5QVxPSdID3ri+ivLjMx/tmrUi9EEKcLR8cRlugDQq118V2WbQ2ltBlrBqb8vAjf57LL7+dED1NU7YF0ReuY7AcdOq3V/cvbm/oHrgU4FqtgbUhU0tr29W3mtBm3gaSJKdp2szbJz9+pTxnCCGEeEPJjUUIIcQ58enPfSNqnVDXE2IMDIcnqKo9ynKv70h1VssDV7ZfyzntUZsDW66p2kyGpupqZRnqasIv/9Lf5pVXvkKaFITYtqKPIfQ1a+YPl0II8d0wJsH7Zr8eVpcVpZQmBs+Ro9fx8CN/niQd9Mdbm1GVe9gka489Q6Cqf+81LBk823OapiTPt8iyLSaTl1FKk6ZDQmik26AQQohzQm4uQgghzplnX/hybGfkZ33WUpLkh3YoPNvMqva4zR0NDzxvtUuh0sQYaOoZWTbC+Ya6nvCF3/57fO2rv0GIHq3aQsqhW7Kojek6Hy5W1BJCiNdGa7OfdaVN20wiOLTSXH3Nfdz/4J+kyLfR2jIrT5MkxXqXQdjcJXDTcsKFQNRa1tVryNSaszalacqFa3tB05Q8//TN8nwhhBDinJAbjBBCiHPq2Re+HPN8i6oakyQ5VTXp62MtWgxI9duHBLGWA0iHBL42vRdj38kQ2pbxztUkacFsegqb5Pzmb/w3vPLyV5hOXuk7F7adFiOLD4BCCPFaLdbTU1oTQ7tEeTg8zrHjN3D/Az/UZq6OTlBVkz6IrpRCz5f3vZbC7QuBqPn2YcGr5evb+vVuXucqy4Y0TUmWjSjLPQleCSGEOKfkJiOEEOKce/4zfxjnt5wYQ1/AeNFhSwPbd9czqM50Tn9e915cCpAFFIrQ1bYyxuJdgzZtJoTRli/8zt/ni1/8BVxTYWzSF46XZYRCiO/GvK7enHM1aTbkllvfy913f6jNEEXhuqLu82vU/D1jbH/uxqLrcOgSwNXjDirWflD21fwavl8rK/LskzfKc4UQQohzSm40QgghzpvnPv2VaG1KjJEQXJv1lOQYk1CWexiToLWhacr+oQ3YmFW1VOT9kOWEBxZ3Xw1yLXQohLbuldaar331N/jCF/4BdTUmBN/XrTE2pa6mpNmAGLriymkBQPBeMrSEuMTFGNGmzVTSymCMxbkaYxOCd+j5trak2ZB77v1jXH/9Q4u5o0udBs/UZXDj9oZlg+37+0XaN53Tdo/NCcHjfUOeb+F9Q9OUWJuitUUphXM1zz11k1zshBBCnBdywxFCCHFePfvCl2KS5GidEGNg9/Q3GY4uQ2tNXc/6jlzzANVhAamDCrsDfbZUf87ZLi1kvkgQvHcYY9ndfZF//PN/q3+YU1pTznY5cuRadne/hTEpg8FRxuOX0dqQpAV+pc6XEOLSoZRCaUNVjimKHUJw1PWUPN9mNjtNlg3b4u3GopTm8ff962zvXEXwrs32jHEpeAVnXiq41EVQL3QRPKRg+0EBr/k1OMZImhaEEJiMX2J75+quY2LT1bu6RZ4lhBBCnDdy0xFCCHHeffpz34jTyUm2dq4kdLP60BYFrqspNsnxvuHQpYFxOUD1epYgru1f+R4ohVZtRpjShp//R/8xp099A+8bsmzEbHaKweAoTVPiXE2eb1HX07bQshDikmVMwnR6ktHoRHd9qMjz7Ta7tMvKMtqyc+Rq3vf+f4sQXJvxFMPy4PxMmVbde2ezBHApwLWQgbXpHGMSXFOSZoO+6UaS5GiTsHf62wyGR6XToBBCiPNObjxCCCHeFJ/52W9F7xu8b4ghUAyOMJuewtgE793yA9aGoNTh3Qm7d15jYfdN+xtXkSQ53jUkSc6v/sr/nW98/fN9wMq5Cmhr2rQ/97w2jNxihbhUheCxSYZ3NUrpvlC71obGVRhtueba+3n40b9A05QYk9A0M5KkXYasVrOsXmfB9kO7DR4Q7IJ2gmBeF3B+bVZaY0yCMQlPfvwqucAJIYQ47+TmI4QQ4k3zmZ/9VnSuIs1GzKanunpYKU0zXSryfrY1rg6vkbX5nE3b8/O1aZc5uqbqOnNpjLH871/4H/nyl36RstojeNcvEZoHu6TAuxCXtvnSu3ltvzQdMJ2eBGAwPMaNNz3KXXf/AMH7dqkekSTJu+V57rusd7WhxtVrrpGlSJIB3tc0TUkxOEJdjbE2k+CVEEKIN40+8yFCCCHEufHkx69SWtt2dl8pYgzs7X4bre3ScfsZBaqrkbX5gWzxP1g+Z37M6jmL57H4uV2beKU0SmnSdIDWmsnkFe5/4Ie4/8EfIklyrE3xvqYsd0nTAQA+SABLiEuZUoqqmpBlI3xwzGanUdowHB7n7nt+kPvu/wiTyatorUmzIVoZlNJtjb158Omw69OBWVfdNY+V81bO6a+jq9fIjtaWvd1v911jZ9NTaG0leCWEEOJNJTchIYQQb7o2E6vtSBhjxPu6LyC8aOPywHbHa1tSuOG41W3XVCRpQVPPum5cDqXbh8y6nkKM7O5+i9/6zb/D6VPfIEmKvv5V+9Anc0RCXKqcqymKbcpqjDUJShu2ti7nrrs/xGWX307wDWk6IMZAiAGjLXUzI00HNPUMm2TAmbOu2pevbcngQecs7muzTVOUUn3nQQleCSGEeLPJjUgIIcRbwv+/vTuNkus87wP/f7d7b1V1NzYuIMWd5k6JFCnJWhJbjrN4zSSxEyeTk8w5SWbyJZ8mOZZEkARBEtBy4vk2H5I5OWdOJsmJE2cb2XGUieMllmVrIUVxF0WCC7gTBNDdVXWXd5kP7723q6qrqqsBkEAD/9+Xrrt2VaFu37cePM/zHjr8SvDetV+eNpUMTjye2+NqzgyFUxvCTwliSanhbAEpNXxwQAjwdW8rKSScs0jSHt595wU8+cR/wnvvvQSlDbxzUErDe3d23hgi2nGUMiirIYxO4b3D7j1X4a67/wou338rhoOT0DqBr4P0ciTr0zkLrZMYBN+icXv8sblZe7vvltlamDjH+Pma/0SQUuHggWv5nYGIiM453oyIiOi8cvirb4WqGrbN0JUyAICiWIeUGlqnsLYY+9IVQtgyo2pqIGurnliT6yYywrz3yLJlnDr1Bp568jfxxus/aL8kBu/hvIWSGkonKIs+ACBJe6jKIWcqJNrBQvDQJhu7rp0t4byFVmYj2ykEXPmRj+HOj/4Cdu26Enm+BiknsjOnzCIIzM++mhu42vKY+Pev+VvqvUWaLgFAXcIY//Ya08GBL+zndwUiIjpv8KZERETnnUe+fCw0X6KGw1NI0x60zuBciUH/fXR7++BchblZVaNN3MfKB+c0g5+WlVXvsyq7SsAAAExASURBVKnRe50pVhb9WGIYAp556rfw/HO/A6VMXVLYh5QK3ntIpaBVgqrK2y+IRLQzjQZ5rCvgnYOUEt47JEkPVTWEcxVuufWncfudPw9Zl+IlaS/+bRr5OwJMKfGbyLaa13y9WRZjWVVy7PjJY5QyGPSPo9vbC6USWJujKProdHa1r+2BL13F7wlERHRe4Y2JiIjOSwcfeTGEENDp7EJRrEMpA+8tknQJg/XjkHVmVjS/nLBZDjMCXHNnI8SUTC2g7YWVJj1IpVEWA0AIvPnGU/j+Y7+Bfv89dLp74F3VBrCsLQEAienUATgi2omaEkEAsRzQWUipIJXBcHACvd4luPueX8YVV94JhIAk7cI7i6Lst72vGpMTUWxsmNf3amSWwWkBri3KBr2r0F3ah7LObHWuQpouxWbzQuDQAzfyOwIREZ13eHMiIqLz1ld+7f0wWD+OJO2iKPp1dkNnRl+szZlV80oDxzK0ppUTTjtuZDlOdx/7XHnvICCQZkvI8zW88/bzeObp38b62jsoij663T3w3iLP15CmvYnnTUQ7UTvTYLaEZjbVNO1haelS3H7nz+Gyy29Bli2jyNfrvnqxbLid6GGRBu0zSgDHAlhzGrbPKjVsHpd1OXOa9lAWA3SX9uGL/3Avvx8QEdF5iTcoIiI6rz306NEg69n/tE4RQkCer27qIRUDQiMBKj9eQljv1C4vVFK4cfJN5/DBtyWBAQFJ0kVZDuBsgW5vH1ZPvYE/+L3/E2XZhxASRbGOXm8frC1QVkMoqc/Cu0NE54JzFUzSgdYp+uvHkWXL8CGWD/7E5/8Bdu26EoP+cSidtn8bBASMyWBdCdkEoLYqIVykZHBKk3cx1mdrPPgFxKB7lq1ACAFrizgbond46P7r+d2AiIjOW7xJERHRee+hR48G5yooZVDka1heuRxVNdyUxTSvRHCR5u5j59uqKbx3cN615UD58BSStIfEdLG+/i4gBNKkh2/+4T/Fm288jSxbRr9/HEnSq/ticZZCop2quYbLso9ebx/yfA37r7gdf+pP/30UZR8IAUtLl6KsBiiLPrLOrrbsWEkFUQfgF8rCGin/m9usfU6J4SghBIzpYG31baTZMpq/rQxeERHR+Y43KiIi2hG+9n+cCsPhCUipEUJACBsBoG2XFGJKCeGMY+Lazb2xhJCoqhwAoJRuz9nsIaVCka8hSbp4+qn/jOee+28wJoOzZV1CxBJCop1KCAHvPZQ2sFWBW279s7jjoz+HsugjzZbbALXARjDJOQsAMCYbD7DP7VvVnGWy/G+ihHDBksGNx6p+DRadzh786v++i98JiIjovMebFRER7RgPH3k1AKIOXglsCjjVRssJF2nuPnnMIsdBiLE+Ns5bhBAg6y+JfqKv1stH/xjPPfNf25JCItrZQvBI0yXcetufx3XXf3osiNQMsH0IEEK0JcNN/7ypsxCOLo9lTYn5mVdTj9tcNjge3AoQQgEIePC+a/h9gIiIdgTesIiIaMd55MvHQtOzJQQPpUydleUhhICzVVuiMzeQNaecsLFIBtfUIJcQQAgoqyHSdAlap3jpxW/imaf/C/rr7yFNe8iLdQCAkhpCSgTv259EdO4IEbOammvSOwcfHBAC0jRO1rB795W47Y6fxbXXfRLWFrC2jDOMehsH2IvOIjg1gypuGV03dbbCGZlXwTsoHf8uCiHj30VXQQiJpqfgA1+6it8DiIhoR+GNi4iIdqRDh18OWqcQQtVZTWLiy5od2TsslIk1nsk1EcTaIoNrMsAlhUJV5VBKw9oS1hZYWr4MJ08cw2Pf/dd4661nsbR8KZyrEIKHrQponaAsh9A6OTtvEhGdNueq2HTdltA6gZAKShmsr72L/ftvw72f/BvYvecqrK2+Da1TaJPCOQuj0xjsqo0FqOZkUE0LXsVNcxq2jwWwNo5RSo8F9UMISJIeQnCwtsDBA9fxOwAREe04vHkREdGOdejwKwGIXzSTpIvh8CQ6nV0oij6UMgBmN2mfl0E1GciaDH5NHj8tiOW9RwgeRqexeXM1BIC6kXMfT/3g63jzjadQFOsQQqLb24vB4ASMTgEh4McCcET0YZJ1XztbFeh296DfP44QPJK0hyuv/Cg+dvdfglZpDBBJhSTpwLkKtiqgtGnPMzV4hfEMrFlBqFllg5PHT2vy7lyFNO1hODyFTmd3bB5f/008eOBajv+JiGhH4g2MiIh2tCYTK8/XkKY9+Lr8zvuNANDU0kA/EYCazKiactzUcsIZmVnWluh0dmGYr8K5Er3ePlTlAHmxjuXly1Dk6/jh87+D55//HQgIFMU6smwFVZW3WWREdO6E4KFNhnx4Cmm6hICAm2/5adx8y59BJ1vB6trbyNIlJEkP/f5xSGXQyVYwzFeh62DR3MyrRRqvTysbBCDkaB+9zcfJuueWlBJF0UeWLTPzioiIdjzexIiIaMc7dPjlkKRLCN6j338PxnSm7jc1G2ur0sD2uO01hQdiHxrnY98cpQ20TuGdRVH2Y2aWVHj92BN4/Hv/Bt67NkuiKfkhonOj6UXnvEViOpBS4eP3/jV85Kq74L1DVQ3R6eyGkhpF2YezJZROIKXa6IGH02+6vp2SwVnB7qoaote7BEJKlMU6g1dERLTj8UZGREQXhAMHnwnGdKB1LOuZnoG1YFZVvRz3mt7gfV42FgAIqZDnq0iTHkzSxWBwAs6VSJIuhJCoqrwObCVYXX0L3/njfx6zOKRGVeXxizARnRPeOxiTwQeHXncvPvnpv43l5cvhXQUA0DqBVAZlOQAAdLt74L1FUcTg9JhtZF1NLRdcNFtrIgNLCAlrC1TVEIcP3c4xPxER7Xi8mRER0QXl4SOvhtifqrnFTetrNdHDasGsqnk9tDYdEzyUTuBcBWcrSCkhpYbzFt5ZSKWhVQIfHKpyiKoa4onv/we89upjSJIOM7CIzqGYtTTANdfei4/d9ZdgTAcm6UAIGa9pV0HrBEoaWFe2AS+lDKpqCCnqAPSU4FVcPdnDajvZWhM9tLA5sAXECS0evO8ajvWJiOiCwZsaERFdcGIQa0bGVLN22vbRANWWQaw5ZYiIPbiEkO02ISR8cAghQAqJgABrSwiINtMjz9dw9KVv4bln/it7YBGdY7fc9udw/Q2fQZYtt7OKBgRoZSClhnUVpBBQKolZn8G1gaqxANUC5X8zg1f1unmZV+PLG9sZvCIiogsNb2xERHRBevjIqyHOxLWMoliHlAreO2idxMDRWJ+p6f2t4pbpJYZbZnBtkc3lvYdWBj442KqAVAZaJ+j3j+PkiWP49p/8cwgIeO+glEFR9GPZUv06Rp9D82U5BA8hJJQycHWpE9HFqLkGmmsCGL9eQgiQSiF4D2tLpGkPzlWQSiMEj0/9+N/G7j1XodfbB2tLeFdBmxRSqBi4qpuoz8uaWjSDatZMhfPKBkMI7d+y5m9Cmi6hKNaglGHwioiILki8uRER0QXryNfeDsPBSWiT1aU/JZRKAISRINCUjKq4YePhlIDUlhlcYWKWw5FztucTAt77WG6odCwxdBWKYh3DwUl864/+GYaDk1DKwJgOhsNTMEmG4D2kVBu/o/6yHIJHCPF1MIOLLmbNNSDqbKjRa1gICe8dhBCoqgKdzi5U1RDOW3Q6u/CZz/5ddLq7kaZLUMrAewvnYkallLK9dudlTY2V+M3JoJo1y+B4ueHmjK3YI0+0f9NC8LBVjk53N+771ct58RMR0QWJNzgiIrqgPXzktSClhHO2zmbSdcaTbveZW244o0m7H+2BNSWINXN2wuYcImZXhRDaL8Xee0AIKKXhvcOg/z6++51/hZMnj8FWBZKkOzOzqv2iHnz95VxO3Y/oYhBCDPI218SsnnJKJyjLAbROsHv3Vbj3E38D3d5eKKXhnAWa67MONgshNmYaBBaabXBzfypATgS42mOmNmXfnMHlnYU2KZyzkFLVfzM8Hrzvao7tiYjogsWbHBERXfAOPvJiEEJC66QNGo01YcfmINbYuilBqEVmJ5x1TLscYsBKChVLCW0JANDKwHkHJRWcs3j88d/Aa698D0AdqJISof4yPfpapFSAEAh+/LURXYxEGxiO2ZZCyPaaGS3FBYCrr7kXd3/8lyCVhnc2BrpHZxysr1GE2Bx95iyBM8sGp2ReLdCsfXbPK9kG06wtEYLHoQdu5LieiIguaLzRERHRReOhR4+G5gts84Vwq+bu7bqFZyhcLBurKWFqM6WaAFe9TxPAah6/cvRP8PjjvwGEAG3S+EW63h68i9lb2PxFl+hi1lyXUsqx6wVCwFYFhJC4+55fxrXXfaouy0MbwAKwUdrX/r3wbQBsO1lXi8w0uFjgauPvVvO37KH7r+dFT0REFwXe8IiI6KLy8JHXgqjL96JtzFIYH9Rr52VjjffAmtXcvSlviv11xMYXaO8ggLpvl4XSBkW+hhMnXsNj3/115Pla3Zxa1H15VAyKuSbThLd3ojZ4pVQ7IUITgBJCIsuWcc8nfgV79l6DLF2ODdGVGgl6bVyPIQQopdtrdl6z9vhwpEn7trKuFptlMPbACywZJCKiiwpvekREdNE5dPiViYY42wxiYXOAapGSwtESwuYLrA9upMRJtL2wmi/SWqcYDk5A6RRKKgyGJ/Gtb8bm7lWVwwcHrUzbmHp0djWii5WQEt65NjAcgo+zBwoFY7LYrP1zfxfd7h447+BciW53D6oqhxAC3rm299VoQEuKOotr8lreRslgXL85wLVo8Kpx8MC1HMcTEdFFhTc+IiK6KD185NUAzJmFsFm7SEBqMisLE7MQTiknDMFvzGZWf5mN2SEb2R3WloAQMDpFZQtoZdqg1Z/80f+N9f57KPK1NhPLOQsgQCrNABZd1GIAywKIkyI0mVdptoyl3iX48c/8LxBSITEdWFfBmAy2KhCCh9YJgI0sydHrc/KanVUCOBagmlY2uGDm1ca68e0P3ncNx/BERHTR4c2PiIguWocOvxySpIc8X4WUsTzIVjmUNrC2hDEZAIGqGkJKDWtzpOkyqnIw9gV1WiBroRLEWTMUTj1ns7gRAPvhc7+Do0e/hbLow3kLo9M6kFW1+2idAkKgKocQQkApA+cqzlJIO1oIvv0shxBgkg4QAqwt2s+2UgYheFS2gJIaSdrD9dd/Bjff+tMbAag2qFSbLPGbtm5K2eC0QNTMflf18zdJF0WxBq0zeG9hTAdAQFXl0DqBsxW0yeqZRS2ybAVl2cfBA9dx/E5ERBcl3gCJiOiiduDgs6HTWYEQEkW+DqUTSKmgTYZ8eCpmMgmBJOnC2gJlOUCWrcDaIp5gSkAKAPzYLIfbyN6aks0V98fYObROICDw0kt/hB888R/j73RV209L1dvzOkOr09kN50qU5RCdzgqqKj/zN4/oHDEmw3C4iiTpQKkEw+FJhBCQZcsICHC2bPtWSWUAAB+76y/hhhs+i4DQzvg5FsCanFlwZN12sqgAQI4GiKcEs7ROkeerSJIutE5RloN6YgaJrLMLtsrhvYOzJdJsCSF4DIerOHzoNo7diYjoosWbIBEREeIMhbFps4D3ti4/QvvlMc/XoJSBlKrtNdWak1V1uiWI05vFb/DO1lkcHfT7x/Gtb/4znDr5BrRJIYVCnq+1X+6tzWFdFXtlSYWqyqGkPvM3jegccd7CmAzBu/azrXXWBmmzbBk+ONiqwK7dV+Izn/u76PX21ZmIElJtfP5Hg1dTG7KfRgng1k3eRfu3xLkKWbbcBtEBQCoNKTVQz1jKmQaJiIgYwCIiImo9fOTVoOo+U0nShfc2BnvqDI6i6KPTWUFZDCBk0xdnsUyquN9IieBIj6qFs7FGgmaubvzelBpBCDz2vV/Hqy9/BwEBve5e9PvHASGgdQJbFTGzTKdtiSHRTqaUgbUFvHfQJo1ZVSGg19uH/uB9CAhcc90ncc+9vwKE0JYGA4CqZxgEMD/Latoy0F7/aLYseo76Z/AeSdrFcLiKNO0BAFzdi0tKjbIcwJgMzlXsd0VERFTjDZGIiGjE4a++FWKpYB9pugRAIB+ewvKu/SiLdYQQMyI2ekgt3uNqZsP408jGUjpF8A55sYYsXa4DbRovvPD7eOH538Xa2jvodHcjeFd/wY/ZKlWVQ5uUTd5pRxNSwlYFjMkgpIKtckipIKTCcHASy8uX4aZbfgo33fSTcC5mazXXipAKzhannXUVV29urL6dHlkh+Ph8hUCSLmHt1FvIOrsABBTFOpKkB61THPjCfo7ViYiIarwpEhERTTh0+JXQ6ezC2urb6C1fikH/fQCxb433FiGEjUyKkcyq0aDU6CyE227uPrLcrpvYbqsCSidIki7W195Fmi1BQMAHj3ff+RG++51/Ce9s26srzkzo2h5ZbOJOO1kzq6BSGkKqtuRX6xRSaXzik38Tl172Y5BCIiCgyNextHwpynIAZ0tokwKYEXSqlye3xx9bN2uPD0dmIRw5ZvTvRiwj1O012u3tRX/tXSyvXI7h8BQOHriW43QiIqIRvDESERFN8dCjRwMAOFsi6+xCVQ3boJQxnY0m7pgRxJrawyps75jJdaNZW3UQqiwHSEyn/kLvY5P5zi7019/DY9/7dbx+7AdIki6EELC2hNYJpDJwdSkV0U6kdALvqvYzHUJAWQ7wkas+hnvu/RX0li5BPjxVf/ZlvFaqIZKkG6/jyWtpkSysKYGodr8FAl6jx2idoqqG9T4SxnSQD09B6QQA2POKiIhoCt4ciYiIZnj0K68H72NgSCmNEOLsZVKqsQyryawqYEqPq0Wau09mXcUN05dDnB0xZnCUbUmSkhqVLaCUxqD/Po6+9Mc4+tIfoSjWY9NrBHjnxr5ME+00IQRIpSAgUFU50nQJ19/wWVx/w6fR7e2NZYM6hfO2LfnVOoH3Ns7212RILdDvKgaLt9GsHZt7ZI0eEx/LWNqrEwgh6sxICSkl7v/iR3hxEhERTcEbJBER0Ra+/I/fC002R1XlEEIiBI8sW8HqqTdhkk7ssZOv1bP+FW3j9y0bs2PxDK7J5c3bNs4nhYAPASF4vHHsCTzx/f+AqhpCmwxVOYTWCcpyCKU0tI4NsJXSMCbOaqh1ehbfQaLtsbaIswZWQzhn40QEtoBzFknSgbUlTNKBrXIY08Fdd/9lXHnVXTEIVH/2N4JMtWmzCC7YdH1q1tWc45yr6gkTSmRZ7FFXlUOs7LoCeb7a/g0xJmuzJr/0jy7huJyIiGgONsAgIiLaQvxiKSCEQlUN2+DU2to7SLNlSKlQlrE8ydoCy8uXbRy8SIZHvSZunvFFeYppZU/NOSpbQCsDrRPsv+J2/MTn/wGWli7BoP8+lDYICMiyZShlUFZDGJPBe4eTJ49hafT5E50DS8uX4eTJY/DexSBPfd1l2TIC4oyCg/77WFq6BD/x+X+A/VfcDq0TaGVQ2WJzhuHM625kl9EMqilZV5v2m9MEfnn5MlhbIEm6KMshpFRIs2Wsrb0DIM6gWFVDCKEACAaviIiIFsCbJRER0YIOPvJSyLJlFMV6XY7k6i/YHVTVEN5ZpNkSVk+9Wc8otniT9oWau89oEj8tE6u5wXvvIaWEdRWCd3j8sd/Am2882WawBO9gXQUpJLROIYTEcHgKxmRn4R0jOj1VlaPT2YUQPKwt4IOHVgZCqjaD8IorP4qP3/PLEFJBK9N+1oHxa2Ba8GpsEoMFZg0UEyWCW2Vs5cNTWNl1BYp8HbLObKyqGMiSUsHaEmm6hDxfw6EHbuB4nIiIaAG8YRIREW3DocOvBCEknKtgTNqWFJblAGm6VPe2safd42r0uHnN3SdnOZw8n5QaZTmIvX/q5xl7eSV47plv4IUf/i6USuKXaqVjLyFbQOsknm+0yTXRh0yIWOZnbQmj07p3m4UxHThX4qabfwq33v4X4FxZN0HPYKsCIXgkSTf2uoonij9Gygbj6pFZAqcGoWb3uhpbrtdNC3hJqRGCR1Gst83jjclQVbHEOATPmQaJiIi2gSWERERE23DwwLUiBAdjUkhp2l42u3dfBSkVimIdwPQMDggx9gW4/VI9kt0xWrrUPh7Zp90P41kjk+drZiXs9vbCewcpVNuT5/Y7fgaf/uzfgQ91c2uVxMbvUqMqc/a/onNO6xRVmbeTEmiVxOBwcPj0Z/8Obr/jZ+BcCa1TSKHgvUO3t7f93G+6ZiavO0y5Bqdde8Cm63QsmDWnwXtRrENKhd27r0IIvm7SbmBMihAcg1dERETbxBsnERHRaXro0aNB67RuNF1BKQNjMjhXjWUwTc2qihuatWPLAOBHM6zmZWPNKDGs6l5cJ068hixdQgBgTAfW5nC2AoRAWazjm//jn8R9OrtQ5GtIs2VUdc8eonPFeweTdNrPZD48hT17rsbn/vTfR5IuASH2wdI6i72kAOTFOvbsuRpra+/AjAZhp5UIzsm6AgA5UWI47ZjJ48TE+tjnKh/529CBtQUeuv96jr+JiIhOA2+gREREZ+ChR4+GNFtGka/BmAxF0W/7Y40anWlwY7ld2F5JITaXEI4egxAglcH6+rtYWroUVT3bYFkOoE0GKWJPLK0TOGfxve/8Kxx77fvIsmUMBifahu5E54qUClWVo9vdgzxfw1VX3417P/k/QykNa8vY8yp42CpHknThnIVJOu1n3rtqi8DTSAnhoiWDmwJX7dKmpvEbfa56qKoczd8IBq+IiIhOH2+iREREZyj2xYq3VO9dW1Y4arIn1ti6KQGoaQGsRY9plpvnoXSCPF9rm2DbqqhLnySUVHDe4cUXfh/PPfffYKspM7gRnQMhBGiT4tZb/yxuvOkn289qCB6otzWTEGTZMpwtN669yZk8t2i6PjWAteUxm49r19bPo8lkDCGwZJCIiOgM8UZKRER0Fjx85LXgXAUpZd3I3UFKDe/tRmN376FNBlvlEHIjA2S0wfsimViLHrNp3URjdqlMO6Ob0ileefnbePbp38apU28iSXso62yyUDd1j42pFbOz6KyY/CyJuml7knRRVkPs2nUFbr/jZ3HNtZ9sS1+NyeC8HR/ATikRBOY0Xp/Tt2qxY7DpWm4atjfXvJQKIXh476GUwYP3Xc0xNxER0RliE3ciIqKz4MH7rhZZZ2XsC3nTxNmYDryzSLMl2CqH0gk2/R/SlCbTzfJM02ZEm1wW0x8LqVCWAygd+/Ssr7+L66//ND7zp/5XXHbZzRgOTmJp+bI6o0xAaQMhBIqizxkK6YzF2fn6ba8oIWPQd2n5MgyHp3DZZTfjs5/7e7ju+k9jff1d2KqIZbDVcGp/qsnHM6+JOdmFk9fd7GMElE5gqxxpttTOjjg6iQMQszGzzgqDV0RERGcJb6hERERn2aNfeT04Z2FMhhA81tfexfLKfuTDU5BKQwgB77ffpH07PbBGzjw1MyuEAOcqGJ3GTKwqR6jLH60r8Nyz/x9eeP53Y5ZM8EiSLryrYmkUAoIfL5Ek2g4hJQTibJlSGZTlALLOXLz5lj+DW2/7c1AqQUAshTUmg3cVqjoALGZkWk0L3i7SA2vbTd6lRAgB3llknV1YW30LS8uXQggZn6PSuP+LH+E4m4iI6CzijZWIiOgD8MiXj4Vm9jFrSwTv4kx/xTpQfykH5ve4mlcaOBrAmlpOOO24kWXvYnbIcHgK3lXo9vaiKPoo8lUsr1yOweAE3nn7h3jse7/e9hlSUgOIwQcGsOhMNOWDIQR4b6GUgVQa99z7K7h8/63odHZhbe0dpOky0rSHQf99SGXQ6exCPlyFVGrLoNPkOjErgDWnYfusUsN4/Qmk6RLy4SkIqepJEeI1/8CXruIYm4iI6CzjzZWIiOgD8tCjR4OUGlqnKMt+29hZ6xTWFmP7bpqlcCRAND8ba4vm7vW6adlZQkg4b2FtASUNkrQH7yoMhifR6+5FUfaxvvYuvvvtf4F+//j47yE6A0KIsc9Sb2kfPvmpv4Xl5cuQpD30199Dt7snZmcVfThfQesUSurxfm6zZglcoFn7zAAYMNajbtosg8013FzTSdKDtQW8t5xpkIiI6APCGywREdEHKM5QKNssE+eqdnayyWDQvBLBRZq7j51vqwbvIaCyBdKkB6k0BoMTEBBtEKushkhMB2U1hHcWP3jiP+Ktt55F8A5VVUDr5Cy8O3SxsraEMSmEVNi//zZ89K7/CUqZ9jNnTAdKapTlAAEB3e4eeGdRlH0Ync4u9ZtaLrhR/je3WfucEsNRsQQ4lts213TTxJ0zDRIREX1weJMlIiL6EBw6/HJIkh76/ePIshU4V7bbxgNXC5QUYkoJ4Yxj4trN2VfOW2id1gGpHFJpaJXAewtrS2iToqpyJEkXzlWwVY5nn/kGXnrxmywhpDPWfIZuuPFzuO2On4nZVXUvLGMyVFUOrRNIqdsSXGMySKVhqxyyLmeNJ5vXtypuGV+eUkK40DEbj5VKkOer6PX2oSz7OHjgOo6piYiIPmC82RIREX1IHj7yavDejWRfTWZRYWR5sWDUeCbWlEDYrOPqAFjTJFsIGbPDvG9nJkyTHpwrUdkCUmoYk+G1V7+HJx7/9yjLwVl5T+jiZEwHd9/zS7j6mnthq1h6p3UCpRIUxTqMyWBdBSkVlDJACPDBtcGmxZquN8T8zKupx20uG5zc1lzLD953DcfTREREHwLecImIiD5Eh7/6VqiqIbROUBYDSKXR7e7B6upbMKYDIMB7h41b9PZ6XC2awbVliWF9bPAeUsq2109lC1hb4Jv/459g0H8f1pYQQkKbFN5V8Zj6XFondcN42/YUYubWhWX031UqDQEBa2N2oagbp0tlYKui7v+WoNvbi8/96b8PrVMYnbafLe99nJ1wXi+rWY3at8ig2m6PLCBASgVAoKqGWFnZj8HgBLyzSNJuXQLZwYEv7OdYmoiI6EPCmy4REdGH7JEvHwu+LokqywGsLZBlKyiLPpROIISAc3bkiLApgFWvHVs3NxtrTjnhtPMIiBhUCKENRCAEOO/gvYUQEk8/+Zt46cVvAkDM2Ep7I7MrxoCE9xYQAlqZ9rlMNvCmnaf5N2wCP9ZVQAiQUrcBTyB+DoqiD2MyAMANN34Od3z0F+o+cBpKKqA+VwgBUogY0Ko/g/Uviz9Gh61TAlrbzroaXTfSJwsAlNIIIcDZEknaQ56vQusUSdKNJbdScaZBIiKiDxlvvEREROfAA4d+GJKkC2M6WFt7B2nag5QazpVwztbZH6ffpH3qcQsEv0ZndwvBj/3O0Zww7x2qcoC33noWTz/5W6iqIZy3bRPupsm7FApNE/smM6cJDtDONRpkbXpVxYCnAxCbtDefBSU1jOngjo/+PPbvvw0m6UJKNZFjuHFeIeT0WQanLY+uW7RZ+8jyrOO8d1BKQ9V94Yqij+Xly1BVQ5TlAI8cvJljaCIiog8Zb75ERETn0KNfeT1IaTAcnIA2KZytoE0WM5dqk2WBY+tGA1ATAaqtmru3x9XrxkoMR9eFuEUAbf8hV5cFemextvY2Hvvur2N9/d36i79BWQ0BAErqej/Xzr7IJvA7X/Nv2MzGJ5VC8B6u/twmplPPzqewtHQp7vnEr2B5+XJIpWOfNaVnfrYgxoenYyWCMwNXwGgQanK/rXpkTa6TMjaLVzqWP3a6e+B9hfu/+BGOnYmIiM4R3oSJiIjOsSNfezv4ejbANO0hz9faDKxRC882iGmzFE5pGD8vi2s0AyaEmI1VHyYASBUbvRudoqyGqKohnnzi/8Vbbz6Nshwiy5ZhbdH+zhBic3ghJKoqhxqdRY52HOctjMkQgoezVT0RQBxWap0iz9eQJB3sv+IOfPSuvwhjOkhMB5UtYEwW+6XV5xKoZwWsP2tx5daN2uPD6U3XN80yOHqeOTMNNrx3yLLltvxRSoX7fvVyjpuJiIjOId6IiYiIzgMHH3kxZJ1dKPI1aJ3AuardNhp02m421pbN3WcdF/xYoKApJwwj20OdfdPt7sH6+rsICHjl5W/jhR/+Hsqi3wY5lNQoy2Fs6C0VrC2nBuho5/DeQesE3juEEJAkHThv2+BkkvZw082fx7XXfQoCAktLl2IwOIEQPIRUbYCp6a82GnBCCBvLUwJZzXH1o7HlsZ5Y28y6Gn2slIG1JdJsGfnwFA49cCPHzEREROcYb8ZERETnicNffTMURT8GA9om7lMCTpgTkFooiDX9uFkZXJPnDECbQRUQUBTr6HR2w7sKZTXEoP8+vvMn/w9WV9+G965+PXGGQm1SAIAfa1JPO41U8d/fVgWEELFstBxCSoWVlcvxyR//W+j29iIxHUhlMByeRJoutUEl5+142WD9uLEpg2rmbIHbDV5Nz7qa3K5UDLqmaQ8HvnAFx8tERETnAd6QiYiIzjPNLIXRVgGsKfuMBqO2yMRq180qQ6zPNdpTaLS/VvPFv6pyGJO1JYJVNcTTT/4Wjr32eDtbXZNpU9mCJYQ7nPMWRqdjmXlCCFx19cdxx0d/HsZ02hLD5rMBYOxzM/mZagJVs8r/5mVQTS03XCDotXk5/uQsg0REROcf3piJiIjOQ49+5Y1QlgNIqepypgJCSIQQYEyGIl9DkvbqzKbYTBshQJsMtsrbIMCsJu2nk8E1fxbDyfPGoMCPfvh7ePbZ/wpnSyhl4FwFpRMghLb8rDmjELItLdwI4NG5MPrv0DRqB+K/aZN9Nflvetttfx4/dvPnN30GgJEB57xm7KeZQTWtyXsIvr0WUJeuCiFjpljRR5oto6pyiHq2Ta1TOFfVGYNd3P/FKzlGJiIiOs/w5kxERHSeOvK1t0MIHmU5qLNZAry3KMshlpYuwXB4qg1MpekSrC1QloPYQL0q2vOcUTnhvEbv7eFhagArBA+jU7z55tN44vH/gH7/PaTZMgb996GUgQ8eWpkYPPAWzsa+X1LKTRln9OESQsB7DyBA6QRKalhbwLoKUig4V6Lb24siX0Ovdwnu+vhfxhVX3IGqDrSOngfYmGWwXb9Fg/YzKhsEoE3TSL4LrVMUxXp7zk5nF9bX30OSdCClhhACVZUjSboQQrJZOxER0XmKN2giIqLz2KHDLwdbFcg6K7C2hFIa1pbwzsIHh253L6pqAGdjJpZJOrC23DjBlGAUsEBz93lBrGnrwthWKGVQlUMAQLe7B6urb+F73/3XePWV76C3dAkQAspyAG1SCCFR5Gtxprqki8HgJLROzuyNozNibYFudw/KcoCqGiLNloEQYqAn7QEA+uvv4ZprP4l7P/HXsbKyH4PBCQCAqXueNUaDV1P7XW0jeLUpcDXjOADQOkFVDmPmlTYwpovB4H1IoSCVridLsNA6QT5chTYpDh64jmNjIiKi8xRv0kRERDvAo195PVRVjuA9tEmhdRoDWT42Q1fKYDg4GbNiinVIqaaXBY4sj66L+46s937TPltmY42c19oSJukgeIeyGsKYDoL3OHr0W3jmqf+MshoiMR1UVY4QfMwacyWqcog0XRoLgNCHTyqNsujDmAxax2wmISSMydqeVrff+XO4/vrPQEiJqv73FFKhKofjAch5WVbTlgEIOTIrIcTWgavRZSHgvUOaLmHQfx+d7u728yRlDFxZW8QG9DK+pvu/+BGOiYmIiM5zvFkTERHtEA8feS1IKSGEQr9/HFm2ghAcynKAXm8frC1iTyzvxwIAs5q0z2vwPlbCdxrZWNpkGAxOtGVZ+XAVnc4uhOBx7NgTePrJ30JRrLXljU0mjJQKw+EqM7DOMWuL+vPl28y/psF6mizhjo/+PK666i4IITEcnkLWifuW5QDd7p629xSw/ayruFpgq0btk+tG+2I114CqS1T7/eP1Z1Ehz1fR6+1DCA7eezx439UcDxMREe0AvGETERHtIA8c+mHQOkWWraC//h6yzkpb5tWUfI3f3uc0aW932Vi3UHP3keV23cR2Zyuk2RK8s/Wsgwo+BITgkZgOVlffwuOP/Vu89+6LMKaDolivgybLgBDwzp6Fd4tOl1QaCAF5vgatU6TpEqpqiEsuvREfv+evYmVlP8oqludJIeC8g9EppNIo8nUobQDM7lE1L3uqXtEuLxQAm9InCwh1SeqJtjw1H66it3QJ8nwV1hZ45ODNHAsTERHtELxpExER7TAPPvyj0MwSV1V5HbjqA4gBpyTpwtpidjAqLtRb5s1SuL3g12hQywffliFKpWLjb2/hXAUBASEVtE7w7DPfwFM/+Dqk1Oh0d6Mo1uBs1c6CR+eG9w5KG6TpMoaDE/De4c6P/SJuv/1nYF3swRYQoJSBkho+OHgXZ44UUkKONHKfNqsgMD8ItdUsg5uzteLWZlnrFGU5aLclSa8OZGXt63v4wR/jOJiIiGgH4Y2biIhoh3r4yKtBSt3OoGZtvmn2vq0yquKWebMUjixP6Z01LzNLCAnrKoQ6GIIQ4L2HUhrOu7heabzzzgt46gdfx3vvvYQk6Z7Re0JnV1kOcMklN+DOj/0iLrvsJjjvIKWCFBLOWUgpASHgbBWDksoghI3+aYv0uxov/5tdNjg1g2vGcRu7CWidtTN5em/x4H3XcPxLRES0A/EGTkREtIM99OjRoJSB9xZCSABirAF6CDFgVJYDdDq7MRyehFIj/aW2asyOBbOxFi4xjIQQCCFACAEpFE6cPIYfPvff8fqx78PXQRIgZvME7xGCh1QaUihYW24KVND2CBGz4LyzcL7uPyYUvLfw3sE5C5NkuOKKO3HTzZ/HJZfcAOcrWFtC66T9HIiNEy5WIridrKs5xwGAc2X7mU6SLpxrroFIKYPYz81DSg3nKjx0//X84BAREe1QvIkTERHtcF/5tffDoP8+jMkghIC15dT9Qgh1YCg2TR/ZEH/MCEZNZmMBU2YpXLC5e3OWJkjlbBkbg2fLyIen8MILv48fvfD7qMphPZOiByCgdQLnNgIodGZC8PDewZgMUsYAZwx2GoQQoE2Km2/+Kdx4008gy2KfteAdhFQj2VG1RZusz5llMO6yWNALQGwqjzjb4KxgZhNoq6oc3d5efPEf7uW4l4iIaAfjjZyIiOgC8NCjR0MM+MQglXMVhIhf8GMmClCVQ2iToiyHbRBo0SbtCzV330aJYZMp44OHcxWkiD2xhsNTOHnydTzx+L/HcHiiff4xK6iKPZd0AjcjSEeLabL2vPeQKma7NcHBXncvPnb3X8HKrv3odnbH3mW2hNIJlNQIwW+UCS5aIridZu3zzlv/tLZEknRgqwIm6QBA/BzV10DzmWmuAWZeERER7Xy8mRMREV1AmkCWUgbOVXXQJ0E+PIUk7cGYDFWVTw9ILRCAGj1u4ebu9fLodikUymrYNgGvbIHgHbRJIYTE+tq7eOrJ38Sx1x6HlLrNwPI+Ngpnk/cz1wShtE7bYNZHrroLt9/xs1jZtR+2KuCDg5QaUgj4kab8o7Zssj41CLVg1lW9blrAq/ksl0UfWWcXnCvj56n+7DNwRUREdGHhTZ2IiOgC8/CRV0NTHhbLCQOk1AghoCjW25nYFm7wXq8b74s1UkJ4Gn2xnHdACLHMC7HMS0oNJVVsSp/2UBTreP7Z/4YXf/QHAACpDKpyCKXNWAkjbZ/SCWyVQ+kE3llIpfFjN/0kbr75p5AkXVRV3pYLhhAghYCsZxt0zkLXWX0ATqPf1UYGXrvfjMDV+HHjy1WVI02X6iwri6bUNH6WFJu1ExERXWB4YyciIroAPfTo0SCERAgeQsjYG6sqoHQCIWT9hT+amlUVNzRrx5aBWPo3suO2s7EA1M9LwroStglg6RgYKfJ1KGWQZst44/Un8dj3fh399ffQ7e1Fka+NBUBo+5y36Hb3YDg4iV5vH+6+55dwxZV3tr2wEtNpyztjb6ykLTv1rorv/2lmXQGAHP33m3eeKdlaAOqArIezJbRJEUJoP+sheGZeERERXYB4cyciIrpAHXzkxZB1dmHYPwEA6PRiwELrpC3Fa4zONLix3C5sr6Rwyn6Ty1IoWFfCuQrGZDCmA2sLVFUOIDbpFkK2fZkG/ffxxOP/HkePfgtLS5eOzbRI2yelQr//Pm648XO46+6/jKyzAmvLOBEABMpqCCEktE6gVALnSlTlEEKqOrgVPz+LNFxfuGRw0zHt0qZG7VLG2Sg73d1jn+98eAqHHriR41siIqILEG/wREREF7jDX30rWFvUzbfDyOx+G6bONDinNHDWDIVblSE2y85ZmLr3knMWUkp47xEQkJgOrCtjmaAQMbMGAs5XeOXlb+OpH3z9LLwrFzchJe644+dwzbWfgNIpBASkUrHPVT0LYdMXCwCklJBC1Q3966y+LfpWxR/Ty//m9c2aDF5tXoc6izA2aY+BthQHvrCf41oiIqILGG/0REREF4GHj7wW4ixtsv3yL6WG97YtKQzeQ5sMtsoh5EaJ12iD93mlgfOysWb2xZq2LsRHAoCvf7esn09R9JHnq/ijP/y/UFXDkUwsMVFiVgdbfBO0kxB14M7Zasc3gffeQWkT/+2cHSsVBcYz6Day6wSUNjCmg89+7u8hy1aQpr36fDFYKIVo3/ttlQhOzaCan3U1uW7032/ys9iUDDaf2SYI672HUgYP3nc1x7REREQXON7siYiILhJf/sfvhXx4qg0GxCbYPWidYTg4gayzEntPtSWG28uqGgtazeuLtVCT+ND2SfLBt5k2zlnYaggfPJ76wdfx2quPQQgBpUzM1vIOZTmAUkn7/Edfg5QKUqpNJZQ7TfMamtfRNFtvAkfOlTBJB1LEQF3sZRVw9TX34M6P/SKkkNCmA6X0RmbexPvd2LLJ+hb9roQQ287WklLB2RJptoR8uIpOdw+szVEU/VjmWAdds84ufOkfXcLxLBER0UWAN3wiIqKLzKNfeT04Z2FMhhA81tfexfLKfuTDU5BK17O6nX6T9tF+WqcbxPLOQSpVlw66jSysOlCjpEZerOGVo3+CH73wB1hbewdKJ9DKtAG6EOqsopGG300J5YWgKaFrGvMH7xAQ2vI+7y2sq+BsieXly/BjN/0Err3uU0iz5fZYhNBmX6k6a61574HTDV7VW86kybuUCCHAuxikWlt9C0vLl0IIiarKoZTG/V/8CMexREREFxHe+ImIiC5Cj3z5WHCuglIG1pYI3iHr7EJRrAN1EATYRo+rOeWE7fIWGVyjyz54SCHbgIoPDlKosdJG7x2MTnH8+FE89YPfxNtvPw9jUkipYW3RzpSopG5LChEmM8V2riYrDcBENlZsvu6DQ1XmuPzyW3Dnx34B+/Zdj6rKIaTaKDX0vn1vm4Bh897XJ4s/tsigmtvrqtlnGz2yYo82gTRdQj48BSEVtE7QfGYf+NJVHMMSERFdZHjzJyIiukg99OjRIKWG1inKsh+zeIKH1imsLcb2nTlL4ZzZBmcGv7Y4buIXx2wqbAxaxvpjATA6xXB4Ei/88Pfwox/9AQb9E+h2d9clhX6seX1TanchaF5L05A/vr4YeBoMTqDb3YMbf+wncNPNP4lOZzcqWwAhtEHAyfdTCDmWJRX3WXSWwY0zzi0ZnNGofbJJe/MZbD6TSdKLQUlv8dD913P8SkREdBHiAICIiOgidujwK6HpJ6SUqXsl+bpJ9nigZ7LH1di6TT2s/JTjpgeyppYVBj92viYwgxBijyYA1pZQOgEAOFsCAN5661k898w3sLb2bgyk1MGappn7xvl29hBo8rU0ZZFNY/Pllctw621/Hvv33wYAY++T1gkCELOsxjKe6vNhI7Or/gXt+q0CVxvbNo4fK0OcOGbyuGY5ljjK9jPZlIEePHDtzv6HIyIiotPGQQARERHh0OGXQ5L00O8fR5atwLmy3bZ5Rjtgy2ysRUoKN04wpYTQtY9HgyFNoMV7D5N0ELxDZQsoqSClRmULVOUA3/7jf47V1bcwHJ6CUiYGbepMLCElwliPr52neQ1NGWFlC3hXodPZjeWVy/GpT/9tJEkPRqfw3sLV5ZZCKlRVDtkGlDa/t3E2QtU+BhYPXk0tGZyRdTW5bvSxUgnyfBW93j6UZR8HD1zHMSsREdFFjoMBIiIiAgA8fOTV4L0byb6aEmzatDyjx9VoBtZWQaw5jeFHzzcaYAEAZytIpSGFhHUVhJCQUsLaElIoPP/87+ClH/0hynIAbVJ4V8E5W8+8t7PLCIUQ7Wtpen4lSRfX3/g53HLLT9eloAl8XWKolYEPHt47aGXGgoxCyPGMq7hy4+GcRu2jywLTM7Cm9cgaP8/ksmizsKRUePC+azheJSIiIgawiIiIaMOhwy+HpmxLCIUQXJz1r13XNHf3Wwak4pZtlBhu1RdrRoBs4xmMnC8EJGkXb7z+FJ568ut4//jL0DqFUqadndA7C+cqaJNCSQPnKwBxBsRzXWIYQmibqgup4F0VSyaVgZQqBneUhncW1pbYd8l1uOPOX8AVV96BsuiPNWoHNg/4ZpYIzltepERwwUbto5+jjc+WaD9zzTpmXhEREVGDgwIiIiLa5OEjr9WzFGoAgHMW3tu6FG96SeG0Ju31lrM+S+HUoNbEa8jzVfS6e5Hnq3jyB1/Hq698tw2mWFtAqQRJ0kGer8F7iyTptr2XzgdNL7KyHEBKjSxbRlkO4VwJrdO2gfvV19yLj971F9Hp7MJwcBJZZ2W8R9boSRcNVp2lWQY39p1eMmhtCSn12OdMKYMH77uaY1QiIiIaw8EBERERTXXka2+HqhrC2QpptlQHG1Q7O1zjdJq0+7EMqm0GsbA5A2tjn43nlKY9DIenIIREYjo4+tIf4emnfxv58BRU3RPLOwupNARiSV6T9eS928Y7dfY1GUjeOxiTISCgqnIoqaF0AlsVyLJl3H7nz+H66z+NshwAADrd3e1jYGSgt6lcbyKDamSfrYJXQN0AfuLc22ny3sx26b2D1gmKfB1KGxjTwX2/ejnHp0RERLQJBwhEREQ00+GvvhnKcohOdzfWVt9GknQhpYJz1dh+Czd3r5cX7Ys1eVy7PG37yD5CKlTlEFonQJ3pY3SK999/Fc8+8w288fqTSNNe+zpC8PDBw5gMtiraWf3OlaaEsCpzaJ20PaGUMqhsgf37b8Vtt/8M9u27DradWTAGuYzJNt6fab2s6vVbBa7ijzmZVwuUGk4LXgExQOe9Q1kOsLxyOYaDk0iSDg584QqOTYmIiGgqDhKIiIhorke/8kYoinUYk0HrFMPhqRgYwrwG7xOBrC1KAbebxTW9hHDjcVkO0OnsRqiDJFIZKKlgbQnvLZ595ht47dXHYG2OougjTXtI02WcOvUG0nRp+2/SWSakxHBwErt2XYmyGqAsBjAmgzEZrr72E7jllp+OsyuaWEroXIXEdCCExHB4Ekna2zjXtMDUtODVNmcZnFxeJHC1UcJZotPZBWsLVFWONF3C/V+8kuNSIiIimokDBSIiIlrIV37t/VAWfQCjJXxbzVS4xYyDU7OxFjtu2nJDCAkfHLxzkFJCSg3nbVuy5r3D228+i8cf+7ewrgRCwGDwPlZ2XYl8uHpeNHHPOitYPfUGut29gBDQKsHH7/mruPyK26CkRlWXciqp4JxFQGhnJQyTJZDbbtS+OZi1WNbV/MDVxvZYgpikPXzxH+7leJSIiIi2xAEDERERLez+h54LWbYyUUK4zSAWJnpYnU4Qa4sSQgBwdbBKQKCshgAAJRUqWyBNeqhsgaoa4vuP/QaOvfY4krSHIl9D1tkFZ8uF3o8PilQaZdFHmi0jH57CVVd/HPd+4q9Dm058DVUOpRP4OnCVmA4CQiwzlHrj/d1OCeGCwau4Xm7aZ9HgFRBLCPN8FY8+dCvHokRERLQQDhqIiIhoWx569GhoekTNnIWwWTsnE2t+k/YFZimcFcRCPYOfUPDewnvfNmcPCBAQsPUMi957BO/w6qvfxbNP/xcMBifb8shzqWki3+nuxs03/xSuufYTMEkHUsRZCWPPq41m6s7XmWZCwXm7qYfXzOBVszwnCDWv3HCr4NXGuvHt3js8dP/1HIcSERHRwjhwICIiotNy8JEXgzEZQoiZP0JIeG/bn1qnqKocQggIIRFCiJlBIWxk82xVGogmmDW9N9bMYxfI0AqIAyEhFbx3eP/4Ubz4oz/EKy9/B0nSaZujQwh4Z9usI+8dpFQQUrZBMYTpATygDtrUQaOAgOB9e474lDyk0kAI7e8syyGuve6TuOHGz2Hv3usglYL3Pr6X4yffeLhok/YZva62DFqNHlv/GwohIYRACB4hhNgE3xaxjDH4kZ8KQghUVY5DD9zI8ScRERFtGwcQREREdNoe+fKxYG0JKSW890iSDobDU0iSHqpygICA3tIlWDv1FkzSgdYpvLdwzm6cZJsN3sfWbRW0mhIQAxCzs4KL2VlCQCqDqspx8sRrOHniGH7wxH9CmvZQ1D2/pIwBuOb5+8keU9gIBjXPbXJ57PdLBSk1rC3qGQZjyV/zOz9611/Enj1XYffuq2FMFn9nCJBCQEg1XoKJOQGnet12ZgpcJPDV9NqytkBVDrG8az/66+9BQMAkXZRlH53OLpTlsP1saJ3ggS9dxbEnERERnRYOIoiIiOiMHPnaO8F7izxfxdLSpXCuQj48hU53D0JwqKocsunbpAzKMs6oB2zdpL1Zt9UshZPHzs66io+liEEg5x1C8FBKQ6kEIXhYW+L4e0fx/cf+DdbW3oVJOjHDyDtUVYEk7dbLvg4kxewlIeWmZvIQot4vZpEJIWPmlpD1zIIphFQQQsZA0PKluPuev4a9+66F0XGbd1UM+AkBOZr1hekzDLbrF8y8apYXmq2w/llVOZKkC+eqOsDmYEwGIRSGgxPIOruglMH6+rvIshVIqXHfr17GcScRERGdNg4kiIiI6Kw48rV3Qp6vIgSPNO3BOYt+/zi63T0QQsCYLobDk0iSLmzbJH1Oj6u4YWx5ZjbWFgGwyXU++JF+TDGbqQ0OBR8DTOUATz35dbz22uOwVQEpFYzpYDA4gTTttWVzW2VejS435ZRF0Ue3uwdVNYwzI5oUV1/9cdz50V9EknQ3nl8I8KEJutXPNwSo0R5XM7KuxtYJcXpZV5uOjT9jmeMAnc5uVNUAIQQMBifQ6+2DUhpF0YcQElm2wsAVERERnRUcUBAREdFZc+RrbwdAwNocWqd1P6TYv6ks+0iSHmyVQyo9t8E72i3Ts6q2OnZuIAuAcxaqznxqt9U9urz3MEkHeb6KNOnhlVe+g2ee+m0MhyfH+jwBGOnv5TcCYSoGl7yLZYayzrhqAl4AxvqDdTq7cfudP4trr/0kirKPLFsZ6R3WBJrq51mfY7RJ+3Yyp2Y2aZ8XBJtyrHcW2mTtv2ksE3Ttv7nWGYCA+371co41iYiI6KzgoIKIiIjOqmaWwqrKkWXLKIo+rC2QpkubejcBc2YyXCAYNe/YWWWEU8850VTeeQcpBKwt0evtw4mTr+H7j/07vPvOD9uG9U35oFQqZkp5B0BAKR3P4SyAOtgkRB3QCu2xUipcetnNuPueX8Ke3Vej3z8OrZOYYVU3dY9PybfPUQg5HmRqzAhIxU2bZwFcJOg169jxXytRFOvQOkWa9pDna21JIWcZJCIiorOJAwsiIiL6QDx85NUQZ59T8N5CKdOWzDUZRY3RmQY3ltuFBWYpRHv8zHLEkeOFkPDBbcyK2GhmCwweEAJJ0sNwcBIBAWm6hKMvfhPff/zfQakE1uZwzrYz7LUlg7LOlqozsppt3jsopaF1BudK3P3xX8L1N34ORbEOAYFOdzfKsg+EOsjVZIU1T61+3kKqzYE3bF32t+Usg1N7ZNVbJ4JXTQDOmA6cq+rZBh28d3jwvms4viQiIqKzjgMMIiIi+sA8eOiFEJueB5RFHyapG6BPZGItPNPgyPLouqkBsC2CWG0j9JHyPITQBrF8cHC2glQ6ZlGFAOcsimIN3/zDf4oiX0NZDjCehbXRWyuW+smx7Ksk6SLNlvG5P/W/IU2XY6aVEPDewTsLpU07Q2Lz3DY9v+Y5LxS8qrduI/NqXq+sjUNl3Xh+gCTtQQiBshjg4YM3cWxJREREHwgOMoiIiOgD9ehXXg9NeV3M0vF1D6eYldQEqpQyAAKcrdosJmBGk/a4YWzd3CDYyP5j59kiyDWp2cc7hxd++Lt4/vnfgXe2ff7OVWON3Zt1ACCVxi23/lncdNPn2z5ZU8sBgbnBqVnr4sPFG7VPrpsMUkmpYuaYs/VMiRv9vprgnBDx31FKhfu/+BGOK4mIiOgDw4EGERERfSgOHX4lOFchSTooyyHSdAnW5lDK1IEsD2tLKGXGMqq2au7eLI8Fq7YIYs0KVo2tn7K9IaRC8A4nT76O7377X2Jt7Z22rK4J1kml4J2DlBJLS5fiE5/6m9i956qYYeXt5t8zrcfUrEDVzH5VG3uMrt9qlsHx4wWa4KIxnXa9tSWSpIOqyutZCIdQyuDggWs5niQiIqIPHAccRERE9KF5+MirIZafiViOl6+h090NIQSqKod3Fmm2hKoqRo4Km4JYi2VixbUbuy3WIH7T+cc2bBw3Ovvgc898Az98/r8DQNu0PfhYBnjTLX8Gt93+FyDFxmyErSlBK2BKZtaWjdY3jpxcv1Xm1ca+G9ubfmVKGWidwnuHweB9dDq72uUQPPtdERER0YeGgw4iIiL6UB06/HKQUtdBkhxKaeT5GqTUSNMl5MNTUDoBMKNBe3zQnq9pdt4+btbPCGS127ZRPjgtoOXrAFWSdGGrHMePH8W3/+RfYDg4AUCg292DT/7438S+fddDmwxVOUBAHeCasNDMgiPrN88IOD2gNVYiuGXW1cay9y7OKjhchQ8Onc5uhOChlIG1BULwOHjgOo4jiYiI6EPDgQcRERGdEw8+/KOgdYpYVtgFEFBV+UgZ3oaZsxTOyKSaDDhNBrO27I01aSKo5UMsr/POoijWkSRdBATYqsDjj/8GAODjH/9lGJMBAMpygDRdglQatso3zcK4UCbWpqyrWVlYM2YZHF3eYpZBrZO2nFMICWsLaJ2iqoY49MCNHD8SERHRh44DECIiIjpnHvnysaBNhnx4CmOz5QkxEXSanlE1GshapK/VIrMdjv3OGQGtqhzCmAwm6aK//h6MyaB0grIYoLe0DwDQXz+OJO3CuQpVlaPX24eqHKCyRRvYmjQvE2ur2QHn9suakXG1+bxx2XuHptQzhIA0XUJZDtjvioiIiM4ZDkKIiIjonHrw0Auhu7QPg/XjSNIevLdjfaJGA1eLBKBOJ5A1GSzbKpgVG8175MNVLK9cjsHgBLRKYhaWLQEARqcAAOdKdLp7sLb2DrJsBVJIWFe259qqfDAuTi/123T8ln2uNrZuOs/I4xACjMlQlkP0enuxtvo2HnnoFo4biYiI6JzhQISIiIjOC4e/+mawtkQIvi6xmx5cmpmJtUBPq3mN3jcFsSaOHV8dA2xKJyjLAYzJ4J0dK9lrenPJuiF6mvRgbbG5H9WoaTMRzsma2jJ4Va9fNPNqfJ8AKTUe+NJVHC8SERHROccBCREREZ03Dh1+OcRG4SW0TlHka0izZYTgYW0Ba0uk6RK8t+0xo/2xFuptNWPGwS2bvo+v2P6LGzUzeNSu2bRt1syEm7ZNzaoa73MlpUZRrEPrBFqnEEK273Xsd5XAuYqN2omIiOi8wUEJERERnXcOf/WtMBi8j+WV/RgOTkIIAa2TGGgp+mMz+c0tBzztINaszKszDFxN2By4areMbT/T4NXk72pmGYyBwRIhBHS6u7G2+ha63b048IX9HCMSERHReYWDEyIiIjovPfLlY0EIMRKwEgjeIUm7bZ+pxnZ6Wm1qzD6ld9bmQNUWGVnbNC/janL7ZC+rTeunbZsTvALiLINlMYCQCkAYCWgFlgwSERHReYkDFCIiIjpvHXzkpZB1VlAWfSRJF3m+huAdlDYAZjV4B6Y2eY8LY+ffXsP38SPPzLxeVwv2tprcNqVJ+6bz1o+drSCkQpYtoywHSNIe8uEqDj1wA8eGREREdF7iIIWIiIjOe49+5fUwHJ5Clq0ghFA3UZ/dfH2hJu1blBduytT6kEzLuNpOttX4uun7CSEhhECer6LT2YX7v/gRjgmJiIjovMbBChEREe0IX/7H74V8eApJMllCuL1A1tR9J4NWs2YfrLfPnEVwQVueZ7L31dym74sHrhq6nj0x6+zCl/7RJRwPEhER0XmPAxYiIiLaUQ4dfiU0QZkte181W2c0Zz+dhu8fmG01Zt/Yc/r6yf3H9wsh4OCBazkOJCIioh2DAxciIiLacR4+8mobVdp+EGtj303r55UPju43c/bABW1xrqllhNvIuhpfvznI9eB913AMSERERDsKBy9ERES0Yx3+6pvB2gIhBBjTQZ6vwpgOvLcQQkBKjRA8rC0hpUIIHkLI9viFMrM2Vm48PMP+WPN6WsVVW2daNa/Fewetk/qxRQgBUmpU1RBZtoKqGkIIAa1THPjCFRz7ERER0Y7EQQwRERHteIcOvxyk1PDeAQjQOkVV5QAAZ0tIZZCmSyiKtbEAFjA7iDW+bdOGM3vCW2ZNja2dui0EjzRdRlGsw7sKSicAAGMyWFsAEJBSwXuLgweu45iPiIiIdjQOZoiIiOiC8NCjR4MxWRu4AgAhJLROIYREv38cxmQIIUwJBk0GpLYRzDpD84JWs/ZpXkNV5ej19tVZZkU9O2PUvBcP3X89x3tERES043FAQ0RERBeU2B9LIAQHKTXyfA1KapikAyn1pkDPqNlBqg+6kft2MrI2AnPeW1TlEM5bZNlyXTqpAAT2uSIiIqILCgc2REREdEF6+MhrAQhQysDaEt67tm+UlNP6YE03ffuZBrQW6Xs1e7v3fuS1KGidwLkKgMCD913N8R0RERFdcDjAISIiogvaI18+FpqSOyEEnLMTe8yfvXCaWRlci5rswzV/3/HZBBtKaYQQ2nLCB750Fcd1REREdMHiQIeIiIguCgcfeSkYk8K5CkLIiYDVyAyDCwSyzrQf1lbZVpv3EWPrQ/BQyqCqChx64AaO54iIiOiCxwEPERERXVQOHX4lNMGhMwlifZDmBa+A+PwOHriW4zgiIiK6aHDgQ0RERBel0VkLpdRQKjZ4BwS8t5BSA4glekoZhBDgXAkp9VkpIfTeQqmkLmus6uDU+O/WOoVzFt5bzipIREREFzUOgIiIiOii9uhX3gjOVXC2RJotw9qiLs/LoXUCawtIqVCWQ3S7e1CW/TrAdPq8t0iSHgaDE0iSDrx30DqFtSWMyeBcBa1TFPkalE6glMH9X7yS4zYiIiK6aHEgRERERFR7+MirocmCEkJAqaTNjlIqQVGsI017qKr8jH6PMRmKoo80XYJzZZvl1TxuMrAevO8ajtWIiIiIwAAWERER0UyPfPlY8N7CewdjMlhbQgi5rVkEpwnBIwQPrZO6hFFBSs2ZBImIiIhm4CCJiIiIaEGHv/pWqKrhWQlgGdPBgS/s51iMiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiIiLbj/wd0PY/piCMhpAAAAABJRU5ErkJggg=="
+# Served through Streamlit static file serving (.streamlit/config.toml), so a rerun only
+# carries the URL. The ?v= content hash lets browsers keep the file until it changes.
+def static_url(name):
+    digest = hashlib.md5((Path(__file__).parent / "static" / name).read_bytes()).hexdigest()[:8]
+    return f"app/static/{name}?v={digest}"
+
+LOGO_URL = static_url("logo-104.png")        # 52px login logo at 2x
+LOGO_HEADER_URL = static_url("logo-76.png")  # 38px header logo at 2x
 
 # ---------- PAGE CONFIG ----------
 st.set_page_config(page_title="ParkOS", layout="wide", page_icon="🅿️", initial_sidebar_state="collapsed")
 
-# ---------- AUTO REFRESH ----------
-st_autorefresh(interval=30000, key="refresh")  # Refresh every 30s — countdown handled by JS
-
 # ---------- STYLESHEET ----------
-st.markdown("""
-<style>
-@import url('https://fonts.googleapis.com/css2?family=Outfit:wght@300;400;500;600;700;800&family=JetBrains+Mono:wght@400;500;600&display=swap');
-
-:root {
-    --bg: #080A0F;
-    --bg-grad: radial-gradient(ellipse 80% 60% at 50% -20%, rgba(99,102,241,0.15) 0%, transparent 70%);
-    --surface: #0F1117;
-    --surface-2: #161923;
-    --surface-3: #1E2230;
-    --border: rgba(255,255,255,0.06);
-    --border-hover: rgba(255,255,255,0.12);
-    --border-active: rgba(99,102,241,0.4);
-    --text-1: #F1F2F6;
-    --text-2: #9397B0;
-    --text-3: #4B5068;
-    --accent: #6366F1;
-    --accent-2: #818CF8;
-    --accent-soft: rgba(99,102,241,0.1);
-    --green: #10B981;
-    --green-soft: rgba(16,185,129,0.08);
-    --green-border: rgba(16,185,129,0.2);
-    --red: #EF4444;
-    --red-soft: rgba(239,68,68,0.08);
-    --amber: #F59E0B;
-    --amber-soft: rgba(245,158,11,0.1);
-    --radius: 14px;
-    --radius-sm: 8px;
-    --radius-xs: 5px;
-    --font: 'Outfit', sans-serif;
-    --font-mono: 'JetBrains Mono', monospace;
-    --shadow-sm: 0 1px 3px rgba(0,0,0,0.3), 0 1px 2px rgba(0,0,0,0.2);
-    --shadow: 0 4px 24px rgba(0,0,0,0.4);
-    --shadow-lg: 0 8px 40px rgba(0,0,0,0.5);
-    --shadow-accent: 0 4px 20px rgba(99,102,241,0.25);
-}
-
-*, *::before, *::after { box-sizing: border-box; margin: 0; }
-html, body, .stApp {
-    background: var(--bg)!important;
-    font-family: var(--font);
-    color: var(--text-1);
-}
-
-/* ── Kill Streamlit's rerun fade/flicker ── */
-.stApp > div, .main, .block-container,
-[data-testid="stAppViewContainer"],
-[data-testid="stVerticalBlock"],
-[data-testid="stHorizontalBlock"],
-[data-testid="element-container"],
-iframe, .stMarkdown, .stButton,
-.stTextInput, .stSelectbox, .stDateInput {
-    animation: none!important;
-    transition: none!important;
-    opacity: 1!important;
-}
-/* Streamlit skeleton loader — hide it */
-[data-testid="stSkeleton"] { display: none!important; }
-/* Remove the white flash on rerun */
-.stApp [data-stale="true"] { opacity: 1!important; }
-.stApp [data-stale="true"] * { opacity: 1!important; }
-.stApp::before {
-    content: '';
-    position: fixed;
-    inset: 0;
-    background: var(--bg-grad);
-    pointer-events: none;
-    z-index: 0;
-}
-.main.block-container {
-    padding: 1.5rem 1.25rem 4rem!important;
-    max-width: 480px!important;
-    margin: 0 auto!important;
-    position: relative;
-    z-index: 1;
-}
-
-/* Desktop layout */
-@media (min-width: 769px) {
-    .main.block-container {
-        padding: 2rem 2rem 4rem!important;
-        max-width: 900px!important;
-    }
-}
-
-p, li { color: var(--text-1); font-size: 0.9rem; line-height: 1.6; }
-
-::-webkit-scrollbar { width: 3px; height: 3px; }
-::-webkit-scrollbar-track { background: transparent; }
-::-webkit-scrollbar-thumb { background: var(--border-hover); border-radius: 9999px; }
-
-#MainMenu, footer, header { visibility: hidden; }
-.stDeployButton, div[data-testid="stDecoration"] { display: none; }
-
-h1, h2, h3, h4 { font-family: var(--font); letter-spacing: -0.02em; }
-
-/* ── Section label ── */
-.section-label {
-    font-size: 0.65rem;
-    font-weight: 700;
-    letter-spacing: 0.12em;
-    text-transform: uppercase;
-    color: var(--text-3);
-    margin-bottom: 0.875rem;
-    display: flex;
-    align-items: center;
-    gap: 0.5rem;
-}
-.section-label::after {
-    content: '';
-    flex: 1;
-    height: 1px;
-    background: var(--border);
-}
-
-/* ── App Header ── */
-.app-header {
-    display: flex;
-    align-items: center;
-    justify-content: space-between;
-    padding: 1.25rem 0 0.75rem;
-    margin-bottom: 0.25rem;
-    border-bottom: 1px solid var(--border);
-}
-.app-brand {
-    display: flex;
-    align-items: center;
-    gap: 0.75rem;
-}
-.app-icon {
-    width: 36px;
-    height: 36px;
-    background: linear-gradient(135deg, var(--accent) 0%, #818CF8 100%);
-    border-radius: 10px;
-    display: flex;
-    align-items: center;
-    justify-content: center;
-    font-size: 1rem;
-    box-shadow: var(--shadow-accent);
-}
-.app-brand-name {
-    font-size: 1.4rem;
-    font-weight: 800;
-    color: var(--text-1);
-    letter-spacing: -0.04em;
-    line-height: 1;
-}
-.app-brand-sub {
-    font-size: 0.58rem;
-    font-weight: 600;
-    color: var(--text-3);
-    letter-spacing: 0.08em;
-    text-transform: uppercase;
-    line-height: 1;
-    margin-top: 2px;
-}
-.header-right {
-    display: flex;
-    align-items: center;
-    gap: 0.5rem;
-}
-.user-pill {
-    background: var(--surface-2);
-    border: 1px solid var(--border);
-    border-radius: 99px;
-    padding: 5px 12px 5px 6px;
-    display: flex;
-    align-items: center;
-    gap: 7px;
-    font-size: 0.78rem;
-    font-weight: 500;
-    color: var(--text-2);
-}
-.user-avatar {
-    width: 24px;
-    height: 24px;
-    background: linear-gradient(135deg, var(--accent) 0%, #818CF8 100%);
-    border-radius: 50%;
-    display: flex;
-    align-items: center;
-    justify-content: center;
-    font-size: 0.6rem;
-    font-weight: 700;
-    color: white;
-}
-
-/* ── Active session card ── */
-.active-card {
-    background: linear-gradient(135deg, rgba(16,185,129,0.08) 0%, var(--surface) 60%);
-    border: 1px solid var(--green-border);
-    border-radius: var(--radius);
-    padding: 1.25rem;
-    margin-bottom: 1rem;
-    position: relative;
-    overflow: hidden;
-}
-.active-card::before {
-    content: '';
-    position: absolute;
-    top: 0; left: 0; right: 0;
-    height: 2px;
-    background: linear-gradient(90deg, var(--green), transparent 60%);
-}
-.active-card-glow {
-    position: absolute;
-    top: -30px; right: -30px;
-    width: 100px; height: 100px;
-    background: radial-gradient(circle, rgba(16,185,129,0.15) 0%, transparent 70%);
-    pointer-events: none;
-}
-.active-badge {
-    display: inline-flex;
-    align-items: center;
-    gap: 5px;
-    font-size: 0.65rem;
-    font-weight: 700;
-    letter-spacing: 0.1em;
-    text-transform: uppercase;
-    color: var(--green);
-    background: var(--green-soft);
-    border: 1px solid var(--green-border);
-    padding: 3px 8px;
-    border-radius: 99px;
-    margin-bottom: 0.75rem;
-}
-.active-dot {
-    width: 6px; height: 6px;
-    background: var(--green);
-    border-radius: 50%;
-    display: inline-block;
-    box-shadow: 0 0 6px var(--green);
-}
-.active-slot-display {
-    display: flex;
-    align-items: flex-end;
-    gap: 0.75rem;
-    margin: 0.5rem 0 0.75rem;
-}
-.active-slot-label {
-    font-size: 0.65rem;
-    color: var(--text-3);
-    font-weight: 600;
-    letter-spacing: 0.06em;
-    text-transform: uppercase;
-    margin-bottom: 4px;
-}
-.active-slot-num {
-    font-family: var(--font-mono);
-    font-size: 3rem;
-    font-weight: 600;
-    color: var(--text-1);
-    line-height: 1;
-}
-.active-time-block {
-    flex: 1;
-    background: var(--surface-2);
-    border: 1px solid var(--border);
-    border-radius: var(--radius-sm);
-    padding: 0.5rem 0.75rem;
-}
-.active-time-label { font-size: 0.6rem; color: var(--text-3); font-weight: 600; letter-spacing: 0.05em; text-transform: uppercase; }
-.active-time-val { font-family: var(--font-mono); font-size: 0.95rem; color: var(--text-1); font-weight: 500; }
-.active-remaining-bar {
-    display: flex;
-    align-items: center;
-    gap: 0.5rem;
-    padding: 0.625rem 0.875rem;
-    background: var(--surface-2);
-    border: 1px solid var(--border);
-    border-radius: var(--radius-sm);
-    margin-top: 0.25rem;
-}
-.remaining-label { font-size: 0.7rem; color: var(--text-3); font-weight: 500; flex: 1; }
-.remaining-val { font-family: var(--font-mono); font-size: 0.9rem; color: var(--green); font-weight: 600; }
-.vehicle-chip {
-    display: inline-flex;
-    align-items: center;
-    gap: 5px;
-    background: var(--surface-2);
-    border: 1px solid var(--border);
-    border-radius: 6px;
-    padding: 3px 8px;
-    font-family: var(--font-mono);
-    font-size: 0.72rem;
-    color: var(--text-2);
-    margin-bottom: 0.75rem;
-}
-
-/* ── Stats row ── */
-.stats-row {
-    display: grid;
-    grid-template-columns: repeat(2, 1fr);
-    gap: 0.625rem;
-    margin-bottom: 1.25rem;
-}
-.stat-card {
-    background: var(--surface);
-    border: 1px solid var(--border);
-    border-radius: var(--radius);
-    padding: 1rem 1.125rem;
-    position: relative;
-    overflow: hidden;
-}
-.stat-card::after {
-    content: '';
-    position: absolute;
-    bottom: 0; right: 0;
-    width: 40px; height: 40px;
-    border-radius: 50%;
-    background: var(--accent-soft);
-    transform: translate(10px, 10px);
-}
-.stat-label {
-    font-size: 0.65rem;
-    font-weight: 700;
-    letter-spacing: 0.08em;
-    text-transform: uppercase;
-    color: var(--text-3);
-    margin-bottom: 0.35rem;
-}
-.stat-value {
-    font-family: var(--font-mono);
-    font-size: 1.75rem;
-    font-weight: 600;
-    color: var(--text-1);
-    line-height: 1;
-}
-.stat-value.accent { color: var(--accent-2); }
-.stat-value.green { color: var(--green); }
-
-/* ── Empty state ── */
-.empty-card {
-    background: var(--surface);
-    border: 1px dashed var(--border-hover);
-    border-radius: var(--radius);
-    padding: 2rem 1.5rem;
-    text-align: center;
-    margin-bottom: 1rem;
-}
-.empty-icon { font-size: 2rem; margin-bottom: 0.5rem; }
-.empty-title { font-size: 0.9rem; font-weight: 600; color: var(--text-2); margin-bottom: 0.25rem; }
-.empty-sub { font-size: 0.78rem; color: var(--text-3); }
-
-/* ── Booking items ── */
-.booking-card {
-    background: var(--surface);
-    border: 1px solid var(--border);
-    border-radius: var(--radius);
-    overflow: hidden;
-    margin-bottom: 0.625rem;
-    transition: border-color 0.2s;
-}
-.booking-card:hover { border-color: var(--border-hover); }
-.booking-card-inner {
-    display: grid;
-    grid-template-columns: auto 1fr auto;
-    align-items: center;
-    gap: 0.875rem;
-    padding: 0.875rem 1rem;
-}
-.slot-badge {
-    width: 48px;
-    height: 48px;
-    background: var(--surface-3);
-    border: 1px solid var(--border);
-    border-radius: 10px;
-    display: flex;
-    align-items: center;
-    justify-content: center;
-    font-family: var(--font-mono);
-    font-size: 0.88rem;
-    font-weight: 600;
-    color: var(--text-1);
-    flex-shrink: 0;
-}
-.slot-badge.active { background: var(--green-soft); border-color: var(--green-border); color: var(--green); }
-.booking-info { min-width: 0; }
-.status-pill {
-    display: inline-flex;
-    align-items: center;
-    gap: 4px;
-    font-size: 0.6rem;
-    font-weight: 700;
-    letter-spacing: 0.08em;
-    text-transform: uppercase;
-    padding: 2px 7px;
-    border-radius: 99px;
-    margin-bottom: 4px;
-}
-.pill-active { background: var(--green-soft); color: var(--green); border: 1px solid var(--green-border); }
-.pill-upcoming { background: var(--accent-soft); color: var(--accent-2); border: 1px solid rgba(99,102,241,0.2); }
-.pill-completed { background: var(--surface-2); color: var(--text-3); border: 1px solid var(--border); }
-.booking-time-text {
-    font-family: var(--font-mono);
-    font-size: 0.75rem;
-    color: var(--text-2);
-    white-space: nowrap;
-    overflow: hidden;
-    text-overflow: ellipsis;
-}
-.booking-date-text {
-    font-size: 0.7rem;
-    color: var(--text-3);
-    margin-top: 1px;
-}
-
-/* ── Divider ── */
-.divider {
-    border: none;
-    border-top: 1px solid var(--border);
-    margin: 1.5rem 0;
-}
-
-/* ── Step header ── */
-.step-wrap {
-    display: flex;
-    align-items: center;
-    gap: 0.625rem;
-    margin-bottom: 1rem;
-}
-.step-num {
-    width: 24px; height: 24px;
-    border-radius: 50%;
-    background: var(--accent-soft);
-    border: 1px solid rgba(99,102,241,0.25);
-    color: var(--accent-2);
-    font-size: 0.7rem;
-    font-weight: 700;
-    display: inline-flex;
-    align-items: center;
-    justify-content: center;
-    flex-shrink: 0;
-}
-.step-title { font-size: 0.875rem; font-weight: 600; color: var(--text-2); }
-
-/* ── Time pickers ── */
-.time-form {
-    background: var(--surface);
-    border: 1px solid var(--border);
-    border-radius: var(--radius);
-    padding: 1.25rem;
-    margin-bottom: 1rem;
-}
-
-/* ── Slot legend ── */
-.slot-legend {
-    display: flex;
-    gap: 1rem;
-    margin-bottom: 0.875rem;
-    flex-wrap: wrap;
-}
-.legend-item { display: flex; align-items: center; gap: 5px; font-size: 0.72rem; color: var(--text-2); }
-.legend-dot { width: 8px; height: 8px; border-radius: 3px; flex-shrink: 0; }
-.legend-free { background: var(--green); }
-.legend-busy { background: var(--red); }
-.legend-selected { background: var(--accent); }
-
-/* ── Row label ── */
-.row-label {
-    font-size: 0.6rem;
-    letter-spacing: 0.1em;
-    text-transform: uppercase;
-    color: var(--text-3);
-    font-weight: 700;
-    margin-bottom: 0.4rem;
-    display: flex;
-    align-items: center;
-    gap: 0.4rem;
-}
-.row-label::before {
-    content: '';
-    display: inline-block;
-    width: 3px;
-    height: 10px;
-    background: var(--accent);
-    border-radius: 99px;
-}
-
-/* ── Confirm banner ── */
-.confirm-banner {
-    background: linear-gradient(135deg, rgba(99,102,241,0.08) 0%, var(--surface) 60%);
-    border: 1px solid rgba(99,102,241,0.25);
-    border-radius: var(--radius);
-    padding: 1rem 1.25rem;
-    margin: 1rem 0;
-    position: relative;
-    overflow: hidden;
-}
-.confirm-banner::before {
-    content: '';
-    position: absolute;
-    top: 0; left: 0; right: 0;
-    height: 2px;
-    background: linear-gradient(90deg, var(--accent), transparent 60%);
-}
-.confirm-slot-big {
-    font-family: var(--font-mono);
-    font-size: 2rem;
-    font-weight: 600;
-    color: var(--text-1);
-    line-height: 1;
-    margin: 0.25rem 0;
-}
-.confirm-time {
-    font-size: 0.78rem;
-    color: var(--text-2);
-    font-family: var(--font-mono);
-}
-
-/* ── Warning / note ── */
-.warn-note {
-    font-size: 0.78rem;
-    color: var(--amber);
-    background: var(--amber-soft);
-    border: 1px solid rgba(245,158,11,0.2);
-    border-radius: var(--radius-sm);
-    padding: 0.625rem 1rem;
-    margin-top: 0.625rem;
-}
-.lock-card {
-    background: var(--surface);
-    border: 1px solid var(--border);
-    border-radius: var(--radius);
-    padding: 2rem 1.25rem;
-    text-align: center;
-}
-.lock-icon { font-size: 1.75rem; margin-bottom: 0.5rem; }
-.lock-title { font-size: 0.95rem; font-weight: 600; color: var(--text-2); margin-bottom: 0.375rem; }
-.lock-sub { font-size: 0.78rem; color: var(--text-3); line-height: 1.5; }
-
-/* ── Login page ── */
-.login-wrap {
-    min-height: 100vh;
-    display: flex;
-    flex-direction: column;
-    align-items: center;
-    justify-content: center;
-    padding: 1.5rem;
-}
-.login-card {
-    width: 100%;
-    max-width: 380px;
-    background: var(--surface);
-    border: 1px solid var(--border);
-    border-radius: calc(var(--radius) * 1.5);
-    padding: 2rem;
-    box-shadow: var(--shadow-lg);
-}
-.login-logo {
-    display: flex;
-    align-items: center;
-    gap: 0.625rem;
-    margin-bottom: 0.25rem;
-}
-.login-logo-icon {
-    width: 40px; height: 40px;
-    background: linear-gradient(135deg, var(--accent) 0%, #818CF8 100%);
-    border-radius: 12px;
-    display: flex;
-    align-items: center;
-    justify-content: center;
-    font-size: 1.1rem;
-    box-shadow: var(--shadow-accent);
-}
-.login-logo-text {
-    font-size: 1.75rem;
-    font-weight: 800;
-    letter-spacing: -0.05em;
-    color: var(--text-1);
-}
-.login-tagline { font-size: 0.78rem; color: var(--text-3); margin-bottom: 1.75rem; }
-
-/* ── Streamlit overrides ── */
-.stTextInput > label, .stDateInput > label, .stTimeInput > label, .stSelectbox > label {
-    font-family: var(--font)!important;
-    font-size: 0.7rem!important;
-    font-weight: 700!important;
-    letter-spacing: 0.08em!important;
-    text-transform: uppercase!important;
-    color: var(--text-3)!important;
-    margin-bottom: 4px!important;
-}
-.stTextInput input, .stDateInput input, .stTimeInput input {
-    background: var(--surface-2)!important;
-    border: 1px solid var(--border)!important;
-    border-radius: var(--radius-sm)!important;
-    color: var(--text-1)!important;
-    font-family: var(--font-mono)!important;
-    font-size: 0.9rem!important;
-    padding: 0.625rem 0.875rem!important;
-    transition: border-color 0.2s, box-shadow 0.2s!important;
-    min-height: 44px!important;
-}
-.stTextInput input:focus, .stDateInput input:focus {
-    border-color: var(--accent)!important;
-    box-shadow: 0 0 0 3px rgba(99,102,241,0.15)!important;
-    outline: none!important;
-}
-/* Override BaseWeb's red/pink focus ring on input containers */
-.stTextInput > div:focus-within,
-.stTextInput > div > div:focus-within {
-    border-color: var(--accent)!important;
-    box-shadow: 0 0 0 3px rgba(99,102,241,0.15)!important;
-    outline: none!important;
-}
-div[data-baseweb="input"]:focus-within,
-div[data-baseweb="base-input"]:focus-within {
-    border-color: var(--accent)!important;
-    box-shadow: 0 0 0 3px rgba(99,102,241,0.15)!important;
-    outline: none!important;
-}
-div[data-baseweb="input"] input:focus,
-div[data-baseweb="base-input"] input:focus {
-    outline: none!important;
-    box-shadow: none!important;
-}
-/* Kill any red/pink coming from BaseWeb theme */
-[data-baseweb="input"] { border-color: var(--border)!important; }
-[data-baseweb="input"]:focus-within { border-color: var(--accent)!important; box-shadow: 0 0 0 3px rgba(99,102,241,0.15)!important; }
-
-/* Selectbox */
-div[data-baseweb="select"] > div {
-    background: var(--surface-2)!important;
-    border: 1px solid var(--border)!important;
-    border-radius: var(--radius-sm)!important;
-    color: var(--text-1)!important;
-    min-height: 44px!important;
-}
-div[data-baseweb="select"] > div:focus-within {
-    border-color: var(--accent)!important;
-    box-shadow: 0 0 0 3px rgba(99,102,241,0.12)!important;
-}
-div[data-baseweb="popover"] { background: var(--surface-2)!important; border: 1px solid var(--border)!important; border-radius: var(--radius)!important; }
-[data-baseweb="menu"] { background: var(--surface-2)!important; }
-[data-baseweb="option"] { background: var(--surface-2)!important; color: var(--text-1)!important; font-size: 0.88rem!important; }
-[data-baseweb="option"]:hover, [aria-selected="true"] { background: var(--surface-3)!important; }
-
-/* Buttons */
-.stButton > button {
-    font-family: var(--font)!important;
-    font-size: 0.88rem!important;
-    font-weight: 600!important;
-    border-radius: var(--radius-sm)!important;
-    transition: all 0.18s ease!important;
-    min-height: 44px!important;
-    letter-spacing: 0.01em!important;
-}
-.stButton > button[kind="primary"] {
-    background: linear-gradient(135deg, var(--accent) 0%, #818CF8 100%)!important;
-    border: none!important;
-    color: #fff!important;
-    box-shadow: var(--shadow-accent)!important;
-}
-.stButton > button[kind="primary"]:hover {
-    box-shadow: 0 6px 24px rgba(99,102,241,0.4)!important;
-    transform: translateY(-1px)!important;
-}
-.stButton > button[kind="secondary"] {
-    background: transparent!important;
-    border: 1px solid var(--border)!important;
-    color: var(--text-3)!important;
-    font-size: 0.78rem!important;
-    min-height: 34px!important;
-    padding: 0 0.75rem!important;
-}
-.stButton > button[kind="secondary"]:hover {
-    border-color: #3B82F6!important;
-    color: #3B82F6!important;
-    background: rgba(59,130,246,0.08)!important;
-}
+st.markdown(f'<link rel="stylesheet" href="{static_url("parkos.css")}">', unsafe_allow_html=True)
 
-/* Slot buttons */
-.stButton > button[key*="slot_"] {
-    height: 48px!important;
-    font-family: var(--font-mono)!important;
-    font-size: 0.8rem!important;
-    font-weight: 600!important;
-    padding: 0!important;
-}
-.stButton > button[key*="slot_"]:hover {
-    border-color: #3B82F6!important;
-    color: #3B82F6!important;
-    background: rgba(59,130,246,0.08)!important;
-}
-.stButton > button[key*="slot_"]:disabled {
-    border-color: #EF4444!important;
-    color: #EF4444!important;
-    background: rgba(239,68,68,0.08)!important;
-    opacity: 1!important;
-    cursor: not-allowed!important;
-}
-
-/* Alerts */
-div[data-testid="stAlert"] {
-    background: var(--surface)!important;
-    border-radius: var(--radius)!important;
-    border: 1px solid var(--border)!important;
-    font-size: 0.85rem!important;
-}
-
-/* Metrics */
-div[data-testid="stMetric"] {
-    background: var(--surface)!important;
-    border: 1px solid var(--border)!important;
-    border-radius: var(--radius)!important;
-    padding: 1rem 1.25rem!important;
-}
-
-/* Tabs */
-.stTabs [data-baseweb="tab-list"] {
-    background: var(--surface)!important;
-    border: 1px solid var(--border)!important;
-    border-radius: var(--radius-sm)!important;
-    padding: 3px!important;
-    gap: 2px!important;
-}
-.stTabs [data-baseweb="tab"] {
-    background: transparent!important;
-    border: none!important;
-    color: var(--text-2)!important;
-    font-size: 0.85rem!important;
-    font-weight: 600!important;
-    padding: 0.5rem 1rem!important;
-    border-radius: var(--radius-xs)!important;
-    transition: all 0.2s!important;
-    flex: 1!important;
-    text-align: center!important;
-    justify-content: center!important;
-}
-.stTabs [data-baseweb="tab"]:hover { color: var(--text-1)!important; }
-.stTabs [aria-selected="true"] {
-    background: var(--surface-3)!important;
-    color: var(--text-1)!important;
-    box-shadow: var(--shadow-sm)!important;
-}
-.stTabs [data-baseweb="tab-panel"] { padding-top: 1.25rem!important; }
+# ---------- DATABASE ----------
+def get_config(name, default=None):
+    """Environment variables override .streamlit/secrets.toml."""
+    if name in os.environ:
+        return os.environ[name]
+    try:
+        return st.secrets.get(name, default)
+    except FileNotFoundError:
+        return default
 
-div[data-testid="stHorizontalBlock"] { gap: 0.4rem!important; }
+@st.cache_resource
+def init_tracer() -> Tracer:
+    # Off unless TRACE=true; the Prometheus endpoint and JSONL file are further opt-ins
+    tracer = Tracer(enabled=str(get_config("TRACE", "false")).lower() == "true",
+                    keep=int(get_config("TRACE_KEEP", 50)), jsonl_path=get_config("TRACE_JSONL"))
+    port = get_config("TRACE_PROMETHEUS_PORT")
+    if tracer.enabled and port:
+        serve_prometheus(tracer, int(port))
+    return tracer
+
+tracer = init_tracer()
+
+def count_deltas():
+    # Streamlit has no public hook on outgoing messages, so wrap this run's enqueue
+    ctx = get_script_run_ctx()
+    enqueue = getattr(ctx, "_enqueue", None)
+    if enqueue is None or getattr(enqueue, "traced", False):
+        return
+    def traced_enqueue(msg):
+        if msg.WhichOneof("type") == "delta":
+            tracer.emitted(msg.ByteSize())
+        enqueue(msg)
+    traced_enqueue.traced = True
+    ctx._enqueue = traced_enqueue
+
+def begin_trace(run):
+    """Trace this run, closing the session's previous trace (which may have ended in st.stop())."""
+    trace = tracer.begin(run, st.session_state.pop("rerun_trace", None))
+    if trace is not None:
+        st.session_state.rerun_trace = trace
+        count_deltas()
+    return trace
+
+def traced_fragment(name):
+    """A fragment-only rerun gets a trace of its own; in a full rerun the fragment is one section."""
+    def decorate(fn):
+        @wraps(fn)
+        def run(*args, **kwargs):
+            ctx = get_script_run_ctx()
+            if not (tracer.enabled and ctx is not None and ctx.fragment_ids_this_run):
+                tracer.mark(name)
+                return fn(*args, **kwargs)
+            trace = begin_trace(f"fragment:{name}")
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                tracer.finish(trace)
+        return run
+    return decorate
+
+trace = begin_trace("page")
+tracer.mark("init")
 
-/* Expander */
-details { border: 1px solid var(--border)!important; border-radius: var(--radius)!important; background: var(--surface)!important; }
-summary { padding: 0.875rem 1rem!important; font-size: 0.85rem!important; color: var(--text-2)!important; font-weight: 600!important; }
+@st.cache_resource
+def init_store() -> BookingStore:
+    # BOOKING_STORE = "supabase" (default) or "sqlite" for offline runs and load tests
+    backend = get_config("BOOKING_STORE", "supabase")
+    if backend == "sqlite":
+        store = create_store("sqlite", path=get_config("SQLITE_PATH", ":memory:"))
+        return TracedStore(store, tracer) if tracer.enabled else store
+    # One pooled HTTP client shared by every session; see README for the knobs
+    http = HttpSettings(
+        max_connections=int(get_config("SUPABASE_POOL_SIZE", 100)),
+        max_keepalive=int(get_config("SUPABASE_KEEPALIVE", 20)),
+        keepalive_expiry=float(get_config("SUPABASE_KEEPALIVE_EXPIRY", 30)),
+        http2=str(get_config("SUPABASE_HTTP2", "true")).lower() == "true",
+        connect_timeout=float(get_config("SUPABASE_CONNECT_TIMEOUT", 5)),
+        timeout=float(get_config("SUPABASE_TIMEOUT", 15)),
+        retries=int(get_config("SUPABASE_RETRIES", 2)),
+        backoff=float(get_config("SUPABASE_RETRY_BACKOFF", 0.2)),
+    )
+    store = create_store(backend, url=get_config("SUPABASE_URL"), key=get_config("SUPABASE_KEY"), http=http)
+    # Times every store call against the rerun that made it
+    return TracedStore(store, tracer) if tracer.enabled else store
+
+store = init_store()
 
-/* Date input */
-div[data-baseweb="calendar"] { background: var(--surface-2)!important; border: 1px solid var(--border)!important; border-radius: var(--radius)!important; }
+ist_timezone = pytz.timezone('Asia/Kolkata')
 
-</style>
-""", unsafe_allow_html=True)
+@st.cache_resource
+def init_service() -> BookingService:
+    # Shared by every session: the occupancy index (rebuilt from the store at most every
+    # OCCUPANCY_MAX_AGE seconds), per-user booking lists and the change feed tying them together
+    service = BookingService.create(store, clock=lambda: datetime.now(ist_timezone),
+                                    occupancy_max_age=float(get_config("OCCUPANCY_MAX_AGE", 15)),
+                                    cache_size=int(get_config("BOOKING_CACHE_SIZE", 4096)),
+                                    profile_cache_size=int(get_config("PROFILE_CACHE_SIZE", 4096)),
+                                    profile_ttl=float(get_config("PROFILE_CACHE_TTL", 600)),
+                                    layout_ttl=float(get_config("LAYOUT_TTL", 300)),
+                                    heatmap_ttl=float(get_config("HEATMAP_TTL", 60)),
+                                    dashboard_ttl=float(get_config("DASHBOARD_TTL", 60)))
+    if get_config("BOOKING_STORE", "supabase") == "supabase" and str(get_config("SUPABASE_REALTIME", "true")).lower() == "true":
+        start_realtime_bridge(get_config("SUPABASE_URL"), get_config("SUPABASE_KEY"), service.feed)
+    # Moves bookings that ended ARCHIVE_RETENTION_DAYS ago to bookings_archive; off by
+    # default, for deployments that run scripts/archive_bookings.py from cron instead
+    archive_every = float(get_config("ARCHIVE_EVERY", 0))
+    if archive_every > 0:
+        start_archiver(store, service.occupancy.clock, timedelta(days=float(get_config("ARCHIVE_RETENTION_DAYS", 30))),
+                       archive_every, batch_size=int(get_config("ARCHIVE_BATCH_SIZE", 5000)))
+    # Folds queued booking changes into the dashboard rollups; 0 leaves it to
+    # scripts/booking_rollups.py and the dashboard's refresh button
+    rollup_every = float(get_config("ROLLUP_REFRESH_EVERY", 60))
+    if rollup_every > 0:
+        start_refresher(store, rollup_every, batch_size=int(get_config("ROLLUP_BATCH_SIZE", 10000)))
+    return service
+
+service = init_service()
 
-# ---------- DATABASE ----------
 @st.cache_resource
-def init_supabase() -> Client:
-    url = st.secrets["SUPABASE_URL"]
-    key = st.secrets["SUPABASE_KEY"]
-    return create_client(url, key)
+def init_auth() -> Authenticator:
+    # scrypt runs on a bounded pool shared by every session, so a login storm queues
+    # there (or is turned away) instead of tying up script threads
+    return Authenticator(store, workers=int(get_config("LOGIN_WORKERS", 2)),
+                         max_pending=int(get_config("LOGIN_MAX_PENDING", 16)),
+                         n=int(get_config("SCRYPT_N", SCRYPT_N)),
+                         limiter=RateLimiter(max_failures=int(get_config("LOGIN_MAX_FAILURES", 5)),
+                                             window=float(get_config("LOGIN_FAILURE_WINDOW", 300))))
+
+auth = init_auth()
+
+# ---------- SLOT GRID ----------
+# The lot renders as one component (static/slot_grid.js) whatever its size, instead of
+# a column and a button per slot, so reruns don't grow with the number of spaces
+@st.cache_resource
+def init_slot_grid():
+    static = Path(__file__).parent / "static"
+    return st.components.v2.component("slot_grid", html='<div class="pg"></div>',
+                                      css=(static / "slot_grid.css").read_text(),
+                                      js=(static / "slot_grid.js").read_text())
 
-supabase = init_supabase()
+slot_grid = init_slot_grid()
+PARKING_LOT = get_config("PARKING_LOT", DEFAULT_LOT)
 
 # ---------- HELPERS ----------
-def hash_password(p): return hashlib.sha256(p.encode()).hexdigest()
+# Usernames that see operator panels, e.g. "alice,bob"
+ADMIN_USERS = {u.strip() for u in str(get_config("ADMIN_USERS", "")).split(",") if u.strip()}
 
-def get_user(u, p):
-    res = supabase.table("users").select("id, vehicle_number").eq("username", u).eq("password_hash", hash_password(p)).execute()
-    if res.data:
-        row = res.data[0]
-        return (row["id"], row["vehicle_number"])
-    return None
-
-def create_user(u, p):
-    try:
-        existing = supabase.table("users").select("id").eq("username", u).execute()
-        if existing.data:
-            return False
-        supabase.table("users").insert({"username": u, "password_hash": hash_password(p)}).execute()
-        return True
-    except Exception:
-        return False
-
-ist_timezone = pytz.timezone('Asia/Kolkata')
+LOGIN_ERRORS = {
+    "invalid": "Incorrect username or password.",
+    "busy": "Lots of people are signing in right now. Please try again in a moment.",
+}
 
 def get_next_30min_slot_tz(dt_tz):
     minutes = dt_tz.minute
@@ -804,22 +197,10 @@ def get_next_30min_slot_tz(dt_tz):
     else:
         return (dt_tz + timedelta(hours=1)).replace(minute=0, second=0, microsecond=0)
 
-def build_time_options(for_date, now_ist=None):
-    standard_slots = [(datetime.strptime(f"{h:02d}:{m:02d}", "%H:%M").strftime("%I:%M %p"),
-                       datetime.strptime(f"{h:02d}:{m:02d}", "%H:%M").time())
-                      for h in range(24) for m in (0, 30)]
-    if for_date == date.today() and now_ist is not None:
-        now_time = now_ist.time().replace(second=0, microsecond=0)
-        now_label = "Now (" + now_ist.strftime("%I:%M %p").lstrip("0") + ")"
-        future_slots = [(label, t) for label, t in standard_slots if t > now_time]
-        return [(now_label, now_time)] + future_slots
-    return standard_slots
-
-def parse_dt(s):
-    dt_obj = datetime.strptime(s.strip(), "%Y-%m-%d %H:%M")
-    if dt_obj.tzinfo is None:
-        return ist_timezone.localize(dt_obj)
-    return dt_obj
+# Entry/exit granularity in minutes: 15, 30 or 60
+slot_table = SLOT_TABLES[int(get_config("SLOT_MINUTES", 30))]
+# Free windows offered when every slot is taken for the chosen one
+NEXT_FREE_SHOWN = 5
 
 # ---------- SESSION STATE ----------
 if 'selected_slot' not in st.session_state:
@@ -827,129 +208,15 @@ if 'selected_slot' not in st.session_state:
 
 # ---------- AUTH PAGE ----------
 if 'user_id' not in st.session_state or st.session_state.user_id is None:
+    tracer.mark("auth")
 
     if 'auth_mode' not in st.session_state:
         st.session_state.auth_mode = 'signin'
 
     st.markdown(f"""
-    <style>
-    /* ── Override Streamlit layout for login page ── */
-    .main.block-container {{
-        max-width: 420px!important;
-        margin: 0 auto!important;
-        padding: 0 1.25rem 3rem!important;
-    }}
-
-    /* Floating card wrapper injected below */
-    .lp-card {{
-        background: #0F1117;
-        border: 1px solid rgba(255,255,255,0.07);
-        border-radius: 20px;
-        padding: 2rem 2rem 1.5rem;
-        margin-bottom: 1rem;
-        position: relative;
-        overflow: hidden;
-        box-shadow: 0 24px 60px rgba(0,0,0,0.5);
-    }}
-    .lp-card::before {{
-        content: '';
-        position: absolute;
-        top: -60px; right: -60px;
-        width: 200px; height: 200px;
-        background: radial-gradient(circle, rgba(99,102,241,0.1) 0%, transparent 65%);
-        pointer-events: none;
-    }}
-    .lp-top {{
-        display: flex;
-        align-items: center;
-        gap: 1rem;
-        margin-bottom: 1.75rem;
-        padding-bottom: 1.25rem;
-        border-bottom: 1px solid rgba(255,255,255,0.06);
-    }}
-    .lp-logo {{
-        width: 52px; height: 52px;
-        object-fit: contain;
-        filter: drop-shadow(0 4px 16px rgba(99,102,241,0.4));
-        flex-shrink: 0;
-    }}
-    .lp-brand-name {{
-        font-family: 'Outfit', sans-serif;
-        font-size: 1.6rem;
-        font-weight: 800;
-        letter-spacing: -0.04em;
-        color: #F1F2F6;
-        line-height: 1;
-    }}
-    .lp-brand-sub {{
-        font-family: 'Outfit', sans-serif;
-        font-size: 0.7rem;
-        color: #4B5068;
-        letter-spacing: 0.07em;
-        text-transform: uppercase;
-        margin-top: 3px;
-    }}
-    .lp-title {{
-        font-family: 'Outfit', sans-serif;
-        font-size: 1.2rem;
-        font-weight: 700;
-        color: #F1F2F6;
-        letter-spacing: -0.02em;
-        margin-bottom: 0.2rem;
-    }}
-    .lp-sub {{
-        font-family: 'Outfit', sans-serif;
-        font-size: 0.78rem;
-        color: #4B5068;
-        margin-bottom: 1.5rem;
-        line-height: 1.5;
-    }}
-    .lp-divider {{
-        display: flex;
-        align-items: center;
-        gap: 0.75rem;
-        margin: 1rem 0;
-    }}
-    .lp-divider-line {{ flex:1; height:1px; background: rgba(255,255,255,0.06); }}
-    .lp-divider-text {{ font-size:0.65rem; color:#4B5068; font-family:'Outfit',sans-serif; letter-spacing:0.1em; text-transform:uppercase; }}
-    .lp-features {{
-        background: #080A0F;
-        border: 1px solid rgba(255,255,255,0.05);
-        border-radius: 14px;
-        padding: 1.1rem 1.25rem;
-        margin-bottom: 1rem;
-    }}
-    .lp-feature {{
-        display: flex;
-        align-items: center;
-        gap: 0.75rem;
-        padding: 0.45rem 0;
-        font-family: 'Outfit', sans-serif;
-        font-size: 0.8rem;
-        color: #6B7090;
-    }}
-    .lp-feature + .lp-feature {{
-        border-top: 1px solid rgba(255,255,255,0.04);
-    }}
-    .lp-feature-dot {{
-        width: 6px; height: 6px;
-        border-radius: 50%;
-        background: #6366F1;
-        flex-shrink: 0;
-        box-shadow: 0 0 6px rgba(99,102,241,0.6);
-    }}
-    .lp-footer {{
-        text-align: center;
-        font-size: 0.68rem;
-        color: #2A2D3E;
-        font-family: 'Outfit', sans-serif;
-        padding-top: 0.5rem;
-    }}
-    </style>
-
     <div class="lp-card">
         <div class="lp-top">
-            <img class="lp-logo" src="{LOGO_B64}" />
+            <img class="lp-logo" src="{LOGO_URL}" />
             <div>
                 <div class="lp-brand-name">ParkOS</div>
                 <div class="lp-brand-sub">Smart Parking Management</div>
@@ -966,14 +233,15 @@ if 'user_id' not in st.session_state or st.session_state.user_id is None:
         p = st.text_input("Password", type="password", key="login_pass", placeholder="Enter your password", label_visibility="collapsed")
         st.markdown("<div style='height:6px'></div>", unsafe_allow_html=True)
         if st.button("Sign In →", type="primary", use_container_width=True):
-            user = get_user(u, p)
-            if user:
-                st.session_state.user_id = user[0]
-                st.session_state.vehicle_number = user[1]
-                st.session_state.username = u
+            result = auth.login(u, p)
+            if result.user:
+                st.session_state.user_id = result.user[0]
+                service.remember_profile(result.user[0], u, result.user[1])
                 st.rerun()
+            elif result.error == "rate_limited":
+                st.error(f"Too many failed attempts. Try again in {int(result.retry_after) + 1} seconds.")
             else:
-                st.error("Incorrect username or password.")
+                st.error(LOGIN_ERRORS[result.error])
         st.markdown("""<div class="lp-divider">
             <div class="lp-divider-line"></div>
             <div class="lp-divider-text">No account yet?</div>
@@ -998,10 +266,13 @@ if 'user_id' not in st.session_state or st.session_state.user_id is None:
         st.markdown("<div style='height:6px'></div>", unsafe_allow_html=True)
         if st.button("Create Account →", type="primary", use_container_width=True):
             if u.strip() and p.strip():
-                if create_user(u, p):
+                created = auth.register(u, p)
+                if created:
                     st.success("✅ Account created! Sign in to continue.")
                     st.session_state.auth_mode = 'signin'
                     st.rerun()
+                elif created is None:
+                    st.error(LOGIN_ERRORS["busy"])
                 else:
                     st.error("That username is already taken.")
             else:
@@ -1031,19 +302,21 @@ if 'user_id' not in st.session_state or st.session_state.user_id is None:
 
 # ---------- MAIN APP ----------
 
-# Fetch username if not set
-if 'username' not in st.session_state:
-    res = supabase.table("users").select("username").eq("id", st.session_state.user_id).execute()
-    st.session_state.username = res.data[0]["username"] if res.data else "User"
+# ── Page reads ── bookings, counters, the profile and the occupancy snapshot are
+# independent, so they are fetched concurrently (mostly from process-wide caches)
+tracer.mark("page_reads")
+page = service.load_page(st.session_state.user_id, PARKING_LOT)
+st.session_state.page_timing = page.timing.as_dict()
 
-username = st.session_state.get('username', 'User')
+username, vehicle_number = page.profile or ("User", None)
 avatar_letter = username[0].upper() if username else "U"
+tracer.mark("header")
 
 # Header — fully in HTML, sign out uses a query param trick via button hidden below
 st.markdown(f"""
 <div class="app-header">
     <div class="app-brand">
-        <img src="{LOGO_B64}" style="width:38px;height:38px;object-fit:contain;flex-shrink:0;filter:drop-shadow(0 2px 8px rgba(99,102,241,0.3));" />
+        <img src="{LOGO_HEADER_URL}" style="width:38px;height:38px;object-fit:contain;flex-shrink:0;filter:drop-shadow(0 2px 8px rgba(99,102,241,0.3));" />
         <div>
             <div class="app-brand-name">ParkOS</div>
             <div class="app-brand-sub">Smart Parking</div>
@@ -1066,7 +339,8 @@ with col_so3:
         st.rerun()
 
 # Vehicle number gate
-if 'vehicle_number' not in st.session_state or st.session_state.vehicle_number is None:
+if not vehicle_number:
+    tracer.mark("vehicle_gate")
     st.markdown("""
     <div style="background:var(--surface);border:1px solid var(--border);border-radius:var(--radius);padding:1.5rem;margin-top:1rem;">
         <div style="font-size:0.65rem;font-weight:700;letter-spacing:0.1em;text-transform:uppercase;color:var(--text-3);margin-bottom:0.5rem;">One-time Setup</div>
@@ -1077,8 +351,8 @@ if 'vehicle_number' not in st.session_state or st.session_state.vehicle_number i
     v = st.text_input("Vehicle Number", placeholder="e.g., TN01 AB1234")
     if st.button("Save & Continue →", type="primary", use_container_width=True):
         if v.strip():
-            supabase.table("users").update({"vehicle_number": v.upper()}).eq("id", st.session_state.user_id).execute()
-            st.session_state.vehicle_number = v.upper(); st.rerun()
+            service.set_vehicle_number(st.session_state.user_id, v.upper())
+            st.rerun()
         else:
             st.error("Please enter a valid vehicle number.")
     st.stop()
@@ -1088,27 +362,22 @@ now_dt_fresh_ist = datetime.now(ist_timezone).replace(second=0, microsecond=0)
 now_dt = now_dt_fresh_ist
 earliest_allowed_dt_ist = get_next_30min_slot_tz(now_dt_fresh_ist)
 
-# ── Fetch bookings (cached for 30s to reduce Supabase calls) ──
-@st.cache_data(ttl=30, show_spinner=False)
-def fetch_bookings(user_id):
-    res = supabase.table("bookings").select("id, slot_number, start_datetime, end_datetime").eq("user_id", user_id).order("start_datetime").execute()
-    return [(r["id"], r["slot_number"], r["start_datetime"], r["end_datetime"]) for r in res.data]
-
-all_user_bookings = fetch_bookings(st.session_state.user_id)
-
-total_bookings = len(all_user_bookings)
-user_current_future = [b for b in all_user_bookings if parse_dt(b[3]) > now_dt]
-past_bookings_list = sorted(
-    [b for b in all_user_bookings if parse_dt(b[3]) <= now_dt],
-    key=lambda x: x[2], reverse=True
-)
-active_booking = next(
-    (b for b in user_current_future if parse_dt(b[2]) <= now_dt <= parse_dt(b[3])), None
-)
+# ── Bookings (cached per user for 30s to reduce Supabase calls; loaded above) ──
+st.session_state.shown_user_version = page.version
+
+# Booking records arrive with parsed datetimes; one pass splits them for the page
+tracer.mark("timeline")
+timeline = classify_bookings(page.bookings, now_dt)
+total_bookings = page.total
+user_current_future = timeline.current_future
+active_booking = timeline.active
 user_has_active_or_future = bool(user_current_future)
-upcoming_count = len([b for b in user_current_future if parse_dt(b[2]) > now_dt])
+upcoming_count = timeline.upcoming_count
+# Next moment a booking starts or ends, when the page has to change without any write
+next_transition = timeline.next_transition
 
 # ── Overview ──
+tracer.mark("overview")
 st.markdown('<div style="height:1.25rem;"></div>', unsafe_allow_html=True)
 st.markdown('<div class="section-label">Overview</div>', unsafe_allow_html=True)
 
@@ -1128,9 +397,9 @@ st.markdown(f"""
 
 # Active session
 if active_booking:
-    _, slot_num, start_str, end_str = active_booking
-    end_dt = parse_dt(end_str)
-    start_dt_active = parse_dt(start_str)
+    slot_num = active_booking.slot_number
+    end_dt = active_booking.end
+    start_dt_active = active_booking.start
     remaining = end_dt - now_dt
     remaining_str = str(remaining).split(".")[0]
     end_ts_ms = int(end_dt.timestamp() * 1000)
@@ -1140,7 +409,7 @@ if active_booking:
     <div class="active-card">
         <div class="active-card-glow"></div>
         <div class="active-badge"><span class="active-dot"></span> Active Session</div>
-        <div class="vehicle-chip">&#128663; {st.session_state.vehicle_number}</div>
+        <div class="vehicle-chip">&#128663; {vehicle_number}</div>
         <div class="active-slot-display">
             <div>
                 <div class="active-slot-label">Slot</div>
@@ -1170,7 +439,7 @@ if active_booking:
             var s = diff % 60;
             el.textContent = pad(h) + ":" + pad(m) + ":" + pad(s);
             el.style.color = diff < 300 ? "#EF4444" : "#10B981";
-            if (diff === 0) {{ setTimeout(function(){{ window.parent.location.reload(); }}, 2000); return; }}
+            if (diff === 0) return;  // watch_for_changes reruns the page once the session ends
             setTimeout(tick, 1000);
         }}
         // Wait for DOM then start
@@ -1192,14 +461,15 @@ else:
     """, unsafe_allow_html=True)
 
 # ── Bookings ──
+tracer.mark("bookings")
 st.markdown('<div style="height:0.5rem;"></div>', unsafe_allow_html=True)
 st.markdown('<hr class="divider">', unsafe_allow_html=True)
 st.markdown('<div class="section-label">Your Bookings</div>', unsafe_allow_html=True)
 
 if user_current_future:
-    for booking_id, slot_number, start_dt_str, end_dt_str in user_current_future:
-        start_dt_obj = parse_dt(start_dt_str)
-        end_dt_obj = parse_dt(end_dt_str)
+    for booking in user_current_future:
+        booking_id, slot_number = booking.id, booking.slot_number
+        start_dt_obj, end_dt_obj = booking.start, booking.end
         is_active_b = (start_dt_obj <= now_dt <= end_dt_obj)
 
         badge_class = "pill-active" if is_active_b else "pill-upcoming"
@@ -1226,8 +496,7 @@ if user_current_future:
             st.markdown("<div style='height:6px;'></div>", unsafe_allow_html=True)
             if st.button(btn_label, key=btn_key, type="secondary", use_container_width=True):
                 if st.session_state.get(f"confirm_{btn_key}", False):
-                    supabase.table("bookings").delete().eq("id", booking_id).execute()
-                    st.cache_data.clear()
+                    service.cancel(st.session_state.user_id, booking_id, slot_number)
                     del st.session_state[f"confirm_{btn_key}"]
                     st.session_state.selected_slot = None
                     st.rerun()
@@ -1238,26 +507,126 @@ else:
     st.markdown('<div class="empty-card" style="padding:1.25rem;"><div class="empty-sub">No current or upcoming bookings.</div></div>', unsafe_allow_html=True)
 
 # Past bookings
-if past_bookings_list:
-    with st.expander(f"📋 Booking History ({len(past_bookings_list)})"):
-        for _, slot_number, start_dt_str, end_dt_str in past_bookings_list:
-            s = parse_dt(start_dt_str)
-            e = parse_dt(end_dt_str)
-            st.markdown(f"""
-            <div class="booking-card" style="opacity:0.55;">
-                <div class="booking-card-inner">
-                    <div class="slot-badge" style="color:var(--text-3);">{slot_number}</div>
-                    <div class="booking-info">
-                        <span class="status-pill pill-completed">Completed</span>
-                        <div class="booking-time-text">{s.strftime('%I:%M %p')} → {e.strftime('%I:%M %p')}</div>
-                        <div class="booking-date-text">{s.strftime('%b %d, %Y')}</div>
-                    </div>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+def history_card(booking):
+    s, e = booking.start, booking.end
+    return (f'<div class="booking-card" style="opacity:0.55;"><div class="booking-card-inner">'
+            f'<div class="slot-badge" style="color:var(--text-3);">{booking.slot_number}</div>'
+            f'<div class="booking-info"><span class="status-pill pill-completed">Completed</span>'
+            f'<div class="booking-time-text">{s:%I:%M %p} → {e:%I:%M %p}</div>'
+            f'<div class="booking-date-text">{s:%b %d, %Y}</div></div></div></div>')
+
+# Loaded only on request, one keyset page at a time; "Load more" reruns just this fragment
+@st.fragment
+@traced_fragment("history")
+def booking_history(user_id):
+    if not st.toggle("Show past bookings", key="show_history"):
+        st.session_state.pop("history_pages", None)
+        return
+    pages = st.session_state.setdefault("history_pages", [])
+    if not pages:
+        pages.append(service.history(user_id))
+    for page in pages:
+        st.markdown("".join(history_card(b) for b in page.bookings), unsafe_allow_html=True)
+    if pages[-1].next_cursor is not None:
+        st.button("Load more", key="history_more", use_container_width=True,
+                  on_click=lambda: pages.append(service.history(user_id, pages[-1].next_cursor)))
+
+past_count = total_bookings - len(user_current_future)
+if past_count > 0:
+    with st.expander(f"📋 Booking History ({past_count})"):
+        booking_history(st.session_state.user_id)
+
+# ── Occupancy heatmap (ADMIN_USERS only) ──
+# Beyond this many cells the chart shows rows instead of single slots
+MAX_HEATMAP_CELLS = 50_000
+
+@st.fragment
+@traced_fragment("heatmap")
+def occupancy_panel(layout):
+    col_from, col_span, col_group = st.columns(3)
+    day = col_from.date_input("From", value=date.today(), key="heatmap_from")
+    span = col_span.radio("Range", ["Day", "Week"], horizontal=True, key="heatmap_span")
+    group = col_group.radio("Show", ["Slots", "Rows"], index=0 if len(layout.slots) <= 60 else 1,
+                            horizontal=True, key="heatmap_group")
+    start = ist_timezone.localize(datetime.combine(day, datetime.min.time()))
+    grid = service.heatmap(layout, start, start + timedelta(days=7 if span == "Week" else 1))
+    if group == "Rows" or grid.size > MAX_HEATMAP_CELLS:
+        grid = by_row(grid, layout)
+    # Naive IST wall times, so the chart reads the same in any browser timezone
+    cells = grid.set_axis(grid.columns.tz_localize(None), axis=1).stack().rename("occupied").rename_axis(["space", "from"]).reset_index()
+    cells["to"] = cells["from"] + timedelta(minutes=BUCKET_MINUTES)
+    chart = alt.Chart(cells).mark_rect().encode(
+        x=alt.X("from:T", title=None), x2="to:T",
+        y=alt.Y("space:N", sort=list(grid.index), title=None),
+        color=alt.Color("occupied:Q", title="Occupied", scale=alt.Scale(domain=[0, 1], scheme="purples"),
+                        legend=alt.Legend(format="%")),
+        tooltip=["space:N", alt.Tooltip("from:T", format="%a %b %d %I:%M %p"), alt.Tooltip("occupied:Q", format=".0%")],
+    ).properties(height=max(160, 14 * len(grid.index)))
+    st.altair_chart(chart, use_container_width=True)
+    lot = grid.mean()
+    st.caption(f"Average occupancy {lot.mean():.0%} · peak {lot.max():.0%} at {lot.idxmax():%a %b %d, %I:%M %p}")
+
+if username in ADMIN_USERS:
+    tracer.mark("heatmap")
+    with st.expander("📊 Occupancy heatmap"):
+        occupancy_panel(page.layout)
+
+# ── Operator dashboard (ADMIN_USERS only) ──
+DASHBOARD_SPANS = {"7 days": 7, "28 days": 28, "90 days": 90}
+
+def share_chart(series, field):
+    # Bars of a 0-1 share, in the series' own order
+    data = series.rename("share").rename_axis(field).reset_index()
+    return alt.Chart(data).mark_bar(color="#6366F1").encode(
+        x=alt.X(f"{field}:N", sort=list(series.index), title=None),
+        y=alt.Y("share:Q", title=None, axis=alt.Axis(format="%")),
+        tooltip=[f"{field}:N", alt.Tooltip("share:Q", format=".1%")],
+    ).properties(height=220)
+
+@st.fragment
+@traced_fragment("dashboard")
+def dashboard_panel(layout):
+    col_span, col_refresh = st.columns([3, 1])
+    span = col_span.radio("Last", list(DASHBOARD_SPANS), index=1, horizontal=True, key="dashboard_span")
+    if col_refresh.button("Refresh now", use_container_width=True, key="dashboard_refresh"):
+        service.refresh_dashboard()
+    end_day = date.today() + timedelta(days=1)
+    util = service.dashboard(layout, end_day - timedelta(days=DASHBOARD_SPANS[span]), end_day)
+
+    col_use, col_peak, col_made, col_noshow = st.columns(4)
+    col_use.metric("Utilization", f"{util.by_slot.mean():.0%}")
+    col_peak.metric("Peak hour", f"{util.peak:.0%}", util.peak_at.strftime("%a %b %d, %I %p") if util.peak_at else None,
+                    delta_color="off", delta_arrow="off")
+    col_made.metric("Bookings", f"{util.bookings:,}")
+    col_noshow.metric("No-show estimate", f"{util.no_show_rate:.1%}", f"{util.late_cancellations:,} late cancels",
+                      delta_color="off", delta_arrow="off")
+    tab_slot, tab_row, tab_hour, tab_weekday = st.tabs(["By slot", "By row", "By hour", "By weekday"])
+    with tab_slot:
+        st.altair_chart(share_chart(util.by_slot, "slot"), use_container_width=True)
+    with tab_row:
+        st.altair_chart(share_chart(util.by_row, "row"), use_container_width=True)
+    with tab_hour:
+        st.altair_chart(share_chart(util.by_hour.rename(index=lambda h: f"{h:02d}:00"), "hour"), use_container_width=True)
+        st.bar_chart(util.bookings_by_hour.rename("bookings starting").rename(index=lambda h: f"{h:02d}:00"), height=160)
+    with tab_weekday:
+        st.altair_chart(share_chart(util.by_weekday, "weekday"), use_container_width=True)
+    refreshed = util.refreshed_at.strftime("%b %d, %I:%M %p") if util.refreshed_at else "never"
+    st.caption(f"From the booking rollups, refreshed {refreshed}. No-shows are estimated from bookings cancelled "
+               f"between {NO_SHOW_BEFORE.seconds // 60} min before they start and {NO_SHOW_AFTER.seconds // 60} min after.")
+
+if username in ADMIN_USERS:
+    tracer.mark("dashboard")
+    with st.expander("🏢 Operator dashboard"):
+        dashboard_panel(page.layout)
 
 # ── Book New Slot ──
+tracer.mark("booking_form")
 st.markdown('<hr class="divider">', unsafe_allow_html=True)
+st.session_state.shown_grid = None
+
+# Left by a successful booking, which reruns the page straight away
+if booking_notice := st.session_state.pop("booking_notice", None):
+    st.success(booking_notice)
 
 if not user_has_active_or_future:
     st.markdown('<div class="section-label">New Booking</div>', unsafe_allow_html=True)
@@ -1273,37 +642,30 @@ if not user_has_active_or_future:
     st.markdown('<div class="time-form">', unsafe_allow_html=True)
     booking_date = st.date_input("Date", min_value=date.today(), key="booking_date_input")
 
-    entry_options = build_time_options(booking_date, now_ist=now_dt_fresh_ist)
-    if not entry_options:
+    entry_labels, entry_times = build_time_options(slot_table, booking_date, now_ist=now_dt_fresh_ist)
+    if not entry_labels:
         st.warning("No available time slots for today. Please select a future date.")
         st.stop()
 
-    entry_labels = [label for label, _ in entry_options]
-    entry_times = [t for _, t in entry_options]
-
     col_en, col_ex = st.columns(2)
     with col_en:
         entry_label = st.selectbox("Entry Time", entry_labels, index=0, key="entry_select")
-    selected_entry_time = entry_times[entry_labels.index(entry_label)]
+    # Only the "Now (...)" label is missing from the table, and it is always first
+    selected_entry_time = slot_table.time_of(entry_label) if entry_label in slot_table.index else entry_times[0]
     start_dt = ist_timezone.localize(datetime.combine(booking_date, selected_entry_time))
 
-    # Exit: 30-min slots strictly after entry time
-    # If entry is "Now" (current minute), build exits from next 30-min boundary onwards
-    all_exit_slots = [(datetime.strptime(f"{h:02d}:{m:02d}", "%H:%M").strftime("%I:%M %p"),
-                       datetime.strptime(f"{h:02d}:{m:02d}", "%H:%M").time())
-                      for h in range(24) for m in (0, 30)]
-    exit_options = [(label, t) for label, t in all_exit_slots if t > selected_entry_time]
-    if not exit_options:
-        exit_options = all_exit_slots  # wrap to next day
-    exit_labels = [label for label, _ in exit_options]
-    exit_times = [t for _, t in exit_options]
+    # Exit: slots strictly after entry time
+    # If entry is "Now" (current minute), exits start from the next slot boundary
+    exit_labels, exit_times = slot_table.after(selected_entry_time)
+    if not exit_labels:
+        exit_labels, exit_times = slot_table.labels, slot_table.times  # wrap to next day
 
     with col_ex:
         default_exit_idx = min(3, len(exit_labels) - 1)
         exit_label = st.selectbox("Exit Time", exit_labels, index=default_exit_idx, key="exit_select")
     st.markdown('</div>', unsafe_allow_html=True)
 
-    selected_exit_time = exit_times[exit_labels.index(exit_label)]
+    selected_exit_time = slot_table.time_of(exit_label)
     end_dt = ist_timezone.localize(datetime.combine(booking_date, selected_exit_time))
 
     next_day_note = False
@@ -1334,83 +696,78 @@ if not user_has_active_or_future:
     </div>
     """, unsafe_allow_html=True)
 
-    @st.cache_data(ttl=15, show_spinner=False)
-    def fetch_blocked(start_str, end_str):
-        _bl = supabase.table("bookings").select("slot_number, start_datetime, end_datetime").execute()
-        return {r["slot_number"] for r in _bl.data
-                if not (r["end_datetime"] <= start_str or r["start_datetime"] >= end_str)}
-    blocked = fetch_blocked(start_dt.strftime("%Y-%m-%d %H:%M"), end_dt.strftime("%Y-%m-%d %H:%M"))
-
-    slots = [f"A{i}" for i in range(1, 11)] + [f"B{i}" for i in range(1, 11)]
-    selected = st.session_state.selected_slot or ""
-
-    def handle_slot_click(slot_name):
+    layout = page.layout
+    slots = layout.slots
+    if st.session_state.selected_slot not in (None, *slots):
+        st.session_state.selected_slot = None   # the layout changed under this session
+
+    def fetch_blocked(start_dt, end_dt):
+        return service.blocked(slots, start_dt, end_dt)
+
+    entry_options = {}
+
+    def form_fields(start, end):
+        """(date, entry label, exit label) that put the window start-end in the form above,
+        or None if the selectors can't express it (e.g. an overnight window not from the last slot)."""
+        day = start.date()
+        if day not in entry_options:
+            entry_options[day] = set(build_time_options(slot_table, day, now_ist=now_dt_fresh_ist)[0])
+        entry = start.strftime("%I:%M %p")
+        if entry not in entry_options[day]:
+            return None
+        exit_labels = slot_table.after(start.time())[0] or slot_table.labels
+        overnight = end.time() <= start.time()
+        exit_ = end.strftime("%I:%M %p")
+        if exit_ not in exit_labels or end.date() != day + timedelta(days=overnight):
+            return None
+        return day, entry, exit_
+
+    def use_free_window(slot_name, fields):
+        # A callback, so the form's widgets can be set before they are drawn
+        st.session_state.booking_date_input, st.session_state.entry_select, st.session_state.exit_select = fields
+        st.session_state.selected_slot = slot_name
+        st.session_state.free_window_picked = True
+
+    def handle_slot_click():
+        slot_name = st.session_state.slot_grid.clicked
         if st.session_state.selected_slot == slot_name:
             st.session_state.selected_slot = None
         else:
             st.session_state.selected_slot = slot_name
 
-    # Force st.columns to stay horizontal on mobile via CSS
-    # Then render real st.buttons — clicks work 100% reliably
-    st.markdown("""<style>
-    /* Force slot columns horizontal on all screen sizes */
-    [data-testid="stHorizontalBlock"]:has(button[kind="secondary"]) {
-        flex-wrap: nowrap !important;
-        overflow: hidden !important;
-    }
-    [data-testid="stHorizontalBlock"]:has(button[kind="secondary"]) > div {
-        min-width: 0 !important;
-        flex: 1 !important;
-    }
-    [data-testid="stHorizontalBlock"]:has(button[kind="secondary"]) button {
-        height: 36px !important;
-        font-size: 0.62rem !important;
-        padding: 0 !important;
-        min-height: unset !important;
-        white-space: nowrap !important;
-    }
-    [data-testid="stHorizontalBlock"]:has(button[kind="primary"]) {
-        flex-wrap: nowrap !important;
-        overflow: hidden !important;
-    }
-    [data-testid="stHorizontalBlock"]:has(button[kind="primary"]) > div {
-        min-width: 0 !important;
-        flex: 1 !important;
-    }
-    [data-testid="stHorizontalBlock"]:has(button[kind="primary"]) button {
-        height: 36px !important;
-        font-size: 0.62rem !important;
-        padding: 0 !important;
-        min-height: unset !important;
-    }
-    </style>""", unsafe_allow_html=True)
-
-    for row_prefix in ['A', 'B']:
-        row_slots = [f"{row_prefix}{i}" for i in range(1, 11)]
-        st.markdown(f'<div class="row-label">Row {row_prefix}</div>', unsafe_allow_html=True)
-        cols = st.columns(10)
-        for j, s in enumerate(row_slots):
-            with cols[j]:
-                is_blocked = s in blocked
-                is_selected = (s == selected)
-                if is_blocked:
-                    st.markdown(f'<div style="height:36px;border-radius:8px;border:none;background:linear-gradient(135deg,#EF4444 0%,#F87171 100%);color:#fff;font-size:0.88rem;font-weight:600;display:flex;align-items:center;justify-content:center;font-family:Outfit,sans-serif;letter-spacing:0.01em;box-shadow:0 4px 20px rgba(239,68,68,0.25);">{s}</div>', unsafe_allow_html=True)
-                elif is_selected:
-                    st.button(s, key=f"slot_{s}", on_click=handle_slot_click, args=(s,), type="primary", use_container_width=True)
-                else:
-                    st.button(s, key=f"slot_{s}", on_click=handle_slot_click, args=(s,), use_container_width=True)
-
-
-
-
-    if st.session_state.selected_slot:
-
-
-        current_blocked = fetch_blocked(start_dt.strftime("%Y-%m-%d %H:%M"), end_dt.strftime("%Y-%m-%d %H:%M"))
-        if st.session_state.selected_slot in current_blocked:
-            st.session_state.selected_slot = None
-            st.rerun()
-        else:
+    # Slot clicks rerun only this fragment instead of the whole page
+    @st.fragment
+    @traced_fragment("slot_grid")
+    def slot_picker(start_dt, end_dt):
+        if st.session_state.pop("free_window_picked", False):
+            st.rerun()   # the form above is outside this fragment
+        blocked = fetch_blocked(start_dt, end_dt)
+        # What this session is showing; watch_for_changes reruns the page when it goes stale
+        st.session_state.shown_grid = (slots, start_dt, end_dt, frozenset(blocked))
+        if st.session_state.selected_slot in blocked:
+            st.session_state.selected_slot = None   # taken since it was picked
+
+        # The layout part of the data is built once per cached layout; only the
+        # occupied slots and the selection change between reruns
+        slot_grid(key="slot_grid", on_clicked_change=handle_slot_click,
+                  data={"levels": layout.grid, "blocked": sorted(blocked), "selected": st.session_state.selected_slot})
+
+        if len(blocked) >= len(slots):
+            # Every slot is taken: offer the earliest windows of the same length the form can book instead
+            windows = service.next_free(slots, start_dt, end_dt - start_dt, limit=NEXT_FREE_SHOWN,
+                                        align=timedelta(minutes=slot_table.minutes), until=start_dt + timedelta(days=7),
+                                        accept=lambda start, end: form_fields(start, end) is not None)
+            if windows:
+                st.markdown('<div class="warn-note">Every slot is taken for this window. The next free ones:</div>', unsafe_allow_html=True)
+            else:
+                st.markdown('<div class="warn-note">Every slot is taken for this window, and no window this long '
+                            'that the form can book starts in the 7 days after it.</div>', unsafe_allow_html=True)
+            for w in windows:
+                label = f"{w.slot_number} · {w.start.strftime('%a %b %d · %I:%M %p')} → {w.end.strftime('%I:%M %p')}"
+                st.button(label, key=f"free_{w.slot_number}_{to_epoch(w.start)}", use_container_width=True,
+                          on_click=use_free_window, args=(w.slot_number, form_fields(w.start, w.end)))
+
+        if st.session_state.selected_slot:
             st.markdown(f"""
             <div class="confirm-banner">
                 <div style="font-size:0.65rem;color:var(--text-3);font-weight:700;letter-spacing:0.08em;text-transform:uppercase;margin-bottom:2px;">Selected Slot</div>
@@ -1420,32 +777,56 @@ if not user_has_active_or_future:
             """, unsafe_allow_html=True)
             confirm_clicked = st.button("Confirm Booking →", type="primary", use_container_width=True)
             if confirm_clicked:
-                if start_dt < now_dt_fresh_ist:
+                if start_dt < datetime.now(ist_timezone).replace(second=0, microsecond=0):
                     st.error("Your selected start time has just passed. Please pick a new time.")
                     st.session_state.selected_slot = None
                     st.rerun()
                 else:
+                    # No availability pre-check: the store rejects overlaps atomically
                     try:
-                        supabase.table("bookings").insert({
-                            "user_id": st.session_state.user_id,
-                            "slot_number": st.session_state.selected_slot,
-                            "start_datetime": start_dt.strftime("%Y-%m-%d %H:%M"),
-                            "end_datetime": end_dt.strftime("%Y-%m-%d %H:%M")
-                        }).execute()
-                        st.cache_data.clear()
-                        st.success(f"✅ Slot {st.session_state.selected_slot} booked successfully!")
-                        st.session_state.selected_slot = None
-                        st.rerun()
+                        reservation = service.book(st.session_state.user_id, st.session_state.selected_slot, start_dt, end_dt)
                     except Exception:
-                        st.error(f"Failed to book slot {st.session_state.selected_slot}. It may have just been taken.")
-                        st.session_state.selected_slot = None
-                        st.rerun()
-    else:
-        st.markdown("""
-        <div class="empty-card" style="padding:1rem;margin-top:0.75rem;">
-            <div class="empty-sub">Tap an available slot above to continue</div>
-        </div>
-        """, unsafe_allow_html=True)
+                        st.error(f"Failed to book slot {st.session_state.selected_slot}. Please try again.")
+                    else:
+                        if reservation.ok:
+                            st.session_state.booking_notice = f"✅ Slot {st.session_state.selected_slot} booked successfully!"
+                        else:
+                            st.error(f"Slot {st.session_state.selected_slot} was just taken. Please pick another slot.")
+                    st.session_state.selected_slot = None
+                    st.rerun()
+        else:
+            st.markdown("""
+            <div class="empty-card" style="padding:1rem;margin-top:0.75rem;">
+                <div class="empty-sub">Tap an available slot above to continue</div>
+            </div>
+            """, unsafe_allow_html=True)
+
+    slot_picker(start_dt, end_dt)
+
+    tracer.mark("fleet")
+    # Fleet bookings: several slots and/or the same window on repeat, booked all-or-nothing
+    with st.expander("🚚 Book several slots or repeat this window"):
+        fleet_slots = st.multiselect("Slots", slots, key="fleet_slots")
+        repeat = st.radio("Repeat", ["Just this window", "Every weekday", "Every day"], horizontal=True, key="fleet_repeat")
+        until = booking_date
+        if repeat != "Just this window":
+            until = st.date_input("Until", value=booking_date + timedelta(days=27), min_value=booking_date, key="fleet_until")
+        if st.button("Reserve All →", type="primary", disabled=not fleet_slots, use_container_width=True, key="fleet_confirm"):
+            weekdays = range(5) if repeat == "Every weekday" else range(7)
+            try:
+                batch = service.book_recurring(st.session_state.user_id, fleet_slots, start_dt, end_dt, until, weekdays)
+            except ValueError as exc:
+                st.error(str(exc))
+            except Exception:
+                st.error("Failed to reserve the slots. Please try again.")
+            else:
+                if batch.ok:
+                    st.session_state.booking_notice = f"✅ Reserved {len(batch.booking_ids)} bookings."
+                    st.rerun()
+                taken = ", ".join(f"{s} on {b_start.strftime('%b %d')}" for s, b_start, _ in batch.conflicts[:5])
+                more = f" and {len(batch.conflicts) - 5} more" if len(batch.conflicts) > 5 else ""
+                st.error(f"Nothing was booked: {taken}{more} already taken.")
+
 else:
     st.markdown("""
     <div class="lock-card">
@@ -1454,3 +835,40 @@ else:
         <div class="lock-sub">You have an active or upcoming booking.<br>Manage your existing sessions above to make a new booking.</div>
     </div>
     """, unsafe_allow_html=True)
+
+# ── Live updates ──
+tracer.mark("live")
+# Replaces the 30 s full-page autorefresh. This fragment only reads in-process state
+# (change feed versions and the occupancy index, no store queries) and reruns the page
+# when this user's bookings change, the viewed window's occupancy changes, or a booking
+# starts or ends.
+@st.fragment(run_every=float(get_config("LIVE_POLL_SECONDS", 5)))
+def watch_for_changes(user_id, next_transition):
+    changed = service.has_changed(user_id, st.session_state.get("shown_user_version"), st.session_state.get("shown_grid"))
+    if changed or (next_transition is not None and datetime.now(ist_timezone) >= next_transition):
+        st.rerun()
+
+watch_for_changes(st.session_state.user_id, next_transition)
+
+# ── Cache diagnostics (?debug=1, ADMIN_USERS only) ──
+tracer.mark("diagnostics")
+if st.query_params.get("debug") and username in ADMIN_USERS:
+    with st.expander("Cache stats"):
+        st.json({**service.stats(), "queries": store.query_stats(),
+                 "page_reads": st.session_state.get("page_timing")})
+
+# ── Rerun traces (TRACE=true, ADMIN_USERS only) ──
+tracer.mark("traces_panel")
+if tracer.enabled and username in ADMIN_USERS:
+    with st.expander("⏱ Rerun traces"):
+        traces = tracer.recent()
+        if traces:
+            st.dataframe([{"at": t["at"], "run": t["run"], "wall_ms": t["wall_ms"], "queries": t["queries"],
+                           "query_ms": t["query_ms"], "deltas": t["deltas"], "bytes": t["bytes"],
+                           "slowest": max(t["sections"], key=t["sections"].get, default=None)} for t in traces],
+                         hide_index=True)
+            st.json(traces[0])
+        else:
+            st.caption("No finished reruns yet.")
+
+tracer.finish(trace)
@@ -0,0 +1,47 @@
+"""Compaction of finished bookings into bookings_archive.
+
+Bookings that ended more than a retention window ago are moved out of the hot
+bookings table in batches (BookingStore.archive_bookings), so availability and
+current-booking queries only ever see current, future and recently finished rows.
+History reads union the archive, so users still see everything they booked.
+
+Run it from cron with scripts/archive_bookings.py, or in the app process with
+start_archiver (ARCHIVE_EVERY).
+"""
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+def archive_expired(store, clock, retention, batch_size=5000, pause=0.0):
+    """Move every booking that ended before clock() - retention, batch_size at a
+    time with pause seconds between batches. Returns how many were moved."""
+    before = clock() - retention
+    total = 0
+    while True:
+        moved = store.archive_bookings(before, batch_size)
+        total += moved
+        if moved < batch_size:
+            return total
+        time.sleep(pause)
+
+
+def start_archiver(store, clock, retention, every, batch_size=5000, pause=0.0):
+    """Run archive_expired every every seconds from a daemon thread. Returns an Event
+    that stops it. Several processes may run one: batches skip rows already moving."""
+    stop = threading.Event()
+
+    def run():
+        while not stop.wait(every):
+            try:
+                moved = archive_expired(store, clock, retention, batch_size, pause)
+            except Exception:
+                logger.exception("Archiving bookings failed; retrying in %ss", every)
+            else:
+                if moved:
+                    logger.info("Archived %d bookings", moved)
+
+    threading.Thread(target=run, name="parkos-archiver", daemon=True).start()
+    return stop
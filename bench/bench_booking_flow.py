@@ -0,0 +1,46 @@
+"""Time each store call on the booking hot path against a seeded local backend.
+
+    python -m bench.bench_booking_flow --bookings 1000000 --users 5000
+    python -m bench.bench_booking_flow --sqlite-path /tmp/parkos-bench.db
+"""
+import argparse
+from datetime import datetime, timedelta
+
+from bench.common import SLOTS, median_ms, seed
+from models import IST
+from store import SQLiteStore
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bookings", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=5_000)
+    parser.add_argument("--sqlite-path", default=":memory:")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    now = datetime.now(IST).replace(second=0, microsecond=0)
+    store = SQLiteStore(args.sqlite_path)
+    seed(store, args.bookings, now, n_users=args.users)
+    start, end = now + timedelta(hours=1), now + timedelta(hours=3)
+    user_id = args.users // 2
+
+    def book_and_cancel():
+        reservation = store.reserve(user_id, "A1", now + timedelta(days=400), now + timedelta(days=400, hours=2))
+        store.delete_booking(reservation.booking_id)
+
+    calls = {
+        "get_login": lambda: store.get_login(f"user{user_id}"),
+        "get_profile": lambda: store.get_profile(user_id),
+        "fetch_bookings": lambda: store.fetch_bookings(user_id, now),
+        "fetch_history": lambda: store.fetch_history(user_id, now),
+        "fetch_blocked": lambda: store.fetch_blocked(SLOTS, start, end),
+        "reserve+delete": book_and_cancel,
+    }
+    print(f"{args.bookings} bookings, {args.users} users")
+    for name, fn in calls.items():
+        print(f"{name:>16} {median_ms(fn, args.repeat):8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Benchmark the operator dashboard: reading the rollups vs. scanning the bookings behind them.
+
+    python -m bench.bench_dashboard --sizes 100000 1000000 --days 28
+"""
+import argparse
+from datetime import date, datetime, timedelta
+
+from bench.common import SLOTS, median_ms, seed
+from heatmap import intervals_frame, occupancy_matrix
+from layout import DEFAULT_LAYOUT
+from models import IST
+from rollups import utilization
+from store import SQLiteStore
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--days", type=int, default=28)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    end_day = date.today() + timedelta(days=1)
+    start_day = end_day - timedelta(days=args.days)
+    start = IST.localize(datetime.combine(start_day, datetime.min.time()))
+    end = IST.localize(datetime.combine(end_day, datetime.min.time()))
+
+    def from_rollups():
+        return utilization(store.fetch_rollups(DEFAULT_LAYOUT.lot_id, start_day, end_day), DEFAULT_LAYOUT, start_day, end_day)
+
+    def from_bookings():
+        return occupancy_matrix(intervals_frame(store.fetch_intervals(start, end)), SLOTS, start, end, 60).mean(axis=1)
+
+    print(f"{'rows':>10} {'rebuild s':>10} {'scan ms':>9} {'rollup ms':>10}")
+    for n in args.sizes:
+        store = SQLiteStore()
+        seed(store, n, datetime.now(IST))
+        rebuild_s = median_ms(store.rebuild_rollups, 1) / 1000
+        assert abs(from_rollups().by_slot.to_numpy() - from_bookings()).max() < 1e-9
+        scan_ms = median_ms(from_bookings, args.repeat)
+        rollup_ms = median_ms(from_rollups, args.repeat)
+        print(f"{n:>10} {rebuild_s:>10.1f} {scan_ms:>9.1f} {rollup_ms:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
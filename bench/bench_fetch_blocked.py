@@ -0,0 +1,44 @@
+"""Benchmark fetch_blocked: full-table scan vs. indexed overlap query.
+
+Runs against SQLiteStore, which carries the index from
+migrations/001_bookings_overlap_index.sql, so it needs no Supabase project:
+
+    python -m bench.bench_fetch_blocked --sizes 1000 10000 100000 1000000
+"""
+import argparse
+from datetime import datetime, timedelta
+
+from bench.common import SLOTS, median_ms, seed
+from models import IST, to_epoch
+from store import SQLiteStore
+
+
+def blocked_scan(store, start, end):
+    # What fetch_blocked used to do: pull every booking and filter in Python.
+    start_s, end_s = to_epoch(start), to_epoch(end)
+    rows = store._query("select slot_number, start_at, end_at from bookings")
+    return {s for s, b_start, b_end in rows if not (b_end <= start_s or b_start >= end_s)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    now = datetime.now(IST).replace(second=0, microsecond=0)
+    start, end = now + timedelta(hours=1), now + timedelta(hours=3)
+
+    print(f"{'rows':>10} {'scan ms':>10} {'indexed ms':>11}")
+    for n in args.sizes:
+        store = SQLiteStore()
+        seed(store, n, now)
+        assert blocked_scan(store, start, end) == store.fetch_blocked(SLOTS, start, end)
+        scan_ms = median_ms(lambda: blocked_scan(store, start, end), max(1, args.repeat // 10))
+        idx_ms = median_ms(lambda: store.fetch_blocked(SLOTS, start, end), args.repeat)
+        print(f"{n:>10} {scan_ms:>10.2f} {idx_ms:>11.3f}")
+        store.conn.close()
+
+
+if __name__ == "__main__":
+    main()
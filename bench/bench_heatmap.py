@@ -0,0 +1,80 @@
+"""Occupancy heatmap for a week over 1M bookings: vectorized vs. per-booking Python.
+
+Bookings are packed back to back on every slot of a --slots layout across the
+week, loaded into SQLite, read back with fetch_intervals and bucketed.
+
+    python -m bench.bench_heatmap --bookings 1000000 --slots 600
+"""
+import argparse
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from heatmap import BUCKET_MINUTES, intervals_frame, occupancy_matrix
+from layout import grid_layout
+from models import IST, to_epoch
+from store import SQLiteStore
+
+
+def python_matrix(rows, slots, start, end, bucket_minutes=BUCKET_MINUTES):
+    """The per-row overlap loop the vectorized version replaces."""
+    bucket = bucket_minutes * 60
+    t0, t1 = to_epoch(start), to_epoch(end)
+    index = {s: i for i, s in enumerate(slots)}
+    matrix = [[0.0] * ((t1 - t0) // bucket) for _ in slots]
+    for slot_number, b_start, b_end in rows:
+        row = matrix[index[slot_number]]
+        for k in range(max(0, (b_start - t0) // bucket), min(len(row), -(-(b_end - t0) // bucket))):
+            lo = t0 + k * bucket
+            row[k] += (min(b_end, lo + bucket) - max(b_start, lo)) / bucket
+    return np.array(matrix)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bookings", type=int, default=1_000_000)
+    parser.add_argument("--slots", type=int, default=600)
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--no-baseline", action="store_true", help="skip the pure-Python loop")
+    args = parser.parse_args()
+
+    layout = grid_layout("bench", levels=3, rows=-(-args.slots // 60), per_row=20)
+    slots = layout.slots
+    start = IST.localize(datetime.combine(datetime.now(IST).date(), datetime.min.time()))
+    end = start + timedelta(days=args.days)
+    # Each slot's bookings tile the range with random gaps, so none overlap
+    per_slot = -(-args.bookings // len(slots))
+    step = (to_epoch(end) - to_epoch(start)) // per_slot
+    rng = np.random.default_rng(0)
+    starts = to_epoch(start) + np.arange(per_slot) * step
+    bookings = ((1, s, datetime.fromtimestamp(b_start, IST), datetime.fromtimestamp(b_start + length, IST))
+                for s in slots
+                for b_start, length in zip(starts.tolist(), rng.integers(step // 4, step, per_slot).tolist()))
+    store = SQLiteStore()
+    store.bulk_load(users=[("bench", "x", None)], bookings=bookings)
+
+    t0 = time.perf_counter()
+    rows = store.fetch_intervals(start, end)
+    load_s = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    frame = intervals_frame(rows)
+    frame_s = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    matrix = occupancy_matrix(frame, slots, start, end)
+    bucket_s = time.perf_counter() - t0
+    vector_s = frame_s + bucket_s
+    print(f"{len(rows):,} bookings, {len(slots)} slots x {matrix.shape[1]} buckets")
+    print(f"  fetch_intervals  {load_s * 1000:9.1f} ms")
+    print(f"  to DataFrame     {frame_s * 1000:9.1f} ms")
+    print(f"  bucketing        {bucket_s * 1000:9.1f} ms   mean occupancy {matrix.mean():.1%}")
+    if not args.no_baseline:
+        t0 = time.perf_counter()
+        expected = python_matrix(rows, slots, start, end)
+        python_s = time.perf_counter() - t0
+        assert np.allclose(matrix, expected)
+        print(f"  python loop      {python_s * 1000:9.1f} ms   ({python_s / vector_s:.1f}x frame + bucketing)")
+
+
+if __name__ == "__main__":
+    main()
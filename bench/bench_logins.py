@@ -0,0 +1,51 @@
+"""Login throughput with scrypt password hashes, per worker and per core.
+
+    python -m bench.bench_logins --workers 1 2 4 --logins 200
+"""
+import argparse
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from passwords import SCRYPT_N, Authenticator, RateLimiter, hash_password
+from store import SQLiteStore
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--logins", type=int, default=100)
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--n", type=int, default=SCRYPT_N, help="scrypt cost parameter")
+    args = parser.parse_args()
+
+    store = SQLiteStore()
+    stored = hash_password("pw", n=args.n)   # same cost for every user, hashed once
+    store.bulk_load(users=[(f"user{u}", stored, None) for u in range(args.users)])
+    cores = os.cpu_count() or 1
+
+    print(f"scrypt n={args.n}, {cores} cores")
+    print(f"{'workers':>8} {'logins/s':>9} {'per core':>9} {'p50 ms':>8}")
+    for workers in args.workers:
+        auth = Authenticator(store, workers=workers, max_pending=args.logins, n=args.n,
+                             limiter=RateLimiter(max_failures=args.logins + 1))
+        latencies, lock = [], threading.Lock()
+
+        def login(i):
+            t0 = time.perf_counter()
+            assert auth.login(f"user{i % args.users}", "pw").user
+            with lock:
+                latencies.append(time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        # More callers than workers, like a burst of sessions signing in at once
+        with ThreadPoolExecutor(max_workers=workers * 4) as callers:
+            list(callers.map(login, range(args.logins)))
+        rate = args.logins / (time.perf_counter() - t0)
+        latencies.sort()
+        print(f"{workers:>8} {rate:>9.1f} {rate / min(workers, cores):>9.1f} {latencies[len(latencies) // 2] * 1000:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Benchmark the next-free-window search: one gap sweep per slot vs. probing windows with blocked().
+
+    python -m bench.bench_next_free --sizes 1000 100000 1000000
+"""
+import argparse
+from datetime import datetime, timedelta
+
+from bench.common import SLOTS, median_ms, seed
+from models import IST
+from occupancy import OccupancyIndex
+from store import SQLiteStore
+
+
+def probe(index, after, duration, limit, align, until):
+    """Baseline: step a window through the grid and ask blocked() for each step."""
+    found, start = {}, after
+    while len(found) < limit and start <= until:
+        for slot in index.free(SLOTS, start, start + duration):
+            if slot not in found and len(found) < limit:
+                found[slot] = start
+        start += align
+    return sorted((start, slot) for slot, start in found.items())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--limit", type=int, default=5)
+    args = parser.parse_args()
+
+    now = datetime.now(IST).replace(minute=0, second=0, microsecond=0)
+    duration, align = timedelta(hours=2), timedelta(minutes=30)
+
+    print(f"{'rows':>10} {'probe ms':>9} {'sweep ms':>9}")
+    for n in args.sizes:
+        store = SQLiteStore()
+        seed(store, n, now)
+        # Start up to 200 bookings deep into each slot's back-to-back run, whose
+        # 30 min gaps never fit the window, so both searches have to walk it
+        depth = n // len(SLOTS)
+        after = now + timedelta(days=1) - timedelta(hours=2) * min(depth, 200)
+        until = after + timedelta(days=30)
+        index = OccupancyIndex(store, lambda: after, max_age=float("inf"))
+        index.rebuild()
+        windows = index.next_free(SLOTS, after, duration, args.limit, align, until)
+        assert sorted((w.start, w.slot_number) for w in windows) == probe(index, after, duration, args.limit, align, until)
+        probe_ms = median_ms(lambda: probe(index, after, duration, args.limit, align, until), args.repeat)
+        sweep_ms = median_ms(lambda: index.next_free(SLOTS, after, duration, args.limit, align, until), args.repeat)
+        print(f"{n:>10} {probe_ms:>9.3f} {sweep_ms:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Benchmark grid availability: indexed SQL query vs. the in-memory OccupancyIndex.
+
+    python -m bench.bench_occupancy --sizes 1000 100000 1000000
+"""
+import argparse
+from datetime import datetime, timedelta
+
+from bench.common import SLOTS, median_ms, seed
+from occupancy import OccupancyIndex
+from models import IST
+from store import SQLiteStore
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    # Seed a day ahead so a few hundred bookings per slot are still current.
+    now = datetime.now(IST).replace(second=0, microsecond=0) - timedelta(days=30)
+    clock = lambda: now
+    start, end = now + timedelta(hours=1), now + timedelta(hours=3)
+
+    print(f"{'rows':>10} {'build ms':>9} {'sql ms':>8} {'index ms':>9}")
+    for n in args.sizes:
+        store = SQLiteStore()
+        seed(store, n, now + timedelta(days=30))
+        index = OccupancyIndex(store, clock, max_age=float("inf"))
+        build_ms = median_ms(index.rebuild, 1)
+        assert index.blocked(SLOTS, start, end) == store.fetch_blocked(SLOTS, start, end)
+        sql_ms = median_ms(lambda: store.fetch_blocked(SLOTS, start, end), args.repeat)
+        idx_ms = median_ms(lambda: index.blocked(SLOTS, start, end), args.repeat)
+        print(f"{n:>10} {build_ms:>9.1f} {sql_ms:>8.3f} {idx_ms:>9.4f}")
+
+
+if __name__ == "__main__":
+    main()
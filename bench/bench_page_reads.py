@@ -0,0 +1,77 @@
+"""Time the main page's reads with simulated network latency: serial vs. concurrent.
+
+Every store call sleeps --latency-ms first, standing in for a PostgREST round trip,
+and caches are cleared before each run so every read goes to the store.
+
+    python -m bench.bench_page_reads --latency-ms 40 --repeat 20
+"""
+import argparse
+import statistics
+import time
+from datetime import datetime
+
+from bench.common import seed
+from models import IST
+from service import BookingService
+from store import SQLiteStore
+
+
+class SlowStore:
+    def __init__(self, store, latency):
+        self._store = store
+        self._latency = latency
+
+    def __getattr__(self, name):
+        attr = getattr(self._store, name)
+
+        def slow(*args, **kwargs):
+            time.sleep(self._latency)
+            return attr(*args, **kwargs)
+        return slow if callable(attr) else attr
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency-ms", type=float, default=40.0)
+    parser.add_argument("--bookings", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    now = datetime.now(IST).replace(second=0, microsecond=0)
+    store = SQLiteStore()
+    seed(store, args.bookings, now)
+    service = BookingService.create(SlowStore(store, args.latency_ms / 1000), clock=lambda: datetime.now(IST))
+    user_id = 7
+
+    def cold():
+        service.booking_cache.clear()
+        service.stats_cache.clear()
+        service.profile_cache.clear()
+        service.layout_cache.clear()
+        service.occupancy.mark_stale()
+
+    def serial():
+        service.profile(user_id)
+        service.user_bookings(user_id)
+        service.booking_count(user_id)
+        service.occupancy.warm()
+
+    serial_ms, concurrent_ms, timing = [], [], None
+    for _ in range(args.repeat):
+        cold()
+        t0 = time.perf_counter()
+        serial()
+        serial_ms.append((time.perf_counter() - t0) * 1000)
+        cold()
+        t0 = time.perf_counter()
+        timing = service.load_page(user_id).timing
+        concurrent_ms.append((time.perf_counter() - t0) * 1000)
+
+    print(f"{args.latency_ms:.0f} ms per store call, {args.bookings:,} bookings")
+    print(f"  serial      {statistics.median(serial_ms):8.1f} ms")
+    print(f"  concurrent  {statistics.median(concurrent_ms):8.1f} ms")
+    print(f"  last batch  {timing.as_dict()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Cost of one slot grid render as the lot grows: occupancy lookup plus the data
+the grid component receives, for layouts from the default 20 spaces up.
+
+    python -m bench.bench_slot_grid --sizes 20 200 600 1200 --levels 3
+"""
+import argparse
+import json
+from datetime import datetime, timedelta
+
+from bench.common import median_ms
+from layout import grid_layout
+from models import IST
+from service import BookingService
+from store import SQLiteStore
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[20, 200, 600, 1200])
+    parser.add_argument("--levels", type=int, default=3)
+    parser.add_argument("--per-row", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    now = datetime.now(IST).replace(second=0, microsecond=0)
+    start, end = now + timedelta(hours=1), now + timedelta(hours=3)
+    print(f"{'slots':>6} {'levels':>6} {'render ms':>10} {'data bytes':>11}")
+    for size in args.sizes:
+        levels = 1 if size <= args.per_row * 2 else args.levels
+        rows = max(1, -(-size // (levels * args.per_row)))
+        layout = grid_layout("bench", levels, rows, args.per_row)
+        store = SQLiteStore()
+        # Every third space taken for the measured window
+        store.bulk_load(users=[("bench", "x", "TN01")], slots=layout.to_rows(),
+                        bookings=[(1, s, start, end) for s in layout.slots[::3]])
+        service = BookingService.create(store, clock=lambda: datetime.now(IST))
+
+        def render():
+            layout_now = service.layout("bench")
+            blocked = service.blocked(layout_now.slots, start, end)
+            return json.dumps({"levels": layout_now.grid, "blocked": sorted(blocked), "selected": None})
+
+        size_bytes = len(render())
+        print(f"{len(layout.slots):>6} {levels:>6} {median_ms(render, args.repeat):>10.3f} {size_bytes:>11,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Micro-benchmark: per-rerun entry/exit option building, old vs. precomputed tables.
+
+    python -m bench.bench_time_options
+"""
+import timeit
+from datetime import date, datetime
+
+import pytz
+
+from timeslots import SLOT_TABLES, build_time_options
+
+IST = pytz.timezone("Asia/Kolkata")
+
+
+def legacy_options(for_date, now_ist, entry_pick, exit_pick):
+    """What app.py did on every rerun before the tables were precomputed."""
+    standard_slots = [(datetime.strptime(f"{h:02d}:{m:02d}", "%H:%M").strftime("%I:%M %p"),
+                       datetime.strptime(f"{h:02d}:{m:02d}", "%H:%M").time())
+                      for h in range(24) for m in (0, 30)]
+    if for_date == date.today() and now_ist is not None:
+        now_time = now_ist.time().replace(second=0, microsecond=0)
+        now_label = "Now (" + now_ist.strftime("%I:%M %p").lstrip("0") + ")"
+        entry_options = [(now_label, now_time)] + [(label, t) for label, t in standard_slots if t > now_time]
+    else:
+        entry_options = standard_slots
+    entry_labels = [label for label, _ in entry_options]
+    entry_times = [t for _, t in entry_options]
+    entry_time = entry_times[entry_labels.index(entry_labels[min(entry_pick, len(entry_labels) - 1)])]
+    all_exit_slots = [(datetime.strptime(f"{h:02d}:{m:02d}", "%H:%M").strftime("%I:%M %p"),
+                       datetime.strptime(f"{h:02d}:{m:02d}", "%H:%M").time())
+                      for h in range(24) for m in (0, 30)]
+    exit_options = [(label, t) for label, t in all_exit_slots if t > entry_time] or all_exit_slots
+    exit_labels = [label for label, _ in exit_options]
+    exit_times = [t for _, t in exit_options]
+    return entry_time, exit_times[exit_labels.index(exit_labels[min(exit_pick, len(exit_labels) - 1)])]
+
+
+def table_options(table, for_date, now_ist, entry_pick, exit_pick):
+    entry_labels, entry_times = build_time_options(table, for_date, now_ist)
+    entry_label = entry_labels[min(entry_pick, len(entry_labels) - 1)]
+    entry_time = table.time_of(entry_label) if entry_label in table.index else entry_times[0]
+    exit_labels, _ = table.after(entry_time)
+    exit_labels = exit_labels or table.labels
+    return entry_time, table.time_of(exit_labels[min(exit_pick, len(exit_labels) - 1)])
+
+
+def main():
+    now = datetime.now(IST).replace(hour=6, minute=10)
+    today = date.today()
+    table = SLOT_TABLES[30]
+    for entry_pick in (0, 5, 30):
+        assert legacy_options(today, now, entry_pick, 3) == table_options(table, today, now, entry_pick, 3)
+
+    n = 2000
+    legacy = timeit.timeit(lambda: legacy_options(today, now, 5, 3), number=n) / n * 1e6
+    print(f"legacy (strptime x192 + list.index)  {legacy:8.1f} us/rerun")
+    for minutes, table in SLOT_TABLES.items():
+        t = timeit.timeit(lambda: table_options(table, today, now, 5, 3), number=n) / n * 1e6
+        print(f"precomputed {minutes:>2} min table          {t:8.1f} us/rerun  ({legacy / t:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""Shared helpers for the offline benchmarks: synthetic data and timing."""
+import statistics
+import time
+from datetime import timedelta
+
+from layout import DEFAULT_LAYOUT
+
+SLOTS = list(DEFAULT_LAYOUT.slots)
+
+
+def synthetic_bookings(n, now, n_users=1000):
+    """n back-to-back 90 min bookings per slot, walking back in time from a day after now."""
+    for i in range(n):
+        k = i // len(SLOTS)
+        start = now + timedelta(days=1) - timedelta(hours=2) * (k + 1)
+        end = start + timedelta(minutes=90)
+        yield (i % n_users + 1, SLOTS[i % len(SLOTS)], start, end)
+
+
+def seed(store, n_bookings, now, n_users=1000):
+    users = [(f"user{u}", "x", f"TN01 AB{u:04d}") for u in range(1, n_users + 1)]
+    store.bulk_load(users=users, bookings=synthetic_bookings(n_bookings, now, n_users))
+
+
+def median_ms(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(samples)
@@ -0,0 +1,195 @@
+"""Concurrent virtual users driving the booking flow against a local SQLite store.
+
+Each virtual user repeats what a browser session does: render the page (its
+bookings plus the slot grid for a window), poll for changes, book a free slot
+and sometimes cancel. All calls go through service.BookingService, the same code
+app.py runs. Windows are drawn from a small set so users contend for slots.
+
+    python -m bench.loadtest --users 50 --duration 20 --out loadtest.json
+
+Prints (and optionally writes) a JSON report: throughput, p50/p95/p99 latency
+per operation, reservation conflicts, double bookings found in the database
+afterwards and store queries per rerun.
+"""
+import argparse
+import contextvars
+import json
+import random
+import statistics
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from bench.common import SLOTS, seed
+from models import IST, classify_bookings
+from service import BookingService
+from store import SQLiteStore
+
+OPERATIONS = ("render", "poll", "book", "cancel")
+
+
+class CountingStore:
+    """Store proxy counting calls per rerun, so each rerun knows its own query count.
+
+    The count lives in a contextvar rather than a thread-local: parallel.gather runs
+    load_page's reads on a pool, in copies of the caller's context that share its counter.
+    """
+
+    def __init__(self, store):
+        self._store = store
+        self._rerun = contextvars.ContextVar("rerun_queries", default=None)
+        self._lock = threading.Lock()
+        self.calls = defaultdict(int)
+
+    def __getattr__(self, name):
+        attr = getattr(self._store, name)
+        if not callable(attr):
+            return attr
+
+        def counted(*args, **kwargs):
+            rerun = self._rerun.get()
+            with self._lock:
+                self.calls[name] += 1
+                if rerun is not None:
+                    rerun[0] += 1
+            return attr(*args, **kwargs)
+        return counted
+
+    def take_count(self):
+        """Calls since the last take_count in this context; starts a new count."""
+        rerun = self._rerun.get()
+        self._rerun.set([0])
+        return rerun[0] if rerun is not None else 0
+
+
+def percentile(samples, q):
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))]
+
+
+def double_bookings(store):
+    # Pairs of bookings for the same slot whose [start, end) ranges overlap.
+    return store._query("select count(*) from bookings a join bookings b"
+                        " on a.slot_number = b.slot_number and a.id < b.id"
+                        " and a.start_at < b.end_at and b.start_at < a.end_at")[0][0]
+
+
+class VirtualUser(threading.Thread):
+    def __init__(self, user_id, service, counting, windows, deadline, think, rng):
+        super().__init__(daemon=True)
+        self.user_id, self.service, self.counting = user_id, service, counting
+        self.windows, self.deadline, self.think, self.rng = windows, deadline, think, rng
+        self.latencies = defaultdict(list)     # operation -> seconds
+        self.queries = defaultdict(list)       # operation -> store calls in that rerun
+        self.booked = self.conflicts = self.errors = 0
+
+    def timed(self, operation, fn, *args):
+        self.counting.take_count()
+        t0 = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            self.latencies[operation].append(time.perf_counter() - t0)
+            self.queries[operation].append(self.counting.take_count())
+
+    def render(self, start, end):
+        page = self.service.load_page(self.user_id)
+        timeline = classify_bookings(page.bookings, datetime.now(IST))
+        blocked = self.service.blocked(SLOTS, start, end)
+        return page.version, timeline, (tuple(SLOTS), start, end, frozenset(blocked))
+
+    def run(self):
+        while time.monotonic() < self.deadline:
+            start, end = self.rng.choice(self.windows)
+            try:
+                version, timeline, grid = self.timed("render", self.render, start, end)
+                self.timed("poll", self.service.has_changed, self.user_id, version, grid)
+                free = [s for s in SLOTS if s not in grid[3]]
+                if timeline.current_future and self.rng.random() < 0.5:
+                    b = self.rng.choice(timeline.current_future)
+                    self.timed("cancel", self.service.cancel, self.user_id, b.id, b.slot_number)
+                elif free:
+                    reservation = self.timed("book", self.service.book, self.user_id, self.rng.choice(free), start, end)
+                    if reservation.ok:
+                        self.booked += 1
+                    else:
+                        self.conflicts += 1
+            except Exception:
+                self.errors += 1
+            if self.think:
+                time.sleep(self.rng.uniform(0, 2 * self.think))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=50, help="concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds to run")
+    parser.add_argument("--bookings", type=int, default=100_000, help="historical bookings to seed")
+    parser.add_argument("--windows", type=int, default=4, help="distinct booking windows users contend for")
+    parser.add_argument("--think-ms", type=float, default=0.0, help="mean pause between iterations")
+    parser.add_argument("--occupancy-max-age", type=float, default=15.0)
+    parser.add_argument("--sqlite-path", default=":memory:")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="also write the JSON report here")
+    args = parser.parse_args()
+
+    now = datetime.now(IST).replace(second=0, microsecond=0)
+    raw_store = SQLiteStore(args.sqlite_path)
+    # Seeded history ends before now, so every seeded booking is in the past.
+    seed(raw_store, args.bookings, now - timedelta(days=2), n_users=max(args.users, 1000))
+    counting = CountingStore(raw_store)
+    service = BookingService.create(counting, clock=lambda: datetime.now(IST),
+                                    occupancy_max_age=args.occupancy_max_age)
+    windows = [(now + timedelta(hours=2 * i + 1), now + timedelta(hours=2 * i + 3)) for i in range(args.windows)]
+
+    rng = random.Random(args.seed)
+    deadline = time.monotonic() + args.duration
+    users = [VirtualUser(u, service, counting, windows, deadline, args.think_ms / 1000, random.Random(rng.random()))
+             for u in range(1, args.users + 1)]
+    t0 = time.perf_counter()
+    for user in users:
+        user.start()
+    for user in users:
+        user.join()
+    elapsed = time.perf_counter() - t0
+
+    operations = {}
+    for op in OPERATIONS:
+        latencies = [s for u in users for s in u.latencies[op]]
+        queries = [q for u in users for q in u.queries[op]]
+        if not latencies:
+            continue
+        operations[op] = {
+            "count": len(latencies),
+            "per_sec": round(len(latencies) / elapsed, 1),
+            "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+            "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+            "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+            "queries_per_rerun": round(statistics.mean(queries), 3),
+            "max_queries_per_rerun": max(queries),
+        }
+    iterations = operations.get("render", {}).get("count", 0)
+    report = {
+        "config": vars(args),
+        "elapsed_s": round(elapsed, 3),
+        "iterations_per_sec": round(iterations / elapsed, 1),
+        "operations": operations,
+        "booked": sum(u.booked for u in users),
+        "conflicts": sum(u.conflicts for u in users),
+        "errors": sum(u.errors for u in users),
+        "double_bookings": double_bookings(raw_store),
+        "store_calls": dict(counting.calls),
+        **service.stats(),
+    }
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
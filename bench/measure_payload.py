@@ -0,0 +1,54 @@
+"""Measure the element payload the server sends on a rerun of app.py.
+
+Drives the app headlessly with AppTest against a throwaway SQLite store and
+sums the serialized size of every element it emits, for the login page and
+for a rerun of the main page with nothing changed. That is what each full rerun
+costs: a widget interaction, or watch_for_changes rerunning the page when a
+booking it shows changes, starts or ends:
+
+    python -m bench.measure_payload
+"""
+import json
+import os
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+APP = str(Path(__file__).resolve().parent.parent / "app.py")
+
+
+def payload(node):
+    """(bytes, elements) for a node of the AppTest element tree."""
+    children = getattr(node, "children", None)
+    if children is None:
+        return node.proto.ByteSize(), 1
+    size = count = 0
+    for child in children.values():
+        s, c = payload(child)
+        size, count = size + s, count + c
+    return size, count
+
+
+def measure():
+    os.environ["BOOKING_STORE"] = "sqlite"
+    os.environ["SQLITE_PATH"] = ":memory:"
+    at = AppTest.from_file(APP, default_timeout=30).run()
+    results = {"login": payload(at.main)}
+
+    at.button[1].click().run()
+    at.text_input(key="reg_user").input("bench")
+    at.text_input(key="reg_pass").input("bench")
+    at.button[0].click().run()
+    at.text_input(key="login_user").input("bench")
+    at.text_input(key="login_pass").input("bench")
+    at.button[0].click().run()
+    at.text_input[0].input("TN01 AB1234")
+    at.button[1].click().run()
+    results["main"] = payload(at.main)
+    at.run()
+    results["main_rerun"] = payload(at.main)
+    return {page: {"bytes": size, "elements": count} for page, (size, count) in results.items()}
+
+
+if __name__ == "__main__":
+    print(json.dumps(measure(), indent=2))
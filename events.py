@@ -0,0 +1,116 @@
+"""Change notifications for booking writes.
+
+Every insert or cancel is published to a process-wide ChangeFeed. Listeners
+(the occupancy index and the booking cache) apply the change, and per-user
+version counters let each session's watcher tell whether anything it shows
+has changed without querying the store. start_realtime_bridge feeds writes made
+by other processes into the same feed from Supabase realtime; realtime also echoes
+this process's own writes back, and publish_remote drops those echoes.
+"""
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+
+from models import parse_dt
+
+logger = logging.getLogger(__name__)
+
+
+class ChangeFeed:
+    def __init__(self, echo_window=60.0, max_echoes=10_000):
+        self._lock = threading.Lock()
+        self._user_versions = {}
+        self._listeners = []
+        # (booking_id, kind) -> monotonic time this process published it, oldest first
+        self._echoes = OrderedDict()
+        self.echo_window = echo_window
+        self.max_echoes = max_echoes
+        self.published = self.echoes_dropped = 0
+
+    def subscribe(self, listener):
+        """listener(kind, booking_id, user_id, slot_number, start, end); kind is "upsert" or "delete"."""
+        with self._lock:
+            self._listeners.append(listener)
+
+    def publish(self, kind, booking_id, user_id=None, slot_number=None, start=None, end=None):
+        """Publish a write this process made."""
+        with self._lock:
+            self._echoes.pop((booking_id, kind), None)
+            self._echoes[(booking_id, kind)] = time.monotonic()
+            while len(self._echoes) > self.max_echoes:
+                self._echoes.popitem(last=False)
+        self._deliver(kind, booking_id, user_id, slot_number, start, end)
+
+    def publish_remote(self, kind, booking_id, user_id=None, slot_number=None, start=None, end=None):
+        """Publish a write reported by another process, unless it is the echo of one
+        publish() already delivered within echo_window seconds. Returns whether it was."""
+        with self._lock:
+            published_at = self._echoes.pop((booking_id, kind), None)
+            if published_at is not None and time.monotonic() - published_at < self.echo_window:
+                self.echoes_dropped += 1
+                return False
+        self._deliver(kind, booking_id, user_id, slot_number, start, end)
+        return True
+
+    def _deliver(self, kind, booking_id, user_id, slot_number, start, end):
+        with self._lock:
+            self.published += 1
+            if user_id is not None:
+                self._user_versions[user_id] = self._user_versions.get(user_id, 0) + 1
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener(kind, booking_id, user_id, slot_number, start, end)
+
+    def user_version(self, user_id):
+        with self._lock:
+            return self._user_versions.get(user_id, 0)
+
+    def stats(self):
+        with self._lock:
+            return {"published": self.published, "echoes_dropped": self.echoes_dropped}
+
+
+def start_realtime_bridge(url, key, feed):
+    """Publish Supabase realtime changes on public.bookings to feed, from a daemon thread.
+
+    Needs the table in the supabase_realtime publication with replica identity
+    full (migrations/003_bookings_realtime.sql) so deletes carry the old row.
+    Deletes of bookings that had already ended are skipped: archive_bookings
+    (migration 009) moves those out in batches, and neither occupancy nor anyone's
+    current bookings change when it does.
+    """
+    def on_change(payload):
+        data = payload["data"]
+        if data["type"] == "DELETE":
+            row = data.get("old_record") or {}
+            kind = "delete"
+        else:
+            row = data.get("record") or {}
+            kind = "upsert"
+        if "id" not in row:
+            return
+        start, end = row.get("start_at"), row.get("end_at")
+        start, end = start and parse_dt(start), end and parse_dt(end)
+        if kind == "delete" and end and end <= datetime.now(timezone.utc):
+            return
+        feed.publish_remote(kind, row["id"], row.get("user_id"), row.get("slot_number"), start, end)
+
+    async def listen():
+        from supabase import acreate_client
+        client = await acreate_client(url, key)
+        channel = client.channel("parkos-bookings")
+        channel.on_postgres_changes("*", on_change, table="bookings", schema="public")
+        await channel.subscribe()
+        await asyncio.Event().wait()
+
+    def run():
+        try:
+            asyncio.run(listen())
+        except Exception:
+            # Sessions still see their own process's writes and periodic index rebuilds.
+            logger.exception("Supabase realtime bridge stopped")
+
+    threading.Thread(target=run, name="parkos-realtime", daemon=True).start()
@@ -0,0 +1,79 @@
+"""Occupancy heatmaps: the share of each time bucket every slot was booked for.
+
+Bookings for the range are loaded once into a DataFrame and turned into bucket
+indices with vectorized NumPy. Each booking adds its partial first and last
+buckets directly, and its full buckets through a difference array that one
+cumulative sum per slot resolves; no Python code runs per booking or per cell.
+"""
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+
+from models import IST, to_epoch
+
+BUCKET_MINUTES = 30
+
+
+def _epoch(values):
+    if len(values) and isinstance(values[0], str):
+        return pd.to_datetime(values, utc=True, format="ISO8601").as_unit("s").asi8
+    return values.astype(np.int64)
+
+
+def intervals_frame(rows):
+    """DataFrame(slot_number, start, end) from BookingStore.fetch_intervals rows, whose
+    times are epoch seconds or ISO strings. Times become epoch-second int64 columns and
+    slot numbers a categorical, so a million rows convert in well under a second."""
+    values = np.array(rows, dtype=object).reshape(-1, 3)
+    return pd.DataFrame({"slot_number": pd.Categorical(values[:, 0]),
+                         "start": _epoch(values[:, 1]), "end": _epoch(values[:, 2])})
+
+
+def occupancy_matrix(frame, slots, start, end, bucket_minutes=BUCKET_MINUTES):
+    """(len(slots), buckets) array of the fraction of each bucket of [start, end)
+    that each slot was booked. Bookings on slots outside slots are ignored."""
+    bucket = bucket_minutes * 60
+    t0 = to_epoch(start)
+    n = -(-(to_epoch(end) - t0) // bucket)
+    t1 = t0 + n * bucket
+    # Match the few distinct slot numbers to rows once, then expand by category code
+    slot_numbers = frame["slot_number"].astype("category").cat
+    row = pd.Index(slots).get_indexer(slot_numbers.categories)[slot_numbers.codes]
+    s = frame["start"].to_numpy(dtype=np.int64).clip(t0, t1)
+    e = frame["end"].to_numpy(dtype=np.int64).clip(t0, t1)
+    keep = (row >= 0) & (e > s)
+    row, s, e = row[keep], s[keep] - t0, e[keep] - t0
+
+    # One extra column takes bookings that end exactly at t1
+    width = n + 1
+    size = len(slots) * width
+    first, last = s // bucket, e // bucket
+    cell = row * width
+    one = first == last
+    many = ~one
+    # np.bincount with weights is np.add.at for flat float sums, several times faster.
+    # Seconds booked: bookings inside one bucket, then the partial head and tail
+    # buckets of the others...
+    seconds = np.bincount(
+        np.concatenate([cell[one] + first[one], cell[many] + first[many], cell[many] + last[many]]),
+        np.concatenate([e[one] - s[one], (first[many] + 1) * bucket - s[many], e[many] - last[many] * bucket]),
+        minlength=size)
+    # ...and a full bucket for everything between, as +1/-1 steps summed along each slot
+    ones = np.ones(many.sum())
+    steps = np.bincount(np.concatenate([cell[many] + first[many] + 1, cell[many] + last[many]]),
+                        np.concatenate([ones, -ones]), minlength=size)
+    full = steps.reshape(len(slots), width).cumsum(axis=1) * bucket
+    return ((seconds.reshape(len(slots), width) + full)[:, :n] / bucket).clip(0, 1)
+
+
+def occupancy_heatmap(frame, slots, start, end, bucket_minutes=BUCKET_MINUTES):
+    """occupancy_matrix as a DataFrame: one row per slot, one column per bucket start (IST)."""
+    matrix = occupancy_matrix(frame, slots, start, end, bucket_minutes)
+    buckets = pd.date_range(start.astimezone(IST), periods=matrix.shape[1], freq=timedelta(minutes=bucket_minutes))
+    return pd.DataFrame(matrix, index=pd.Index(slots, name="slot_number"), columns=buckets)
+
+
+def by_row(heatmap, layout):
+    """Mean occupancy per layout row ("Level / Row A"), for lots too big to show by slot."""
+    return heatmap.groupby(heatmap.index.map(layout.row_names), sort=False).mean()
@@ -0,0 +1,133 @@
+"""Shared HTTP client for the Supabase REST API: pooling, retries and per-query timing.
+
+Every session's PostgREST calls go through one httpx.Client, so connections (and,
+with HTTP/2, a single multiplexed connection) are reused across reruns instead of
+paying a TLS handshake per request. Transient failures are retried with
+exponential backoff, and every request is timed per endpoint.
+"""
+import logging
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Safe to resend after the request may have reached the server.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUSES = frozenset({502, 503, 504})
+# Raised before anything was sent, so any method can be retried.
+_NOT_SENT = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+@dataclass(frozen=True)
+class HttpSettings:
+    max_connections: int = 100
+    max_keepalive: int = 20
+    keepalive_expiry: float = 30.0   # seconds an idle connection stays open
+    http2: bool = True
+    connect_timeout: float = 5.0
+    timeout: float = 15.0            # read / write / pool wait
+    retries: int = 2                 # extra attempts after the first
+    backoff: float = 0.2             # seconds before the first retry, doubled each time
+
+
+class QueryStats:
+    """Per-endpoint request counts and latencies ("GET bookings", "POST rpc/reserve_batch")."""
+
+    def __init__(self, window=256):
+        self._lock = threading.Lock()
+        self._window = window
+        self._by_key = {}
+
+    def record(self, key, elapsed, error=False, retries=0):
+        with self._lock:
+            entry = self._by_key.get(key)
+            if entry is None:
+                entry = self._by_key[key] = {"count": 0, "errors": 0, "retries": 0, "total": 0.0,
+                                             "max": 0.0, "recent": deque(maxlen=self._window)}
+            entry["count"] += 1
+            entry["errors"] += error
+            entry["retries"] += retries
+            entry["total"] += elapsed
+            entry["max"] = max(entry["max"], elapsed)
+            entry["recent"].append(elapsed)
+
+    def stats(self):
+        with self._lock:
+            out = {}
+            for key, e in sorted(self._by_key.items()):
+                recent = sorted(e["recent"])
+                out[key] = {
+                    "count": e["count"],
+                    "errors": e["errors"],
+                    "retries": e["retries"],
+                    "mean_ms": round(e["total"] / e["count"] * 1000, 2),
+                    "p50_ms": round(recent[len(recent) // 2] * 1000, 2),
+                    "p95_ms": round(recent[min(len(recent) - 1, int(len(recent) * 0.95))] * 1000, 2),
+                    "max_ms": round(e["max"] * 1000, 2),
+                }
+            return out
+
+
+def endpoint(request):
+    path = request.url.path
+    return f"{request.method} {path.split('/rest/v1/', 1)[-1].strip('/') or path}"
+
+
+class RetryTransport(httpx.BaseTransport):
+    """Wraps a transport with retry/backoff and records each request in QueryStats."""
+
+    def __init__(self, transport, settings, stats):
+        self.transport = transport
+        self.settings = settings
+        self.stats = stats
+
+    def handle_request(self, request):
+        key = endpoint(request)
+        idempotent = request.method in IDEMPOTENT_METHODS
+        t0 = time.perf_counter()
+        attempt = 0
+        while True:
+            try:
+                response = self.transport.handle_request(request)
+            except httpx.TransportError as exc:
+                if attempt >= self.settings.retries or not (idempotent or isinstance(exc, _NOT_SENT)):
+                    self.stats.record(key, time.perf_counter() - t0, error=True, retries=attempt)
+                    raise
+            else:
+                if response.status_code not in RETRY_STATUSES or not idempotent or attempt >= self.settings.retries:
+                    self.stats.record(key, time.perf_counter() - t0, error=response.status_code >= 500, retries=attempt)
+                    return response
+                response.read()
+                response.close()
+            # Full jitter keeps hundreds of sessions from retrying in lockstep
+            delay = self.settings.backoff * (2 ** attempt) * random.uniform(0.5, 1.5)
+            logger.warning("Retrying %s in %.2fs (attempt %d)", key, delay, attempt + 1)
+            time.sleep(delay)
+            attempt += 1
+
+    def close(self):
+        self.transport.close()
+
+
+def build_http_client(settings=None, stats=None):
+    """httpx.Client for SupabaseStore; returns (client, stats)."""
+    settings = settings or HttpSettings()
+    stats = stats or QueryStats()
+    http2 = settings.http2
+    if http2:
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            logger.warning("h2 is not installed (pip install 'httpx[http2]'); using HTTP/1.1")
+            http2 = False
+    limits = httpx.Limits(max_connections=settings.max_connections,
+                          max_keepalive_connections=settings.max_keepalive,
+                          keepalive_expiry=settings.keepalive_expiry)
+    timeout = httpx.Timeout(settings.timeout, connect=settings.connect_timeout)
+    transport = RetryTransport(httpx.HTTPTransport(http2=http2, limits=limits), settings, stats)
+    return httpx.Client(transport=transport, timeout=timeout, follow_redirects=True), stats
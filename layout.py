@@ -0,0 +1,96 @@
+"""Parking lot layout: lots -> levels -> rows -> slots.
+
+Layouts are loaded from the parking_slots table (migrations/008), one row per
+space, and cached per lot by BookingService. A lot without any rows falls back
+to DEFAULT_LAYOUT, the original two rows of ten.
+"""
+import hashlib
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Tuple
+
+DEFAULT_LOT = "main"
+
+
+@dataclass(frozen=True)
+class Row:
+    label: str
+    slots: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class Level:
+    name: str
+    rows: Tuple[Row, ...]
+
+    @property
+    def slots(self):
+        return tuple(s for row in self.rows for s in row.slots)
+
+
+@dataclass(frozen=True)
+class Layout:
+    lot_id: str
+    levels: Tuple[Level, ...]
+
+    @cached_property
+    def slots(self):
+        """Every slot number, level by level and row by row."""
+        return tuple(s for level in self.levels for s in level.slots)
+
+    @cached_property
+    def version(self):
+        """Short digest of the structure; changes whenever a slot is added, moved or removed."""
+        return hashlib.sha1(repr((self.lot_id, self.levels)).encode()).hexdigest()[:12]
+
+    @cached_property
+    def grid(self):
+        """The structure as plain lists, the part of the slot grid's data that only
+        changes with the layout, so it is built once per load instead of per rerun."""
+        return [{"name": level.name, "rows": [{"label": row.label, "slots": list(row.slots)} for row in level.rows]}
+                for level in self.levels]
+
+    @cached_property
+    def row_names(self):
+        """slot_number -> "Level / Row A", for views that group slots by row."""
+        return {s: f"{level.name} / Row {row.label}" for level in self.levels for row in level.rows for s in row.slots}
+
+    def to_rows(self):
+        """(slot_number, lot_id, level, level_order, row_label, row_order, position) per
+        slot, the shape of a parking_slots row."""
+        return [(s, self.lot_id, level.name, i, row.label, j, k)
+                for i, level in enumerate(self.levels)
+                for j, row in enumerate(level.rows)
+                for k, s in enumerate(row.slots, 1)]
+
+
+def layout_from_rows(lot_id, rows):
+    """Layout from parking_slots rows (see Layout.to_rows), in any order; None if empty."""
+    rows = sorted(rows, key=lambda r: (r[3], r[2], r[5], r[4], r[6], r[0]))
+    levels, level_name, row_label = [], None, None
+    for slot_number, _, level, _, label, _, _ in rows:
+        if level != level_name:
+            levels.append((level, []))
+            level_name, row_label = level, None
+        if label != row_label:
+            levels[-1][1].append((label, []))
+            row_label = label
+        levels[-1][1][-1][1].append(slot_number)
+    if not levels:
+        return None
+    return Layout(lot_id, tuple(Level(name, tuple(Row(label, tuple(slots)) for label, slots in level_rows))
+                                for name, level_rows in levels))
+
+
+def grid_layout(lot_id, levels, rows, per_row):
+    """A regular layout: levels named L1.., rows lettered A.. with per_row spaces each.
+    Slot numbers are "A1" on a single level and "L2-A1" otherwise, unique across levels."""
+    labels = [chr(ord("A") + r) for r in range(rows)]
+    prefix = (lambda n: "") if levels == 1 else (lambda n: f"L{n}-")
+    return Layout(lot_id, tuple(
+        Level(f"Level {n}" if levels > 1 else "Ground",
+              tuple(Row(label, tuple(f"{prefix(n)}{label}{i}" for i in range(1, per_row + 1))) for label in labels))
+        for n in range(1, levels + 1)))
+
+
+DEFAULT_LAYOUT = grid_layout(DEFAULT_LOT, levels=1, rows=2, per_row=10)
@@ -0,0 +1,14 @@
+-- Composite index backing the server-side overlap filter in fetch_blocked.
+--
+-- fetch_blocked asks for
+--   slot_number IN (...) AND start_datetime >= <window start - 24h>
+--   AND start_datetime < <window end> AND end_datetime > <window start>
+-- which is one bounded range scan per slot on this index. The 24h lower bound
+-- (MAX_BOOKING_DURATION in app.py) is what keeps the scan from walking the
+-- whole history of the slot.
+--
+-- Timestamps are stored as zero-padded "YYYY-MM-DD HH:MM" IST strings, so text
+-- ordering matches chronological ordering.
+
+create index concurrently if not exists bookings_slot_start_end_idx
+    on public.bookings (slot_number, start_datetime, end_datetime);
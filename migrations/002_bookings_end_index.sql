@@ -0,0 +1,5 @@
+-- Supports the occupancy index rebuild (fetch_active_bookings), which loads
+-- every booking that has not ended yet: end_datetime > now.
+
+create index concurrently if not exists bookings_end_idx
+    on public.bookings (end_datetime);
@@ -0,0 +1,6 @@
+-- Stream booking changes to app processes (events.start_realtime_bridge).
+-- Replica identity full makes DELETE events carry the whole old row, so the
+-- bridge knows which slot to free and which user's cached bookings to drop.
+
+alter table public.bookings replica identity full;
+alter publication supabase_realtime add table public.bookings;
@@ -0,0 +1,85 @@
+-- Store booking times as timestamptz instead of "YYYY-MM-DD HH:MM" IST text.
+--
+-- Rolled out expand -> backfill -> contract so the table stays writable throughout:
+--   1. Run this file. New columns are added and kept in sync with the old ones by
+--      a trigger, so app versions reading either pair keep working.
+--   2. Backfill existing rows in batches: python scripts/backfill_timestamptz.py
+--   3. Deploy the app that reads and writes start_at/end_at.
+--   4. Run the contract step at the bottom once nothing reads the text columns.
+
+-- ---------- 1. Expand ----------
+alter table public.bookings
+    add column if not exists start_at timestamptz,
+    add column if not exists end_at timestamptz;
+
+alter table public.bookings
+    alter column start_datetime drop not null,
+    alter column end_datetime drop not null;
+
+create or replace function public.bookings_sync_timestamps() returns trigger
+language plpgsql as $$
+begin
+    if new.start_at is null and new.start_datetime is not null then
+        new.start_at := new.start_datetime::timestamp at time zone 'Asia/Kolkata';
+    elsif new.start_datetime is null and new.start_at is not null then
+        new.start_datetime := to_char(new.start_at at time zone 'Asia/Kolkata', 'YYYY-MM-DD HH24:MI');
+    end if;
+    if new.end_at is null and new.end_datetime is not null then
+        new.end_at := new.end_datetime::timestamp at time zone 'Asia/Kolkata';
+    elsif new.end_datetime is null and new.end_at is not null then
+        new.end_datetime := to_char(new.end_at at time zone 'Asia/Kolkata', 'YYYY-MM-DD HH24:MI');
+    end if;
+    return new;
+end $$;
+
+drop trigger if exists bookings_sync_timestamps on public.bookings;
+create trigger bookings_sync_timestamps
+    before insert or update on public.bookings
+    for each row execute function public.bookings_sync_timestamps();
+
+-- ---------- 2. Backfill ----------
+-- Converts up to batch_size rows per call and returns how many it touched, so the
+-- caller loops until 0 without holding one long lock on the whole table.
+create or replace function public.backfill_booking_timestamps(batch_size int default 5000)
+returns int language plpgsql as $$
+declare
+    touched int;
+begin
+    with batch as (
+        select id from public.bookings
+        where start_at is null or end_at is null
+        limit batch_size
+        for update skip locked
+    )
+    update public.bookings b
+    set start_at = b.start_datetime::timestamp at time zone 'Asia/Kolkata',
+        end_at = b.end_datetime::timestamp at time zone 'Asia/Kolkata'
+    from batch
+    where b.id = batch.id;
+    get diagnostics touched = row_count;
+    return touched;
+end $$;
+
+-- Same shape as 001/002, on the new columns. Built concurrently, so run these
+-- statements outside a transaction.
+create index concurrently if not exists bookings_slot_start_at_end_at_idx
+    on public.bookings (slot_number, start_at, end_at);
+
+create index concurrently if not exists bookings_user_start_at_idx
+    on public.bookings (user_id, start_at);
+
+create index concurrently if not exists bookings_end_at_idx
+    on public.bookings (end_at);
+
+-- ---------- 4. Contract (run after the backfill and deploy) ----------
+-- alter table public.bookings
+--     alter column start_at set not null,
+--     alter column end_at set not null;
+-- drop trigger if exists bookings_sync_timestamps on public.bookings;
+-- drop function if exists public.bookings_sync_timestamps();
+-- drop function if exists public.backfill_booking_timestamps(int);
+-- drop index concurrently if exists bookings_slot_start_end_idx;
+-- drop index concurrently if exists bookings_end_idx;
+-- alter table public.bookings
+--     drop column start_datetime,
+--     drop column end_datetime;
@@ -0,0 +1,29 @@
+-- Make the database the single source of truth for slot availability.
+--
+-- Two sessions confirming the same slot at the same moment used to both pass
+-- the (possibly stale) availability check and both insert. With this constraint
+-- the second insert fails with SQLSTATE 23P01 (exclusion_violation), which
+-- SupabaseStore.reserve reports as a conflict instead of a booking.
+--
+-- Requires migration 004 (start_at/end_at). Bookings are half-open [start, end),
+-- so back-to-back bookings on a slot do not conflict.
+--
+-- Rows the 004 backfill hasn't reached yet have no start_at/end_at, and a range
+-- with NULL bounds is unbounded, so the constraint leaves them out; each row is
+-- checked once the backfill fills it in. Running the backfill first (see README)
+-- means an overlap from the old race shows up here rather than mid-backfill.
+--
+-- Adding the constraint validates existing rows and fails if the old race has
+-- already produced overlaps. List them first and cancel the later duplicate:
+--
+--   select a.id, b.id, a.slot_number, a.start_at, a.end_at, b.start_at, b.end_at
+--   from public.bookings a join public.bookings b
+--     on a.slot_number = b.slot_number and a.id < b.id
+--    and tstzrange(a.start_at, a.end_at, '[)') && tstzrange(b.start_at, b.end_at, '[)');
+
+create extension if not exists btree_gist;
+
+alter table public.bookings
+    add constraint bookings_no_overlap
+    exclude using gist (slot_number with =, tstzrange(start_at, end_at, '[)') with &&)
+    where (start_at is not null and end_at is not null);
@@ -0,0 +1,72 @@
+-- All-or-nothing batch and recurring reservations (SupabaseStore.reserve_many /
+-- reserve_recurring). Requires migrations 004 and 005.
+--
+-- Both return jsonb {"ids": [...], "conflicts": [{slot_number, start_at, end_at}, ...]}.
+-- When conflicts is non-empty nothing was inserted. Adjust p_user_id's type if
+-- users.id is not bigint.
+
+create or replace function public.reserve_batch(p_user_id bigint, p_items jsonb)
+returns jsonb language plpgsql as $$
+declare
+    conflicts jsonb;
+    ids jsonb;
+begin
+    if jsonb_array_length(p_items) > 500 then
+        raise exception 'reserve_batch: at most 500 bookings per call, got %', jsonb_array_length(p_items);
+    end if;
+
+    -- One pass checks every request against existing bookings (bounded like
+    -- fetch_blocked, so it stays on bookings_slot_start_at_end_at_idx) and
+    -- against earlier requests in the same batch.
+    with req as (
+        select r.ord, r.item->>'slot_number' as slot_number,
+               (r.item->>'start_at')::timestamptz as start_at,
+               (r.item->>'end_at')::timestamptz as end_at
+        from jsonb_array_elements(p_items) with ordinality as r(item, ord)
+    )
+    select coalesce(jsonb_agg(jsonb_build_object(
+               'slot_number', req.slot_number, 'start_at', req.start_at, 'end_at', req.end_at) order by req.ord), '[]')
+    into conflicts
+    from req
+    where exists (select 1 from public.bookings b
+                  where b.slot_number = req.slot_number
+                    and b.start_at >= req.start_at - interval '24 hours'
+                    and b.start_at < req.end_at and b.end_at > req.start_at)
+       or exists (select 1 from req r2
+                  where r2.ord < req.ord and r2.slot_number = req.slot_number
+                    and r2.start_at < req.end_at and r2.end_at > req.start_at);
+
+    if jsonb_array_length(conflicts) > 0 then
+        return jsonb_build_object('ids', '[]'::jsonb, 'conflicts', conflicts);
+    end if;
+
+    with inserted as (
+        insert into public.bookings (user_id, slot_number, start_at, end_at)
+        select p_user_id, r.item->>'slot_number', (r.item->>'start_at')::timestamptz, (r.item->>'end_at')::timestamptz
+        from jsonb_array_elements(p_items) with ordinality as r(item, ord)
+        order by r.ord
+        returning id
+    )
+    select coalesce(jsonb_agg(id), '[]') into ids from inserted;
+    return jsonb_build_object('ids', ids, 'conflicts', '[]'::jsonb);
+exception when exclusion_violation then
+    -- A concurrent booking landed between the check and the insert; the insert was
+    -- rolled back. Which request lost is unknown, so report the whole batch.
+    return jsonb_build_object('ids', '[]'::jsonb, 'conflicts', p_items);
+end $$;
+
+-- Every p_slots slot on each day from p_start's date through p_until (IST) whose
+-- ISO weekday (1 = Monday) is in p_isodows, at p_start's time of day, lasting
+-- p_end - p_start. Expanded here so a month of bookings is one request.
+create or replace function public.reserve_recurring(
+    p_user_id bigint, p_slots text[], p_start timestamptz, p_end timestamptz,
+    p_until date, p_isodows int[] default '{1,2,3,4,5,6,7}')
+returns jsonb language sql as $$
+    select public.reserve_batch(p_user_id, coalesce(jsonb_agg(jsonb_build_object(
+               'slot_number', s.slot, 'start_at', d.day_start, 'end_at', d.day_start + (p_end - p_start))
+               order by d.day_start, s.ord), '[]'))
+    from generate_series(p_start, (p_until + 1)::timestamp at time zone 'Asia/Kolkata' - interval '1 second',
+                         interval '1 day') as d(day_start)
+    cross join unnest(p_slots) with ordinality as s(slot, ord)
+    where extract(isodow from d.day_start at time zone 'Asia/Kolkata')::int = any(p_isodows)
+$$;
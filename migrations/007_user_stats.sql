@@ -0,0 +1,35 @@
+-- Per-user booking counters for the Overview stats row (count_bookings).
+--
+-- "Total Bookings" used to be len() of every booking the user ever made. A row
+-- per user kept current by triggers makes it a primary-key lookup. "Upcoming"
+-- is still derived from the current/future list the page already loads.
+
+create table if not exists public.user_stats (
+    user_id bigint primary key references public.users(id) on delete cascade,
+    total_bookings bigint not null default 0,
+    updated_at timestamptz not null default now()
+);
+
+create or replace function public.bookings_maintain_user_stats() returns trigger
+language plpgsql as $$
+begin
+    if tg_op = 'INSERT' then
+        insert into public.user_stats as s (user_id, total_bookings) values (new.user_id, 1)
+        on conflict (user_id) do update set total_bookings = s.total_bookings + 1, updated_at = now();
+    elsif tg_op = 'DELETE' then
+        update public.user_stats set total_bookings = total_bookings - 1, updated_at = now()
+        where user_id = old.user_id;
+    end if;
+    return null;
+end $$;
+
+drop trigger if exists bookings_maintain_user_stats on public.bookings;
+create trigger bookings_maintain_user_stats
+    after insert or delete on public.bookings
+    for each row execute function public.bookings_maintain_user_stats();
+
+-- Seed from existing rows. Run in the same transaction as the trigger creation
+-- (or with writes paused) so no booking is counted twice or missed.
+insert into public.user_stats (user_id, total_bookings)
+select user_id, count(*) from public.bookings group by user_id
+on conflict (user_id) do update set total_bookings = excluded.total_bookings, updated_at = now();
@@ -0,0 +1,27 @@
+-- Data-driven parking layout: lots -> levels -> rows -> slots (fetch_layout).
+--
+-- The slot grid used to be hardcoded as rows A and B of ten spaces. Each row of
+-- this table is one space; the app groups a lot's rows by level and row, ordered
+-- by level_order, row_order and position, and caches the result per lot
+-- (PARKING_LOT, LAYOUT_TTL). A lot with no rows falls back to the old A1-B10 grid.
+--
+-- bookings.slot_number refers to slot_number, so slot numbers must be unique
+-- across lots and levels (e.g. "L2-A14").
+
+create table if not exists public.parking_slots (
+    slot_number text primary key,
+    lot_id text not null default 'main',
+    level text not null default 'Ground',
+    level_order integer not null default 0,
+    row_label text not null,
+    row_order integer not null default 0,
+    position integer not null default 0
+);
+
+create index if not exists parking_slots_lot_idx on public.parking_slots (lot_id);
+
+-- The grid the app shipped with, so existing bookings keep their spaces.
+insert into public.parking_slots (slot_number, lot_id, level, level_order, row_label, row_order, position)
+select r.label || n, 'main', 'Ground', 0, r.label, r.ord - 1, n
+from unnest(array['A', 'B']) with ordinality as r(label, ord), generate_series(1, 10) as n
+on conflict (slot_number) do nothing;
@@ -0,0 +1,65 @@
+-- Move finished bookings out of the hot table (archive.py, scripts/archive_bookings.py).
+--
+-- Bookings that ended more than ARCHIVE_RETENTION_DAYS ago are moved to
+-- bookings_archive in batches by archive_bookings(), so availability and
+-- current-booking queries only see current, future and recently finished rows.
+-- History reads (fetch_history) and heatmaps (fetch_intervals) read both tables.
+--
+-- Requires migrations 004 and 007.
+
+create table if not exists public.bookings_archive (
+    id bigint primary key,
+    user_id bigint not null,
+    slot_number text not null,
+    start_at timestamptz not null,
+    end_at timestamptz not null,
+    archived_at timestamptz not null default now()
+);
+
+create index if not exists bookings_archive_user_start_at_idx on public.bookings_archive (user_id, start_at);
+create index if not exists bookings_archive_end_at_idx on public.bookings_archive (end_at);
+
+-- A move is an insert into the archive followed by a delete from bookings, so
+-- the user_stats delete trigger must not count it as a cancellation.
+create or replace function public.bookings_maintain_user_stats() returns trigger
+language plpgsql as $$
+begin
+    if tg_op = 'INSERT' then
+        insert into public.user_stats as s (user_id, total_bookings) values (new.user_id, 1)
+        on conflict (user_id) do update set total_bookings = s.total_bookings + 1, updated_at = now();
+    elsif tg_op = 'DELETE' then
+        update public.user_stats set total_bookings = total_bookings - 1, updated_at = now()
+        where user_id = old.user_id
+          and not exists (select 1 from public.bookings_archive a where a.id = old.id);
+    end if;
+    return null;
+end $$;
+
+-- Moves up to p_batch_size bookings that ended by p_before, oldest first, and
+-- returns how many it moved. Each call is one short transaction; rows another
+-- caller is already moving are skipped rather than waited for.
+create or replace function public.archive_bookings(p_before timestamptz, p_batch_size integer default 5000)
+returns integer language plpgsql as $$
+declare
+    ids bigint[];
+begin
+    select array_agg(id) into ids
+    from (select id from public.bookings where end_at <= p_before
+          order by end_at limit p_batch_size for update skip locked) b;
+    if ids is null then
+        return 0;
+    end if;
+    insert into public.bookings_archive (id, user_id, slot_number, start_at, end_at)
+    select id, user_id, slot_number, start_at, end_at from public.bookings where id = any(ids)
+    on conflict (id) do nothing;
+    delete from public.bookings where id = any(ids);
+    return cardinality(ids);
+end $$;
+
+-- Re-seeding user_stats (migration 007) after archiving must count both tables:
+--
+--   insert into public.user_stats (user_id, total_bookings)
+--   select user_id, count(*) from (select user_id from public.bookings
+--                                  union all select user_id from public.bookings_archive) b
+--   group by user_id
+--   on conflict (user_id) do update set total_bookings = excluded.total_bookings, updated_at = now();
@@ -0,0 +1,175 @@
+-- Rollups behind the operator dashboard (rollups.py, scripts/booking_rollups.py).
+--
+-- The dashboard reads two small tables and never scans bookings:
+--   rollup_slot_days  seconds each slot was booked, per IST day
+--   rollup_hours      seconds booked across a lot, bookings starting and late
+--                     cancellations, per lot, IST day and hour
+-- Triggers queue every booking insert, cancel and edit in booking_changes;
+-- refresh_booking_rollups() folds queued changes in, oldest first, and deletes
+-- them, so each run only touches bookings changed since the last one.
+-- rebuild_booking_rollups() recomputes occupancy from bookings and
+-- bookings_archive: run it once after applying this migration.
+--
+-- Requires migrations 008 and 009, and the 004 backfill (scripts/backfill_timestamptz.py)
+-- to have finished. Rows still without start_at/end_at are neither queued nor rebuilt;
+-- if one is backfilled later, the update queues it as a new booking.
+
+create table if not exists public.booking_changes (
+    seq bigserial primary key,
+    op char(1) not null,            -- I insert, D cancel, U old row of an edit
+    booking_id bigint not null,
+    slot_number text not null,
+    start_at timestamptz not null,
+    end_at timestamptz not null,
+    changed_at timestamptz not null default now()
+);
+
+create table if not exists public.rollup_slot_days (
+    day date not null,
+    slot_number text not null,
+    lot_id text not null,
+    occupied_seconds bigint not null default 0,
+    primary key (day, slot_number)
+);
+create index if not exists rollup_slot_days_lot_day_idx on public.rollup_slot_days (lot_id, day);
+
+create table if not exists public.rollup_hours (
+    lot_id text not null,
+    day date not null,
+    hour smallint not null,
+    occupied_seconds bigint not null default 0,
+    bookings integer not null default 0,
+    late_cancellations integer not null default 0,
+    primary key (lot_id, day, hour)
+);
+
+create table if not exists public.rollup_state (
+    name text primary key,
+    refreshed_at timestamptz,
+    rebuilt_at timestamptz
+);
+insert into public.rollup_state (name) values ('bookings') on conflict (name) do nothing;
+
+create or replace function public.bookings_queue_change() returns trigger
+language plpgsql as $$
+begin
+    -- Archive moves (migration 009) are not cancellations; a row without times (not
+    -- backfilled yet, migration 004) was never counted, so there is nothing to take back
+    if (tg_op = 'UPDATE' or (tg_op = 'DELETE' and not exists (select 1 from public.bookings_archive a where a.id = old.id)))
+       and old.start_at is not null and old.end_at is not null then
+        insert into public.booking_changes (op, booking_id, slot_number, start_at, end_at)
+        values (case tg_op when 'DELETE' then 'D' else 'U' end, old.id, old.slot_number, old.start_at, old.end_at);
+    end if;
+    if tg_op in ('INSERT', 'UPDATE') and new.start_at is not null and new.end_at is not null then
+        insert into public.booking_changes (op, booking_id, slot_number, start_at, end_at)
+        values ('I', new.id, new.slot_number, new.start_at, new.end_at);
+    end if;
+    return null;
+end $$;
+
+drop trigger if exists bookings_queue_change on public.bookings;
+create trigger bookings_queue_change
+    after insert or delete or update of slot_number, start_at, end_at on public.bookings
+    for each row execute function public.bookings_queue_change();
+
+-- Adds the caller's temp table rollup_pending(sign, slot_number, start_at, end_at, late)
+-- to the rollups: sign times the seconds each booking covers in every IST day and
+-- hour, plus sign bookings and late late cancellations at the hour it starts.
+-- Slots missing from parking_slots count towards the 'main' lot.
+create or replace function public.rollup_apply_pending() returns void
+language plpgsql as $$
+begin
+    insert into public.rollup_slot_days as r (day, slot_number, lot_id, occupied_seconds)
+    select b::date, p.slot_number, coalesce(min(ps.lot_id), 'main'),
+           sum(p.sign * extract(epoch from least(p.end_at at time zone 'Asia/Kolkata', b + interval '1 day')
+                                         - greatest(p.start_at at time zone 'Asia/Kolkata', b)))::bigint
+    from rollup_pending p
+    left join public.parking_slots ps on ps.slot_number = p.slot_number
+    cross join generate_series(date_trunc('day', p.start_at at time zone 'Asia/Kolkata'),
+                               p.end_at at time zone 'Asia/Kolkata' - interval '1 second', interval '1 day') b
+    group by 1, 2
+    on conflict (day, slot_number) do update set occupied_seconds = r.occupied_seconds + excluded.occupied_seconds;
+
+    insert into public.rollup_hours as r (lot_id, day, hour, occupied_seconds, bookings, late_cancellations)
+    select lot_id, b::date, extract(hour from b)::smallint, sum(seconds)::bigint, sum(bookings), sum(late)
+    from (
+        select coalesce(ps.lot_id, 'main') as lot_id, b,
+               p.sign * extract(epoch from least(p.end_at at time zone 'Asia/Kolkata', b + interval '1 hour')
+                                         - greatest(p.start_at at time zone 'Asia/Kolkata', b)) as seconds,
+               0 as bookings, 0 as late
+        from rollup_pending p
+        left join public.parking_slots ps on ps.slot_number = p.slot_number
+        cross join generate_series(date_trunc('hour', p.start_at at time zone 'Asia/Kolkata'),
+                                   p.end_at at time zone 'Asia/Kolkata' - interval '1 second', interval '1 hour') b
+        union all
+        select coalesce(ps.lot_id, 'main'), date_trunc('hour', p.start_at at time zone 'Asia/Kolkata'), 0, p.sign, p.late
+        from rollup_pending p
+        left join public.parking_slots ps on ps.slot_number = p.slot_number
+    ) h
+    group by 1, 2, 3
+    on conflict (lot_id, day, hour) do update set
+        occupied_seconds = r.occupied_seconds + excluded.occupied_seconds,
+        bookings = r.bookings + excluded.bookings,
+        late_cancellations = r.late_cancellations + excluded.late_cancellations;
+end $$;
+
+-- Folds up to p_batch_size queued changes into the rollups and returns how many.
+-- Changes another refresh has claimed are skipped, so runs may overlap. A cancel
+-- from an hour before its booking starts to 15 minutes after counts as a late
+-- cancellation (rollups.NO_SHOW_BEFORE / NO_SHOW_AFTER).
+create or replace function public.refresh_booking_rollups(p_batch_size integer default 10000)
+returns integer language plpgsql as $$
+declare
+    n integer;
+begin
+    drop table if exists pg_temp.rollup_pending;
+    create temp table rollup_pending (sign integer, slot_number text, start_at timestamptz, end_at timestamptz, late integer)
+        on commit drop;
+    with batch as (
+        delete from public.booking_changes where seq in (
+            select seq from public.booking_changes order by seq limit p_batch_size for update skip locked)
+        returning op, slot_number, start_at, end_at, changed_at
+    )
+    insert into rollup_pending
+    select case op when 'I' then 1 else -1 end, slot_number, start_at, end_at,
+           (op = 'D' and changed_at >= start_at - interval '60 minutes'
+                     and changed_at < start_at + interval '15 minutes')::int
+    from batch;
+    get diagnostics n = row_count;
+    perform public.rollup_apply_pending();
+    update public.rollup_state set refreshed_at = now() where name = 'bookings';
+    return n;
+end $$;
+
+-- Recomputes occupancy and booking counts from bookings and bookings_archive and
+-- returns how many bookings it read. Booking writes wait while it runs (reads do
+-- not). Cancellations are only known from the queue, so late_cancellations is kept
+-- and the late ones still queued are added as the queue is cleared.
+create or replace function public.rebuild_booking_rollups() returns bigint
+language plpgsql as $$
+declare
+    n bigint;
+begin
+    lock table public.bookings in share row exclusive mode;
+    drop table if exists pg_temp.rollup_pending;
+    create temp table rollup_pending (sign integer, slot_number text, start_at timestamptz, end_at timestamptz, late integer)
+        on commit drop;
+    insert into rollup_pending
+    select 1, slot_number, start_at, end_at, 0 from public.bookings where start_at is not null and end_at is not null
+    union all
+    select 1, slot_number, start_at, end_at, 0 from public.bookings_archive where start_at is not null and end_at is not null;
+    get diagnostics n = row_count;
+    -- Waits for rows a running refresh has claimed, then skips them as already applied
+    with queued as (
+        delete from public.booking_changes returning op, slot_number, start_at, end_at, changed_at
+    )
+    insert into rollup_pending
+    select 0, slot_number, start_at, end_at, 1 from queued
+    where op = 'D' and changed_at >= start_at - interval '60 minutes'
+                   and changed_at < start_at + interval '15 minutes';
+    delete from public.rollup_slot_days;
+    update public.rollup_hours set occupied_seconds = 0, bookings = 0;
+    perform public.rollup_apply_pending();
+    update public.rollup_state set refreshed_at = now(), rebuilt_at = now() where name = 'bookings';
+    return n;
+end $$;
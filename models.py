@@ -0,0 +1,122 @@
+"""Typed booking records, parsed once when they are fetched."""
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, List, NamedTuple, Optional
+
+import pytz
+
+IST = pytz.timezone('Asia/Kolkata')
+# IST has had a fixed +05:30 offset since 1945, so attaching this tzinfo is
+# equivalent to IST.localize() without its per-call transition lookup.
+_IST_FIXED = IST.localize(datetime(2000, 1, 1)).tzinfo
+
+
+def parse_dt(value):
+    """Stored timestamp -> IST-aware datetime.
+
+    Accepts epoch seconds (SQLite), ISO 8601 timestamptz strings (PostgREST) and
+    legacy naive "YYYY-MM-DD HH:MM" strings, which are IST.
+    """
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value, _IST_FIXED)
+    # fromisoformat is much faster than strptime
+    dt_obj = datetime.fromisoformat(value.strip())
+    if dt_obj.tzinfo is None:
+        return dt_obj.replace(tzinfo=_IST_FIXED)
+    return dt_obj.astimezone(_IST_FIXED)
+
+
+def to_epoch(dt):
+    return int(dt.timestamp())
+
+
+@dataclass(frozen=True, slots=True)
+class Booking:
+    id: Any
+    slot_number: str
+    start: datetime   # timezone-aware, IST
+    end: datetime
+
+    @classmethod
+    def from_row(cls, booking_id, slot_number, start, end):
+        return cls(booking_id, slot_number, parse_dt(start), parse_dt(end))
+
+
+class Reservation(NamedTuple):
+    booking_id: Any   # None when the slot was already taken
+    conflict: bool    # an overlapping booking for the slot exists
+
+    @property
+    def ok(self):
+        return not self.conflict
+
+
+class BatchReservation(NamedTuple):
+    booking_ids: List[Any]  # in request order; empty unless every booking was made
+    conflicts: List[tuple]  # (slot_number, start, end) requests that clashed
+
+    @property
+    def ok(self):
+        return not self.conflicts
+
+
+def expand_recurrence(slot_numbers, start, end, until, weekdays=range(7)):
+    """(slot_number, start, end) for each slot on every day from start's date to until
+    (a date, inclusive) whose weekday() is in weekdays, at the same local times."""
+    weekdays = set(weekdays)
+    occurrences = []
+    day = timedelta(days=1)
+    while start.date() <= until:
+        if start.weekday() in weekdays:
+            occurrences.extend((slot, start, end) for slot in slot_numbers)
+        # IST has no DST, so adding whole days keeps the wall-clock time
+        start, end = start + day, end + day
+    return occurrences
+
+
+class FreeWindow(NamedTuple):
+    slot_number: str
+    start: datetime
+    end: datetime
+
+
+class Rollups(NamedTuple):
+    slot_days: List[tuple]              # (day, slot_number, occupied_seconds)
+    hours: List[tuple]                  # (day, hour, occupied_seconds, bookings, late_cancellations)
+    refreshed_at: Optional[datetime]    # last refresh_rollups, None if never
+
+
+class HistoryPage(NamedTuple):
+    bookings: List[Booking]    # most recent first
+    next_cursor: Optional[tuple]  # (start, id) to pass for the next page; None on the last page
+
+
+class BookingTimeline(NamedTuple):
+    current_future: List[Booking]       # not yet ended, by start
+    past: List[Booking]                 # ended, most recent first
+    active: Optional[Booking]
+    upcoming_count: int
+    next_transition: Optional[datetime]  # next start or end, when the page must change
+
+
+def classify_bookings(bookings, now):
+    """Split bookings (ordered by start) into current/future and past in one pass."""
+    current_future, past = [], []
+    active = next_transition = None
+    upcoming_count = 0
+    for b in bookings:
+        if b.end <= now:
+            past.append(b)
+            continue
+        current_future.append(b)
+        if b.start <= now:
+            if active is None:
+                active = b
+            edge = b.end
+        else:
+            upcoming_count += 1
+            edge = b.start
+        if next_transition is None or edge < next_transition:
+            next_transition = edge
+    past.reverse()
+    return BookingTimeline(current_future, past, active, upcoming_count, next_transition)
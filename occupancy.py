@@ -0,0 +1,193 @@
+"""In-memory occupancy index answering "which slots are free for [start, end)".
+
+One sorted interval list per slot_number holds every booking that has not ended
+yet. Lookups bisect each slot's list, so a grid query costs O(slots * log n)
+instead of a scan over the bookings table. The index is shared by all sessions
+of the process and kept current on insert and delete; a periodic rebuild picks
+up writes made by other processes. Intervals are kept as epoch seconds so
+comparisons are plain integer compares.
+"""
+import heapq
+import threading
+import time
+from bisect import bisect_left, insort
+
+from models import FreeWindow, parse_dt, to_epoch
+from store import MAX_BOOKING_DURATION
+
+_MAX_DURATION_S = int(MAX_BOOKING_DURATION.total_seconds())
+
+
+class OccupancyIndex:
+    def __init__(self, store, clock, max_age=15.0):
+        """clock() returns the current time as an aware datetime; max_age is
+        the number of seconds after which the index is rebuilt from the store."""
+        self.store = store
+        self.clock = clock
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._rebuild_lock = threading.Lock()
+        self._by_slot = {}     # slot_number -> sorted [(start_s, end_s, booking_id)]
+        self._entry_of = {}    # booking_id -> (slot_number, interval)
+        self._journal = None   # add/remove calls made while a rebuild is reading the store
+        self._built = None     # time.monotonic() of the last rebuild
+        self.queries = self.rebuilds = self.updates = 0
+
+    def rebuild(self):
+        with self._lock:
+            self._journal = []
+        rows = self.store.fetch_active_bookings(self.clock())
+        by_slot, entry_of = {}, {}
+        for b in rows:
+            interval = (to_epoch(b.start), to_epoch(b.end), b.id)
+            by_slot.setdefault(b.slot_number, []).append(interval)
+            entry_of[b.id] = (b.slot_number, interval)
+        for intervals in by_slot.values():
+            intervals.sort()
+        with self._lock:
+            self._by_slot, self._entry_of = by_slot, entry_of
+            # Writes that raced with the snapshot may or may not be in it; replaying is idempotent.
+            for args in self._journal:
+                if len(args) == 1:
+                    self._remove(*args)
+                else:
+                    self._add(*args)
+            self._journal = None
+            self._built = time.monotonic()
+            self.rebuilds += 1
+
+    def _ensure_fresh(self):
+        if self._built is not None and time.monotonic() - self._built <= self.max_age:
+            return
+        # One session rebuilds while the others keep answering from the previous snapshot.
+        if self._rebuild_lock.acquire(blocking=self._built is None):
+            try:
+                if self._built is None or time.monotonic() - self._built > self.max_age:
+                    self.rebuild()
+            finally:
+                self._rebuild_lock.release()
+
+    def warm(self):
+        """Rebuild now if the snapshot is due, so the next blocked() call doesn't wait."""
+        self._ensure_fresh()
+
+    def mark_stale(self):
+        """Rebuild on the next query, e.g. after the store reported a conflict the index missed."""
+        with self._lock:
+            self._built = float("-inf") if self._built is not None else None
+
+    def _add(self, booking_id, slot_number, start, end):
+        self._remove(booking_id)
+        interval = (start, end, booking_id)
+        insort(self._by_slot.setdefault(slot_number, []), interval)
+        self._entry_of[booking_id] = (slot_number, interval)
+
+    def _remove(self, booking_id):
+        entry = self._entry_of.pop(booking_id, None)
+        if entry is None:
+            return
+        slot_number, interval = entry
+        intervals = self._by_slot[slot_number]
+        i = bisect_left(intervals, interval)
+        if i < len(intervals) and intervals[i] == interval:
+            del intervals[i]
+
+    def add(self, booking_id, slot_number, start, end):
+        start, end = to_epoch(start), to_epoch(end)
+        with self._lock:
+            self.updates += 1
+            self._add(booking_id, slot_number, start, end)
+            if self._journal is not None:
+                self._journal.append((booking_id, slot_number, start, end))
+
+    def remove(self, booking_id):
+        with self._lock:
+            self.updates += 1
+            self._remove(booking_id)
+            if self._journal is not None:
+                self._journal.append((booking_id,))
+
+    def _overlaps(self, intervals, start, end, earliest):
+        # Intervals starting before `end`, walked back only as far as the longest
+        # possible booking could still reach into the window.
+        i = bisect_left(intervals, (end,)) - 1
+        while i >= 0 and intervals[i][0] >= earliest:
+            if intervals[i][1] > start:
+                return True
+            i -= 1
+        return False
+
+    def blocked(self, slots, start, end):
+        """Return the subset of slots with a booking overlapping [start, end)."""
+        self._ensure_fresh()
+        start, end = to_epoch(start), to_epoch(end)
+        earliest = start - _MAX_DURATION_S
+        with self._lock:
+            self.queries += 1
+            return {s for s in slots if self._overlaps(self._by_slot.get(s, ()), start, end, earliest)}
+
+    def free(self, slots, start, end):
+        blocked = self.blocked(slots, start, end)
+        return [s for s in slots if s not in blocked]
+
+    def next_free(self, slots, after, duration, limit=5, align=None, until=None, accept=None):
+        """The earliest limit FreeWindows of length duration starting at or after after,
+        at most one per slot, ordered by start and then by position in slots.
+
+        Each slot's sorted intervals are swept once for the first gap that fits,
+        instead of probing window after window with blocked(). align (a timedelta)
+        rounds candidate starts up to the booking form's time grid in after's local
+        time; windows starting later than until are left out. accept(start, end), if
+        given, rejects free windows the caller can't use and the sweep moves on to the
+        next aligned start; pass until with it, or a slot may be swept without end.
+        """
+        self._ensure_fresh()
+        start, length = to_epoch(after), int(duration.total_seconds())
+        earliest = start - _MAX_DURATION_S
+        latest = to_epoch(until) if until is not None else None
+        step = int(align.total_seconds()) if align else 1
+        offset = int(after.utcoffset().total_seconds()) if after.utcoffset() else 0
+
+        def round_up(t):
+            return -(-(t + offset) // step) * step - offset
+
+        with self._lock:
+            self.queries += 1
+            # Copied out so accept runs without holding up bookings from other sessions
+            pending = []
+            for order, slot in enumerate(slots):
+                intervals = self._by_slot.get(slot, [])
+                pending.append((order, slot, intervals[bisect_left(intervals, (earliest,)):]))
+
+        found = []
+        for order, slot, intervals in pending:
+            candidate, i = round_up(start), 0
+            while latest is None or candidate <= latest:
+                # A slot's bookings never overlap, so ends ascend with starts and one
+                # forward pass settles it: stop at the first booking starting after the fit
+                while i < len(intervals) and intervals[i][0] < candidate + length:
+                    if intervals[i][1] > candidate:
+                        candidate = round_up(intervals[i][1])
+                    i += 1
+                if latest is not None and candidate > latest:
+                    break
+                if accept is None or accept(parse_dt(candidate), parse_dt(candidate + length)):
+                    found.append((candidate, order, slot))
+                    break
+                candidate = round_up(candidate + 1)
+        return [FreeWindow(slot, parse_dt(t), parse_dt(t + length)) for t, _, slot in heapq.nsmallest(limit, found)]
+
+    def stats(self):
+        with self._lock:
+            return {
+                "bookings": len(self._entry_of),
+                "queries": self.queries,
+                "updates": self.updates,
+                "rebuilds": self.rebuilds,
+            }
+
+
+def next_free_windows(store, slots, after, duration, limit=5, align=None, until=None, accept=None):
+    """OccupancyIndex.next_free against a fresh snapshot of store, for scripts."""
+    index = OccupancyIndex(store, clock=lambda: after)
+    return index.next_free(slots, after, duration, limit, align, until, accept)
@@ -0,0 +1,61 @@
+"""Run independent reads concurrently on a shared thread pool, with per-task timing.
+
+A rerun's reads (booking list, counters, occupancy snapshot) don't depend on each
+other, so issuing them together bounds the rerun by the slowest one instead of
+their sum. Timing records which task that was.
+"""
+import contextvars
+import time
+from typing import Dict, NamedTuple
+
+
+class Timing(NamedTuple):
+    wall_ms: float            # submit to last result
+    tasks: Dict[str, float]   # name -> ms spent in the task
+
+    @property
+    def critical_path(self):
+        """The task that bounded the batch."""
+        return max(self.tasks, key=self.tasks.get) if self.tasks else None
+
+    @property
+    def serial_ms(self):
+        """What the batch would have cost run one after another."""
+        return sum(self.tasks.values())
+
+    def as_dict(self):
+        return {
+            "wall_ms": round(self.wall_ms, 2),
+            "serial_ms": round(self.serial_ms, 2),
+            "critical_path": self.critical_path,
+            "tasks": {name: round(ms, 2) for name, ms in sorted(self.tasks.items(), key=lambda kv: -kv[1])},
+        }
+
+
+def _timed(fn):
+    t0 = time.perf_counter()
+    try:
+        return fn(), None, (time.perf_counter() - t0) * 1000
+    except Exception as exc:
+        return None, exc, (time.perf_counter() - t0) * 1000
+
+
+def gather(executor, tasks):
+    """Run {name: fn} on executor and wait for all; returns ({name: result}, Timing).
+
+    The first task (in dict order) runs on the calling thread, which would
+    otherwise sit idle. If any task raised, the first such error is re-raised
+    once every task has finished. Each task runs in a copy of the caller's
+    contextvars, so per-rerun state such as the current trace follows it.
+    """
+    t0 = time.perf_counter()
+    names = list(tasks)
+    futures = {name: executor.submit(contextvars.copy_context().run, _timed, tasks[name]) for name in names[1:]}
+    outcomes = {names[0]: _timed(tasks[names[0]])} if names else {}
+    for name, future in futures.items():
+        outcomes[name] = future.result()
+    timing = Timing((time.perf_counter() - t0) * 1000, {name: o[2] for name, o in outcomes.items()})
+    for name in names:
+        if outcomes[name][1] is not None:
+            raise outcomes[name][1]
+    return {name: o[0] for name, o in outcomes.items()}, timing
@@ -0,0 +1,182 @@
+"""Password hashing and the login path around it.
+
+Hashes are scrypt (hashlib, no extra dependency), stored as
+"scrypt$<n>$<r>$<p>$<salt>$<key>" with base64 salt and key. Rows from before the
+switch hold an unsalted SHA-256 hex digest; they still verify and are rehashed on
+the next successful login.
+
+scrypt is deliberately expensive, so Authenticator runs it on a small bounded
+pool (hashlib releases the GIL while hashing) and sheds load instead of queueing
+without limit, and it limits failed attempts per username.
+"""
+import base64
+import hashlib
+import hmac
+import os
+import re
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from typing import NamedTuple, Optional
+
+SCRYPT_N, SCRYPT_R, SCRYPT_P = 2 ** 15, 8, 1
+_LEGACY_SHA256 = re.compile(r"[0-9a-f]{64}")
+
+
+def _scrypt(password, salt, n, r, p):
+    # scrypt needs 128 * r * n bytes; leave headroom over OpenSSL's 32 MiB default
+    return hashlib.scrypt(password.encode(), salt=salt, n=n, r=r, p=p, dklen=32, maxmem=256 * r * n)
+
+
+def hash_password(password, n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P):
+    salt = os.urandom(16)
+    key = _scrypt(password, salt, n, r, p)
+    return f"scrypt${n}${r}${p}${base64.b64encode(salt).decode()}${base64.b64encode(key).decode()}"
+
+
+def verify_password(password, stored, n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P):
+    """(matches, needs_rehash) for a stored hash; needs_rehash is set for legacy
+    SHA-256 rows and for scrypt hashes made with other parameters than n, r, p."""
+    if stored.startswith("scrypt$"):
+        try:
+            _, s_n, s_r, s_p, salt, key = stored.split("$")
+            s_n, s_r, s_p = int(s_n), int(s_r), int(s_p)
+            salt, key = base64.b64decode(salt), base64.b64decode(key)
+        except ValueError:
+            return False, False
+        matches = hmac.compare_digest(_scrypt(password, salt, s_n, s_r, s_p), key)
+        return matches, matches and (s_n, s_r, s_p) != (n, r, p)
+    if _LEGACY_SHA256.fullmatch(stored):
+        matches = hmac.compare_digest(hashlib.sha256(password.encode()).hexdigest(), stored)
+        return matches, matches
+    return False, False
+
+
+class RateLimiter:
+    """At most max_failures failed logins per username in any window seconds.
+
+    Only the most recent max_keys usernames are tracked, so a flood of made-up
+    names can't grow memory without bound.
+    """
+
+    def __init__(self, max_failures=5, window=300.0, max_keys=100_000):
+        self.max_failures = max_failures
+        self.window = window
+        self.max_keys = max_keys
+        self._failures = OrderedDict()   # username -> deque of monotonic failure times
+        self._lock = threading.Lock()
+
+    def retry_after(self, username):
+        """Seconds until username may try again; 0 when it may try now."""
+        now = time.monotonic()
+        with self._lock:
+            times = self._failures.get(username)
+            if not times:
+                return 0.0
+            while times and times[0] <= now - self.window:
+                times.popleft()
+            if len(times) < self.max_failures:
+                return 0.0
+            return times[0] + self.window - now
+
+    def failed(self, username):
+        with self._lock:
+            times = self._failures.pop(username, None) or deque(maxlen=self.max_failures)
+            times.append(time.monotonic())
+            self._failures[username] = times
+            while len(self._failures) > self.max_keys:
+                self._failures.popitem(last=False)
+
+    def succeeded(self, username):
+        with self._lock:
+            self._failures.pop(username, None)
+
+
+class LoginResult(NamedTuple):
+    user: Optional[tuple]    # (user_id, vehicle_number) on success
+    error: Optional[str]     # "invalid", "rate_limited" or "busy"
+    retry_after: float = 0.0
+
+
+class Authenticator:
+    def __init__(self, store, workers=2, max_pending=16, timeout=10.0, limiter=None,
+                 n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P):
+        self.store = store
+        self.params = (n, r, p)
+        self.timeout = timeout
+        self.limiter = limiter or RateLimiter()
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="parkos-kdf")
+        # Running plus queued hashes; beyond this, logins fail fast with "busy"
+        self._slots = threading.BoundedSemaphore(workers + max_pending)
+        # Unknown usernames still pay for one hash, so response time doesn't reveal them
+        self._dummy_hash = hash_password(os.urandom(8).hex(), *self.params)
+        self.logins = self.failures = self.rejected = self.rehashed = 0
+        self._stats_lock = threading.Lock()
+
+    def _run(self, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            return None
+        try:
+            future = self._pool.submit(fn, *args)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def _count(self, name):
+        # Logins come in on many sessions' threads at once
+        with self._stats_lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def hash(self, password):
+        """Hash on the pool; None when it's saturated or the hash takes longer than timeout."""
+        future = self._run(hash_password, password, *self.params)
+        if future is None:
+            return None
+        try:
+            return future.result(self.timeout)
+        except TimeoutError:
+            return None
+
+    def login(self, username, password):
+        wait = self.limiter.retry_after(username)
+        if wait:
+            return LoginResult(None, "rate_limited", wait)
+        row = self.store.get_login(username)
+        stored = row[1] if row else self._dummy_hash
+        future = self._run(verify_password, password, stored, *self.params)
+        if future is None:
+            self._count("rejected")
+            return LoginResult(None, "busy")
+        try:
+            matches, needs_rehash = future.result(self.timeout)
+        except TimeoutError:
+            # The hash still finishes on the pool and frees its slot then
+            self._count("rejected")
+            return LoginResult(None, "busy")
+        if not (row and matches):
+            self._count("failures")
+            self.limiter.failed(username)
+            return LoginResult(None, "invalid")
+        self._count("logins")
+        self.limiter.succeeded(username)
+        if needs_rehash:
+            # Off the login's critical path; if the pool is saturated, the next login retries
+            user_id = row[0]
+            upgrade = self._run(lambda: self.store.set_password_hash(user_id, hash_password(password, *self.params)))
+            if upgrade is not None:
+                self._count("rehashed")
+        return LoginResult((row[0], row[2]), None)
+
+    def register(self, username, password):
+        """True if created; False if the name is taken; None when hashing is saturated or times out."""
+        password_hash = self.hash(password)
+        if password_hash is None:
+            return None
+        return self.store.create_user(username, password_hash)
+
+    def stats(self):
+        with self._stats_lock:
+            return {"logins": self.logins, "failures": self.failures, "rejected": self.rejected, "rehashed": self.rehashed}
@@ -0,0 +1,132 @@
+"""Operator dashboard figures from the booking rollups.
+
+Occupancy is rolled up per slot and IST day (rollup_slot_days) and per lot, IST
+day and hour (rollup_hours), next to the bookings starting in each hour and their
+late cancellations. BookingStore.refresh_rollups keeps the tables current from the
+booking_changes queue (migrations/010_booking_rollups.sql on Postgres,
+rollup_deltas on SQLite), so the dashboard never reads bookings.
+
+Nothing records whether a car arrived, so no-shows are estimated from late
+cancellations: bookings cancelled between NO_SHOW_BEFORE before their start and
+NO_SHOW_AFTER after it.
+"""
+import logging
+import threading
+from datetime import date, datetime, time, timedelta
+from typing import Any, NamedTuple, Optional
+
+import pandas as pd
+
+from layout import DEFAULT_LOT
+from models import IST
+
+logger = logging.getLogger(__name__)
+
+NO_SHOW_BEFORE = timedelta(minutes=60)
+NO_SHOW_AFTER = timedelta(minutes=15)
+WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+_NO_SHOW_BEFORE_S = int(NO_SHOW_BEFORE.total_seconds())
+_NO_SHOW_AFTER_S = int(NO_SHOW_AFTER.total_seconds())
+# IST is a fixed UTC+05:30 (models._IST_FIXED), so local days and hours are integer division
+_IST_OFFSET_S = 19800
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def pending_row(op, slot_number, start_s, end_s, changed_s):
+    """(sign, slot_number, start_s, end_s, late) for one booking_changes row, times in epoch seconds."""
+    late = op == "D" and start_s - _NO_SHOW_BEFORE_S <= changed_s < start_s + _NO_SHOW_AFTER_S
+    return (1 if op == "I" else -1, slot_number, start_s, end_s, int(late))
+
+
+def rollup_deltas(rows, lot_of):
+    """Rollup increments for pending_row tuples, as {(day, slot_number): [lot_id, seconds]}
+    and {(lot_id, day, hour): [seconds, bookings, late]} with IST dates. lot_of maps
+    slot_number to lot_id; slots missing from it belong to DEFAULT_LOT."""
+    slot_days, hours = {}, {}
+    for sign, slot, start, end, late in rows:
+        lot = lot_of.get(slot, DEFAULT_LOT)
+        start, end = start + _IST_OFFSET_S, end + _IST_OFFSET_S
+        for d in range(start // 86400, (end - 1) // 86400 + 1):
+            cell = slot_days.setdefault((d, slot), [lot, 0])
+            cell[1] += sign * (min(end, (d + 1) * 86400) - max(start, d * 86400))
+        for h in range(start // 3600, (end - 1) // 3600 + 1):
+            hours.setdefault((lot, h), [0, 0, 0])[0] += sign * (min(end, (h + 1) * 3600) - max(start, h * 3600))
+        cell = hours.setdefault((lot, start // 3600), [0, 0, 0])
+        cell[1] += sign
+        cell[2] += late
+    return ({(date.fromordinal(_EPOCH_ORDINAL + d), slot): v for (d, slot), v in slot_days.items()},
+            {(lot, date.fromordinal(_EPOCH_ORDINAL + h // 24), h % 24): v for (lot, h), v in hours.items()})
+
+
+def refresh_all(store, batch_size=10000):
+    """Run store.refresh_rollups until the queue is drained; returns how many changes it applied."""
+    total = 0
+    while True:
+        applied = store.refresh_rollups(batch_size)
+        total += applied
+        if applied < batch_size:
+            return total
+
+
+def start_refresher(store, every, batch_size=10000):
+    """Run refresh_all every every seconds from a daemon thread. Returns an Event that
+    stops it. Several processes may run one: each claims different queued changes."""
+    stop = threading.Event()
+
+    def run():
+        while not stop.wait(every):
+            try:
+                refresh_all(store, batch_size)
+            except Exception:
+                logger.exception("Refreshing booking rollups failed; retrying in %ss", every)
+
+    threading.Thread(target=run, name="parkos-rollups", daemon=True).start()
+    return stop
+
+
+class Utilization(NamedTuple):
+    by_slot: Any                    # Series slot_number -> share of the range booked, layout order
+    by_row: Any                     # Series "Level / Row A" -> share
+    by_hour: Any                    # Series hour of day (0-23) -> share
+    by_weekday: Any                 # Series "Mon".."Sun" -> share, weekdays in the range only
+    bookings_by_hour: Any           # Series hour of day -> bookings starting then
+    peak_at: Optional[datetime]     # start of the busiest hour
+    peak: float                     # share of the lot booked during it
+    bookings: int
+    late_cancellations: int
+    refreshed_at: Optional[datetime]
+
+    @property
+    def no_show_rate(self):
+        """Late cancellations per booking made, cancelled or not."""
+        made = self.bookings + self.late_cancellations
+        return self.late_cancellations / made if made else 0.0
+
+
+def utilization(rollups, layout, start_day, end_day):
+    """Utilization of layout's slots over the IST days [start_day, end_day) from a
+    models.Rollups; shares are of the time every slot could have been booked."""
+    days = pd.date_range(start_day, end_day - timedelta(days=1), freq="D")
+    hour_capacity = len(layout.slots) * 3600
+
+    slot_days = pd.DataFrame(rollups.slot_days, columns=["day", "slot_number", "seconds"])
+    by_slot = (slot_days.groupby("slot_number")["seconds"].sum()
+               .reindex(list(layout.slots), fill_value=0) / (len(days) * 86400))
+    by_row = by_slot.groupby(by_slot.index.map(layout.row_names), sort=False).mean()
+
+    hours = pd.DataFrame(rollups.hours, columns=["day", "hour", "seconds", "bookings", "late"])
+    by_hour = hours.groupby("hour")["seconds"].sum().reindex(range(24), fill_value=0) / (len(days) * hour_capacity)
+    weekdays = pd.to_datetime(hours["day"]).dt.dayofweek
+    per_weekday = days.dayofweek.value_counts().reindex(range(7))
+    by_weekday = (hours.groupby(weekdays)["seconds"].sum().reindex(range(7), fill_value=0)
+                  / (per_weekday * 24 * hour_capacity)).dropna()
+    by_weekday.index = [WEEKDAYS[d] for d in by_weekday.index]
+    peak_at, peak = None, 0.0
+    if len(hours) and hours["seconds"].max() > 0:
+        busiest = hours.loc[hours["seconds"].idxmax()]
+        peak_at = IST.localize(datetime.combine(busiest["day"], time(int(busiest["hour"]))))
+        peak = busiest["seconds"] / hour_capacity
+    return Utilization(by_slot, by_row, by_hour, by_weekday,
+                       hours.groupby("hour")["bookings"].sum().reindex(range(24), fill_value=0),
+                       peak_at, peak, int(hours["bookings"].sum()), int(hours["late"].sum()), rollups.refreshed_at)
@@ -0,0 +1,51 @@
+"""Move bookings that ended more than --retention-days ago into bookings_archive.
+
+Supabase: run migrations/009_bookings_archive.sql first, then
+
+    python scripts/archive_bookings.py --retention-days 30 --batch-size 5000
+
+with SUPABASE_URL and SUPABASE_KEY set. Each batch is one archive_bookings RPC
+call and its own short transaction. Against a local database:
+
+    python scripts/archive_bookings.py --sqlite parkos.db
+
+--every SECONDS keeps running and archives on that interval instead of once.
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from archive import archive_expired  # noqa: E402
+from models import IST  # noqa: E402
+from store import create_store  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sqlite", metavar="PATH", help="archive a local SQLite database instead of Supabase")
+    parser.add_argument("--retention-days", type=float, default=30)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--pause", type=float, default=0.0, help="seconds to wait between batches")
+    parser.add_argument("--every", type=float, metavar="SECONDS", help="repeat on this interval")
+    args = parser.parse_args()
+
+    if args.sqlite:
+        store = create_store("sqlite", path=args.sqlite)
+    else:
+        store = create_store("supabase", url=os.environ["SUPABASE_URL"], key=os.environ["SUPABASE_KEY"])
+    retention = timedelta(days=args.retention_days)
+    while True:
+        moved = archive_expired(store, lambda: datetime.now(IST), retention, args.batch_size, args.pause)
+        print(f"{datetime.now(IST):%Y-%m-%d %H:%M:%S} archived {moved:,} bookings")
+        if not args.every:
+            return
+        time.sleep(args.every)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Backfill booking start_at/end_at from the legacy "YYYY-MM-DD HH:MM" text columns.
+
+Supabase: run migrations/004_bookings_timestamptz.sql first, then
+
+    python scripts/backfill_timestamptz.py --batch-size 5000
+
+which calls the backfill_booking_timestamps RPC until no rows are left. Each call
+is its own short transaction, so bookings stay writable while it runs.
+
+SQLite: upgrade a database created before the switch to epoch seconds in place
+
+    python scripts/backfill_timestamptz.py --sqlite parkos.db
+"""
+import argparse
+import os
+import sqlite3
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from models import parse_dt, to_epoch  # noqa: E402
+from store import SQLITE_SCHEMA  # noqa: E402
+
+
+def backfill_supabase(url, key, batch_size):
+    from supabase import create_client
+    client = create_client(url, key)
+    total = 0
+    while True:
+        touched = client.rpc("backfill_booking_timestamps", {"batch_size": batch_size}).execute().data
+        if not touched:
+            return total
+        total += touched
+        print(f"{total:,} rows backfilled")
+
+
+def backfill_sqlite(path, batch_size):
+    conn = sqlite3.connect(path)
+    columns = {row[1] for row in conn.execute("pragma table_info(bookings)")}
+    if "start_datetime" not in columns:
+        print("bookings already uses start_at/end_at")
+        return 0
+    with conn:
+        for column in ("start_at", "end_at"):
+            if column not in columns:
+                conn.execute(f"alter table bookings add column {column} integer")
+    total = 0
+    while True:
+        rows = conn.execute("select id, start_datetime, end_datetime from bookings"
+                            " where start_at is null limit ?", (batch_size,)).fetchall()
+        if not rows:
+            break
+        with conn:
+            conn.executemany("update bookings set start_at = ?, end_at = ? where id = ?",
+                             [(to_epoch(parse_dt(s)), to_epoch(parse_dt(e)), i) for i, s, e in rows])
+        total += len(rows)
+        print(f"{total:,} rows backfilled")
+    # SQLite can't drop indexed columns or add NOT NULL in place, so swap in a fresh table.
+    with conn:
+        conn.execute("alter table bookings rename to bookings_legacy")
+        for (name,) in conn.execute("select name from sqlite_master where type = 'index' and tbl_name = 'bookings_legacy'"
+                                    " and sql is not null").fetchall():
+            conn.execute(f"drop index {name}")
+        conn.executescript(SQLITE_SCHEMA)
+        conn.execute("insert into bookings (id, user_id, slot_number, start_at, end_at)"
+                     " select id, user_id, slot_number, start_at, end_at from bookings_legacy")
+        conn.execute("drop table bookings_legacy")
+    conn.close()
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sqlite", metavar="PATH", help="upgrade a local SQLite database instead of Supabase")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args()
+    if args.sqlite:
+        total = backfill_sqlite(args.sqlite, args.batch_size)
+    else:
+        total = backfill_supabase(os.environ["SUPABASE_URL"], os.environ["SUPABASE_KEY"], args.batch_size)
+    print(f"done, {total:,} rows")
+
+
+if __name__ == "__main__":
+    main()
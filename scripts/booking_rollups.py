@@ -0,0 +1,54 @@
+"""Maintain the operator dashboard's rollup tables.
+
+Supabase: run migrations/010_booking_rollups.sql first, then backfill once with
+
+    python scripts/booking_rollups.py rebuild
+
+and fold in the changes queued since the last run with
+
+    python scripts/booking_rollups.py refresh --every 60
+
+(SUPABASE_URL and SUPABASE_KEY set). rebuild holds off booking writes while it
+reads every booking; on a big table, run `select public.rebuild_booking_rollups()`
+from psql instead, where no request timeout applies. Against a local database,
+add --sqlite parkos.db.
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from models import IST  # noqa: E402
+from rollups import refresh_all  # noqa: E402
+from store import create_store  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("command", choices=["refresh", "rebuild"])
+    parser.add_argument("--sqlite", metavar="PATH", help="use a local SQLite database instead of Supabase")
+    parser.add_argument("--batch-size", type=int, default=10000, help="queued changes per refresh transaction")
+    parser.add_argument("--every", type=float, metavar="SECONDS", help="keep refreshing on this interval")
+    args = parser.parse_args()
+
+    if args.sqlite:
+        store = create_store("sqlite", path=args.sqlite)
+    else:
+        store = create_store("supabase", url=os.environ["SUPABASE_URL"], key=os.environ["SUPABASE_KEY"])
+    if args.command == "rebuild":
+        print(f"rolled up {store.rebuild_rollups():,} bookings")
+        return
+    while True:
+        applied = refresh_all(store, args.batch_size)
+        print(f"{datetime.now(IST):%Y-%m-%d %H:%M:%S} applied {applied:,} booking changes")
+        if not args.every:
+            return
+        time.sleep(args.every)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Rebuild the vendored Outfit and JetBrains Mono fonts in static/fonts/.
+
+The upstream variable fonts come from the google/fonts repository, packaged as
+the fontpkg-outfit and fontpkg-jetbrains-mono wheels on PyPI. This downloads
+them, checks their sha256 against PyPI, and writes each family's upright
+variable font as woff2 next to its SIL OFL 1.1 license text. Needs fontTools
+with brotli (pip install fonttools brotli); the app itself does not.
+
+    python scripts/fetch_fonts.py
+"""
+import hashlib
+import io
+import json
+import urllib.request
+import zipfile
+from pathlib import Path
+
+FONTS_DIR = Path(__file__).resolve().parent.parent / "static" / "fonts"
+PYPI_API = "https://pypi.org/pypi/{package}/json"
+
+# output name -> (wheel, version, font inside the wheel, license file to write)
+FONTS = {
+    "Outfit-Variable.woff2": ("fontpkg-outfit", "1.100", "fontpkg_outfit/files/Outfit[wght].ttf",
+                              "Outfit-OFL.txt"),
+    "JetBrainsMono-Variable.woff2": ("fontpkg-jetbrains-mono", "2.211",
+                                     "fontpkg_jetbrains_mono/files/JetBrainsMono[wght].ttf", "JetBrainsMono-OFL.txt"),
+}
+
+
+def fetch(url):
+    with urllib.request.urlopen(url, timeout=30) as resp:
+        return resp.read()
+
+
+def fetch_wheel(package, version):
+    project = json.loads(fetch(PYPI_API.format(package=package)))
+    wheel = next(u for u in project["releases"][version] if u["packagetype"] == "bdist_wheel")
+    data = fetch(wheel["url"])
+    if hashlib.sha256(data).hexdigest() != wheel["digests"]["sha256"]:
+        raise RuntimeError(f"{wheel['filename']}: sha256 does not match PyPI")
+    return zipfile.ZipFile(io.BytesIO(data))
+
+
+def main():
+    from fontTools.ttLib import TTFont
+
+    FONTS_DIR.mkdir(parents=True, exist_ok=True)
+    for filename, (package, version, font_path, license_name) in FONTS.items():
+        wheel = fetch_wheel(package, version)
+        font = TTFont(io.BytesIO(wheel.read(font_path)), recalcTimestamp=False)   # reproducible output
+        font.flavor = "woff2"
+        font.save(FONTS_DIR / filename)
+        (FONTS_DIR / license_name).write_bytes(wheel.read(f"{font_path.split('/')[0]}/LICENSE"))
+        print(f"{filename}: {(FONTS_DIR / filename).stat().st_size:,} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""List the earliest free windows of a given length across a lot's slots.
+
+    python scripts/next_free.py --hours 2 --after "2026-10-20 09:00"
+    python scripts/next_free.py --sqlite parkos.db --hours 1.5 --limit 10
+
+Supabase is reached through SUPABASE_URL and SUPABASE_KEY. Starts are rounded
+up to the booking form's time grid (--align minutes, default 30) and searched up
+to --days ahead.
+"""
+import argparse
+import os
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from layout import DEFAULT_LAYOUT, DEFAULT_LOT  # noqa: E402
+from models import IST, parse_dt  # noqa: E402
+from occupancy import next_free_windows  # noqa: E402
+from store import create_store  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sqlite", metavar="PATH", help="read a local SQLite database instead of Supabase")
+    parser.add_argument("--hours", type=float, required=True, help="length of the window")
+    parser.add_argument("--after", help='earliest start, "YYYY-MM-DD HH:MM" IST (default: now)')
+    parser.add_argument("--limit", type=int, default=5)
+    parser.add_argument("--align", type=int, default=30, metavar="MINUTES")
+    parser.add_argument("--days", type=int, default=7, help="how far ahead to search")
+    parser.add_argument("--lot", default=DEFAULT_LOT)
+    args = parser.parse_args()
+
+    if args.sqlite:
+        store = create_store("sqlite", path=args.sqlite)
+    else:
+        store = create_store("supabase", url=os.environ["SUPABASE_URL"], key=os.environ["SUPABASE_KEY"])
+    layout = store.fetch_layout(args.lot) or DEFAULT_LAYOUT
+    after = parse_dt(args.after) if args.after else datetime.now(IST).replace(second=0, microsecond=0)
+    windows = next_free_windows(store, layout.slots, after, timedelta(hours=args.hours), args.limit,
+                                align=timedelta(minutes=args.align), until=after + timedelta(days=args.days))
+    for w in windows:
+        print(f"{w.slot_number:<10} {w.start:%a %Y-%m-%d %H:%M} -> {w.end:%a %Y-%m-%d %H:%M}")
+    if not windows:
+        print(f"no {args.hours:g} h window in the next {args.days} days")
+
+
+if __name__ == "__main__":
+    main()
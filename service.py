@@ -0,0 +1,194 @@
+"""Booking operations behind app.py's pages, without any Streamlit dependency.
+
+app.py calls these for the page render, slot grid, confirm, cancel and live-update
+paths, and bench/loadtest.py drives the very same code from many threads.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, NamedTuple, Optional
+
+from occupancy import OccupancyIndex
+from cache import TTLCache
+from events import ChangeFeed
+from heatmap import BUCKET_MINUTES, intervals_frame, occupancy_heatmap
+from layout import DEFAULT_LAYOUT, DEFAULT_LOT
+from models import Booking, expand_recurrence
+from parallel import gather
+from rollups import refresh_all, utilization
+
+
+class PageData(NamedTuple):
+    version: int              # feed version read before the bookings fetch
+    bookings: List[Booking]   # current and future, by start
+    total: int
+    profile: Optional[tuple]  # (username, vehicle_number)
+    layout: Any               # layout.Layout of the lot
+    timing: Any               # parallel.Timing of the batch
+
+
+class BookingService:
+    def __init__(self, store, occupancy, booking_cache, feed, stats_cache=None, executor=None, profile_cache=None,
+                 layout_cache=None, heatmap_cache=None, dashboard_cache=None):
+        self.store = store
+        self.occupancy = occupancy
+        self.booking_cache = booking_cache
+        # Counters change far less often than what the page lists, so they get their own
+        # longer-lived cache; feed events still invalidate them on every write
+        self.stats_cache = stats_cache or TTLCache(maxsize=booking_cache.maxsize, ttl=300)
+        # (username, vehicle_number) per user; only the vehicle gate changes it, and it
+        # writes through, so the TTL just bounds drift from edits made elsewhere
+        self.profile_cache = profile_cache or TTLCache(maxsize=booking_cache.maxsize, ttl=600)
+        # Layouts per lot_id; they change with construction work, not with bookings
+        self.layout_cache = layout_cache or TTLCache(maxsize=64, ttl=300)
+        # Operator heatmaps per (layout version, range, bucket); a minute behind is fine there
+        self.heatmap_cache = heatmap_cache or TTLCache(maxsize=32, ttl=60)
+        # Operator dashboards per (layout version, day range); the rollups lag the refresher anyway
+        self.dashboard_cache = dashboard_cache or TTLCache(maxsize=32, ttl=60)
+        self.feed = feed
+        # Shared by all sessions for the reads a rerun issues side by side
+        self.executor = executor or ThreadPoolExecutor(max_workers=8, thread_name_prefix="parkos-read")
+        feed.subscribe(self._apply_change)
+
+    @classmethod
+    def create(cls, store, clock, occupancy_max_age=15.0, cache_size=4096, cache_ttl=30, stats_ttl=300,
+               read_workers=8, profile_cache_size=None, profile_ttl=600, layout_ttl=300, heatmap_ttl=60,
+               dashboard_ttl=60):
+        return cls(store, OccupancyIndex(store, clock, max_age=occupancy_max_age),
+                   TTLCache(maxsize=cache_size, ttl=cache_ttl), ChangeFeed(),
+                   TTLCache(maxsize=cache_size, ttl=stats_ttl),
+                   ThreadPoolExecutor(max_workers=read_workers, thread_name_prefix="parkos-read"),
+                   TTLCache(maxsize=profile_cache_size or cache_size, ttl=profile_ttl),
+                   TTLCache(maxsize=64, ttl=layout_ttl), TTLCache(maxsize=32, ttl=heatmap_ttl),
+                   TTLCache(maxsize=32, ttl=dashboard_ttl))
+
+    def _apply_change(self, kind, booking_id, user_id, slot_number, start, end):
+        # Every booking write goes through the feed; it keeps the shared index and cache current
+        if kind == "delete":
+            self.occupancy.remove(booking_id)
+        else:
+            self.occupancy.add(booking_id, slot_number, start, end)
+        if user_id is not None:
+            self.booking_cache.invalidate(user_id)
+            self.stats_cache.invalidate(user_id)
+
+    def user_bookings(self, user_id):
+        """(feed version, current and future bookings) for the user. The version is read
+        first so a write racing with the fetch still shows up as a change."""
+        version = self.feed.user_version(user_id)
+        return version, self.booking_cache.get_or_load(
+            user_id, lambda: self.store.fetch_bookings(user_id, self.occupancy.clock()))
+
+    def load_page(self, user_id, lot_id=DEFAULT_LOT):
+        """Every independent read the main page needs, issued concurrently.
+
+        The occupancy snapshot is refreshed alongside, so the slot grid rendered
+        later in the rerun never waits on a rebuild.
+        """
+        results, timing = gather(self.executor, {
+            "bookings": lambda: self.user_bookings(user_id),
+            "count": lambda: self.booking_count(user_id),
+            "profile": lambda: self.profile(user_id),
+            "layout": lambda: self.layout(lot_id),
+            "occupancy": self.occupancy.warm,
+        })
+        version, bookings = results["bookings"]
+        return PageData(version, bookings, results["count"], results["profile"], results["layout"], timing)
+
+    def layout(self, lot_id=DEFAULT_LOT):
+        """The lot's Layout, or DEFAULT_LAYOUT while parking_slots has no rows for it."""
+        return self.layout_cache.get_or_load(lot_id, lambda: self.store.fetch_layout(lot_id) or DEFAULT_LAYOUT)
+
+    def profile(self, user_id):
+        return self.profile_cache.get_or_load(user_id, lambda: self.store.get_profile(user_id))
+
+    def remember_profile(self, user_id, username, vehicle_number):
+        """Seed the cache with what login already returned, saving the first lookup."""
+        self.profile_cache.set(user_id, (username, vehicle_number))
+
+    def set_vehicle_number(self, user_id, vehicle_number):
+        self.store.set_vehicle_number(user_id, vehicle_number)
+        profile = self.profile_cache.get(user_id) or self.store.get_profile(user_id)
+        # invalidate() first, so a lookup already in flight can't put the old row back
+        self.profile_cache.invalidate(user_id)
+        if profile is not None:
+            self.profile_cache.set(user_id, (profile[0], vehicle_number))
+
+    def booking_count(self, user_id):
+        return self.stats_cache.get_or_load(user_id, lambda: self.store.count_bookings(user_id))
+
+    def history(self, user_id, cursor=None, limit=20):
+        """One HistoryPage of ended bookings; not cached, only fetched on request."""
+        return self.store.fetch_history(user_id, self.occupancy.clock(), cursor, limit)
+
+    def heatmap(self, layout, start, end, bucket_minutes=BUCKET_MINUTES):
+        """Slot x bucket occupancy DataFrame for [start, end) (see heatmap.py). Shared
+        between sessions, so callers must not modify it."""
+        return self.heatmap_cache.get_or_load((layout.version, start, end, bucket_minutes), lambda: occupancy_heatmap(
+            intervals_frame(self.store.fetch_intervals(start, end)), layout.slots, start, end, bucket_minutes))
+
+    def dashboard(self, layout, start_day, end_day):
+        """rollups.Utilization of the layout's lot over the IST days [start_day, end_day),
+        read from the rollup tables only. Shared between sessions like heatmap()."""
+        return self.dashboard_cache.get_or_load((layout.version, start_day, end_day), lambda: utilization(
+            self.store.fetch_rollups(layout.lot_id, start_day, end_day), layout, start_day, end_day))
+
+    def refresh_dashboard(self, batch_size=10000):
+        """Fold queued booking changes into the rollups now and drop cached dashboards."""
+        applied = refresh_all(self.store, batch_size)
+        self.dashboard_cache.clear()
+        return applied
+
+    def blocked(self, slots, start, end):
+        return self.occupancy.blocked(slots, start, end)
+
+    def next_free(self, slots, after, duration, limit=5, align=None, until=None, accept=None):
+        """Earliest free windows across slots; see OccupancyIndex.next_free."""
+        return self.occupancy.next_free(slots, after, duration, limit, align, until, accept)
+
+    def book(self, user_id, slot_number, start, end):
+        """Reserve the slot; returns the store's Reservation."""
+        reservation = self.store.reserve(user_id, slot_number, start, end)
+        if reservation.ok:
+            self.feed.publish("upsert", reservation.booking_id, user_id, slot_number, start, end)
+        elif not self.occupancy.blocked((slot_number,), start, end):
+            # Usually another session won a race the index already knows about; only a
+            # write it missed (another process) calls for a rebuild before the next render
+            self.occupancy.mark_stale()
+        return reservation
+
+    def book_many(self, user_id, requests):
+        """All-or-nothing booking of (slot_number, start, end) requests; returns a BatchReservation."""
+        return self._apply_batch(user_id, requests, self.store.reserve_many(user_id, requests))
+
+    def book_recurring(self, user_id, slot_numbers, start, end, until, weekdays=range(7)):
+        batch = self.store.reserve_recurring(user_id, slot_numbers, start, end, until, weekdays)
+        # Published rows come back in expansion order, matching expand_recurrence
+        requests = expand_recurrence(slot_numbers, start, end, until, weekdays) if batch.ok else ()
+        return self._apply_batch(user_id, requests, batch)
+
+    def _apply_batch(self, user_id, requests, batch):
+        if batch.ok:
+            for booking_id, (slot_number, start, end) in zip(batch.booking_ids, requests):
+                self.feed.publish("upsert", booking_id, user_id, slot_number, start, end)
+        elif any(not self.occupancy.blocked((s,), b_start, b_end) for s, b_start, b_end in batch.conflicts):
+            self.occupancy.mark_stale()
+        return batch
+
+    def cancel(self, user_id, booking_id, slot_number):
+        self.store.delete_booking(booking_id)
+        self.feed.publish("delete", booking_id, user_id, slot_number)
+
+    def has_changed(self, user_id, shown_version, shown_grid):
+        """Whether the user's bookings or the shown grid's occupancy moved on.
+        Reads in-process state only, never the store."""
+        if self.feed.user_version(user_id) != shown_version:
+            return True
+        if shown_grid:
+            grid_slots, grid_start, grid_end, shown_blocked = shown_grid
+            return self.occupancy.blocked(grid_slots, grid_start, grid_end) != shown_blocked
+        return False
+
+    def stats(self):
+        return {"bookings": self.booking_cache.stats(), "stats": self.stats_cache.stats(),
+                "profiles": self.profile_cache.stats(), "layouts": self.layout_cache.stats(),
+                "heatmaps": self.heatmap_cache.stats(), "dashboards": self.dashboard_cache.stats(),
+                "occupancy": self.occupancy.stats(), "feed": self.feed.stats()}
@@ -0,0 +1,65 @@
+// Slot grid component (app.py): the whole lot is one element, whatever its size.
+// data = {levels: [{name, rows: [{label, slots}]}], blocked: [slot, ...], selected: slot | null}
+// A click on a free slot sends it back as the "clicked" trigger; level tabs switch
+// in the browser without a rerun.
+
+const escape = (s) => String(s).replace(/[&<>"']/g, (c) => `&#${c.charCodeAt(0)};`);
+
+export default function (component) {
+    const { data, parentElement, setTriggerValue } = component;
+    const root = parentElement.querySelector(".pg");
+    if (!root || !data) return;
+
+    const levels = data.levels || [];
+    const blocked = new Set(data.blocked || []);
+    const selected = data.selected;
+
+    // Keep the tab the user picked across reruns; otherwise show the selected slot's level
+    let current = Number(root.dataset.level);
+    if (!(current >= 0 && current < levels.length)) {
+        current = Math.max(0, levels.findIndex((l) => l.rows.some((r) => r.slots.includes(selected))));
+    }
+
+    function render() {
+        const parts = [];
+        if (levels.length > 1) {
+            parts.push('<div class="pg-tabs" role="tablist">');
+            levels.forEach((level, i) => {
+                const free = level.rows.reduce((n, r) => n + r.slots.filter((s) => !blocked.has(s)).length, 0);
+                parts.push(`<button class="pg-tab${i === current ? " on" : ""}" data-level="${i}" role="tab">`
+                    + `${escape(level.name)} <span>${free} free</span></button>`);
+            });
+            parts.push("</div>");
+        }
+        for (const row of (levels[current] || { rows: [] }).rows) {
+            parts.push(`<div class="pg-row-label">Row ${escape(row.label)}</div><div class="pg-row">`);
+            for (const s of row.slots) {
+                const state = blocked.has(s) ? "busy" : s === selected ? "sel" : "free";
+                parts.push(`<button class="pg-slot ${state}" data-slot="${escape(s)}"`
+                    + `${state === "busy" ? " disabled" : ""} title="${escape(s)}">${escape(s)}</button>`);
+            }
+            parts.push("</div>");
+        }
+        root.innerHTML = parts.join("");
+    }
+
+    // One delegated listener for every slot; reassigned (not added) on each data update
+    root.onclick = (event) => {
+        const tab = event.target.closest("[data-level]");
+        if (tab) {
+            current = Number(tab.dataset.level);
+            root.dataset.level = current;
+            render();
+            return;
+        }
+        const slot = event.target.closest("[data-slot]");
+        if (slot && !slot.disabled) {
+            // Show the choice at once; the rerun confirms it with the next data
+            root.querySelectorAll(".pg-slot.sel").forEach((b) => b.classList.replace("sel", "free"));
+            if (slot.dataset.slot !== selected) slot.classList.replace("free", "sel");
+            setTriggerValue("clicked", slot.dataset.slot);
+        }
+    };
+
+    render();
+}
@@ -0,0 +1,707 @@
+"""Storage backends for users and bookings.
+
+app.py talks to a BookingStore instead of the Supabase client directly, so the
+booking flow can run (and be benchmarked) against a local SQLite database with
+the same semantics as the hosted one.
+"""
+import heapq
+import sqlite3
+import threading
+from datetime import date, timedelta
+
+from layout import layout_from_rows
+from models import BatchReservation, Booking, HistoryPage, Reservation, Rollups, expand_recurrence, parse_dt, to_epoch
+from rollups import pending_row, rollup_deltas
+
+# Exit wraps to the next day at most, so no booking is longer than this.
+MAX_BOOKING_DURATION = timedelta(hours=24)
+# Where finished bookings live: the hot table, then the archive (archive_bookings).
+HISTORY_TABLES = ("bookings", "bookings_archive")
+# Upper bound on the bookings one reserve_many / reserve_recurring call may create.
+MAX_BATCH_SIZE = 500
+
+
+def earliest_overlapping_start(start):
+    """Lower bound on the start of any booking that can overlap a window beginning at start."""
+    return start - MAX_BOOKING_DURATION
+
+
+class BookingStore:
+    """Interface shared by every backend. Times are timezone-aware datetimes; Supabase
+    stores them as timestamptz (start_at/end_at), SQLite as integer epoch seconds."""
+
+    def get_login(self, username):
+        """Return (user_id, password_hash, vehicle_number), or None for an unknown username."""
+        raise NotImplementedError
+
+    def set_password_hash(self, user_id, password_hash):
+        raise NotImplementedError
+
+    def create_user(self, username, password_hash):
+        """Create a user. Return False if the username is taken or the insert fails."""
+        raise NotImplementedError
+
+    def get_profile(self, user_id):
+        """Return (username, vehicle_number), or None."""
+        raise NotImplementedError
+
+    def set_vehicle_number(self, user_id, vehicle_number):
+        raise NotImplementedError
+
+    def fetch_layout(self, lot_id):
+        """Return the lot's layout.Layout from parking_slots, or None if it has no slots."""
+        raise NotImplementedError
+
+    def fetch_bookings(self, user_id, since):
+        """Return the user's bookings ending after since (current and future) ordered by start."""
+        raise NotImplementedError
+
+    def fetch_history(self, user_id, before, cursor=None, limit=20):
+        """One HistoryPage of the user's bookings that ended by before, most recent first,
+        from bookings and bookings_archive alike.
+
+        Keyset-paginated on (start, id): pass the previous page's next_cursor to
+        continue, so every page is an index range scan however deep it is.
+        """
+        raise NotImplementedError
+
+    def count_bookings(self, user_id):
+        """Total bookings the user holds, read from the trigger-maintained user_stats
+        row, so it costs one primary-key lookup however long the history is."""
+        raise NotImplementedError
+
+    def fetch_blocked(self, slots, start, end):
+        """Return the subset of slots with a booking overlapping [start, end)."""
+        raise NotImplementedError
+
+    def fetch_active_bookings(self, since):
+        """Return every booking ending after since as Booking records."""
+        raise NotImplementedError
+
+    def fetch_intervals(self, start, end):
+        """(slot_number, start_at, end_at) for every booking overlapping [start, end),
+        archived ones included.
+
+        Times are left as stored (epoch seconds or ISO strings) for callers that
+        convert them in bulk (heatmap.intervals_frame) rather than per row.
+        """
+        raise NotImplementedError
+
+    def reserve(self, user_id, slot_number, start, end):
+        """Atomically book slot_number for [start, end).
+
+        The database rejects overlapping bookings for a slot, so two sessions
+        confirming the same slot at once get one success and one Reservation with
+        conflict=True, whatever their caches showed.
+        """
+        raise NotImplementedError
+
+    def reserve_many(self, user_id, requests):
+        """Book every (slot_number, start, end) in requests, or none of them.
+
+        All requests are checked against existing bookings (and each other) in one
+        query and inserted in one round trip. Returns a BatchReservation listing the
+        clashing requests when nothing was booked.
+        """
+        raise NotImplementedError
+
+    def reserve_recurring(self, user_id, slot_numbers, start, end, until, weekdays=range(7)):
+        """reserve_many for each slot on every matching weekday (0 = Monday) from
+        start's date through until, at start/end's times of day."""
+        return self.reserve_many(user_id, expand_recurrence(slot_numbers, start, end, until, weekdays))
+
+    def delete_booking(self, booking_id):
+        raise NotImplementedError
+
+    def archive_bookings(self, before, batch_size=5000):
+        """Move up to batch_size bookings that ended by before, oldest first, from
+        bookings to bookings_archive in one transaction. Returns how many moved.
+
+        The move is not a cancellation: user_stats keeps counting archived bookings.
+        """
+        raise NotImplementedError
+
+    def refresh_rollups(self, batch_size=10000):
+        """Fold up to batch_size queued booking changes (booking_changes) into the
+        dashboard rollups, oldest first, and drop them from the queue. Returns how many."""
+        raise NotImplementedError
+
+    def rebuild_rollups(self):
+        """Recompute rollup occupancy and booking counts from bookings and
+        bookings_archive, for a backfill. Late cancellations are only known from the
+        queue, so they are kept, and queued ones are counted before the queue is
+        cleared. Returns how many bookings were read."""
+        raise NotImplementedError
+
+    def fetch_rollups(self, lot_id, start_day, end_day):
+        """models.Rollups of lot_id for the IST days [start_day, end_day)."""
+        raise NotImplementedError
+
+    def query_stats(self):
+        """Per-query latency counters, for backends that keep them."""
+        return {}
+
+
+# Postgres SQLSTATE for an exclusion constraint violation.
+EXCLUSION_VIOLATION = "23P01"
+
+
+class SupabaseStore(BookingStore):
+    def __init__(self, client, stats=None):
+        self.client = client
+        self.stats = stats
+
+    @classmethod
+    def from_credentials(cls, url, key, http=None):
+        """http: an http_client.HttpSettings for the shared connection pool."""
+        from supabase import ClientOptions, create_client
+        from http_client import build_http_client
+        http_client, stats = build_http_client(http)
+        return cls(create_client(url, key, options=ClientOptions(httpx_client=http_client)), stats)
+
+    def query_stats(self):
+        return self.stats.stats() if self.stats else {}
+
+    def get_login(self, username):
+        res = self.client.table("users").select("id, password_hash, vehicle_number").eq("username", username).execute()
+        if res.data:
+            row = res.data[0]
+            return (row["id"], row["password_hash"], row["vehicle_number"])
+        return None
+
+    def set_password_hash(self, user_id, password_hash):
+        self.client.table("users").update({"password_hash": password_hash}).eq("id", user_id).execute()
+
+    def create_user(self, username, password_hash):
+        try:
+            existing = self.client.table("users").select("id").eq("username", username).execute()
+            if existing.data:
+                return False
+            self.client.table("users").insert({"username": username, "password_hash": password_hash}).execute()
+            return True
+        except Exception:
+            return False
+
+    def get_profile(self, user_id):
+        res = self.client.table("users").select("username, vehicle_number").eq("id", user_id).execute()
+        return (res.data[0]["username"], res.data[0]["vehicle_number"]) if res.data else None
+
+    def set_vehicle_number(self, user_id, vehicle_number):
+        self.client.table("users").update({"vehicle_number": vehicle_number}).eq("id", user_id).execute()
+
+    def fetch_layout(self, lot_id, page_size=1000):
+        rows, offset = [], 0
+        while True:
+            res = (self.client.table("parking_slots")
+                   .select("slot_number, lot_id, level, level_order, row_label, row_order, position")
+                   .eq("lot_id", lot_id).order("slot_number")
+                   .range(offset, offset + page_size - 1).execute())
+            rows.extend((r["slot_number"], r["lot_id"], r["level"], r["level_order"],
+                         r["row_label"], r["row_order"], r["position"]) for r in res.data)
+            if len(res.data) < page_size:
+                return layout_from_rows(lot_id, rows)
+            offset += page_size
+
+    def fetch_bookings(self, user_id, since):
+        res = (self.client.table("bookings").select("id, slot_number, start_at, end_at").eq("user_id", user_id)
+               .gte("start_at", earliest_overlapping_start(since).isoformat())
+               .gt("end_at", since.isoformat())
+               .order("start_at").execute())
+        return [Booking.from_row(r["id"], r["slot_number"], r["start_at"], r["end_at"]) for r in res.data]
+
+    def fetch_history(self, user_id, before, cursor=None, limit=20):
+        pages = []
+        for table in HISTORY_TABLES:
+            query = (self.client.table(table).select("id, slot_number, start_at, end_at")
+                     .eq("user_id", user_id).lte("end_at", before.isoformat()))
+            if cursor is not None:
+                start, booking_id = cursor
+                start = start.isoformat()
+                query = query.or_(f'start_at.lt."{start}",and(start_at.eq."{start}",id.lt.{booking_id})')
+            res = query.order("start_at", desc=True).order("id", desc=True).limit(limit + 1).execute()
+            pages.append([Booking.from_row(r["id"], r["slot_number"], r["start_at"], r["end_at"]) for r in res.data])
+        return merge_history(pages, limit)
+
+    def count_bookings(self, user_id):
+        res = self.client.table("user_stats").select("total_bookings").eq("user_id", user_id).execute()
+        return res.data[0]["total_bookings"] if res.data else 0
+
+    def fetch_blocked(self, slots, start, end):
+        # Overlap test runs in Postgres: start_at < window end AND end_at > window start.
+        # The lower bound on start_at keeps the (slot_number, start_at, end_at) index
+        # scan to the last MAX_BOOKING_DURATION instead of all history.
+        res = (self.client.table("bookings").select("slot_number")
+               .in_("slot_number", list(slots))
+               .gte("start_at", earliest_overlapping_start(start).isoformat())
+               .lt("start_at", end.isoformat())
+               .gt("end_at", start.isoformat())
+               .execute())
+        return {r["slot_number"] for r in res.data}
+
+    def fetch_active_bookings(self, since, page_size=1000):
+        # PostgREST caps each response (1000 rows by default), so page through by range.
+        rows, offset = [], 0
+        while True:
+            res = (self.client.table("bookings").select("id, slot_number, start_at, end_at")
+                   .gt("end_at", since.isoformat()).order("id")
+                   .range(offset, offset + page_size - 1).execute())
+            rows.extend(Booking.from_row(r["id"], r["slot_number"], r["start_at"], r["end_at"]) for r in res.data)
+            if len(res.data) < page_size:
+                return rows
+            offset += page_size
+
+    def fetch_intervals(self, start, end, page_size=1000):
+        # end_at is bounded on both sides (no booking ends later than MAX_BOOKING_DURATION
+        # after the window), so the scan stays on bookings_end_at_idx
+        rows = []
+        for table in HISTORY_TABLES:
+            offset = 0
+            while True:
+                res = (self.client.table(table).select("slot_number, start_at, end_at")
+                       .gt("end_at", start.isoformat())
+                       .lt("end_at", (end + MAX_BOOKING_DURATION).isoformat())
+                       .lt("start_at", end.isoformat()).order("id")
+                       .range(offset, offset + page_size - 1).execute())
+                rows.extend((r["slot_number"], r["start_at"], r["end_at"]) for r in res.data)
+                if len(res.data) < page_size:
+                    break
+                offset += page_size
+        return rows
+
+    def reserve(self, user_id, slot_number, start, end):
+        # bookings_no_overlap (migrations/005) makes the insert itself the availability check.
+        try:
+            res = self.client.table("bookings").insert({
+                "user_id": user_id,
+                "slot_number": slot_number,
+                "start_at": start.isoformat(),
+                "end_at": end.isoformat()
+            }).execute()
+        except Exception as exc:
+            if getattr(exc, "code", None) == EXCLUSION_VIOLATION:
+                return Reservation(None, True)
+            raise
+        return Reservation(res.data[0]["id"] if res.data else None, False)
+
+    def reserve_many(self, user_id, requests):
+        check_batch_size(len(requests))
+        items = [{"slot_number": s, "start_at": b_start.isoformat(), "end_at": b_end.isoformat()}
+                 for s, b_start, b_end in requests]
+        return self._batch_result(self.client.rpc("reserve_batch", {"p_user_id": user_id, "p_items": items}).execute())
+
+    def reserve_recurring(self, user_id, slot_numbers, start, end, until, weekdays=range(7)):
+        # Expanded by generate_series in Postgres (migrations/006), so a month of
+        # weekdays is still one request instead of one per booking. Counted here
+        # too, so an oversized series fails like it does on SQLite.
+        check_batch_size(len(expand_recurrence(slot_numbers, start, end, until, weekdays)))
+        res = self.client.rpc("reserve_recurring", {
+            "p_user_id": user_id,
+            "p_slots": list(slot_numbers),
+            "p_start": start.isoformat(),
+            "p_end": end.isoformat(),
+            "p_until": until.isoformat(),
+            "p_isodows": [d + 1 for d in weekdays],
+        }).execute()
+        return self._batch_result(res)
+
+    @staticmethod
+    def _batch_result(res):
+        data = res.data or {}
+        conflicts = [(c["slot_number"], parse_dt(c["start_at"]), parse_dt(c["end_at"])) for c in data.get("conflicts") or ()]
+        return BatchReservation([] if conflicts else list(data.get("ids") or ()), conflicts)
+
+    def delete_booking(self, booking_id):
+        self.client.table("bookings").delete().eq("id", booking_id).execute()
+
+    def archive_bookings(self, before, batch_size=5000):
+        # migrations/009_bookings_archive.sql
+        res = self.client.rpc("archive_bookings", {"p_before": before.isoformat(), "p_batch_size": batch_size}).execute()
+        return res.data or 0
+
+    def refresh_rollups(self, batch_size=10000):
+        # migrations/010_booking_rollups.sql
+        return self.client.rpc("refresh_booking_rollups", {"p_batch_size": batch_size}).execute().data or 0
+
+    def rebuild_rollups(self):
+        return self.client.rpc("rebuild_booking_rollups", {}).execute().data or 0
+
+    def fetch_rollups(self, lot_id, start_day, end_day, page_size=1000):
+        def fetch_all(table, columns):
+            rows, offset = [], 0
+            while True:
+                res = (self.client.table(table).select(columns).eq("lot_id", lot_id)
+                       .gte("day", start_day.isoformat()).lt("day", end_day.isoformat()).order("day")
+                       .range(offset, offset + page_size - 1).execute())
+                rows.extend(res.data)
+                if len(res.data) < page_size:
+                    return rows
+                offset += page_size
+
+        slot_days = fetch_all("rollup_slot_days", "day, slot_number, occupied_seconds")
+        hours = fetch_all("rollup_hours", "day, hour, occupied_seconds, bookings, late_cancellations")
+        state = self.client.table("rollup_state").select("refreshed_at").eq("name", "bookings").execute().data
+        return Rollups([(date.fromisoformat(r["day"]), r["slot_number"], r["occupied_seconds"]) for r in slot_days],
+                       [(date.fromisoformat(r["day"]), r["hour"], r["occupied_seconds"], r["bookings"], r["late_cancellations"])
+                        for r in hours],
+                       parse_dt(state[0]["refreshed_at"]) if state and state[0]["refreshed_at"] else None)
+
+
+SQLITE_SCHEMA = """
+create table if not exists users (
+    id integer primary key autoincrement,
+    username text not null unique,
+    password_hash text not null,
+    vehicle_number text
+);
+create table if not exists bookings (
+    id integer primary key autoincrement,
+    user_id integer not null references users(id),
+    slot_number text not null,
+    start_at integer not null,  -- epoch seconds
+    end_at integer not null
+);
+create index if not exists bookings_slot_start_at_end_at_idx on bookings (slot_number, start_at, end_at);
+create index if not exists bookings_user_start_at_idx on bookings (user_id, start_at);
+create index if not exists bookings_end_at_idx on bookings (end_at);
+-- Stands in for the bookings_no_overlap exclusion constraint on Postgres;
+-- 86400 is MAX_BOOKING_DURATION, bounding the index scan like fetch_blocked.
+create trigger if not exists bookings_no_overlap before insert on bookings
+when exists (
+    select 1 from bookings where slot_number = new.slot_number
+    and start_at >= new.start_at - 86400 and start_at < new.end_at and end_at > new.start_at
+)
+begin
+    select raise(abort, 'bookings_no_overlap');
+end;
+create trigger if not exists bookings_no_overlap_update before update of slot_number, start_at, end_at on bookings
+when exists (
+    select 1 from bookings where id != new.id and slot_number = new.slot_number
+    and start_at >= new.start_at - 86400 and start_at < new.end_at and end_at > new.start_at
+)
+begin
+    select raise(abort, 'bookings_no_overlap');
+end;
+-- Finished bookings moved out by archive_bookings (migrations/009_bookings_archive.sql).
+create table if not exists bookings_archive (
+    id integer primary key,
+    user_id integer not null,
+    slot_number text not null,
+    start_at integer not null,
+    end_at integer not null,
+    archived_at integer not null default (strftime('%s', 'now'))
+);
+create index if not exists bookings_archive_user_start_at_idx on bookings_archive (user_id, start_at);
+create index if not exists bookings_archive_end_at_idx on bookings_archive (end_at);
+-- Per-user counters kept by triggers (migrations/007_user_stats.sql on Postgres).
+create table if not exists user_stats (
+    user_id integer primary key references users(id),
+    total_bookings integer not null default 0
+);
+insert into user_stats (user_id, total_bookings)
+    select user_id, count(*) from bookings where not exists (select 1 from user_stats) group by user_id;
+create trigger if not exists bookings_count_insert after insert on bookings
+begin
+    insert into user_stats (user_id, total_bookings) values (new.user_id, 1)
+    on conflict (user_id) do update set total_bookings = total_bookings + 1;
+end;
+-- Recreated so databases from before the archive stop counting archive moves as cancellations.
+drop trigger if exists bookings_count_delete;
+create trigger bookings_count_delete after delete on bookings
+when not exists (select 1 from bookings_archive where id = old.id)
+begin
+    update user_stats set total_bookings = total_bookings - 1 where user_id = old.user_id;
+end;
+-- Dashboard rollups fed from a queue of booking changes (migrations/010_booking_rollups.sql).
+create table if not exists booking_changes (
+    seq integer primary key autoincrement,
+    op text not null,  -- I insert, D cancel, U old row of an edit
+    booking_id integer not null,
+    slot_number text not null,
+    start_at integer not null,
+    end_at integer not null,
+    changed_at integer not null default (strftime('%s', 'now'))
+);
+create trigger if not exists bookings_queue_insert after insert on bookings
+begin
+    insert into booking_changes (op, booking_id, slot_number, start_at, end_at)
+    values ('I', new.id, new.slot_number, new.start_at, new.end_at);
+end;
+create trigger if not exists bookings_queue_delete after delete on bookings
+when not exists (select 1 from bookings_archive where id = old.id)
+begin
+    insert into booking_changes (op, booking_id, slot_number, start_at, end_at)
+    values ('D', old.id, old.slot_number, old.start_at, old.end_at);
+end;
+create trigger if not exists bookings_queue_update after update of slot_number, start_at, end_at on bookings
+begin
+    insert into booking_changes (op, booking_id, slot_number, start_at, end_at)
+    values ('U', old.id, old.slot_number, old.start_at, old.end_at), ('I', new.id, new.slot_number, new.start_at, new.end_at);
+end;
+create table if not exists rollup_slot_days (
+    day text not null,  -- IST date, YYYY-MM-DD
+    slot_number text not null,
+    lot_id text not null,
+    occupied_seconds integer not null default 0,
+    primary key (day, slot_number)
+);
+create index if not exists rollup_slot_days_lot_day_idx on rollup_slot_days (lot_id, day);
+create table if not exists rollup_hours (
+    lot_id text not null,
+    day text not null,
+    hour integer not null,
+    occupied_seconds integer not null default 0,
+    bookings integer not null default 0,
+    late_cancellations integer not null default 0,
+    primary key (lot_id, day, hour)
+);
+create table if not exists rollup_state (
+    name text primary key,
+    refreshed_at integer,
+    rebuilt_at integer
+);
+insert or ignore into rollup_state (name) values ('bookings');
+-- One row per space (migrations/008_parking_slots.sql on Postgres).
+create table if not exists parking_slots (
+    slot_number text primary key,
+    lot_id text not null,
+    level text not null,
+    level_order integer not null default 0,
+    row_label text not null,
+    row_order integer not null default 0,
+    position integer not null default 0
+);
+create index if not exists parking_slots_lot_idx on parking_slots (lot_id);
+"""
+
+
+class SQLiteStore(BookingStore):
+    """Local backend mirroring the Supabase schema; ":memory:" gives a throwaway database.
+
+    A single connection is shared by all Streamlit sessions, so every call holds a lock.
+    """
+
+    def __init__(self, path=":memory:"):
+        self.path = path
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.lock = threading.Lock()
+        with self.lock:
+            self.conn.executescript(SQLITE_SCHEMA)
+
+    def _query(self, sql, params=()):
+        with self.lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    def _write(self, sql, params=()):
+        with self.lock, self.conn:
+            return self.conn.execute(sql, params).lastrowid
+
+    def bulk_load(self, users=(), bookings=(), slots=()):
+        """Seed the database. users: (username, password_hash, vehicle_number);
+        bookings: (user_id, slot_number, start, end) with datetime start/end;
+        slots: parking_slots rows as produced by Layout.to_rows()."""
+        with self.lock, self.conn:
+            self.conn.executemany("insert into parking_slots (slot_number, lot_id, level, level_order, row_label,"
+                                  " row_order, position) values (?, ?, ?, ?, ?, ?, ?)", slots)
+            self.conn.executemany("insert into users (username, password_hash, vehicle_number) values (?, ?, ?)", users)
+            self.conn.executemany("insert into bookings (user_id, slot_number, start_at, end_at) values (?, ?, ?, ?)",
+                                  ((u, s, to_epoch(b_start), to_epoch(b_end)) for u, s, b_start, b_end in bookings))
+
+    def get_login(self, username):
+        rows = self._query("select id, password_hash, vehicle_number from users where username = ?", (username,))
+        return tuple(rows[0]) if rows else None
+
+    def set_password_hash(self, user_id, password_hash):
+        self._write("update users set password_hash = ? where id = ?", (password_hash, user_id))
+
+    def create_user(self, username, password_hash):
+        try:
+            self._write("insert into users (username, password_hash) values (?, ?)", (username, password_hash))
+            return True
+        except sqlite3.Error:
+            return False
+
+    def get_profile(self, user_id):
+        rows = self._query("select username, vehicle_number from users where id = ?", (user_id,))
+        return tuple(rows[0]) if rows else None
+
+    def set_vehicle_number(self, user_id, vehicle_number):
+        self._write("update users set vehicle_number = ? where id = ?", (vehicle_number, user_id))
+
+    def fetch_layout(self, lot_id):
+        rows = self._query("select slot_number, lot_id, level, level_order, row_label, row_order, position"
+                           " from parking_slots where lot_id = ?", (lot_id,))
+        return layout_from_rows(lot_id, rows)
+
+    def fetch_bookings(self, user_id, since):
+        since_s = to_epoch(since)
+        rows = self._query("select id, slot_number, start_at, end_at from bookings"
+                           " where user_id = ? and start_at >= ? and end_at > ? order by start_at",
+                           (user_id, to_epoch(earliest_overlapping_start(since)), since_s))
+        return [Booking.from_row(*r) for r in rows]
+
+    def fetch_history(self, user_id, before, cursor=None, limit=20):
+        pages = []
+        for table in HISTORY_TABLES:
+            sql = f"select id, slot_number, start_at, end_at from {table} where user_id = ? and end_at <= ?"
+            params = [user_id, to_epoch(before)]
+            if cursor is not None:
+                sql += " and (start_at, id) < (?, ?)"
+                params += [to_epoch(cursor[0]), cursor[1]]
+            rows = self._query(sql + " order by start_at desc, id desc limit ?", (*params, limit + 1))
+            pages.append([Booking.from_row(*r) for r in rows])
+        return merge_history(pages, limit)
+
+    def count_bookings(self, user_id):
+        rows = self._query("select total_bookings from user_stats where user_id = ?", (user_id,))
+        return rows[0][0] if rows else 0
+
+    def fetch_blocked(self, slots, start, end):
+        slots = list(slots)
+        marks = ",".join("?" * len(slots))
+        rows = self._query(f"select distinct slot_number from bookings where slot_number in ({marks})"
+                           " and start_at >= ? and start_at < ? and end_at > ?",
+                           (*slots, to_epoch(earliest_overlapping_start(start)), to_epoch(end), to_epoch(start)))
+        return {r[0] for r in rows}
+
+    def fetch_active_bookings(self, since):
+        rows = self._query("select id, slot_number, start_at, end_at from bookings where end_at > ?", (to_epoch(since),))
+        return [Booking.from_row(*r) for r in rows]
+
+    def fetch_intervals(self, start, end):
+        where = "where end_at > ? and end_at < ? and start_at < ?"
+        params = (to_epoch(start), to_epoch(end + MAX_BOOKING_DURATION), to_epoch(end))
+        return self._query(f"select slot_number, start_at, end_at from bookings {where}"
+                           f" union all select slot_number, start_at, end_at from bookings_archive {where}", params * 2)
+
+    def reserve(self, user_id, slot_number, start, end):
+        try:
+            booking_id = self._write("insert into bookings (user_id, slot_number, start_at, end_at) values (?, ?, ?, ?)",
+                                     (user_id, slot_number, to_epoch(start), to_epoch(end)))
+        except sqlite3.IntegrityError as exc:
+            if "bookings_no_overlap" in str(exc):
+                return Reservation(None, True)
+            raise
+        return Reservation(booking_id, False)
+
+    def reserve_many(self, user_id, requests):
+        check_batch_size(len(requests))
+        if not requests:
+            return BatchReservation([], [])
+        rows = [(i, s, to_epoch(b_start), to_epoch(b_end)) for i, (s, b_start, b_end) in enumerate(requests)]
+        values = ",".join("(?, ?, ?, ?)" for _ in rows)
+        params = [p for row in rows for p in row]
+        with self.lock, self.conn:
+            # Take the write lock before checking, so no other process can book in between.
+            self.conn.execute("begin immediate")
+            clashes = self.conn.execute(
+                f"with req(i, slot_number, start_at, end_at) as (values {values})"
+                " select req.i from req where exists ("
+                "   select 1 from bookings b where b.slot_number = req.slot_number"
+                "   and b.start_at >= req.start_at - 86400 and b.start_at < req.end_at and b.end_at > req.start_at)"
+                " or exists ("
+                "   select 1 from req r2 where r2.i < req.i and r2.slot_number = req.slot_number"
+                "   and r2.start_at < req.end_at and r2.end_at > req.start_at)"
+                " order by req.i", params).fetchall()
+            if clashes:
+                return BatchReservation([], [requests[i] for (i,) in clashes])
+            insert = "insert into bookings (user_id, slot_number, start_at, end_at) values (?, ?, ?, ?)"
+            ids = [self.conn.execute(insert, (user_id, s, b_start, b_end)).lastrowid for _, s, b_start, b_end in rows]
+        return BatchReservation(ids, [])
+
+    def delete_booking(self, booking_id):
+        self._write("delete from bookings where id = ?", (booking_id,))
+
+    def archive_bookings(self, before, batch_size=5000):
+        with self.lock, self.conn:
+            rows = self.conn.execute("select id, user_id, slot_number, start_at, end_at from bookings"
+                                     " where end_at <= ? order by end_at limit ?", (to_epoch(before), batch_size)).fetchall()
+            # Archive first: the user_stats delete trigger skips rows already in the archive
+            self.conn.executemany("insert or ignore into bookings_archive (id, user_id, slot_number, start_at, end_at)"
+                                  " values (?, ?, ?, ?, ?)", rows)
+            self.conn.executemany("delete from bookings where id = ?", [(r[0],) for r in rows])
+        return len(rows)
+
+    def _add_rollups(self, rows):
+        # Caller holds the lock and transaction
+        slot_days, hours = rollup_deltas(rows, dict(self.conn.execute("select slot_number, lot_id from parking_slots")))
+        self.conn.executemany(
+            "insert into rollup_slot_days (day, slot_number, lot_id, occupied_seconds) values (?, ?, ?, ?)"
+            " on conflict (day, slot_number) do update set occupied_seconds = occupied_seconds + excluded.occupied_seconds",
+            [(day.isoformat(), slot, lot, seconds) for (day, slot), (lot, seconds) in slot_days.items()])
+        self.conn.executemany(
+            "insert into rollup_hours (lot_id, day, hour, occupied_seconds, bookings, late_cancellations)"
+            " values (?, ?, ?, ?, ?, ?) on conflict (lot_id, day, hour) do update set"
+            " occupied_seconds = occupied_seconds + excluded.occupied_seconds, bookings = bookings + excluded.bookings,"
+            " late_cancellations = late_cancellations + excluded.late_cancellations",
+            [(lot, day.isoformat(), hour, *values) for (lot, day, hour), values in hours.items()])
+
+    def refresh_rollups(self, batch_size=10000):
+        with self.lock, self.conn:
+            changes = self.conn.execute("select seq, op, slot_number, start_at, end_at, changed_at from booking_changes"
+                                        " order by seq limit ?", (batch_size,)).fetchall()
+            if changes:
+                self._add_rollups(pending_row(*c[1:]) for c in changes)
+                self.conn.execute("delete from booking_changes where seq <= ?", (changes[-1][0],))
+            self.conn.execute("update rollup_state set refreshed_at = strftime('%s', 'now') where name = 'bookings'")
+        return len(changes)
+
+    def rebuild_rollups(self):
+        with self.lock, self.conn:
+            rows = self.conn.execute("select slot_number, start_at, end_at from bookings"
+                                     " union all select slot_number, start_at, end_at from bookings_archive").fetchall()
+            # Queued cancellations are dropped with the queue; keep the late ones' counts
+            # (sign 0: a late count, no occupancy)
+            queued = (pending_row(*c) for c in self.conn.execute(
+                "select op, slot_number, start_at, end_at, changed_at from booking_changes where op = 'D'"))
+            late = [(0, *row[1:]) for row in queued if row[4]]
+            self.conn.execute("delete from booking_changes")
+            self.conn.execute("delete from rollup_slot_days")
+            self.conn.execute("update rollup_hours set occupied_seconds = 0, bookings = 0")
+            self._add_rollups([(1, slot, b_start, b_end, 0) for slot, b_start, b_end in rows] + late)
+            self.conn.execute("update rollup_state set refreshed_at = strftime('%s', 'now'),"
+                              " rebuilt_at = strftime('%s', 'now') where name = 'bookings'")
+        return len(rows)
+
+    def fetch_rollups(self, lot_id, start_day, end_day):
+        params = (lot_id, start_day.isoformat(), end_day.isoformat())
+        slot_days = self._query("select day, slot_number, occupied_seconds from rollup_slot_days"
+                                " where lot_id = ? and day >= ? and day < ?", params)
+        hours = self._query("select day, hour, occupied_seconds, bookings, late_cancellations from rollup_hours"
+                            " where lot_id = ? and day >= ? and day < ?", params)
+        state = self._query("select refreshed_at from rollup_state where name = 'bookings'")
+        return Rollups([(date.fromisoformat(day), slot, seconds) for day, slot, seconds in slot_days],
+                       [(date.fromisoformat(day), *rest) for day, *rest in hours],
+                       parse_dt(state[0][0]) if state and state[0][0] is not None else None)
+
+
+def merge_history(pages, limit):
+    """history_page over per-table pages, each most recent first. A booking archived
+    between the reads (hot table first) is in both and is kept once."""
+    seen, bookings = set(), []
+    for b in heapq.merge(*pages, key=lambda b: (b.start, b.id), reverse=True):
+        if b.id not in seen:
+            seen.add(b.id)
+            bookings.append(b)
+    return history_page(bookings, limit)
+
+
+def history_page(bookings, limit):
+    """HistoryPage from up to limit + 1 rows; the extra row only says another page exists."""
+    if len(bookings) > limit:
+        last = bookings[limit - 1]
+        return HistoryPage(bookings[:limit], (last.start, last.id))
+    return HistoryPage(bookings, None)
+
+
+def check_batch_size(n):
+    if n > MAX_BATCH_SIZE:
+        raise ValueError(f"At most {MAX_BATCH_SIZE} bookings per batch, got {n}")
+
+
+def create_store(backend="supabase", **options):
+    """Build a store by name: "supabase" (url, key, http) or "sqlite" (path)."""
+    if backend == "supabase":
+        return SupabaseStore.from_credentials(options["url"], options["key"], options.get("http"))
+    if backend == "sqlite":
+        return SQLiteStore(options.get("path", ":memory:"))
+    raise ValueError(f"Unknown booking store backend: {backend!r}")
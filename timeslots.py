@@ -0,0 +1,47 @@
+"""Precomputed time-of-day slot tables for the entry and exit selectors.
+
+Tables are built once at import for each supported granularity, so a rerun only
+bisects and slices instead of formatting and parsing 48+ times per selector.
+"""
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import date, time
+from types import MappingProxyType
+from typing import Mapping, Tuple
+
+SLOT_GRANULARITIES = (15, 30, 60)
+
+
+@dataclass(frozen=True)
+class SlotTable:
+    minutes: int
+    labels: Tuple[str, ...]     # "12:00 AM", "12:30 AM", ...
+    times: Tuple[time, ...]
+    index: Mapping[str, int]    # label -> position in labels/times
+
+    def after(self, t):
+        """(labels, times) of the slots strictly after time t."""
+        i = bisect_right(self.times, t)
+        return self.labels[i:], self.times[i:]
+
+    def time_of(self, label):
+        return self.times[self.index[label]]
+
+
+def _build(minutes):
+    times = tuple(time(m // 60, m % 60) for m in range(0, 24 * 60, minutes))
+    labels = tuple(t.strftime("%I:%M %p") for t in times)
+    return SlotTable(minutes, labels, times, MappingProxyType({label: i for i, label in enumerate(labels)}))
+
+
+SLOT_TABLES = MappingProxyType({minutes: _build(minutes) for minutes in SLOT_GRANULARITIES})
+
+
+def build_time_options(table, for_date, now_ist=None):
+    """Entry options as (labels, times); today starts with "Now (h:mm AM)" then the later slots."""
+    if for_date == date.today() and now_ist is not None:
+        now_time = now_ist.time().replace(second=0, microsecond=0)
+        now_label = "Now (" + now_ist.strftime("%I:%M %p").lstrip("0") + ")"
+        labels, times = table.after(now_time)
+        return (now_label,) + labels, (now_time,) + times
+    return table.labels, table.times
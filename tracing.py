@@ -0,0 +1,265 @@
+"""Opt-in per-rerun tracing: section timers, store query counts and bytes emitted.
+
+Each rerun of app.py (and each fragment-only rerun) opens a Trace. Store calls
+made for it, on any thread, are timed and counted against it, and app.py marks
+where each render section begins. Finished traces are kept in a ring for the admin
+debug panel, optionally appended to a JSONL file, and summed into process-wide
+metrics served in the Prometheus text format.
+
+With tracing off, begin() returns None and every other call is a no-op.
+"""
+import contextvars
+import json
+import logging
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (seconds) of the rerun duration histogram.
+RERUN_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+_current = contextvars.ContextVar("parkos_trace", default=None)
+
+
+class Trace:
+    def __init__(self, run):
+        self.run = run                 # "page" or "fragment:<name>"
+        self.started_at = time.time()
+        self._t0 = self._last = time.perf_counter()
+        self._lock = threading.Lock()
+        self._section = None           # (name, perf_counter at its start)
+        self.sections = {}             # name -> ms, in the order they first ran
+        self.queries = {}              # store method -> [calls, seconds, errors]
+        self.deltas = self.bytes = 0
+        self.wall_ms = None            # set by Tracer.finish
+
+    def mark(self, section):
+        """End the running section, if any, and start timing section."""
+        now = time.perf_counter()
+        with self._lock:
+            self._close_section(now)
+            self._section = (section, now)
+            self._last = now
+
+    def _close_section(self, now):
+        if self._section is not None:
+            name, t0 = self._section
+            self.sections[name] = self.sections.get(name, 0.0) + (now - t0) * 1000
+            self._section = None
+
+    def query(self, method, elapsed, error=False):
+        with self._lock:
+            entry = self.queries.setdefault(method, [0, 0.0, 0])
+            entry[0] += 1
+            entry[1] += elapsed
+            entry[2] += error
+            self._last = time.perf_counter()
+
+    def emitted(self, nbytes):
+        with self._lock:
+            self.deltas += 1
+            self.bytes += nbytes
+            self._last = time.perf_counter()
+
+    def _finish(self, ended):
+        """Close the trace at perf_counter time ended; False if it was already closed."""
+        with self._lock:
+            if self.wall_ms is not None:
+                return False
+            self._close_section(ended)
+            self.wall_ms = (ended - self._t0) * 1000
+            return True
+
+    def as_dict(self):
+        with self._lock:
+            return {
+                "run": self.run,
+                "at": datetime.fromtimestamp(self.started_at, timezone.utc).isoformat(timespec="milliseconds"),
+                "wall_ms": round(self.wall_ms, 2) if self.wall_ms is not None else None,
+                "queries": sum(q[0] for q in self.queries.values()),
+                "query_ms": round(sum(q[1] for q in self.queries.values()) * 1000, 2),
+                "query_errors": sum(q[2] for q in self.queries.values()),
+                "deltas": self.deltas,
+                "bytes": self.bytes,
+                "sections": {name: round(ms, 2) for name, ms in self.sections.items()},
+                "by_query": {method: q[0] for method, q in sorted(self.queries.items())},
+            }
+
+
+class Tracer:
+    def __init__(self, enabled=False, keep=50, jsonl_path=None):
+        self.enabled = enabled
+        self.jsonl_path = jsonl_path
+        self._recent = deque(maxlen=keep)
+        self._lock = threading.Lock()
+        # Process-wide totals for prometheus()
+        self._reruns = {}     # run -> [count, seconds, bucket counts]
+        self._sections = {}   # section -> [count, seconds]
+        self._queries = {}    # store method -> [calls, seconds, errors]
+        self._deltas = self._bytes = 0
+
+    def begin(self, run, previous=None):
+        """Start tracing a rerun in the current context; returns the Trace, or None when off.
+
+        previous is the session's last trace. A rerun that ended in st.stop() or
+        st.rerun() never reached its finish(), so it is closed here instead, at the
+        time of the last thing it recorded.
+        """
+        if previous is not None:
+            self.finish(previous, at_last=True)
+        if not self.enabled:
+            return None
+        trace = Trace(run)
+        _current.set(trace)
+        return trace
+
+    def current(self):
+        return _current.get()
+
+    def mark(self, section):
+        trace = _current.get()
+        if trace is not None:
+            trace.mark(section)
+
+    def query(self, method, elapsed, error=False):
+        trace = _current.get()
+        if trace is not None:
+            trace.query(method, elapsed, error)
+
+    def emitted(self, nbytes):
+        trace = _current.get()
+        if trace is not None:
+            trace.emitted(nbytes)
+
+    def finish(self, trace, at_last=False):
+        if trace is None or not trace._finish(trace._last if at_last else time.perf_counter()):
+            return
+        if _current.get() is trace:
+            _current.set(None)
+        record = trace.as_dict()
+        with self._lock:
+            self._recent.append(record)
+            rerun = self._reruns.setdefault(trace.run, [0, 0.0, [0] * len(RERUN_BUCKETS)])
+            rerun[0] += 1
+            rerun[1] += trace.wall_ms / 1000
+            for i, bound in enumerate(RERUN_BUCKETS):
+                if trace.wall_ms / 1000 <= bound:
+                    rerun[2][i] += 1
+            for name, ms in trace.sections.items():
+                section = self._sections.setdefault(name, [0, 0.0])
+                section[0] += 1
+                section[1] += ms / 1000
+            for method, (calls, seconds, errors) in trace.queries.items():
+                query = self._queries.setdefault(method, [0, 0.0, 0])
+                query[0] += calls
+                query[1] += seconds
+                query[2] += errors
+            self._deltas += trace.deltas
+            self._bytes += trace.bytes
+            if self.jsonl_path:
+                try:
+                    with open(self.jsonl_path, "a") as f:
+                        f.write(json.dumps(record) + "\n")
+                except OSError:
+                    logger.exception("Could not append trace to %s", self.jsonl_path)
+
+    def recent(self):
+        """Finished traces, most recent first."""
+        with self._lock:
+            return list(reversed(self._recent))
+
+    def prometheus(self):
+        """Process-wide totals in the Prometheus text exposition format."""
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(samples)
+
+        with self._lock:
+            samples = []
+            for run, (count, seconds, buckets) in sorted(self._reruns.items()):
+                samples += [f'parkos_rerun_seconds_bucket{{run="{run}",le="{bound}"}} {n}'
+                            for bound, n in zip(RERUN_BUCKETS, buckets)]
+                samples += [f'parkos_rerun_seconds_bucket{{run="{run}",le="+Inf"}} {count}',
+                            f'parkos_rerun_seconds_sum{{run="{run}"}} {seconds:.6f}',
+                            f'parkos_rerun_seconds_count{{run="{run}"}} {count}']
+            metric("parkos_rerun_seconds", "histogram", "Wall time of traced reruns.", samples)
+            metric("parkos_section_seconds", "summary", "Time spent in each render section.",
+                   [s for name, (count, seconds) in sorted(self._sections.items())
+                    for s in (f'parkos_section_seconds_sum{{section="{name}"}} {seconds:.6f}',
+                              f'parkos_section_seconds_count{{section="{name}"}} {count}')])
+            metric("parkos_store_query_seconds", "summary", "Store calls made by traced reruns.",
+                   [s for method, (calls, seconds, _) in sorted(self._queries.items())
+                    for s in (f'parkos_store_query_seconds_sum{{method="{method}"}} {seconds:.6f}',
+                              f'parkos_store_query_seconds_count{{method="{method}"}} {calls}')])
+            metric("parkos_store_query_errors_total", "counter", "Store calls that raised.",
+                   [f'parkos_store_query_errors_total{{method="{method}"}} {errors}'
+                    for method, (_, _, errors) in sorted(self._queries.items())])
+            metric("parkos_deltas_total", "counter", "Elements sent to browsers by traced reruns.",
+                   [f"parkos_deltas_total {self._deltas}"])
+            metric("parkos_emitted_bytes_total", "counter", "Serialized bytes of those elements.",
+                   [f"parkos_emitted_bytes_total {self._bytes}"])
+        return "\n".join(lines) + "\n"
+
+
+class TracedStore:
+    """Wraps a BookingStore so every call is timed and counted against the current trace."""
+
+    def __init__(self, store, tracer):
+        self._store = store
+        self._tracer = tracer
+
+    def __getattr__(self, name):
+        attr = getattr(self._store, name)
+        if name.startswith("_") or name == "query_stats" or not callable(attr):
+            return attr
+
+        def traced(*args, **kwargs):
+            t0 = time.perf_counter()
+            error = False
+            try:
+                return attr(*args, **kwargs)
+            except Exception:
+                error = True
+                raise
+            finally:
+                self._tracer.query(name, time.perf_counter() - t0, error)
+
+        # Later lookups find it on the instance and skip __getattr__
+        setattr(self, name, traced)
+        return traced
+
+
+def serve_prometheus(tracer, port, host="127.0.0.1"):
+    """Serve tracer.prometheus() at http://host:port/metrics from a daemon thread.
+    Returns the server, or None if the port is taken (e.g. by another app process)."""
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = tracer.prometheus().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    try:
+        server = ThreadingHTTPServer((host, port), MetricsHandler)
+    except OSError:
+        logger.warning("Prometheus endpoint not started: %s:%d is in use", host, port)
+        return None
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="parkos-metrics", daemon=True).start()
+    return server